@@ -1,5 +1,5 @@
+import numpy as np
 import pandas as pd
-from pyDOE2 import fullfact, fracfact, pbdesign, bbdesign, ccdesign
 
 
 class DesignController:
@@ -14,6 +14,8 @@ class DesignController:
         일반 다수준 요인설계 생성.
         levels: 각 요인의 수준 수 리스트 (예: [2, 3, 2])
         """
+        from pyDOE2 import fullfact
+
         design = fullfact(levels)
         columns = [f"F{i+1}" for i in range(len(levels))]
         df = pd.DataFrame(design, columns=columns)
@@ -23,14 +25,44 @@ class DesignController:
         """
         2수준 부분요인 설계 생성.
         design_str: pyDOE2 generator 문자열 (예: 'a b ab')
+        별칭 구조(utils.aliasing.AliasStructure)는 df.attrs["aliasing"] 에 담는다.
         """
+        from pyDOE2 import fracfact
+        from utils.aliasing import alias_structure
+
         design = fracfact(design_str)
         columns = [f"F{i+1}" for i in range(design.shape[1])]
-        df = pd.DataFrame(design, columns=columns)
-        return df.astype(int)
+        aliasing = alias_structure(design_str, labels=columns)   # 별칭 표도 설계 열 이름으로
+        df = pd.DataFrame(design, columns=columns).astype(int)
+        df.attrs["aliasing"] = aliasing
+        return df
+
+    def find_min_aberration(self, factors, runs, min_resolution=3, max_workers=1, use_catalogue=True,
+                            time_budget=30.0):
+        """
+        요인 수와 런 예산으로 최소 aberration 2^(k-p) 생성 열 탐색 (utils.min_aberration)
+        max_workers > 1 이면 후보 평가를 프로세스 풀로 나누고 (기본은 직렬),
+        time_budget 초를 넘기면 남은 작업을 취소하고 근사 결과(exhaustive=False)를 돌려준다.
+        반환 dict 의 design_str 을 create_fractional_factorial 에 그대로 넘길 수 있다.
+        """
+        from utils.min_aberration import minimum_aberration
+
+        return minimum_aberration(factors, runs, min_resolution=min_resolution, max_workers=max_workers,
+                                  use_catalogue=use_catalogue, time_budget=time_budget)
+
+    def create_min_aberration_design(self, factors, runs, min_resolution=3, max_workers=1, use_catalogue=True,
+                                     time_budget=30.0):
+        """최소 aberration 부분요인 설계. 탐색 결과는 df.attrs["min_aberration"] 에 담는다."""
+        info = self.find_min_aberration(factors, runs, min_resolution=min_resolution, max_workers=max_workers,
+                                        use_catalogue=use_catalogue, time_budget=time_budget)
+        df = self.create_fractional_factorial(info["design_str"])
+        df.attrs["min_aberration"] = info
+        return df
 
     def create_plackett_burman(self, factors):
         """Plackett-Burman 설계 생성"""
+        from pyDOE2 import pbdesign
+
         design = pbdesign(factors)
         columns = [f"F{i+1}" for i in range(design.shape[1])]
         df = pd.DataFrame(design, columns=columns)
@@ -41,58 +73,156 @@ class DesignController:
         """Box-Behnken 설계 생성 (요인 3개 이상 권장)"""
         if factors < 3:
             raise ValueError("Box-Behnken 설계는 최소 3개 이상의 요인이 필요합니다.")
+        from pyDOE2 import bbdesign
+
         design = bbdesign(factors, center=center)
         columns = [f"F{i+1}" for i in range(design.shape[1])]
         return pd.DataFrame(design, columns=columns)
 
     def create_ccd(self, factors, center=(4, 4), alpha="orthogonal"):
         """중심합성설계(CCD) 생성"""
+        from pyDOE2 import ccdesign
+
         # face를 명시적으로 지정하지 않으면 pyDOE2에서 None.lower() 에러가 날 수 있어 "ccc"로 강제
         design = ccdesign(factors, center=center, alpha=alpha, face="ccc")
         columns = [f"F{i+1}" for i in range(design.shape[1])]
         return pd.DataFrame(design, columns=columns)
 
+    # 최적 설계 ------------------------------------------------------------
+    def create_optimal_design(self, factors, runs, model="quadratic", criterion="D", bounds=None, levels=None,
+                              constraints=None, fixed_runs=None, n_starts=10, seed=0, max_workers=1,
+                              factor_names=None, time_budget=30.0):
+        """
+        D-/I-최적 설계 생성 (후보 격자 Fedorov 교환).
+        factors: 요인 수, bounds: 요인별 (하한, 상한), constraints: 선형 제약, fixed_runs: 고정 런
+        time_budget: 모든 무작위 시작을 합친 시간 상한(초) - 넘기면 그때까지의 최선 (timed_out=True)
+        효율 지표는 df.attrs["optimal_design"] 에 담는다.
+        """
+        from utils.optimal_design import optimal_design
+
+        names = list(factor_names) if factor_names else [f"F{i+1}" for i in range(factors)]
+        if len(names) != factors:
+            raise ValueError("요인 이름 수가 요인 수와 다릅니다.")
+        result = optimal_design(
+            names, runs, model=model, criterion=criterion, bounds=bounds, levels=levels,
+            constraints=constraints, fixed_runs=fixed_runs, n_starts=n_starts, seed=seed, max_workers=max_workers,
+            time_budget=time_budget,
+        )
+        df = result.pop("design")
+        df.attrs["optimal_design"] = result
+        return df
+
+    # 공간 채움 설계 --------------------------------------------------------
+    def create_space_filling_design(self, factors, runs, kind="maximin_lhs", bounds=None, seed=0, restarts=4,
+                                    iterations=None, time_budget=None, max_workers=1, factor_names=None):
+        """
+        컴퓨터 실험용 공간 채움 설계 (LHS, maximin LHS, Sobol, Halton - utils.space_filling).
+        maximin 재시작은 기본 직렬, max_workers > 1 이면 그 수만큼 프로세스로 나눠 실행한다.
+        time_budget 은 재시작 전체의 시간 한도(초)이다.
+        최소 거리/φ_p/불일치도 등은 df.attrs["space_filling"] 에 담는다.
+        """
+        from utils.space_filling import space_filling_design
+
+        names = list(factor_names) if factor_names else [f"X{i+1}" for i in range(factors)]
+        if len(names) != factors:
+            raise ValueError("요인 이름 수가 요인 수와 다릅니다.")
+        result = space_filling_design(
+            names, runs, kind=kind, bounds=bounds, seed=seed, restarts=restarts, iterations=iterations,
+            time_budget=time_budget, max_workers=max_workers, use_processes=max_workers > 1,
+        )
+        df = result.pop("design")
+        df.attrs["space_filling"] = result
+        return df
+
+    # 분할구 설계 ----------------------------------------------------------
+    @staticmethod
+    def _level_grid(levels):
+        """fullfact 와 같은 순서(첫 요인이 가장 빠르게 변함)의 수준 조합 (N, k) 정수 배열"""
+        levels = [int(level) for level in levels]
+        if not levels or any(level < 1 for level in levels):
+            raise ValueError("요인 수준 수는 1 이상이어야 합니다.")
+        grid = np.indices(levels[::-1]).reshape(len(levels), -1).T
+        return grid[:, ::-1]
+
+    def create_split_plot(self, whole_levels, subplot_levels, replicates=1, randomize_whole=True,
+                          randomize_subplot=True, seed=None, seed_per_block=True):
+        """
+        분할구 설계: 전구(whole-plot) 요인 완전요인 × 세구(sub-plot) 요인 완전요인.
+
+        행 = 전구 인덱스 행렬 (반복, 전구) 과 세구 인덱스 행렬 (전구, 세구) 로 한 번에 색인한다.
+        - randomize_whole: 반복마다 전구 순서를 무작위화
+        - randomize_subplot: 전구마다 세구 순서를 무작위화 (seed_per_block=False 면 모든 전구에 같은 순서)
+        - replicates: 전구 요인 조합 전체를 새 전구로 반복 (WholePlot 번호는 이어서, Replicate 열 추가)
+        seed 가 같으면 같은 설계 (None 이면 매번 다름)
+        """
+        W = self._level_grid(whole_levels)
+        S = self._level_grid(subplot_levels)
+        replicates = int(replicates)
+        if replicates < 1:
+            raise ValueError("반복수는 1 이상이어야 합니다.")
+        n_w, n_s = len(W), len(S)
+        rng = np.random.default_rng(seed)
+
+        whole = np.tile(np.arange(n_w), (replicates, 1))
+        if randomize_whole:
+            whole = rng.permuted(whole, axis=1)
+        whole = whole.ravel()                                     # 전구 순서 (n_w·r)
+
+        n_plots = len(whole)
+        if not randomize_subplot:
+            sub = np.tile(np.arange(n_s), (n_plots, 1))
+        elif seed_per_block:
+            sub = rng.permuted(np.tile(np.arange(n_s), (n_plots, 1)), axis=1)
+        else:
+            sub = np.tile(rng.permutation(n_s), (n_plots, 1))
+
+        data = np.hstack([np.repeat(W[whole], n_s, axis=0), S[sub.ravel()]])
+        columns = [f"W{i+1}" for i in range(W.shape[1])] + [f"S{i+1}" for i in range(S.shape[1])]
+        df = pd.DataFrame(data, columns=columns)
+        df["WholePlot"] = np.repeat(np.arange(1, n_plots + 1), n_s)
+        if replicates > 1:
+            df["Replicate"] = np.repeat(np.arange(1, replicates + 1), n_w * n_s)
+        return df
+
+    # 혼합물 설계 ----------------------------------------------------------
+    def create_mixture_design(self, components, kind="lattice", degree=3, lower=None, upper=None,
+                              component_names=None, edge_centroids=False, overall_centroid=True):
+        """
+        혼합물 설계: 심플렉스 격자 / 심플렉스 중심 / 제약 꼭짓점 (controllers.mixture_design)
+        lower/upper: 성분별 비율 하한/상한
+        """
+        from controllers.mixture_design import mixture_design
+
+        return mixture_design(components, kind=kind, degree=degree, lower=lower, upper=upper,
+                              names=component_names, edge_centroids=edge_centroids,
+                              overall_centroid=overall_centroid)
+
+    def iter_mixture_design(self, components, kind="lattice", degree=3, lower=None, upper=None,
+                            component_names=None, chunk_size=100_000):
+        """매우 큰 후보 집합용 스트리밍 모드 (DataFrame 청크 생성기)"""
+        from controllers.mixture_design import iter_mixture_design
+
+        return iter_mixture_design(components, kind=kind, degree=degree, lower=lower, upper=upper,
+                                   names=component_names, chunk_size=chunk_size)
+
     # 직교배열/Taguchi ------------------------------------------------------
     def create_orthogonal_array(self, factors, design="L8"):
-        """간단한 직교배열(Taguchi) 생성: L4/L8/L9 지원"""
-        design = design.upper()
-        taguchi_tables = {
-            "L4": [
-                [1, 1, 1],
-                [1, 2, 2],
-                [2, 1, 2],
-                [2, 2, 1],
-            ],
-            "L8": [
-                [1, 1, 1, 1, 1, 1, 1],
-                [1, 1, 1, 2, 2, 2, 2],
-                [1, 2, 2, 1, 1, 2, 2],
-                [1, 2, 2, 2, 2, 1, 1],
-                [2, 1, 2, 1, 2, 1, 2],
-                [2, 1, 2, 2, 1, 2, 1],
-                [2, 2, 1, 1, 2, 2, 1],
-                [2, 2, 1, 2, 1, 1, 2],
-            ],
-            "L9": [
-                [1, 1, 1, 1],
-                [1, 2, 2, 2],
-                [1, 3, 3, 3],
-                [2, 1, 2, 3],
-                [2, 2, 3, 1],
-                [2, 3, 1, 2],
-                [3, 1, 3, 2],
-                [3, 2, 1, 3],
-                [3, 3, 2, 1],
-            ],
-        }
-
-        if design not in taguchi_tables:
-            raise ValueError(f"지원하지 않는 직교배열입니다: {design}")
-
-        table = pd.DataFrame(taguchi_tables[design], dtype=int)
-        if factors > table.shape[1]:
-            raise ValueError(f"{design} 설계는 최대 {table.shape[1]}개 요인까지 지원합니다.")
-
-        table = table.iloc[:, :factors]
+        """
+        직교배열(Taguchi) 생성: utils.orthogonal_arrays 카탈로그의 배열 (L4~L81, 혼합 L18/L36)
+        design: "L8", "L16(4^5)", "L18(2^1 3^7)" 등. 앞에서부터 factors 개 열을 사용하고 수준은 1부터.
+        """
+        from utils.orthogonal_arrays import orthogonal_array, resolve
+
+        spec = resolve(design)
+        if factors < 1 or factors > spec.columns:
+            raise ValueError(f"{spec.name} 설계는 최대 {spec.columns}개 요인까지 지원합니다.")
+
+        table = pd.DataFrame(orthogonal_array(spec.name)[:, :factors].astype(int) + 1)
         table.columns = [f"F{i+1}" for i in range(table.shape[1])]
         return table
+
+    def list_orthogonal_arrays(self):
+        """지원하는 직교배열 목록 [{"name", "runs", "levels", "columns"}]"""
+        from utils.orthogonal_arrays import catalogue
+
+        return catalogue()
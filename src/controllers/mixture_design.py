@@ -0,0 +1,231 @@
+"""
+혼합물(mixture) 설계 생성 (Qt 비의존)
+
+성분 비율 x_1..x_q 는 0 이상이고 합이 1 이다.
+- 심플렉스 격자 {q, m}: x_i ∈ {0, 1/m, ..., 1}. 점들은 m 을 q 개로 나누는 조합(별과 막대)이므로
+  막대 위치 combinations(range(m + q - 1), q - 1) 를 NumPy 배열로 받아 차분으로 바로 만든다.
+  (사전식 순서, 점 수 C(m + q - 1, q - 1))
+- 심플렉스 중심: 공집합이 아닌 성분 부분집합마다 등비율 점 (2^q - 1 개, 부분집합 크기 순)
+- 제약 꼭짓점(McLean–Anderson): L ≤ x ≤ U, Σx = 1 인 다면체의 꼭짓점.
+  한 성분만 자유롭게 두고 나머지를 하한/상한 조합(2^(q-1))으로 고정해 자유 성분이 범위 안이면 꼭짓점이다.
+  먼저 암묵적 범위로 L, U 를 좁힌다. (U_j ≤ 1 - Σ_{i≠j} L_i, L_j ≥ 1 - Σ_{i≠j} U_i)
+  한 꼭짓점이 여러 (자유 성분, 조합) 에서 나오지 않도록 표준 표현 하나만 남긴다:
+  자유 성분 값이 경계에 닿으면 j = 0 일 때만, 하한 = 상한인 성분은 하한 쪽 조합만.
+
+후보가 매우 많으면 iter_* 생성기로 chunk_size 행씩 받는다. (전체를 메모리에 만들지 않음)
+스트리밍도 평가하는 후보 수는 MAX_CANDIDATES 까지만 허용한다.
+"""
+
+from itertools import combinations, islice
+from math import comb
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+KINDS = ("lattice", "centroid", "extreme_vertices")
+
+# 한 번에 만드는 최대 점 수 (넘으면 iter_* 스트리밍 사용)
+MAX_POINTS = 1_000_000
+DEFAULT_CHUNK = 100_000
+# 스트리밍 포함, 평가하는 후보(격자점 / 꼭짓점 조합) 수 상한
+MAX_CANDIDATES = 20 * MAX_POINTS
+
+_TOL = 1e-9
+
+
+def lattice_size(components: int, degree: int) -> int:
+    return comb(degree + components - 1, components - 1)
+
+
+def _check_lattice(components: int, degree: int):
+    if components < 2:
+        raise ValueError("혼합물 설계에는 성분이 2개 이상 필요합니다.")
+    if degree < 1:
+        raise ValueError("격자 차수는 1 이상이어야 합니다.")
+
+
+def _bars_to_points(bars: np.ndarray, components: int, degree: int) -> np.ndarray:
+    """막대 위치 (N, q-1) → 비율 (N, q)"""
+    edges = np.column_stack([np.full(len(bars), -1), bars, np.full(len(bars), degree + components - 1)])
+    return (np.diff(edges, axis=1) - 1) / degree
+
+
+def iter_simplex_lattice(components: int, degree: int, chunk_size: int = DEFAULT_CHUNK,
+                         lower: Optional[Sequence[float]] = None,
+                         upper: Optional[Sequence[float]] = None) -> Iterator[np.ndarray]:
+    """{q, m} 격자를 chunk_size 행씩 (lower/upper 를 주면 범위 밖 점은 제외)"""
+    _check_lattice(components, degree)
+    size = lattice_size(components, degree)
+    if size > MAX_CANDIDATES:
+        raise ValueError(f"격자 점이 {size:,}개로 너무 많습니다. (최대 {MAX_CANDIDATES:,})")
+    bounds = _bounds(components, lower, upper) if lower is not None or upper is not None else None
+    bars = combinations(range(degree + components - 1), components - 1)
+    dtype = np.dtype((np.int64, components - 1))
+    while True:
+        chunk = np.fromiter(islice(bars, chunk_size), dtype=dtype)
+        if not len(chunk):
+            return
+        points = _bars_to_points(chunk, components, degree)
+        if bounds is not None:
+            points = points[_within(points, *bounds)]
+        if len(points):
+            yield points
+
+
+def simplex_lattice(components: int, degree: int, lower=None, upper=None) -> np.ndarray:
+    """{q, m} 심플렉스 격자 (N, q)"""
+    _check_lattice(components, degree)
+    size = lattice_size(components, degree)
+    if size > MAX_POINTS:
+        raise ValueError(f"격자 점이 {size:,}개로 너무 많습니다. (최대 {MAX_POINTS:,}, 스트리밍 모드를 사용하세요)")
+    chunks = list(iter_simplex_lattice(components, degree, max(size, 1), lower, upper))
+    return np.vstack(chunks) if chunks else np.zeros((0, components))
+
+
+def simplex_centroid(components: int) -> np.ndarray:
+    """심플렉스 중심 설계 (2^q - 1, q): 꼭짓점, 2성분 중점, ..., 전체 중심 순"""
+    if components < 2:
+        raise ValueError("혼합물 설계에는 성분이 2개 이상 필요합니다.")
+    if 2 ** components - 1 > MAX_POINTS:
+        raise ValueError("성분이 너무 많습니다.")
+    masks = np.array(list(_subset_masks(components)), dtype=float)
+    return masks / masks.sum(axis=1, keepdims=True)
+
+
+def _subset_masks(components: int) -> Iterator[Tuple[int, ...]]:
+    """공집합이 아닌 부분집합의 0/1 지시 벡터 (크기 순, 같은 크기는 사전식)"""
+    for size in range(1, components + 1):
+        for subset in combinations(range(components), size):
+            mask = [0] * components
+            for i in subset:
+                mask[i] = 1
+            yield tuple(mask)
+
+
+def _bounds(components: int, lower, upper) -> Tuple[np.ndarray, np.ndarray]:
+    """검증 후 암묵적 범위까지 좁힌 (L, U)"""
+    L = np.zeros(components) if lower is None else np.asarray(lower, dtype=float)
+    U = np.ones(components) if upper is None else np.asarray(upper, dtype=float)
+    if L.shape != (components,) or U.shape != (components,):
+        raise ValueError("성분 하한/상한 개수가 성분 수와 다릅니다.")
+    if np.any(L < -_TOL) or np.any(U > 1 + _TOL) or np.any(L > U + _TOL):
+        raise ValueError("성분 범위는 0 ≤ 하한 ≤ 상한 ≤ 1 이어야 합니다.")
+    if L.sum() > 1 + _TOL or U.sum() < 1 - _TOL:
+        raise ValueError("하한 합이 1 이하, 상한 합이 1 이상이어야 합니다. (실행 가능한 혼합이 없음)")
+    U = np.minimum(U, 1 - (L.sum() - L))
+    L = np.maximum(L, 1 - (U.sum() - U))
+    return L, U
+
+
+def _within(points: np.ndarray, L: np.ndarray, U: np.ndarray) -> np.ndarray:
+    return np.all((points >= L - _TOL) & (points <= U + _TOL), axis=1)
+
+
+def iter_extreme_vertices(lower=None, upper=None, components: Optional[int] = None,
+                          chunk_size: int = DEFAULT_CHUNK) -> Iterator[np.ndarray]:
+    """
+    꼭짓점 후보를 chunk_size 조합씩 평가해 유효한 꼭짓점을 내보낸다.
+    꼭짓점마다 표준 표현 하나만 통과시키므로 청크 사이에도 중복이 없다.
+    """
+    q = components or len(lower if lower is not None else upper)
+    _check_vertex_work(q)
+    L, U = _bounds(q, lower, upper)
+    pinned = U - L <= _TOL
+    n_combos = 2 ** (q - 1)
+    bits = np.arange(q - 1)
+    for start in range(0, n_combos, chunk_size):
+        codes = np.arange(start, min(start + chunk_size, n_combos))
+        at_upper = ((codes[:, None] >> bits) & 1).astype(bool)          # (n, q-1)
+        found = []
+        for j in range(q):
+            others = np.delete(np.arange(q), j)
+            fixed = np.where(at_upper, U[others], L[others])
+            free = 1 - fixed.sum(axis=1)
+            ok = (free >= L[j] - _TOL) & (free <= U[j] + _TOL)
+            ok &= ~np.any(at_upper & pinned[others], axis=1)
+            if j > 0:
+                ok &= (np.abs(free - L[j]) > _TOL) & (np.abs(free - U[j]) > _TOL)
+            if np.any(ok):
+                points = np.empty((int(ok.sum()), q))
+                points[:, others] = fixed[ok]
+                points[:, j] = np.clip(free[ok], L[j], U[j])
+                found.append(points)
+        if found:
+            yield np.vstack(found)
+
+
+def _check_vertex_work(q: int):
+    if q < 2:
+        raise ValueError("혼합물 설계에는 성분이 2개 이상 필요합니다.")
+    if q * 2 ** (q - 1) > MAX_CANDIDATES:
+        raise ValueError(f"성분이 너무 많습니다. (꼭짓점 후보 {q * 2 ** (q - 1):,}개, 최대 {MAX_CANDIDATES:,})")
+
+
+def _unique_rows(points: np.ndarray) -> np.ndarray:
+    """반올림 기준 중복 제거 (처음 나온 순서 유지)"""
+    _, index = np.unique(np.round(points, 9), axis=0, return_index=True)
+    return points[np.sort(index)]
+
+
+def extreme_vertices(lower=None, upper=None, components: Optional[int] = None,
+                     edge_centroids: bool = False, overall_centroid: bool = True) -> np.ndarray:
+    """
+    제약 혼합 영역의 꼭짓점 (+ 선택: 모서리 중점, 전체 중심)
+    모서리는 공통으로 걸린 범위 제약이 q - 2 개 이상인 꼭짓점 쌍으로 판단한다.
+    """
+    q = components or len(lower if lower is not None else upper)
+    vertices = _unique_rows(np.vstack(list(iter_extreme_vertices(lower, upper, q))))
+    parts = [vertices]
+    if edge_centroids and len(vertices) > 1:
+        L, U = _bounds(q, lower, upper)
+        active = np.hstack([np.abs(vertices - L) <= _TOL, np.abs(vertices - U) <= _TOL]).astype(int)
+        shared = active @ active.T
+        i, j = np.where(np.triu(shared >= q - 2, 1))
+        if len(i):
+            parts.append((vertices[i] + vertices[j]) / 2)
+    if overall_centroid and len(vertices) > 1:
+        parts.append(vertices.mean(axis=0, keepdims=True))
+    return _unique_rows(np.vstack(parts))
+
+
+def mixture_design(components: int, kind: str = "lattice", degree: int = 3, lower=None, upper=None,
+                   names: Optional[List[str]] = None, edge_centroids: bool = False,
+                   overall_centroid: bool = True) -> pd.DataFrame:
+    """
+    kind: "lattice" (lower/upper 를 주면 범위 안 격자점만) | "centroid" | "extreme_vertices"
+    """
+    names = list(names) if names else [f"C{i+1}" for i in range(components)]
+    if len(names) != components or len(set(names)) != components:
+        raise ValueError("성분 이름은 성분 수만큼 서로 달라야 합니다.")
+    if kind == "lattice":
+        points = simplex_lattice(components, degree, lower, upper)
+    elif kind == "centroid":
+        points = simplex_centroid(components)
+        if lower is not None or upper is not None:
+            points = points[_within(points, *_bounds(components, lower, upper))]
+    elif kind == "extreme_vertices":
+        points = extreme_vertices(lower, upper, components, edge_centroids=edge_centroids,
+                                  overall_centroid=overall_centroid)
+    else:
+        raise ValueError(f"알 수 없는 혼합물 설계입니다: {kind} ({', '.join(KINDS)})")
+    if not len(points):
+        raise ValueError("범위 안에 설계점이 없습니다.")
+    return pd.DataFrame(points, columns=names)
+
+
+def iter_mixture_design(components: int, kind: str = "lattice", degree: int = 3, lower=None, upper=None,
+                        names: Optional[List[str]] = None,
+                        chunk_size: int = DEFAULT_CHUNK) -> Iterator[pd.DataFrame]:
+    """스트리밍 모드: 격자/꼭짓점을 chunk_size 단위 DataFrame 으로"""
+    names = list(names) if names else [f"C{i+1}" for i in range(components)]
+    if len(names) != components:
+        raise ValueError("성분 이름은 성분 수만큼 서로 달라야 합니다.")
+    if kind == "lattice":
+        chunks = iter_simplex_lattice(components, degree, chunk_size, lower, upper)
+    elif kind == "extreme_vertices":
+        chunks = iter_extreme_vertices(lower, upper, components, chunk_size)
+    else:
+        raise ValueError("스트리밍 모드는 lattice/extreme_vertices 만 지원합니다.")
+    for points in chunks:
+        yield pd.DataFrame(points, columns=names)
@@ -0,0 +1,13 @@
+"""
+Core 패키지
+Qt 에 의존하지 않는 분석/차트 계산 로직과 분석 레지스트리를 포함합니다.
+데스크톱 컨트롤러(controllers)와 웹 서비스(webapp)는 이 패키지를 감싸는 얇은 어댑터입니다.
+"""
+
+__all__ = [
+    "AnalysisService",
+    "ChartBuilder",
+    "AnalysisError",
+    "ChartError",
+    "CoreError",
+]
@@ -0,0 +1,773 @@
+"""
+분석 코어 (Qt 비의존)
+
+각 분석은 AnalysisResult 를 반환하거나 AnalysisError(제목, 메시지)를 발생시킨다.
+진행 상태 문구는 선택 인자 progress(str) 로 전달한다. (데스크톱 어댑터는 status_updated 로 연결)
+statsmodels/scipy/sklearn 은 해당 분석을 호출할 때 import 한다.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.errors import AnalysisError
+from models.analysis_result import AnalysisResult
+
+
+def _statsmodels():
+    import statsmodels.api as sm
+    import statsmodels.formula.api as smf
+
+    return sm, smf
+
+
+@contextmanager
+def _failure(title: str):
+    """예상하지 못한 예외를 AnalysisError(title, ...) 로 변환"""
+    try:
+        yield
+    except AnalysisError:
+        raise
+    except Exception as exc:
+        raise AnalysisError(title, f"분석 중 오류가 발생했습니다:\n{exc}") from exc
+
+
+def _envelope(analysis_type: str, description: str, results: dict) -> dict:
+    return {
+        "type": analysis_type,
+        "timestamp": datetime.now().strftime("%H:%M:%S"),
+        "status": "완료",
+        "description": description,
+        "results": results,
+    }
+
+
+class AnalysisService:
+    """
+    기본 통계/상관/ANOVA/회귀/DOE 분석 코어.
+    데스크톱(AnalysisController)과 웹(AnalysisRunner)이 공통으로 사용한다.
+    """
+
+    # 잔차/적합값/진단 배열 보관 dtype (np.float32 로 두면 메모리 절반)
+    result_array_dtype = np.float64
+
+    def __init__(self, progress: Optional[Callable[[str], None]] = None):
+        self._progress = progress
+
+    def _report(self, message: str):
+        if self._progress is not None:
+            self._progress(message)
+
+    def _complete(self, result: dict) -> AnalysisResult:
+        return AnalysisResult.from_mapping(result)
+
+    # 기초 통계 ------------------------------------------------------------
+    def basic_statistics(self, dataframe: pd.DataFrame) -> AnalysisResult:
+        self._validate_data(dataframe)
+        with _failure("기초 통계 분석 실패"):
+            self._report("기초 통계량을 계산하는 중입니다...")
+            numeric_data = dataframe.select_dtypes(include=[np.number])
+            if numeric_data.empty:
+                raise AnalysisError("분석 오류", "숫자형 데이터가 없습니다.")
+
+            result = self._complete(_envelope("기초 통계", f"{len(numeric_data.columns)}개 변수의 기초 통계량", {
+                "summary": numeric_data.describe(),
+                "missing_values": numeric_data.isnull().sum(),
+                "data_types": numeric_data.dtypes,
+                "variable_count": len(numeric_data.columns),
+                "observation_count": len(numeric_data),
+            }))
+            self._report("기초 통계 분석이 완료되었습니다.")
+            return result
+
+    def streaming_statistics(self, file_path: str, chunksize: int = 200_000, max_workers: int = 1,
+                             use_processes: bool = False) -> AnalysisResult:
+        """
+        메모리보다 큰 CSV/Parquet 파일의 기초 통계를 청크 단위로 계산한다.
+        결과 구조는 basic_statistics 와 같다. (분위수는 근사값)
+        """
+        with _failure("기초 통계 분석 실패"):
+            from utils.streaming_stats import summarize_file
+
+            self._report("파일을 청크 단위로 읽으며 기초 통계량을 계산하는 중입니다...")
+            stats = summarize_file(file_path, chunksize=chunksize, max_workers=max_workers, use_processes=use_processes)
+            if not stats.columns:
+                raise AnalysisError("분석 오류", "숫자형 데이터가 없습니다.")
+
+            result = self._complete(stats.to_result(
+                description=f"{len(stats.columns)}개 변수의 기초 통계량 (스트리밍, {stats.rows:,}행)"
+            ))
+            self._report("기초 통계 분석이 완료되었습니다.")
+            return result
+
+    # 상관 분석 ------------------------------------------------------------
+    def correlation(self, dataframe: pd.DataFrame) -> AnalysisResult:
+        self._validate_data(dataframe)
+        with _failure("상관분석 실패"):
+            self._report("상관분석을 수행하는 중입니다...")
+            numeric_data = dataframe.select_dtypes(include=[np.number])
+            if len(numeric_data.columns) < 2:
+                raise AnalysisError("분석 오류", "상관분석에는 최소 2개의 숫자형 변수가 필요합니다.")
+
+            corr_matrix = numeric_data.corr()
+            strong = []
+            for i in range(len(corr_matrix.columns)):
+                for j in range(i + 1, len(corr_matrix.columns)):
+                    corr_value = corr_matrix.iloc[i, j]
+                    if abs(corr_value) > 0.7:
+                        strong.append(
+                            {
+                                "var1": corr_matrix.columns[i],
+                                "var2": corr_matrix.columns[j],
+                                "correlation": corr_value,
+                                "strength": self._get_correlation_strength(abs(corr_value)),
+                            }
+                        )
+
+            result = self._complete(_envelope("상관분석", f"{len(numeric_data.columns)}개 변수 간 상관관계 분석", {
+                "correlation_matrix": corr_matrix,
+                "strong_correlations": strong,
+                "variable_count": len(numeric_data.columns),
+                "total_pairs": len(corr_matrix.columns) * (len(corr_matrix.columns) - 1) // 2,
+            }))
+            self._report("상관분석이 완료되었습니다.")
+            return result
+
+    # DOE ANOVA -----------------------------------------------------------
+    def doe_anova(self, dataframe: pd.DataFrame, response: str, factors: list,
+                  bootstrap_samples: int = 0, bootstrap_method: str = "residual",
+                  bootstrap_seed: int = 0, max_workers: int = 1) -> AnalysisResult:
+        """
+        DOE용 ANOVA: 주효과 + 2요인 교호효과 포함
+
+        bootstrap_samples > 0 이면(기본 0, 선택) 계수의 부트스트랩 백분위/BCa 구간을 results["bootstrap"]에 첨부한다.
+        max_workers 는 부트스트랩 청크를 나눌 스레드 수.
+        """
+        df = self._prepare_model_frame(dataframe, response, factors)
+        with _failure("DOE ANOVA 실패"):
+            sm, smf = _statsmodels()
+            main_terms = " + ".join([f"C({f})" for f in factors])
+            inter_terms = " + ".join([f"C({f1}):C({f2})" for i, f1 in enumerate(factors) for f2 in factors[i + 1 :]])
+            formula = f"{response} ~ {main_terms}"
+            if inter_terms:
+                formula += " + " + inter_terms
+            main_only_formula = f"{response} ~ {main_terms}"
+
+            def fit_and_anova(frm):
+                model_local = smf.ols(formula=frm, data=df).fit()
+                if model_local.df_resid <= 0:
+                    raise ValueError("잔차 자유도가 0입니다.")
+                anova_local = sm.stats.anova_lm(model_local, typ=2)
+                return model_local, anova_local
+
+            # 단계적 단순화: (1) 주효과+교호 -> (2) 주효과 -> (3) 단일 요인
+            formulas = [
+                ("main+interaction", formula),
+                ("main_only", main_only_formula),
+            ]
+            # 단일 요인 후보
+            for f in factors:
+                formulas.append((f"single_factor:{f}", f"{response} ~ C({f})"))
+
+            model = anova_table = chosen_formula = None
+            fallback_reason = ""
+            for name, frm in formulas:
+                try:
+                    model, anova_table = fit_and_anova(frm)
+                except Exception:
+                    continue
+                chosen_formula = frm
+                fallback_reason = "" if name == "main+interaction" else name
+                break
+
+            if model is None:
+                raise AnalysisError(
+                    "분석 오류",
+                    "잔차 자유도가 0이거나 데이터가 부족합니다.\n"
+                    "요인 수준을 줄이거나(카테고리 합치기), 관측을 더 추가한 뒤 다시 시도하세요."
+                )
+
+            result = _envelope("DOE ANOVA", f"DOE ANOVA: response={response}, factors={', '.join(factors)}", {
+                "formula": chosen_formula,
+                "fallback": fallback_reason,
+                "anova": anova_table,
+                "factors": factors,
+                "response": response,
+                "coefficients": model.params,
+                "r_squared": model.rsquared,
+                "adj_r_squared": model.rsquared_adj,
+                "n_obs": int(model.nobs),
+                "residuals": self._result_array(model.resid),
+                "fitted": self._result_array(model.fittedvalues),
+            })
+            self._attach_loo_diagnostics(result["results"], model)
+            self._attach_bootstrap(result["results"], model, bootstrap_samples, bootstrap_method, bootstrap_seed,
+                                   max_workers)
+            result = self._complete(result)
+            self._report("DOE ANOVA가 완료되었습니다.")
+            return result
+
+    # 부분요인/직교/Taguchi용: 주효과 중심 ANOVA -------------------------
+    def main_effects_anova(self, dataframe: pd.DataFrame, response: str, factors: list,
+                           analysis_type="부분요인 ANOVA", bootstrap_samples: int = 0,
+                           bootstrap_method: str = "residual", bootstrap_seed: int = 0,
+                           best_subsets_top: int = 0, max_workers: int = 1) -> AnalysisResult:
+        df = self._prepare_model_frame(dataframe, response, factors)
+        with _failure(f"{analysis_type} 실패"):
+            sm, smf = _statsmodels()
+            main_terms = " + ".join([f"C({f})" for f in factors])
+            formula = f"{response} ~ {main_terms}"
+
+            model = smf.ols(formula=formula, data=df).fit()
+            anova_table = sm.stats.anova_lm(model, typ=2)
+
+            result = _envelope(analysis_type, f"{analysis_type}: response={response}, factors={', '.join(factors)}", {
+                "formula": formula,
+                "anova": anova_table,
+                "factors": factors,
+                "response": response,
+                "coefficients": model.params,
+                "r_squared": model.rsquared,
+                "adj_r_squared": model.rsquared_adj,
+                "n_obs": int(model.nobs),
+                "residuals": self._result_array(model.resid),
+                "fitted": self._result_array(model.fittedvalues),
+            })
+            self._attach_loo_diagnostics(result["results"], model)
+            self._attach_bootstrap(result["results"], model, bootstrap_samples, bootstrap_method, bootstrap_seed,
+                                   max_workers)
+            self._attach_best_subsets(result["results"], df, response, factors, best_subsets_top)
+            result = self._complete(result)
+            self._report(f"{analysis_type}가 완료되었습니다.")
+            return result
+
+    def factorial_effects(self, dataframe: pd.DataFrame, response: str, factors: list = None,
+                          alpha: float = 0.05) -> AnalysisResult:
+        """
+        2수준 (부분)요인 설계의 전체 효과를 Yates/FWHT 로 한 번에 추정 (utils.effects).
+        Lenth PSE 유의성, 반정규/정규 확률도 좌표, 파레토 순위를 포함한다.
+        factors 가 없으면 값이 정확히 2개인 열을 모두 요인으로 쓴다.
+        """
+        self._validate_data(dataframe)
+        if response not in dataframe.columns:
+            raise AnalysisError("분석 오류", "반응 열을 찾을 수 없습니다.")
+        with _failure("2수준 효과 분석 실패"):
+            from utils.effects import effects_from_frame, two_level_factors
+
+            factors = list(factors) if factors else two_level_factors(dataframe, exclude=(response,))
+            if not factors:
+                raise AnalysisError("분석 오류", "2수준 요인 열이 없습니다.")
+            self._report(f"{len(factors)}개 요인의 효과를 계산하는 중입니다...")
+            try:
+                estimates = effects_from_frame(dataframe, response, factors, alpha=alpha)
+            except ValueError as exc:
+                raise AnalysisError("분석 오류", str(exc)) from exc
+
+            active = estimates["active"]
+            result = self._complete(_envelope(
+                "2수준 효과 분석",
+                f"{response}: 효과 {len(estimates['effects'])}개, 유의 효과 {', '.join(active) if active else '없음'}",
+                {"response": response, "factors": factors, **estimates},
+            ))
+            self._report("2수준 효과 분석이 완료되었습니다.")
+            return result
+
+    def _prepare_model_frame(self, dataframe: pd.DataFrame, response: str, factors: list) -> pd.DataFrame:
+        """선형모형 DOE 분석 공통 검증: 반응 숫자 변환, 결측 제거, 표본 수 확인"""
+        if dataframe is None or dataframe.empty:
+            raise AnalysisError("분석 오류", "분석할 데이터가 없습니다.")
+        if response not in dataframe.columns or any(f not in dataframe.columns for f in factors):
+            raise AnalysisError("분석 오류", "요인/반응 열을 찾을 수 없습니다.")
+        df = dataframe.copy()
+        df[response] = pd.to_numeric(df[response], errors="coerce")
+        df = df.dropna(subset=[response] + factors)
+        if len(df) < len(factors) + 1:
+            raise AnalysisError("분석 오류", "표본 수가 부족합니다.")
+        return df
+
+    def _result_array(self, values):
+        """관측치 길이 결과 배열을 타입 배열(CompactArray)로 보관"""
+        from utils.compact_array import compact_array
+
+        return compact_array(values, dtype=self.result_array_dtype)
+
+    def _attach_loo_diagnostics(self, results: dict, model):
+        """PRESS/예측 R²/레버리지/스튜던트화 잔차/Cook 거리를 재적합 없이 첨부"""
+        try:
+            from utils.loo_diagnostics import ARRAY_KEYS, model_diagnostics
+
+            diagnostics = model_diagnostics(model)
+            for key in ARRAY_KEYS:
+                diagnostics[key] = self._result_array(diagnostics[key])
+            results.update(diagnostics)
+        except Exception as exc:
+            results["diagnostics_error"] = str(exc)
+
+    def _attach_bootstrap(self, results: dict, model, n_boot: int, method: str, seed: int, max_workers: int = 1):
+        """
+        계수 부트스트랩 구간을 결과에 첨부.
+        포화 설계 등으로 계산할 수 없으면 분석은 그대로 두고 사유만 기록한다.
+        """
+        if not n_boot or n_boot <= 0:
+            return
+        try:
+            from utils.bootstrap import bootstrap_model
+
+            results["bootstrap"] = bootstrap_model(model, n_boot=n_boot, method=method, seed=seed,
+                                                   max_workers=max_workers)
+        except Exception as exc:
+            results["bootstrap_error"] = str(exc)
+
+    def _attach_best_subsets(self, results: dict, df: pd.DataFrame, response: str, factors: list, top: int):
+        """스크리닝 설계용 크기별 상위 주효과 모형 첨부 (계산 불가 시 사유만 기록)"""
+        if not top or top <= 0:
+            return
+        try:
+            from utils.best_subsets import best_subsets, code_factors
+
+            results["best_subsets"] = best_subsets(
+                code_factors(df, factors), df[response].to_numpy(dtype=float), factors, top=top,
+            )
+        except Exception as exc:
+            results["best_subsets_error"] = str(exc)
+
+    def best_subsets(self, dataframe: pd.DataFrame, response: str, factors: list = None, max_size: int = None,
+                     top: int = 5, criterion: str = "adj_r2", time_budget: float = 10.0,
+                     max_workers: int = 1) -> AnalysisResult:
+        """
+        분기한정 전체 부분집합 회귀 (스크리닝 설계의 크기별 상위 주효과 모형).
+        요인은 숫자형 또는 2수준 범주형(-1/+1 코딩)이어야 한다.
+        """
+        self._validate_data(dataframe)
+        with _failure("부분집합 탐색 실패"):
+            if not factors:
+                factors = [c for c in dataframe.columns if c != response]
+            if response not in dataframe.columns or any(f not in dataframe.columns for f in factors):
+                raise AnalysisError("분석 오류", "요인/반응 열을 찾을 수 없습니다.")
+            df = dataframe[[response] + list(factors)].copy()
+            df[response] = pd.to_numeric(df[response], errors="coerce")
+            df = df.dropna()
+            if len(df) < 3:
+                raise AnalysisError("분석 오류", "표본 수가 부족합니다.")
+
+            from utils.best_subsets import best_subsets, code_factors
+
+            self._report(f"{len(factors)}개 요인의 부분집합 모형을 탐색하는 중입니다...")
+            search = best_subsets(
+                code_factors(df, factors), df[response].to_numpy(dtype=float), list(factors),
+                max_size=max_size, top=top, criterion=criterion, time_budget=time_budget, max_workers=max_workers,
+            )
+            best = search["best"] or {}
+            result = self._complete(_envelope(
+                "최적 부분집합 회귀", f"최적 부분집합({criterion}): {response} ~ {best.get('terms', '-')}", {
+                    "response": response,
+                    "factors": list(factors),
+                    "models": search["models"],
+                    "best": best,
+                    "criterion": criterion,
+                    "complete": search["complete"],
+                    "nodes": search["nodes"],
+                    "elapsed": search["elapsed"],
+                    "dropped": search["dropped"],
+                    "r_squared": best.get("r_squared"),
+                    "adj_r_squared": best.get("adj_r_squared"),
+                    "n_obs": int(len(df)),
+                },
+            ))
+            if search["complete"]:
+                self._report("부분집합 탐색이 완료되었습니다.")
+            else:
+                self._report("시간 제한으로 부분집합 탐색을 중단했습니다. (현재까지의 상위 모형)")
+            return result
+
+    # RSM/CCD/Box-Behnken: 2차 모델 적합 ---------------------------------
+    def rsm_quadratic(self, dataframe: pd.DataFrame, response: str, factors: list,
+                      analysis_type="RSM") -> AnalysisResult:
+        df = self._prepare_model_frame(dataframe, response, factors)
+        with _failure(f"{analysis_type} 실패"):
+            sm, smf = _statsmodels()
+            # 2차 모델 공식 생성: main + interaction + squared
+            terms = [f"{f}" for f in factors]
+            inter_terms = [f"{f1}:{f2}" for i, f1 in enumerate(factors) for f2 in factors[i + 1 :]]
+            quad_terms = [f"I({f}**2)" for f in factors]
+            formula_rhs = " + ".join(terms + inter_terms + quad_terms)
+            formula = f"{response} ~ {formula_rhs}"
+
+            model = smf.ols(formula=formula, data=df).fit()
+            anova_table = sm.stats.anova_lm(model, typ=2)
+
+            result = _envelope(analysis_type, f"{analysis_type}: response={response}, factors={', '.join(factors)}", {
+                "formula": formula,
+                "anova": anova_table,
+                "factors": factors,
+                "response": response,
+                "coefficients": model.params,
+                "r_squared": model.rsquared,
+                "adj_r_squared": model.rsquared_adj,
+                "n_obs": int(model.nobs),
+                "residuals": self._result_array(model.resid),
+                "fitted": self._result_array(model.fittedvalues),
+            })
+            self._attach_loo_diagnostics(result["results"], model)
+            self._attach_canonical_analysis(result["results"], df, response, factors)
+            result = self._complete(result)
+            self._report(f"{analysis_type}가 완료되었습니다.")
+            return result
+
+    def _attach_canonical_analysis(self, results: dict, df: pd.DataFrame, response: str, factors: list):
+        """정상점/정준분석 첨부 (계산할 수 없으면 사유만 기록)"""
+        try:
+            from utils.rsm import QuadraticModel
+
+            results["canonical_analysis"] = QuadraticModel.from_frame(df, response, factors).canonical_analysis()
+        except Exception as exc:
+            results["canonical_analysis_error"] = str(exc)
+
+    def rsm_surface(self, dataframe: pd.DataFrame, response: str, factors: list, x_factor: str = None,
+                    y_factor: str = None, resolution: int = 100, fixed: dict = None) -> AnalysisResult:
+        """
+        2차 모형의 두 요인 격자 예측값/표준오차 (나머지 요인은 fixed, 기본은 중심값).
+        등고선도/3D 표면도 데이터로 사용한다.
+        """
+        df = self._prepare_model_frame(dataframe, response, factors)
+        x_factor = x_factor or (factors[0] if factors else None)
+        y_factor = y_factor or (factors[1] if len(factors) > 1 else None)
+        if x_factor not in factors or y_factor not in factors or x_factor == y_factor:
+            raise AnalysisError("분석 오류", "격자 요인은 모형 요인 중 서로 다른 두 개여야 합니다.")
+        with _failure("RSM 격자 예측 실패"):
+            from utils.rsm import QuadraticModel
+
+            self._report("반응표면 격자를 계산하는 중입니다...")
+            try:
+                model = QuadraticModel.from_frame(df, response, factors)
+                grid = model.grid(x_factor, y_factor, resolution=resolution, fixed=fixed)
+            except ValueError as exc:
+                raise AnalysisError("분석 오류", str(exc)) from exc
+            canonical = model.canonical_analysis()
+
+            result = self._complete(_envelope(
+                "RSM 격자 예측", f"{response} 반응표면: {x_factor} × {y_factor} ({resolution}×{resolution})", {
+                    "response": response,
+                    "factors": factors,
+                    "x_factor": x_factor,
+                    "y_factor": y_factor,
+                    "resolution": int(resolution),
+                    "nature": canonical["nature"],
+                    "fixed": grid["fixed"],
+                    "canonical_analysis": canonical,
+                    "x": self._result_array(grid["x"]),
+                    "y": self._result_array(grid["y"]),
+                    "fit": self._result_array(grid["fit"]),
+                    "se": self._result_array(grid["se"]),
+                }))
+            self._report("반응표면 격자 계산이 완료되었습니다.")
+            return result
+
+    def desirability_optimization(self, dataframe: pd.DataFrame, goals: list, factors: list,
+                                  method: str = "lhs", n_candidates: int = 5000, n_starts: int = 10,
+                                  seed: int = 0, max_workers: int = 1) -> AnalysisResult:
+        """
+        반응별 2차 모형 위의 Derringer–Suich 만족도 최적화.
+        goals: [{"response", "goal": maximize|minimize|target, "lower", "upper", "target", ...}]
+        """
+        self._validate_data(dataframe)
+        if not factors or any(f not in dataframe.columns for f in factors):
+            raise AnalysisError("분석 오류", "요인 열을 찾을 수 없습니다.")
+        with _failure("만족도 최적화 실패"):
+            from utils.desirability import DesirabilityProblem, optimize
+
+            self._report("반응별 2차 모형을 적합하는 중입니다...")
+            try:
+                problem = DesirabilityProblem.from_frame(dataframe, goals, factors)
+                self._report(f"후보점 {n_candidates:,}개를 평가하고 국소 최적화하는 중입니다...")
+                search = optimize(problem, method=method, n_candidates=n_candidates, n_starts=n_starts,
+                                  seed=seed, max_workers=max_workers)
+            except ValueError as exc:
+                raise AnalysisError("분석 오류", str(exc)) from exc
+
+            best = search["best"]
+            result = self._complete(_envelope(
+                "만족도 최적화", f"{len(problem.responses)}개 반응 만족도 최적화: D = {best['overall']:.4f}", {
+                    "factors": list(factors),
+                    "responses": problem.responses,
+                    "method": method,
+                    "overall_desirability": best["overall"],
+                    "n_candidates": search["n_candidates"],
+                    "n_starts": search["n_starts"],
+                    "best_point": best["point"],
+                    "predictions": best["predictions"],
+                    "desirabilities": best["desirabilities"],
+                    "goals": problem.goals,
+                    "solutions": search["solutions"],
+                }))
+            self._report("만족도 최적화가 완료되었습니다.")
+            return result
+
+    # ANOVA ---------------------------------------------------------------
+    def anova(self, dataframe: pd.DataFrame) -> AnalysisResult:
+        self._validate_data(dataframe)
+        with _failure("ANOVA 실패"):
+            self._report("ANOVA 분석을 수행하는 중입니다...")
+            numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
+            categorical_cols = dataframe.select_dtypes(include=["object", "category"]).columns
+
+            if len(numeric_cols) == 0:
+                raise AnalysisError("분석 오류", "ANOVA에는 숫자형 종속변수가 필요합니다.")
+            if len(categorical_cols) == 0:
+                raise AnalysisError("분석 오류", "ANOVA에는 범주형 독립변수가 필요합니다.")
+
+            try:
+                from scipy import stats
+            except ImportError:
+                raise AnalysisError("분석 오류", "scipy가 설치되어 있지 않아 ANOVA를 실행할 수 없습니다.")
+
+            categorical_var = categorical_cols[0]
+            numeric_var = numeric_cols[0]
+
+            groups = []
+            names = []
+            for group_name in dataframe[categorical_var].dropna().unique():
+                group_data = dataframe[dataframe[categorical_var] == group_name][numeric_var].dropna()
+                if len(group_data) > 0:
+                    groups.append(group_data)
+                    names.append(str(group_name))
+
+            if len(groups) < 2:
+                raise AnalysisError("분석 오류", "ANOVA에는 최소 2개 이상의 그룹이 필요합니다.")
+
+            f_stat, p_value = stats.f_oneway(*groups)
+            group_stats = [
+                {
+                    "group": names[i],
+                    "count": len(group),
+                    "mean": group.mean(),
+                    "std": group.std(),
+                    "min": group.min(),
+                    "max": group.max(),
+                }
+                for i, group in enumerate(groups)
+            ]
+
+            result = self._complete(_envelope("ANOVA", f"{categorical_var} ~ {numeric_var} 일원분산분석", {
+                "independent_var": categorical_var,
+                "dependent_var": numeric_var,
+                "f_statistic": f_stat,
+                "p_value": p_value,
+                "significant": p_value < 0.05,
+                "group_count": len(groups),
+                "group_stats": group_stats,
+                "interpretation": self._interpret_anova_result(p_value),
+            }))
+            self._report("ANOVA 분석이 완료되었습니다.")
+            return result
+
+    # 순열검정 ANOVA ------------------------------------------------------
+    def permutation_anova(self, dataframe: pd.DataFrame, response: str = None, factors: list = None,
+                          interactions: bool = False, n_permutations: int = 4999, seed: int = 0,
+                          max_workers: int = 1) -> AnalysisResult:
+        """
+        F 분포 대신 순열 분포로 p-값을 구하는 ANOVA (치우친 계수형 반응 등).
+        response/factors 를 생략하면 anova 와 같이 첫 숫자형/범주형 열을 사용한다.
+        """
+        self._validate_data(dataframe)
+        with _failure("순열 ANOVA 실패"):
+            if response is None:
+                numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
+                if len(numeric_cols) == 0:
+                    raise AnalysisError("분석 오류", "ANOVA에는 숫자형 종속변수가 필요합니다.")
+                response = numeric_cols[0]
+            if not factors:
+                categorical_cols = dataframe.select_dtypes(include=["object", "category"]).columns
+                if len(categorical_cols) == 0:
+                    raise AnalysisError("분석 오류", "ANOVA에는 범주형 독립변수가 필요합니다.")
+                factors = [categorical_cols[0]]
+            if response not in dataframe.columns or any(f not in dataframe.columns for f in factors):
+                raise AnalysisError("분석 오류", "요인/반응 열을 찾을 수 없습니다.")
+            if n_permutations < 1:
+                raise AnalysisError("분석 오류", "순열 횟수는 1 이상이어야 합니다.")
+
+            from utils.permutation_anova import permutation_anova
+
+            self._report(f"순열 {n_permutations:,}회로 ANOVA를 수행하는 중입니다...")
+            perm = permutation_anova(
+                dataframe, response, factors, interactions=interactions,
+                n_permutations=n_permutations, seed=seed, max_workers=max_workers,
+            )
+            anova_table = perm["anova"]
+            first = anova_table.iloc[0]
+            p_value = float(first["PR(perm)"])
+
+            result = self._complete(_envelope(
+                "순열 ANOVA",
+                f"순열 ANOVA: response={response}, factors={', '.join(factors)} ({n_permutations:,}회)",
+                {
+                    "response": response,
+                    "factors": list(factors),
+                    "anova": anova_table,
+                    "method": perm["method"],
+                    "n_permutations": perm["n_permutations"],
+                    "seed": seed,
+                    "f_statistic": float(first["F"]),
+                    "p_value": p_value,
+                    "significant": p_value < 0.05,
+                    "interpretation": self._interpret_anova_result(p_value),
+                },
+            ))
+            self._report("순열 ANOVA가 완료되었습니다.")
+            return result
+
+    # 회귀분석 -------------------------------------------------------------
+    def regression(self, dataframe: pd.DataFrame) -> AnalysisResult:
+        self._validate_data(dataframe)
+        with _failure("회귀분석 실패"):
+            self._report("회귀분석을 수행하는 중입니다...")
+            numeric_data = dataframe.select_dtypes(include=[np.number])
+            if len(numeric_data.columns) < 2:
+                raise AnalysisError("분석 오류", "회귀분석에는 최소 2개의 숫자형 변수가 필요합니다.")
+
+            try:
+                from sklearn.linear_model import LinearRegression
+                from sklearn.metrics import mean_squared_error, r2_score
+            except ImportError:
+                raise AnalysisError("분석 오류", "scikit-learn이 설치되어 있지 않아 회귀분석을 실행할 수 없습니다.")
+
+            y = numeric_data.iloc[:, 0].dropna()
+            X = numeric_data.iloc[:, 1:].dropna()
+            common_index = y.index.intersection(X.index)
+            y = y.loc[common_index]
+            X = X.loc[common_index]
+
+            if len(y) < 3:
+                raise AnalysisError("분석 오류", "회귀분석에는 최소 3개 이상의 관측치가 필요합니다.")
+
+            model = LinearRegression()
+            model.fit(X, y)
+            y_pred = model.predict(X)
+
+            r2 = r2_score(y, y_pred)
+            mse = mean_squared_error(y, y_pred)
+            rmse = np.sqrt(mse)
+
+            coefficients = [
+                {"variable": col, "coefficient": model.coef_[i], "abs_coefficient": abs(model.coef_[i])}
+                for i, col in enumerate(X.columns)
+            ]
+
+            result = self._complete(_envelope("회귀분석", f"{y.name} ~ {len(X.columns)}개 변수의 선형회귀", {
+                "dependent_var": y.name,
+                "independent_vars": list(X.columns),
+                "intercept": model.intercept_,
+                "coefficients": coefficients,
+                "r_squared": r2,
+                "rmse": rmse,
+                "observations": len(y),
+                "model_fit": self._interpret_r_squared(r2),
+            }))
+            self._report("회귀분석이 완료되었습니다.")
+            return result
+
+    def stepwise_regression(self, dataframe: pd.DataFrame, response: str = None, predictors: list = None,
+                            direction: str = "stepwise", criterion: str = "aic",
+                            alpha_enter: float = 0.15, alpha_remove: float = 0.15) -> AnalysisResult:
+        """
+        스윕 연산자 기반 단계적/전진/후진 변수 선택 회귀.
+        predictors 를 생략하면 response 를 제외한 모든 숫자형 열을 후보로 사용한다.
+        """
+        self._validate_data(dataframe)
+        with _failure("단계적 회귀 실패"):
+            numeric_cols = [c for c in dataframe.select_dtypes(include=[np.number]).columns]
+            if response is None:
+                if not numeric_cols:
+                    raise AnalysisError("분석 오류", "회귀분석에는 숫자형 종속변수가 필요합니다.")
+                response = numeric_cols[0]
+            if not predictors:
+                predictors = [c for c in numeric_cols if c != response]
+            if response not in dataframe.columns or any(p not in dataframe.columns for p in predictors):
+                raise AnalysisError("분석 오류", "반응/후보 변수 열을 찾을 수 없습니다.")
+            if not predictors:
+                raise AnalysisError("분석 오류", "단계적 회귀에는 최소 1개의 후보 변수가 필요합니다.")
+
+            data = dataframe[[response] + list(predictors)].apply(pd.to_numeric, errors="coerce").dropna()
+            if len(data) < 3:
+                raise AnalysisError("분석 오류", "회귀분석에는 최소 3개 이상의 관측치가 필요합니다.")
+
+            from utils.stepwise import stepwise_select
+
+            self._report("단계적 회귀분석을 수행하는 중입니다...")
+            selection = stepwise_select(
+                data[list(predictors)].to_numpy(dtype=float), data[response].to_numpy(dtype=float),
+                list(predictors), direction=direction, criterion=criterion,
+                alpha_enter=alpha_enter, alpha_remove=alpha_remove,
+            )
+            selected = selection["selected"]
+            r2 = selection["r_squared"]
+
+            result = self._complete(_envelope(
+                "단계적 회귀",
+                f"단계적 회귀({direction}, {criterion}): {response} ~ {', '.join(selected) or '절편'}",
+                {
+                    "dependent_var": response,
+                    "candidates": list(predictors),
+                    "selected": selected,
+                    "direction": direction,
+                    "criterion": criterion,
+                    "path": selection["path"],
+                    "coefficients": selection["coefficients"],
+                    "std_errors": selection["std_errors"],
+                    "p_values": selection["p_values"],
+                    "r_squared": r2,
+                    "adj_r_squared": selection["adj_r_squared"],
+                    "aic": selection["aic"],
+                    "bic": selection["bic"],
+                    "observations": selection["n_obs"],
+                    "fitted": self._result_array(selection["fitted"]),
+                    "residuals": self._result_array(selection["residuals"]),
+                    "model_fit": self._interpret_r_squared(r2),
+                },
+            ))
+            self._report("단계적 회귀분석이 완료되었습니다.")
+            return result
+
+    # 검증/해석 -----------------------------------------------------------
+    def _validate_data(self, dataframe: pd.DataFrame):
+        if dataframe is None or dataframe.empty:
+            raise AnalysisError("분석 오류", "분석할 데이터가 없습니다.")
+        if len(dataframe) < 3:
+            raise AnalysisError("분석 오류", "분석에는 최소 3행 이상의 데이터가 필요합니다.")
+
+    def _get_correlation_strength(self, abs_corr: float) -> str:
+        if abs_corr >= 0.9:
+            return "매우 강함"
+        elif abs_corr >= 0.7:
+            return "강함"
+        elif abs_corr >= 0.5:
+            return "보통"
+        elif abs_corr >= 0.3:
+            return "약함"
+        else:
+            return "매우 약함"
+
+    def _interpret_anova_result(self, p_value: float) -> str:
+        if p_value < 0.001:
+            return "그룹 차이가 매우 유의함 (p < 0.001)"
+        elif p_value < 0.01:
+            return "그룹 차이가 유의함 (p < 0.01)"
+        elif p_value < 0.05:
+            return "그룹 차이가 유의함 (p < 0.05)"
+        else:
+            return "그룹 차이가 통계적으로 유의하지 않음 (p ≥ 0.05)"
+
+    def _interpret_r_squared(self, r2: float) -> str:
+        if r2 >= 0.9:
+            return "매우 좋은 적합"
+        elif r2 >= 0.7:
+            return "좋은 적합"
+        elif r2 >= 0.5:
+            return "보통 적합"
+        elif r2 >= 0.3:
+            return "낮은 적합"
+        else:
+            return "매우 낮은 적합"
@@ -0,0 +1,649 @@
+"""
+차트 생성 코어 (Qt 비의존)
+
+create_chart 는 차트 정보 dict(figure 포함)를 반환하거나 ChartError(제목, 메시지)를 발생시킨다.
+matplotlib/seaborn 은 ChartBuilder 를 처음 만들 때 로드한다.
+FigurePool 을 넘기면 매번 새 Figure 를 만들지 않고 스레드별 Figure 를 비워서 재사용한다. (웹 렌더러용)
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.errors import ChartError
+
+
+def _plotting():
+    """(pyplot, seaborn)"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    return plt, sns
+
+
+class FigurePool:
+    """
+    스레드별로 하나의 Figure(Agg 캔버스)를 두고 렌더링마다 비워서 재사용한다.
+    pyplot 전역 상태에 등록되지 않으므로 plt.close 가 필요 없다.
+    반환된 Figure 는 같은 스레드의 다음 acquire 때 지워지므로 그 전에 이미지로 변환해야 한다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def acquire(self, figsize, dpi, projection=None):
+        """비운 Figure 와 새 Axes 반환 (projection="3d" 이면 3D Axes)"""
+        fig = getattr(self._local, "figure", None)
+        if fig is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            fig = Figure()
+            FigureCanvasAgg(fig)
+            self._local.figure = fig
+        else:
+            fig.clear()
+        import matplotlib as mpl
+
+        # 이전 렌더링의 tight_layout 여백을 기본값으로 되돌림
+        fig.subplots_adjust(**{k: mpl.rcParams[f"figure.subplot.{k}"]
+                               for k in ("left", "right", "bottom", "top", "wspace", "hspace")})
+        fig.set_dpi(dpi)
+        fig.set_size_inches(figsize, forward=False)
+        return fig, fig.add_subplot(projection=projection)
+
+
+# 반응표면 (등고선도/3D 표면도) --------------------------------------------
+def response_surface_grid(df: pd.DataFrame, response: str, factors: List[str], x_var: str, y_var: str,
+                          resolution: int = 100, fixed: Optional[Dict[str, float]] = None):
+    """2차 모형 적합 후 (모형, 격자 예측) - 데스크톱 ChartView 와 ChartBuilder 공용"""
+    from utils.rsm import QuadraticModel
+
+    factors = list(factors or [x_var, y_var])
+    for name in (x_var, y_var):
+        if name not in factors:
+            factors.append(name)
+    missing = [c for c in [response] + factors if c not in df.columns]
+    if missing:
+        raise ChartError("차트 오류", f"변수를 찾을 수 없습니다: {', '.join(missing)}")
+    try:
+        model = QuadraticModel.from_frame(df, response, factors)
+        return model, model.grid(x_var, y_var, resolution=resolution, fixed=fixed)
+    except ValueError as exc:
+        raise ChartError("차트 오류", str(exc)) from exc
+
+
+def _stationary_in_slice(model, grid):
+    """격자 평면 위에 있는 정상점 (x, y, 종류) - 요인이 2개일 때만 평면이 정상점을 지난다"""
+    if model.k != 2:
+        return None
+    canonical = model.canonical_analysis()
+    point = canonical["stationary_point"]
+    if point is None:
+        return None
+    x, y = point[grid["x_factor"]], point[grid["y_factor"]]
+    if grid["x"][0] <= x <= grid["x"][-1] and grid["y"][0] <= y <= grid["y"][-1]:
+        return x, y, canonical["nature"]
+    return None
+
+
+def draw_response_contour(fig, ax, model, grid, data: Optional[pd.DataFrame] = None, levels: int = 20):
+    """격자 예측 등고선 + 실험점 + 정상점"""
+    filled = ax.contourf(grid["x"], grid["y"], grid["fit"], levels=levels, cmap="viridis")
+    lines = ax.contour(grid["x"], grid["y"], grid["fit"], levels=filled.levels[::2], colors="k", linewidths=0.5)
+    ax.clabel(lines, fmt="%.3g", fontsize=8)
+    fig.colorbar(filled, ax=ax, label=model.response)
+    if data is not None:
+        points = data[[grid["x_factor"], grid["y_factor"]]].apply(pd.to_numeric, errors="coerce").dropna()
+        ax.scatter(points.iloc[:, 0], points.iloc[:, 1], c="white", edgecolors="k", s=25, label="실험점")
+    stationary = _stationary_in_slice(model, grid)
+    if stationary is not None:
+        ax.plot(stationary[0], stationary[1], "r*", markersize=14, label=f"정상점 ({stationary[2]})")
+    ax.set_xlabel(grid["x_factor"])
+    ax.set_ylabel(grid["y_factor"])
+    ax.set_title(f"{model.response} 등고선도")
+    if grid["fixed"]:
+        ax.text(0.01, 0.01, ", ".join(f"{k}={v:.3g}" for k, v in grid["fixed"].items()),
+                transform=ax.transAxes, fontsize=8, va="bottom")
+
+
+def draw_response_surface(fig, ax, model, grid):
+    """격자 예측 3D 표면 (ax 는 3D Axes)"""
+    gx, gy = np.meshgrid(grid["x"], grid["y"])
+    surface = ax.plot_surface(gx, gy, grid["fit"], cmap="viridis", linewidth=0, antialiased=False)
+    fig.colorbar(surface, ax=ax, shrink=0.6)
+    ax.set_xlabel(grid["x_factor"])
+    ax.set_ylabel(grid["y_factor"])
+    ax.set_zlabel(model.response)
+    ax.set_title(f"{model.response} 반응표면")
+
+
+# 2수준 효과 (파레토 차트/효과 정규확률도) --------------------------------
+def factorial_effects_table(df: pd.DataFrame, response: str, factors: Optional[List[str]] = None,
+                            alpha: float = 0.05) -> Dict[str, Any]:
+    """utils.effects 추정 결과 - 데스크톱 ChartView 와 ChartBuilder 공용 (요인 기본값: 값이 2개인 열)"""
+    from utils.effects import effects_from_frame, two_level_factors
+
+    if not response or response not in df.columns:
+        raise ChartError("차트 오류", "효과 차트에는 반응 변수가 필요합니다.")
+    factors = list(factors) if factors else two_level_factors(df, exclude=(response,))
+    if not factors:
+        raise ChartError("차트 오류", "2수준 요인 열이 없습니다.")
+    try:
+        return effects_from_frame(df, response, factors, alpha=alpha)
+    except ValueError as exc:
+        raise ChartError("차트 오류", str(exc)) from exc
+
+
+def _significant(table: pd.DataFrame) -> np.ndarray:
+    if "significant" in table:
+        return table["significant"].to_numpy(dtype=bool)
+    return np.zeros(len(table), dtype=bool)
+
+
+def draw_effects_pareto(fig, ax, estimates: Dict[str, Any], response: str, top: int = 30):
+    """|효과|/PSE (Lenth t) 막대 + ME/SME 기준선. PSE 를 구할 수 없으면 |효과| 막대"""
+    table = estimates["effects"].sort_values("pareto_rank").head(top)
+    pse = estimates.get("pse")
+    scale = pse if pse else 1.0
+    values = table["effect"].abs().to_numpy() / scale
+    positions = np.arange(len(table))[::-1]
+    ax.barh(positions, values, color=np.where(_significant(table), "tab:red", "tab:blue"))
+    ax.set_yticks(positions)
+    ax.set_yticklabels(table["term"])
+    if pse:
+        alpha = estimates.get("alpha", 0.05)
+        ax.axvline(estimates["margin_of_error"] / pse, color="k", linestyle="--", linewidth=1,
+                   label=f"ME (α={alpha:g})")
+        ax.axvline(estimates["simultaneous_margin"] / pse, color="gray", linestyle=":", linewidth=1, label="SME")
+        ax.set_xlabel("|효과| / PSE (Lenth t)")
+    else:
+        ax.set_xlabel("|효과|")
+    ax.set_title(f"{response} 효과 파레토 차트" + (f" (상위 {top}개)" if len(estimates["effects"]) > top else ""))
+
+
+def draw_effects_probability(fig, ax, estimates: Dict[str, Any], response: str, half_normal: bool = True,
+                             max_labels: int = 20):
+    """효과 (반)정규확률도. 유의 효과는 빨간 점과 이름, 기준선은 기울기 PSE"""
+    table = estimates["effects"]
+    if half_normal:
+        x, q = table["effect"].abs().to_numpy(), table["half_normal_q"].to_numpy()
+    else:
+        x, q = table["effect"].to_numpy(), table["normal_q"].to_numpy()
+    significant = _significant(table)
+    ax.scatter(x[~significant], q[~significant], s=20, c="tab:blue", label="효과")
+    if significant.any():
+        ax.scatter(x[significant], q[significant], s=30, c="tab:red", label="유의 효과 (Lenth ME)")
+    pse = estimates.get("pse")
+    if pse:
+        line = np.array([0.0 if half_normal else q.min(), q.max()])
+        ax.plot(pse * line, line, color="k", linewidth=1, linestyle="--", label="PSE 기준선")
+    labelled = np.flatnonzero(significant)
+    if not len(labelled):
+        labelled = np.argsort(-np.abs(x))[:3]
+    for i in labelled[:max_labels]:
+        ax.annotate(table["term"].iloc[i], (x[i], q[i]), textcoords="offset points", xytext=(4, 2), fontsize=8)
+    ax.set_xlabel("|효과|" if half_normal else "효과")
+    ax.set_ylabel("반정규 분위수" if half_normal else "정규 분위수")
+    ax.set_title(f"{response} 효과 {'반정규' if half_normal else '정규'}확률도")
+
+
+class ChartBuilder:
+    """
+    차트 생성기. 데스크톱(ChartController)과 웹(ChartService)이 공통으로 사용한다.
+    """
+
+    def __init__(self, progress: Optional[Callable[[str], None]] = None,
+                 figure_pool: Optional[FigurePool] = None):
+        self._progress = progress
+        self.figure_pool = figure_pool
+
+        from utils.font_manager import get_font_manager
+
+        # 한글 폰트 설정
+        self.font_manager = get_font_manager()
+        self.font_manager.setup_default_font()
+
+        # 지원하는 차트 타입
+        self.supported_chart_types = {
+            "히스토그램": self._create_histogram,
+            "박스플롯": self._create_boxplot,
+            "산점도": self._create_scatter,
+            "선 그래프": self._create_line_plot,
+            "막대 그래프": self._create_bar_plot,
+            "상관행렬": self._create_correlation_matrix,
+            "주효과도": self._create_main_effects_plot,
+            "상호작용도": self._create_interaction_plot,
+            "등고선도": self._create_contour_plot,
+            "3D 표면도": self._create_surface_plot,
+            "파레토 차트": self._create_pareto_chart,
+            "정규확률도": self._create_normal_plot,
+        }
+
+    def create_chart(self, chart_type: str, dataframe: pd.DataFrame,
+                     x_var: str = None, y_var: str = None, group_var: str = None,
+                     options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        차트를 생성하고 차트 정보를 반환합니다.
+
+        Args:
+            chart_type: 차트 유형
+            dataframe: 데이터프레임
+            x_var: X축 변수
+            y_var: Y축 변수
+            group_var: 그룹 변수 (선택적)
+            options: 차트 옵션 딕셔너리
+
+        Raises:
+            ChartError: 입력이 유효하지 않거나 차트를 만들 수 없을 때
+        """
+        self._validate_inputs(chart_type, dataframe, x_var, y_var)
+
+        try:
+            if self._progress is not None:
+                self._progress(f"{chart_type} 차트를 생성하는 중...")
+
+            # 기본 옵션 설정
+            default_options = {
+                'show_grid': True,
+                'show_legend': True,
+                'bins': 20,
+                'figsize': (10, 6),
+                'dpi': 100
+            }
+            default_options.update(options or {})
+
+            # 차트 생성
+            chart_func = self.supported_chart_types[chart_type]
+            figure = chart_func(dataframe, x_var, y_var, group_var, default_options)
+        except ChartError:
+            raise
+        except Exception as e:
+            raise ChartError("차트 생성 실패", f"차트를 생성하는 중 오류가 발생했습니다:\n{str(e)}") from e
+
+        # 차트 정보 생성
+        return {
+            'type': chart_type,
+            'timestamp': datetime.now().strftime('%H:%M:%S'),
+            'x_variable': x_var,
+            'y_variable': y_var,
+            'group_variable': group_var if group_var != "없음" else None,
+            'options': default_options,
+            'figure': figure,
+            'description': self._generate_chart_description(chart_type, x_var, y_var, group_var)
+        }
+
+    def _figure(self, options: Dict[str, Any], projection: str = None):
+        """(Figure, Axes) - FigurePool 이 있으면 재사용, 없으면 pyplot 으로 새로 생성"""
+        if self.figure_pool is not None:
+            return self.figure_pool.acquire(options['figsize'], options['dpi'], projection=projection)
+        plt, _ = _plotting()
+        return plt.subplots(figsize=options['figsize'], dpi=options['dpi'],
+                            subplot_kw={'projection': projection} if projection else None)
+
+    def _validate_inputs(self, chart_type: str, dataframe: pd.DataFrame,
+                         x_var: str, y_var: str):
+        """입력값 유효성 검증"""
+        if chart_type not in self.supported_chart_types:
+            raise ChartError("차트 오류", f"지원하지 않는 차트 유형입니다: {chart_type}")
+
+        if dataframe is None or dataframe.empty:
+            raise ChartError("차트 오류", "차트를 그릴 데이터가 없습니다.")
+
+        # 차트 유형별 변수 요구사항 검증
+        if chart_type in ["히스토그램"] and not x_var:
+            raise ChartError("차트 오류", f"{chart_type}에는 X축 변수가 필요합니다.")
+
+        if chart_type in ["산점도", "선 그래프", "막대 그래프"] and (not x_var or not y_var):
+            raise ChartError("차트 오류", f"{chart_type}에는 X축과 Y축 변수가 모두 필요합니다.")
+
+        if chart_type in ["등고선도", "3D 표면도"] and (not x_var or not y_var or x_var == y_var):
+            raise ChartError("차트 오류", f"{chart_type}에는 서로 다른 X축/Y축 요인이 필요합니다.")
+
+    def _create_histogram(self, df: pd.DataFrame, x_var: str, y_var: str,
+                         group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """히스토그램 생성"""
+        fig, ax = self._figure(options)
+
+        if x_var not in df.columns:
+            raise ChartError("차트 오류", f"변수 '{x_var}'를 찾을 수 없습니다.")
+
+        data = df[x_var].dropna()
+
+        if group_var and group_var != "없음" and group_var in df.columns:
+            # 그룹별 히스토그램
+            groups = df.groupby(group_var)[x_var].apply(lambda x: x.dropna())
+            for name, group_data in groups.items():
+                ax.hist(group_data, bins=options['bins'], alpha=0.7, label=str(name))
+            if options['show_legend']:
+                ax.legend()
+        else:
+            # 단일 히스토그램
+            ax.hist(data, bins=options['bins'], alpha=0.7)
+
+        ax.set_xlabel(x_var)
+        ax.set_ylabel('빈도수')
+        ax.set_title(f'{x_var}의 분포')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_boxplot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                       group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """박스플롯 생성"""
+        _, sns = _plotting()
+        fig, ax = self._figure(options)
+
+        if y_var and y_var in df.columns:
+            # Y축 변수가 있는 경우
+            if x_var and x_var in df.columns:
+                # X축 변수도 있는 경우 (그룹별 박스플롯)
+                sns.boxplot(data=df, x=x_var, y=y_var, ax=ax)
+            else:
+                # Y축 변수만 있는 경우
+                sns.boxplot(data=df, y=y_var, ax=ax)
+        else:
+            # X축 변수만 있는 경우
+            if x_var in df.columns:
+                sns.boxplot(data=df, y=x_var, ax=ax)
+            else:
+                raise ChartError("차트 오류", "박스플롯에 사용할 변수를 찾을 수 없습니다.")
+
+        ax.set_title('박스플롯')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_scatter(self, df: pd.DataFrame, x_var: str, y_var: str,
+                       group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """산점도 생성"""
+        fig, ax = self._figure(options)
+
+        if x_var not in df.columns or y_var not in df.columns:
+            raise ChartError("차트 오류", f"변수 '{x_var}' 또는 '{y_var}'를 찾을 수 없습니다.")
+
+        if group_var and group_var != "없음" and group_var in df.columns:
+            # 그룹별 산점도
+            groups = df[group_var].unique()
+            for group in groups:
+                group_data = df[df[group_var] == group]
+                ax.scatter(group_data[x_var], group_data[y_var],
+                          label=str(group), alpha=0.7)
+            if options['show_legend']:
+                ax.legend()
+        else:
+            # 단일 산점도
+            ax.scatter(df[x_var], df[y_var], alpha=0.7)
+
+        ax.set_xlabel(x_var)
+        ax.set_ylabel(y_var)
+        ax.set_title(f'{x_var} vs {y_var}')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_line_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                         group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """선 그래프 생성"""
+        fig, ax = self._figure(options)
+
+        if x_var not in df.columns or y_var not in df.columns:
+            raise ChartError("차트 오류", f"변수 '{x_var}' 또는 '{y_var}'를 찾을 수 없습니다.")
+
+        if group_var and group_var != "없음" and group_var in df.columns:
+            # 그룹별 선 그래프
+            groups = df[group_var].unique()
+            for group in groups:
+                group_data = df[df[group_var] == group].sort_values(x_var)
+                ax.plot(group_data[x_var], group_data[y_var],
+                       marker='o', label=str(group))
+            if options['show_legend']:
+                ax.legend()
+        else:
+            # 단일 선 그래프
+            sorted_df = df.sort_values(x_var)
+            ax.plot(sorted_df[x_var], sorted_df[y_var], marker='o')
+
+        ax.set_xlabel(x_var)
+        ax.set_ylabel(y_var)
+        ax.set_title(f'{x_var} vs {y_var}')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_bar_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                        group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """막대 그래프 생성"""
+        _, sns = _plotting()
+        fig, ax = self._figure(options)
+
+        if x_var not in df.columns or y_var not in df.columns:
+            raise ChartError("차트 오류", f"변수 '{x_var}' 또는 '{y_var}'를 찾을 수 없습니다.")
+
+        if group_var and group_var != "없음" and group_var in df.columns:
+            # 그룹별 막대 그래프
+            sns.barplot(data=df, x=x_var, y=y_var, hue=group_var, ax=ax)
+        else:
+            # 단일 막대 그래프
+            if df[x_var].dtype == 'object' or df[x_var].dtype.name == 'category':
+                # 범주형 X축
+                sns.barplot(data=df, x=x_var, y=y_var, ax=ax)
+            else:
+                # 연속형 X축을 범주화
+                df_copy = df.copy()
+                df_copy[x_var + '_binned'] = pd.cut(df_copy[x_var], bins=10)
+                grouped = df_copy.groupby(x_var + '_binned')[y_var].mean()
+                ax.bar(range(len(grouped)), grouped.values)
+                ax.set_xticks(range(len(grouped)))
+                ax.set_xticklabels([str(x) for x in grouped.index], rotation=45)
+
+        ax.set_xlabel(x_var)
+        ax.set_ylabel(y_var)
+        ax.set_title(f'{x_var}별 {y_var}')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_correlation_matrix(self, df: pd.DataFrame, x_var: str, y_var: str,
+                                  group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """상관행렬 히트맵 생성"""
+        _, sns = _plotting()
+        fig, ax = self._figure(options)
+
+        # 숫자형 변수만 선택
+        numeric_df = df.select_dtypes(include=[np.number])
+
+        if numeric_df.empty:
+            raise ChartError("차트 오류", "상관행렬을 생성할 숫자형 데이터가 없습니다.")
+
+        # 상관행렬 계산
+        corr_matrix = numeric_df.corr()
+
+        # 히트맵 생성
+        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
+                   square=True, linewidths=0.5, ax=ax)
+
+        ax.set_title('변수 간 상관관계')
+
+        fig.tight_layout()
+        return fig
+
+    def _create_main_effects_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                                 group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """주효과도 생성"""
+        fig, ax = self._figure(options)
+
+        # 범주형 변수들 찾기
+        categorical_vars = df.select_dtypes(include=['object', 'category']).columns
+        numeric_vars = df.select_dtypes(include=[np.number]).columns
+
+        if len(categorical_vars) == 0 or len(numeric_vars) == 0:
+            raise ChartError("차트 오류", "주효과도를 생성하려면 범주형 변수와 숫자형 변수가 필요합니다.")
+
+        # 기본값 설정
+        if not y_var or y_var not in numeric_vars:
+            y_var = numeric_vars[0]
+        if not x_var or x_var not in categorical_vars:
+            x_var = categorical_vars[0]
+
+        # 주효과 계산 및 플롯
+        grouped = df.groupby(x_var)[y_var].mean()
+        ax.plot(range(len(grouped)), grouped.values, 'bo-', linewidth=2, markersize=8)
+
+        ax.set_xticks(range(len(grouped)))
+        ax.set_xticklabels(grouped.index)
+        ax.set_xlabel(x_var)
+        ax.set_ylabel(f'{y_var}의 평균')
+        ax.set_title(f'{x_var}의 주효과')
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _create_interaction_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                                group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """상호작용도 생성"""
+        fig, ax = self._figure(options)
+
+        # 범주형 변수들 찾기
+        categorical_vars = df.select_dtypes(include=['object', 'category']).columns
+        numeric_vars = df.select_dtypes(include=[np.number]).columns
+
+        if len(categorical_vars) < 2 or len(numeric_vars) == 0:
+            raise ChartError("차트 오류", "상호작용도를 생성하려면 최소 2개의 범주형 변수와 1개의 숫자형 변수가 필요합니다.")
+
+        # 기본값 설정
+        if not y_var or y_var not in numeric_vars:
+            y_var = numeric_vars[0]
+        if not x_var or x_var not in categorical_vars:
+            x_var = categorical_vars[0]
+        if not group_var or group_var not in categorical_vars:
+            remaining_cats = [col for col in categorical_vars if col != x_var]
+            group_var = remaining_cats[0] if remaining_cats else None
+
+        if not group_var:
+            raise ChartError("차트 오류", "상호작용도를 위한 두 번째 범주형 변수를 찾을 수 없습니다.")
+
+        # 상호작용 플롯 생성
+        for group_val in df[group_var].unique():
+            group_data = df[df[group_var] == group_val]
+            grouped = group_data.groupby(x_var)[y_var].mean()
+            ax.plot(range(len(grouped)), grouped.values, 'o-',
+                   label=f'{group_var}={group_val}', linewidth=2, markersize=6)
+
+        ax.set_xticks(range(len(df[x_var].unique())))
+        ax.set_xticklabels(df[x_var].unique())
+        ax.set_xlabel(x_var)
+        ax.set_ylabel(f'{y_var}의 평균')
+        ax.set_title(f'{x_var}와 {group_var}의 상호작용')
+
+        if options['show_legend']:
+            ax.legend()
+
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return fig
+
+    def _response_surface(self, df: pd.DataFrame, x_var: str, y_var: str, options: Dict[str, Any]):
+        """options: response(필수), factors(기본 [x, y]), resolution(기본 100), fixed"""
+        response = options.get('response')
+        if not response:
+            raise ChartError("차트 오류", "반응표면 차트에는 반응 변수(options.response)가 필요합니다.")
+        return response_surface_grid(df, response, options.get('factors'), x_var, y_var,
+                                     resolution=options.get('resolution', 100), fixed=options.get('fixed'))
+
+    def _create_contour_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                             group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """2차 반응표면 등고선도"""
+        model, grid = self._response_surface(df, x_var, y_var, options)
+        fig, ax = self._figure(options)
+        draw_response_contour(fig, ax, model, grid, data=df, levels=options.get('levels', 20))
+        if options['show_legend'] and ax.get_legend_handles_labels()[0]:
+            ax.legend(loc='upper right', fontsize=8)
+        fig.tight_layout()
+        return fig
+
+    def _create_surface_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                             group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """2차 반응표면 3D 표면도"""
+        model, grid = self._response_surface(df, x_var, y_var, options)
+        fig, ax = self._figure(options, projection='3d')
+        draw_response_surface(fig, ax, model, grid)
+        return fig
+
+    def _factorial_effects(self, df: pd.DataFrame, y_var: str, options: Dict[str, Any]):
+        """options: response(기본 y_var), factors(기본: 값이 2개인 열), alpha(기본 0.05)"""
+        response = options.get('response') or y_var
+        return response, factorial_effects_table(df, response, options.get('factors'),
+                                                 alpha=options.get('alpha', 0.05))
+
+    def _create_pareto_chart(self, df: pd.DataFrame, x_var: str, y_var: str,
+                             group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """2수준 효과 파레토 차트 (Lenth ME/SME 기준선)"""
+        response, estimates = self._factorial_effects(df, y_var, options)
+        fig, ax = self._figure(options)
+        draw_effects_pareto(fig, ax, estimates, response, top=options.get('top', 30))
+        if options['show_legend'] and ax.get_legend_handles_labels()[0]:
+            ax.legend(loc='lower right', fontsize=8)
+        if options['show_grid']:
+            ax.grid(True, axis='x', alpha=0.3)
+        fig.tight_layout()
+        return fig
+
+    def _create_normal_plot(self, df: pd.DataFrame, x_var: str, y_var: str,
+                            group_var: str, options: Dict[str, Any]) -> plt.Figure:
+        """2수준 효과 반정규(기본)/정규 확률도 - options.half_normal"""
+        response, estimates = self._factorial_effects(df, y_var, options)
+        fig, ax = self._figure(options)
+        draw_effects_probability(fig, ax, estimates, response, half_normal=options.get('half_normal', True))
+        if options['show_legend']:
+            ax.legend(loc='lower right', fontsize=8)
+        if options['show_grid']:
+            ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        return fig
+
+    def _generate_chart_description(self, chart_type: str, x_var: str,
+                                   y_var: str, group_var: str) -> str:
+        """차트 설명 생성"""
+        description_parts = []
+
+        if x_var:
+            description_parts.append(f"X: {x_var}")
+        if y_var:
+            description_parts.append(f"Y: {y_var}")
+        if group_var and group_var != "없음":
+            description_parts.append(f"그룹: {group_var}")
+
+        if description_parts:
+            return ", ".join(description_parts)
+        else:
+            return chart_type
+
+    def get_supported_chart_types(self) -> List[str]:
+        """지원하는 차트 타입 목록 반환"""
+        return list(self.supported_chart_types.keys())
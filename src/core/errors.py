@@ -0,0 +1,21 @@
+"""
+코어 예외
+
+모든 코어 예외는 사용자에게 보여줄 제목(title)과 메시지(message)를 가진다.
+데스크톱 어댑터는 error_occurred(title, message) 로, 웹은 HTTP 400 detail 로 변환한다.
+"""
+
+
+class CoreError(RuntimeError):
+    def __init__(self, title: str, message: str):
+        super().__init__(f"{title}: {message}")
+        self.title = title
+        self.message = message
+
+
+class AnalysisError(CoreError):
+    """분석 입력 검증 실패 또는 계산 오류"""
+
+
+class ChartError(CoreError):
+    """차트 입력 검증 실패 또는 생성 오류"""
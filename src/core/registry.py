@@ -0,0 +1,162 @@
+"""
+분석 레지스트리
+
+분석 id 별로 입력 스키마, 비용 등급, 진입점을 선언한다.
+데스크톱 메뉴 분기, 웹 라우트/러너 분기, 실행기 선택은 모두 이 표를 참조한다.
+
+진입점과 스키마는 "모듈:속성" 문자열로 두고 실제 분석을 호출할 때 import 한다.
+따라서 이 모듈과 레지스트리 조회만으로는 scipy/statsmodels/sklearn 이 로드되지 않는다.
+"""
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple
+
+# 비용 등급: 요청 스레드에서 바로 / 제한된 스레드 풀 / 별도 프로세스
+CHEAP = "cheap"
+CPU = "cpu"
+HEAVY = "heavy"
+COST_CLASSES = (CHEAP, CPU, HEAVY)
+
+CORE = "core.analysis:AnalysisService"
+
+
+@dataclass(frozen=True)
+class AnalysisSpec:
+    """
+    분석 하나의 선언.
+
+    Attributes:
+        analysis_id: 웹 라우트 경로/러너 분기 키
+        title: 표시 이름
+        cost: 비용 등급 (CHEAP | CPU | HEAVY)
+        entry_point: "모듈:클래스.메서드" - 호출 시 import (None 이면 데스크톱 전용)
+        schema: 웹 요청 본문 스키마 "모듈:클래스" (None 이면 본문 없음)
+        empty_as_none: 빈 리스트를 None(자동 선택)으로 넘길 인자
+        desktop_ids: 데스크톱 메뉴 요청 id
+        desktop_handler: MainWindow 처리 메서드 이름
+        requires: 진입점이 로드하는 무거운 라이브러리
+        columns: 열 이름을 담는 인자 - 프로세스 실행 시 이 열만 넘긴다
+    """
+
+    analysis_id: str
+    title: str
+    cost: str = CHEAP
+    entry_point: Optional[str] = None
+    schema: Optional[str] = None
+    empty_as_none: Tuple[str, ...] = ()
+    desktop_ids: Tuple[str, ...] = ()
+    desktop_handler: Optional[str] = None
+    requires: Tuple[str, ...] = ()
+    columns: Tuple[str, ...] = ()
+
+    @property
+    def web(self) -> bool:
+        return self.entry_point is not None
+
+    def load_entry_point(self) -> Tuple[type, str]:
+        """(클래스, 메서드 이름) - 진입점 모듈을 이때 import"""
+        if self.entry_point is None:
+            raise LookupError(f"'{self.analysis_id}' 분석은 진입점이 없습니다.")
+        module_name, _, attr = self.entry_point.partition(":")
+        class_name, _, method = attr.partition(".")
+        return getattr(import_module(module_name), class_name), method
+
+    def load_schema(self):
+        if self.schema is None:
+            return None
+        module_name, _, attr = self.schema.partition(":")
+        return getattr(import_module(module_name), attr)
+
+    def prepare(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 값 → 진입점 인자"""
+        params = dict(params)
+        for key in self.empty_as_none:
+            if key in params and not params[key]:
+                params[key] = None
+        return params
+
+    def used_columns(self, df_columns, params: Dict[str, Any]) -> Optional[List[str]]:
+        """요청이 쓰는 열 (df 열 순서). 비었거나 자동 선택/없는 열이 있으면 None - 전체 표 필요"""
+        if not self.columns:
+            return None
+        names = set()
+        for key in self.columns:
+            value = params.get(key)
+            if not value:
+                return None
+            names.update([value] if isinstance(value, str) else value)
+        if not names.issubset(df_columns):
+            return None
+        return [c for c in df_columns if c in names]
+
+
+_SCHEMAS = "webapp.api.schemas"
+
+ANALYSES: Dict[str, AnalysisSpec] = {}
+
+
+def register_analysis(spec: AnalysisSpec) -> AnalysisSpec:
+    if spec.cost not in COST_CLASSES:
+        raise ValueError(f"알 수 없는 비용 등급입니다: {spec.cost}")
+    if spec.analysis_id in ANALYSES:
+        raise ValueError(f"이미 등록된 분석입니다: {spec.analysis_id}")
+    ANALYSES[spec.analysis_id] = spec
+    return spec
+
+
+def get_analysis(analysis_id: str) -> AnalysisSpec:
+    """분석 id 또는 데스크톱 요청 id 로 조회 (없으면 KeyError)"""
+    spec = ANALYSES.get(analysis_id)
+    if spec is not None:
+        return spec
+    for spec in ANALYSES.values():
+        if analysis_id in spec.desktop_ids:
+            return spec
+    raise KeyError(analysis_id)
+
+
+def web_analyses():
+    return [spec for spec in ANALYSES.values() if spec.web]
+
+
+for _spec in (
+    AnalysisSpec("basic_statistics", "기초 통계", CHEAP, f"{CORE}.basic_statistics",
+                 desktop_ids=("basic_stats",), desktop_handler="run_basic_statistics"),
+    AnalysisSpec("correlation", "상관분석", CHEAP, f"{CORE}.correlation",
+                 desktop_ids=("correlation_analysis",), desktop_handler="run_correlation_analysis_impl"),
+    AnalysisSpec("anova", "ANOVA", CHEAP, f"{CORE}.anova",
+                 desktop_ids=("one_way_anova",), desktop_handler="run_one_way_anova", requires=("scipy",)),
+    AnalysisSpec("two_way_anova", "이원분산분석", desktop_ids=("two_way_anova",),
+                 desktop_handler="run_two_way_anova", requires=("statsmodels",)),
+    AnalysisSpec("regression", "회귀분석", CHEAP, f"{CORE}.regression",
+                 requires=("sklearn",)),
+    AnalysisSpec("doe_anova", "DOE ANOVA", HEAVY, f"{CORE}.doe_anova",
+                 schema=f"{_SCHEMAS}:DoeAnovaRequest", requires=("statsmodels",),
+                 columns=("response", "factors")),
+    AnalysisSpec("main_effects_anova", "주효과 ANOVA", HEAVY, f"{CORE}.main_effects_anova",
+                 schema=f"{_SCHEMAS}:MainEffectsAnovaRequest", requires=("statsmodels",),
+                 columns=("response", "factors")),
+    AnalysisSpec("factorial_effects", "2수준 효과 분석", CHEAP, f"{CORE}.factorial_effects",
+                 schema=f"{_SCHEMAS}:FactorialEffectsRequest", empty_as_none=("factors",),
+                 desktop_ids=("doe_factorial_effects",), desktop_handler="run_factorial_effects_dialog",
+                 requires=("scipy",)),
+    AnalysisSpec("permutation_anova", "순열 ANOVA", HEAVY, f"{CORE}.permutation_anova",
+                 schema=f"{_SCHEMAS}:PermutationAnovaRequest", empty_as_none=("factors",),
+                 requires=("statsmodels",), columns=("response", "factors")),
+    AnalysisSpec("rsm_quadratic", "RSM 2차 모형", CPU, f"{CORE}.rsm_quadratic",
+                 schema=f"{_SCHEMAS}:RsmQuadraticRequest", requires=("statsmodels",)),
+    AnalysisSpec("rsm_surface", "RSM 격자 예측", CPU, f"{CORE}.rsm_surface",
+                 schema=f"{_SCHEMAS}:RsmSurfaceRequest"),
+    AnalysisSpec("desirability_optimization", "만족도 최적화", CPU, f"{CORE}.desirability_optimization",
+                 schema=f"{_SCHEMAS}:DesirabilityRequest", desktop_ids=("doe_desirability",),
+                 desktop_handler="run_desirability_dialog", requires=("scipy",)),
+    AnalysisSpec("stepwise_regression", "단계적 회귀", CPU, f"{CORE}.stepwise_regression",
+                 schema=f"{_SCHEMAS}:StepwiseRegressionRequest", empty_as_none=("predictors",),
+                 desktop_ids=("stepwise_regression",), desktop_handler="run_stepwise_regression_dialog",
+                 requires=("scipy",)),
+    AnalysisSpec("best_subsets", "최적 부분집합 회귀", HEAVY, f"{CORE}.best_subsets",
+                 schema=f"{_SCHEMAS}:BestSubsetsRequest", empty_as_none=("factors",),
+                 columns=("response", "factors")),
+):
+    register_analysis(_spec)
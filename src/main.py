@@ -9,6 +9,7 @@ Version: 0.1.0
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 # Add the current directory to Python path
@@ -141,4 +142,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller exe 에서 프로세스 풀 자식이 앱을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
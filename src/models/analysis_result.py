@@ -0,0 +1,455 @@
+"""
+분석 결과 객체
+
+컨트롤러 결과는 {"type", "timestamp", "status", "description", "results"} 봉투 구조이다.
+봉투와 분석 계열별 results 를 __slots__ 클래스로 두고 필드마다 종류(kind)를 선언한다.
+
+- 가벼운 필드(SCALAR/TEXT/NAMES): 히스토리 목록/요약에 쓰는 값
+- 무거운 필드(FRAME/SERIES/ARRAY/ANY): 표·관측치 배열·부가 결과
+
+직렬화는 선언된 종류별 인코더 표로 필드를 바로 처리하고(재귀 타입 검사 없음),
+선언되지 않은 키(부트스트랩 등 선택 첨부)만 범용 함수로 넘긴다.
+기존 소비 코드를 위해 MutableMapping 인터페이스(get/[]/in/items/update)를 그대로 제공한다.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+SCALAR = "scalar"
+TEXT = "text"
+NAMES = "names"
+FRAME = "frame"
+SERIES = "series"
+ARRAY = "array"
+ANY = "any"
+
+LIGHT_KINDS = frozenset((SCALAR, TEXT, NAMES))
+RESULT_TAG = "__result__"
+
+_MISSING = object()
+
+
+def _slots(schema) -> Tuple[str, ...]:
+    return tuple(name for name, _ in schema)
+
+
+class ResultRecord(MutableMapping):
+    """스키마(필드 이름, 종류)가 있는 슬롯 레코드. 스키마 밖의 키는 _extras 에 둔다."""
+
+    __slots__ = ("_extras",)
+    SCHEMA: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, values: Optional[Mapping] = None, **kwargs):
+        self._extras: Optional[Dict[str, Any]] = None
+        if values:
+            self.update(values)
+        if kwargs:
+            self.update(kwargs)
+
+    @classmethod
+    def kinds(cls) -> Dict[str, str]:
+        cached = cls.__dict__.get("_kinds_cache")
+        if cached is None:
+            cached = dict(cls.SCHEMA)
+            setattr(cls, "_kinds_cache", cached)
+        return cached
+
+    # MutableMapping ------------------------------------------------------
+    def __getitem__(self, key):
+        if key in self.kinds():
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self._extras is not None and key in self._extras:
+            return self._extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.kinds():
+            setattr(self, key, value)
+        else:
+            if self._extras is None:
+                self._extras = {}
+            self._extras[key] = value
+
+    def __delitem__(self, key):
+        if key in self.kinds() and hasattr(self, key):
+            delattr(self, key)
+        elif self._extras is not None and key in self._extras:
+            del self._extras[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name, _ in self.SCHEMA:
+            if hasattr(self, name):
+                yield name
+        if self._extras:
+            yield from self._extras
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in self.kinds():
+            return hasattr(self, key)
+        return self._extras is not None and key in self._extras
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self)})"
+
+    # 요약/직렬화 ----------------------------------------------------------
+    def light_items(self) -> Dict[str, Any]:
+        """가벼운 필드만 (무거운 값은 건드리지 않음)"""
+        return {
+            name: getattr(self, name)
+            for name, kind in self.SCHEMA
+            if kind in LIGHT_KINDS and hasattr(self, name)
+        }
+
+    def encode(self, encoders: Dict[str, Callable], fallback: Callable) -> Dict[str, Any]:
+        """종류별 인코더 표로 필드를 변환한 dict ({"__result__": 클래스 이름, ...})"""
+        out = {RESULT_TAG: type(self).__name__}
+        for name, kind in self.SCHEMA:
+            value = getattr(self, name, _MISSING)
+            if value is _MISSING:
+                continue
+            out[name] = fallback(value) if value is None else encoders.get(kind, fallback)(value)
+        if self._extras:
+            for key, value in self._extras.items():
+                out[str(key)] = fallback(value)
+        return out
+
+    @classmethod
+    def decode(cls, data: Mapping, decoders: Dict[str, Callable], fallback: Callable) -> "ResultRecord":
+        record = cls()
+        kinds = cls.kinds()
+        for key, value in data.items():
+            if key == RESULT_TAG:
+                continue
+            kind = kinds.get(key)
+            record[key] = fallback(value) if kind is None or value is None else decoders.get(kind, fallback)(value)
+        return record
+
+
+# 분석 계열별 results ---------------------------------------------------------
+class DescriptiveResults(ResultRecord):
+    """기초 통계"""
+
+    SCHEMA = (
+        ("variable_count", SCALAR),
+        ("observation_count", SCALAR),
+        ("summary", FRAME),
+        ("missing_values", SERIES),
+        ("data_types", SERIES),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class CorrelationResults(ResultRecord):
+    """상관분석"""
+
+    SCHEMA = (
+        ("variable_count", SCALAR),
+        ("total_pairs", SCALAR),
+        ("correlation_matrix", FRAME),
+        ("strong_correlations", ANY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class GroupTestResults(ResultRecord):
+    """일원 ANOVA 등 그룹 비교 검정"""
+
+    SCHEMA = (
+        ("independent_var", TEXT),
+        ("dependent_var", TEXT),
+        ("f_statistic", SCALAR),
+        ("p_value", SCALAR),
+        ("significant", SCALAR),
+        ("group_count", SCALAR),
+        ("interpretation", TEXT),
+        ("group_stats", ANY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class ModelResults(ResultRecord):
+    """선형모형 기반 DOE 분석 (DOE ANOVA, 주효과 ANOVA, RSM, 순열 ANOVA)"""
+
+    SCHEMA = (
+        ("response", TEXT),
+        ("factors", NAMES),
+        ("formula", TEXT),
+        ("fallback", TEXT),
+        ("method", TEXT),
+        ("n_permutations", SCALAR),
+        ("seed", SCALAR),
+        ("f_statistic", SCALAR),
+        ("p_value", SCALAR),
+        ("significant", SCALAR),
+        ("interpretation", TEXT),
+        ("r_squared", SCALAR),
+        ("adj_r_squared", SCALAR),
+        ("n_obs", SCALAR),
+        ("press", SCALAR),
+        ("predicted_r_squared", SCALAR),
+        ("rank", SCALAR),
+        ("anova", FRAME),
+        ("coefficients", SERIES),
+        ("residuals", ARRAY),
+        ("fitted", ARRAY),
+        ("leverage", ARRAY),
+        ("studentized_residuals", ARRAY),
+        ("externally_studentized", ARRAY),
+        ("cooks_distance", ARRAY),
+        ("high_leverage", ANY),
+        ("influential", ANY),
+        ("canonical_analysis", ANY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class ResponseSurfaceResults(ResultRecord):
+    """RSM 격자 예측 (등고선/표면도 데이터)"""
+
+    SCHEMA = (
+        ("response", TEXT),
+        ("factors", NAMES),
+        ("x_factor", TEXT),
+        ("y_factor", TEXT),
+        ("resolution", SCALAR),
+        ("nature", TEXT),
+        ("fixed", ANY),
+        ("canonical_analysis", ANY),
+        ("x", ARRAY),
+        ("y", ARRAY),
+        ("fit", ARRAY),
+        ("se", ARRAY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class EffectsResults(ResultRecord):
+    """2수준 요인 효과 (Yates/FWHT, Lenth PSE, 확률도/파레토 데이터)"""
+
+    SCHEMA = (
+        ("response", TEXT),
+        ("factors", NAMES),
+        ("base_factors", NAMES),
+        ("active", NAMES),
+        ("generators", NAMES),
+        ("resolution", SCALAR),
+        ("mean", SCALAR),
+        ("pse", SCALAR),
+        ("margin_of_error", SCALAR),
+        ("simultaneous_margin", SCALAR),
+        ("lenth_df", SCALAR),
+        ("alpha", SCALAR),
+        ("runs", SCALAR),
+        ("replicates", SCALAR),
+        ("n_obs", SCALAR),
+        ("pure_error_df", SCALAR),
+        ("pure_error_sigma", SCALAR),
+        ("total_sum_sq", SCALAR),
+        ("levels", ANY),
+        ("effects", FRAME),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class OptimizationResults(ResultRecord):
+    """만족도(desirability) 다중 반응 최적화"""
+
+    SCHEMA = (
+        ("factors", NAMES),
+        ("responses", NAMES),
+        ("method", TEXT),
+        ("overall_desirability", SCALAR),
+        ("n_candidates", SCALAR),
+        ("n_starts", SCALAR),
+        ("best_point", ANY),
+        ("predictions", ANY),
+        ("desirabilities", ANY),
+        ("goals", ANY),
+        ("solutions", FRAME),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class RegressionResults(ResultRecord):
+    """회귀 및 변수 선택 (회귀분석, 단계적 회귀, 최적 부분집합 회귀)"""
+
+    SCHEMA = (
+        ("dependent_var", TEXT),
+        ("response", TEXT),
+        ("independent_vars", NAMES),
+        ("candidates", NAMES),
+        ("factors", NAMES),
+        ("selected", NAMES),
+        ("direction", TEXT),
+        ("criterion", TEXT),
+        ("model_fit", TEXT),
+        ("complete", SCALAR),
+        ("nodes", SCALAR),
+        ("elapsed", SCALAR),
+        ("intercept", SCALAR),
+        ("r_squared", SCALAR),
+        ("adj_r_squared", SCALAR),
+        ("rmse", SCALAR),
+        ("aic", SCALAR),
+        ("bic", SCALAR),
+        ("observations", SCALAR),
+        ("n_obs", SCALAR),
+        ("coefficients", ANY),
+        ("std_errors", SERIES),
+        ("p_values", SERIES),
+        ("path", FRAME),
+        ("models", FRAME),
+        ("best", ANY),
+        ("dropped", ANY),
+        ("fitted", ARRAY),
+        ("residuals", ARRAY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+
+class GenericResults(ResultRecord):
+    """계열이 등록되지 않은 분석 (모든 키를 부가 필드로 보관)"""
+
+    __slots__ = ()
+
+
+RESULT_CLASSES = {
+    cls.__name__: cls
+    for cls in (DescriptiveResults, CorrelationResults, GroupTestResults, ModelResults,
+                ResponseSurfaceResults, EffectsResults, OptimizationResults, RegressionResults, GenericResults)
+}
+
+# 분석 유형 → results 클래스 (등록되지 않은 유형은 ModelResults 여부를 키로 판단)
+RESULT_FAMILIES = {
+    "기초 통계": DescriptiveResults,
+    "상관분석": CorrelationResults,
+    "ANOVA": GroupTestResults,
+    "DOE ANOVA": ModelResults,
+    "순열 ANOVA": ModelResults,
+    "RSM 격자 예측": ResponseSurfaceResults,
+    "2수준 효과 분석": EffectsResults,
+    "만족도 최적화": OptimizationResults,
+    "회귀분석": RegressionResults,
+    "단계적 회귀": RegressionResults,
+    "최적 부분집합 회귀": RegressionResults,
+}
+
+
+def results_class_for(analysis_type: str, results: Mapping) -> type:
+    cls = RESULT_FAMILIES.get(analysis_type)
+    if cls is not None:
+        return cls
+    # 주효과/RSM/CCD 등 analysis_type 이 자유 문자열인 선형모형 분석
+    if "anova" in results and "coefficients" in results:
+        return ModelResults
+    return GenericResults
+
+
+class AnalysisResult(ResultRecord):
+    """분석 결과 봉투"""
+
+    SCHEMA = (
+        ("type", TEXT),
+        ("timestamp", TEXT),
+        ("status", TEXT),
+        ("description", TEXT),
+        ("results", ANY),
+    )
+    __slots__ = _slots(SCHEMA)
+
+    @classmethod
+    def create(cls, analysis_type: str, description: str, results: Mapping, status: str = "완료",
+               timestamp: Optional[str] = None) -> "AnalysisResult":
+        results_cls = results_class_for(analysis_type, results)
+        return cls(
+            type=analysis_type,
+            timestamp=timestamp or datetime.now().strftime("%H:%M:%S"),
+            status=status,
+            description=description,
+            results=results if isinstance(results, results_cls) else results_cls(results),
+        )
+
+    @classmethod
+    def from_mapping(cls, data: Mapping) -> "AnalysisResult":
+        """봉투 구조 dict 를 결과 객체로 변환 (이미 변환된 객체는 그대로)"""
+        if isinstance(data, AnalysisResult):
+            return data
+        result = cls.create(
+            data.get("type", ""), data.get("description", ""), data.get("results") or {},
+            status=data.get("status", "완료"), timestamp=data.get("timestamp"),
+        )
+        for key, value in data.items():
+            if key not in cls.kinds():
+                result[key] = value
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """히스토리 목록용 요약: 봉투 텍스트 + results 의 가벼운 필드만"""
+        out = {name: getattr(self, name) for name in ("type", "timestamp", "status", "description")
+               if hasattr(self, name)}
+        results = getattr(self, "results", None)
+        if isinstance(results, ResultRecord):
+            out["summary"] = results.light_items()
+        return out
+
+    def encode(self, encoders: Dict[str, Callable], fallback: Callable) -> Dict[str, Any]:
+        out = super().encode(encoders, fallback)
+        results = getattr(self, "results", None)
+        if isinstance(results, ResultRecord):
+            out["results"] = results.encode(encoders, fallback)
+        return out
+
+    @classmethod
+    def decode(cls, data: Mapping, decoders: Dict[str, Callable], fallback: Callable) -> "AnalysisResult":
+        envelope = {k: v for k, v in data.items() if k != "results"}
+        result = super().decode(envelope, decoders, fallback)
+        raw = data.get("results")
+        if isinstance(raw, Mapping) and raw.get(RESULT_TAG) in RESULT_CLASSES:
+            result["results"] = RESULT_CLASSES[raw[RESULT_TAG]].decode(raw, decoders, fallback)
+        elif raw is not None:
+            result["results"] = fallback(raw)
+        return result
+
+
+RESULT_CLASSES[AnalysisResult.__name__] = AnalysisResult
+
+
+def plain_scalar(value):
+    """NumPy 스칼라를 파이썬 스칼라로"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def plain_names(values):
+    return [plain_scalar(v) for v in values]
+
+
+def result_encoders(fallback: Callable, frame: Tuple, series: Tuple, array: Tuple,
+                    scalar: Callable = plain_scalar, names: Callable = plain_names) -> Dict[str, Callable]:
+    """
+    ResultRecord.encode 용 종류별 인코더 표 (프로젝트 저장/웹 응답 공용).
+    frame/series/array 는 (허용 타입, 인코더) 쌍이며, 선언된 종류와 실제 값이 다르면
+    (구버전 결과 등) fallback 범용 직렬화로 보낸다.
+    """
+    def typed(kind_type, encoder):
+        def encode(value):
+            return encoder(value) if isinstance(value, kind_type) else fallback(value)
+        return encode
+
+    return {
+        SCALAR: scalar,
+        TEXT: plain_scalar,
+        NAMES: names,
+        FRAME: typed(*frame),
+        SERIES: typed(*series),
+        ARRAY: typed(*array),
+    }
@@ -1,8 +1,14 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+from models.analysis_result import (
+    NAMES, RESULT_CLASSES, RESULT_TAG, SCALAR, TEXT, ResultRecord, result_encoders,
+)
+from utils.compact_array import CompactArray, encode_array, is_encoded_array
+
 @dataclass
 class Project:
     """
@@ -61,9 +67,9 @@ class Project:
                 'created_at': self.created_at.isoformat()
             },
             'data': data_dict,
-            'analysis_history': _serialize(self.analysis_history),
-            'chart_history': _serialize(self.chart_history),
-            'settings': _serialize(self.settings)
+            'analysis_history': serialize_value(self.analysis_history),
+            'chart_history': serialize_value(self.chart_history),
+            'settings': serialize_value(self.settings)
         }
 
     @classmethod
@@ -83,36 +89,75 @@ class Project:
             created_at=datetime.fromisoformat(project_info.get('created_at', datetime.now().isoformat())),
             dataframe=df,
             data_description=data_info.get('description', '') if data_info else '',
-            analysis_history=_deserialize(data.get('analysis_history', [])),
-            chart_history=_deserialize(data.get('chart_history', [])),
-            settings=_deserialize(data.get('settings', {}))
+            analysis_history=deserialize_value(data.get('analysis_history', [])),
+            chart_history=deserialize_value(data.get('chart_history', [])),
+            settings=deserialize_value(data.get('settings', {}))
         )
 
 # 직렬화/역직렬화 헬퍼 ---------------------------------------------
-def _serialize(obj):
-    """JSON 직렬화를 위한 보조 함수"""
+def _frame_to_dict(obj: pd.DataFrame) -> Dict[str, Any]:
+    return {
+        "__type__": "DataFrame",
+        "columns": list(obj.columns),
+        "index": list(obj.index),
+        "data": obj.to_dict("records"),
+    }
+
+
+def _series_to_dict(obj: pd.Series) -> Dict[str, Any]:
+    return {
+        "__type__": "Series",
+        "index": list(obj.index),
+        "data": obj.to_dict(),
+    }
+
+
+def _array_to_dict(obj) -> Dict[str, Any]:
+    if isinstance(obj, CompactArray):
+        return obj.to_payload()
+    return encode_array(np.asarray(obj, dtype=float))
+
+
+# 결과 객체 필드 종류별 인코더/디코더 (스키마 경로)
+_RESULT_ENCODERS = result_encoders(
+    lambda value: serialize_value(value),
+    frame=(pd.DataFrame, _frame_to_dict),
+    series=(pd.Series, _series_to_dict),
+    array=((CompactArray, np.ndarray, list), _array_to_dict),
+)
+_RESULT_DECODERS = {
+    SCALAR: lambda v: v,
+    TEXT: lambda v: v,
+    NAMES: list,
+}
+
+
+def serialize_value(obj):
+    """분석/차트 기록 등을 JSON 저장 가능한 형태로 (결과 객체, 배열, DataFrame/Series 포함)"""
+    if isinstance(obj, ResultRecord):
+        return obj.encode(_RESULT_ENCODERS, serialize_value)
+    if isinstance(obj, CompactArray):
+        return obj.to_payload()
+    if isinstance(obj, np.ndarray):
+        return encode_array(obj)
     if isinstance(obj, pd.DataFrame):
-        return {
-            "__type__": "DataFrame",
-            "columns": list(obj.columns),
-            "index": list(obj.index),
-            "data": obj.to_dict("records"),
-        }
+        return _frame_to_dict(obj)
     if isinstance(obj, pd.Series):
-        return {
-            "__type__": "Series",
-            "index": list(obj.index),
-            "data": obj.to_dict(),
-        }
+        return _series_to_dict(obj)
     if isinstance(obj, list):
-        return [_serialize(o) for o in obj]
+        return [serialize_value(o) for o in obj]
     if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
+        return {k: serialize_value(v) for k, v in obj.items()}
     return obj
 
 
-def _deserialize(obj):
-    """JSON 역직렬화를 위한 보조 함수"""
+def deserialize_value(obj):
+    """serialize_value 의 역변환 (배열은 접근 시 디코딩하는 CompactArray 로)"""
+    if isinstance(obj, dict) and obj.get(RESULT_TAG) in RESULT_CLASSES:
+        return RESULT_CLASSES[obj[RESULT_TAG]].decode(obj, _RESULT_DECODERS, deserialize_value)
+    if is_encoded_array(obj):
+        # 배열은 실제로 접근할 때 디코딩
+        return CompactArray.from_payload(obj)
     if isinstance(obj, dict) and "__type__" in obj:
         if obj["__type__"] == "DataFrame":
             df = pd.DataFrame(obj.get("data", []))
@@ -124,7 +169,7 @@ def _deserialize(obj):
         if obj["__type__"] == "Series":
             return pd.Series(obj.get("data", {}), index=obj.get("index", None))
     if isinstance(obj, list):
-        return [_deserialize(o) for o in obj]
+        return [deserialize_value(o) for o in obj]
     if isinstance(obj, dict):
-        return {k: _deserialize(v) for k, v in obj.items()}
+        return {k: deserialize_value(v) for k, v in obj.items()}
     return obj
@@ -1,7 +1,20 @@
 """
 유틸리티 패키지
+
+하위 모듈은 처음 사용할 때 로드한다. (utils.x 를 import 해도 matplotlib 등이 함께 로드되지 않도록)
 """
 
-from utils.font_manager import get_font_manager, set_korean_font
+from importlib import import_module
+
+_LAZY = {
+    'get_font_manager': 'utils.font_manager',
+    'set_korean_font': 'utils.font_manager',
+}
+
+__all__ = ['get_font_manager', 'set_korean_font']
+
 
-__all__ = ['get_font_manager', 'set_korean_font'] 
\ No newline at end of file
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name]), name)
+    raise AttributeError(f"module 'utils' has no attribute {name!r}")
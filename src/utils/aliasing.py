@@ -0,0 +1,313 @@
+"""
+2수준 부분요인 설계의 별칭(alias) 구조
+
+효과(요인 부분집합)를 비트마스크로 표현한다. (열 i ↔ 비트 i, 곱 = XOR)
+- 각 열 c 는 기본 요인 공간의 마스크 m_c 와 부호 s_c 를 가진다: x_c = s_c · Π_{b∈m_c} H_b
+- 효과 e 의 열은 sign(e) · (기본 요인 곱 φ(e)), φ(e) = XOR_{c∈e} m_c, sign(e) = Π_{c∈e} s_c
+  → φ 가 같은 효과끼리 별칭, φ(e) = 0 이면 정의 관계의 단어
+- 정의 관계 군은 생성 단어 p 개의 XOR 조합(2^p)을 배가(doubling)로 한 번에 만든다.
+
+generator 문자열은 pyDOE2 fracfact 와 같은 규칙으로 읽는다.
+(한 글자 = 기본 요인, 여러 글자 = 기본 요인 곱이며 a 는 첫 번째 기본 요인, '-' 는 열 부호 반전)
+"""
+
+from dataclasses import dataclass
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 전체 별칭 사슬(2^k - 1 효과)을 만드는 최대 요인 수 (넘으면 DEFAULT_ORDER 차까지만)
+MAX_FULL_FACTORS = 16
+DEFAULT_ORDER = 3
+# 효과 후보 수 상한
+MAX_EFFECTS = 1 << 20
+# 정의 관계 군(2^p)을 펼치는 최대 생성 열 수
+MAX_GENERATORS = 20
+
+# np.bitwise_count 는 NumPy 2.0 부터 - 1.x 는 바이트 표로 센다
+_NATIVE_POPCOUNT = hasattr(np, "bitwise_count")
+_BYTE_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+_ROMAN = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX", 10: "X"}
+
+
+def factor_labels(k: int) -> Tuple[str, ...]:
+    """A, B, ... (항등원과 헷갈리지 않게 I 는 건너뜀), 25개를 넘으면 F1, F2, ..."""
+    letters = [chr(c) for c in range(ord("A"), ord("Z") + 1) if chr(c) != "I"]
+    if k <= len(letters):
+        return tuple(letters[:k])
+    return tuple(f"F{i+1}" for i in range(k))
+
+
+def popcount(values) -> np.ndarray:
+    """정수(마스크) 배열 원소별 1 비트 수 (uint8, np.bitwise_count 와 같음)"""
+    if _NATIVE_POPCOUNT:
+        return np.bitwise_count(values)
+    values = np.asarray(values)
+    if values.dtype.kind == "i":
+        values = np.abs(values)
+    flat = np.ascontiguousarray(values).reshape(-1)
+    counts = _BYTE_BITS[flat.view(np.uint8).reshape(len(flat), values.itemsize)].sum(axis=1, dtype=np.uint8)
+    return counts.reshape(values.shape) if values.ndim else counts[0]
+
+
+def parse_generator(design_str: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    generator 문자열 → (images, signs, base_columns)
+    images[c]: 열 c 의 기본 요인 마스크, signs[c]: ±1, base_columns[b]: 기본 요인 b 의 열 번호
+    """
+    tokens = str(design_str).split()
+    if not tokens:
+        raise ValueError("generator 문자열이 비어 있습니다.")
+    terms = []
+    for token in tokens:
+        sign = -1 if token.startswith("-") else 1
+        letters = token.lstrip("+-").lower()
+        if not letters.isalpha() or not letters.isascii():
+            raise ValueError(f"generator 항을 해석할 수 없습니다: {token}")
+        if len(set(letters)) != len(letters):
+            raise ValueError(f"generator 항에 같은 문자가 반복되었습니다: {token}")
+        terms.append((sign, letters))
+
+    base_columns = np.array([c for c, (_, letters) in enumerate(terms) if len(letters) == 1], dtype=np.int64)
+    n_base = len(base_columns)
+    if n_base == 0:
+        raise ValueError("기본 요인(한 글자 항)이 하나 이상 필요합니다.")
+    images = np.zeros(len(terms), dtype=np.int64)
+    signs = np.array([sign for sign, _ in terms], dtype=np.int8)
+    next_base = 0
+    for c, (_, letters) in enumerate(terms):
+        if len(letters) == 1:
+            images[c] = 1 << next_base
+            next_base += 1
+            continue
+        for ch in letters:
+            b = ord(ch) - ord("a")
+            if b >= n_base:
+                raise ValueError(f"'{ch}' 는 기본 요인 {n_base}개 범위를 벗어납니다. ({''.join(l for _, l in terms)})")
+            images[c] |= 1 << b
+    return images, signs, base_columns
+
+
+def defining_group(words: Sequence[int], signs: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """생성 단어들의 XOR 군 (항등원 0 포함, 2^p 개) 과 부호"""
+    group = np.zeros(1, dtype=np.int64)
+    group_signs = np.ones(1, dtype=np.int8)
+    for i, word in enumerate(words):
+        s = 1 if signs is None else signs[i]
+        group = np.concatenate([group, group ^ np.int64(word)])
+        group_signs = np.concatenate([group_signs, group_signs * np.int8(s)])
+    return group, group_signs
+
+
+def word_length_pattern(group: np.ndarray, k: int) -> Tuple[int, ...]:
+    """(A_1, ..., A_k): 길이 j 인 정의 단어 수"""
+    lengths = popcount(group[group != 0])
+    return tuple(int(v) for v in np.bincount(lengths, minlength=k + 1)[1:k + 1])
+
+
+def _join(labels: Sequence[str]) -> str:
+    return ("" if all(len(label) == 1 for label in labels) else "*").join(labels)
+
+
+def _name_table(labels: Sequence[str]) -> List[str]:
+    """마스크 → 효과 이름 (배가로 2^k 개)"""
+    sep = "" if all(len(label) == 1 for label in labels) else "*"
+    names = [""]
+    for label in labels:
+        names += [f"{name}{sep}{label}" if name else label for name in names]
+    return names
+
+
+@dataclass(frozen=True, eq=False)
+class AliasStructure:
+    """정의 관계 군과 열별 기본 요인 마스크로 표현한 별칭 구조 (df.attrs 에 넣으므로 동일성 비교)"""
+
+    labels: Tuple[str, ...]
+    images: np.ndarray          # (k,) 열의 기본 요인 마스크
+    signs: np.ndarray           # (k,) ±1
+    base_columns: np.ndarray    # (k - p,) 기본 요인의 열 번호
+    group: np.ndarray           # (2^p,) 정의 관계 군 (열 마스크, 0 포함)
+    group_signs: np.ndarray
+
+    @property
+    def n_factors(self) -> int:
+        return len(self.images)
+
+    @property
+    def n_generators(self) -> int:
+        return self.n_factors - len(self.base_columns)
+
+    @property
+    def runs(self) -> int:
+        return 1 << len(self.base_columns)
+
+    @property
+    def word_length_pattern(self) -> Tuple[int, ...]:
+        return word_length_pattern(self.group, self.n_factors)
+
+    @property
+    def resolution(self) -> Optional[int]:
+        """최소 단어 길이 (완전요인이면 None)"""
+        words = self.group[self.group != 0]
+        return int(popcount(words).min()) if len(words) else None
+
+    def _name(self, mask: int) -> str:
+        return _join([self.labels[i] for i in range(self.n_factors) if mask >> i & 1])
+
+    def _column_mask(self, image: int) -> int:
+        return sum(1 << int(c) for b, c in enumerate(self.base_columns) if image >> b & 1)
+
+    def generators(self) -> List[str]:
+        """생성된 열의 정의 (예: 'D = AB', 'E = -ABC')"""
+        base = set(int(c) for c in self.base_columns)
+        lines = []
+        for c in range(self.n_factors):
+            if c in base:
+                continue
+            sign = "-" if self.signs[c] < 0 else ""
+            lines.append(f"{self.labels[c]} = {sign}{self._name(self._column_mask(int(self.images[c])))}")
+        return lines
+
+    def words(self) -> List[str]:
+        """정의 단어 (길이, 사전식 순, 음수면 '-' 접두)"""
+        order = self._sorted(self.group[1:])
+        return [("-" if self.group_signs[1:][i] < 0 else "") + self._name(int(self.group[1:][i])) for i in order]
+
+    def defining_relation(self) -> str:
+        return " = ".join(["I"] + self.words())
+
+    def _reverse_key(self, masks: np.ndarray) -> np.ndarray:
+        """같은 차수 안에서 내림차순이면 사전식이 되는 비트 역순 키"""
+        k = self.n_factors
+        key = np.zeros(len(masks), dtype=np.int64)
+        for i in range(k):
+            key |= ((masks >> i) & 1) << (k - 1 - i)
+        return key
+
+    def _sorted(self, masks: np.ndarray) -> np.ndarray:
+        return np.lexsort((-self._reverse_key(masks), popcount(masks)))
+
+    def effect_images(self, masks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """효과 마스크 → (기본 요인 곱 φ, 부호 ±1)"""
+        masks = np.asarray(masks, dtype=np.int64)
+        phi = np.zeros(masks.shape, dtype=np.int64)
+        negative = np.zeros(masks.shape, dtype=bool)
+        for i in range(self.n_factors):
+            hit = ((masks >> i) & 1).astype(bool)
+            phi ^= np.where(hit, self.images[i], 0)
+            if self.signs[i] < 0:
+                negative ^= hit
+        return phi, np.where(negative, -1, 1).astype(np.int8)
+
+    def _effects(self, max_order: Optional[int]) -> np.ndarray:
+        k = self.n_factors
+        if max_order is None:
+            max_order = k if k <= MAX_FULL_FACTORS else DEFAULT_ORDER
+        if max_order >= k:
+            if k > MAX_FULL_FACTORS:
+                raise ValueError(f"전체 별칭 사슬은 요인 {MAX_FULL_FACTORS}개까지 지원합니다. (max_order 지정)")
+            return np.arange(1, 1 << k, dtype=np.int64)
+        if sum(comb(k, r) for r in range(1, max_order + 1)) > MAX_EFFECTS:
+            raise ValueError("효과 후보가 너무 많습니다. max_order 를 줄이세요.")
+        masks = [sum(1 << i for i in subset) for r in range(1, max_order + 1) for subset in combinations(range(k), r)]
+        return np.array(masks, dtype=np.int64)
+
+    def alias_groups(self, max_order: Optional[int] = None) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        별칭 사슬 (φ, 효과 마스크, 대표 대비 상대 부호) 목록.
+        사슬 안은 (차수, 사전식) 순, 사슬끼리는 대표 효과 순. φ = 0 (정의 관계) 은 제외.
+        max_order: 이 차수 이하 효과만 (None 이면 요인 MAX_FULL_FACTORS 개까지 전체, 그 위는 DEFAULT_ORDER)
+        """
+        masks = self._effects(max_order)
+        phi, sign = self.effect_images(masks)
+        keep = phi != 0
+        masks, phi, sign = masks[keep], phi[keep], sign[keep]
+        order = np.lexsort((-self._reverse_key(masks), popcount(masks), phi))
+        masks, phi, sign = masks[order], phi[order], sign[order]
+        starts = np.flatnonzero(np.r_[True, phi[1:] != phi[:-1]])
+        leaders = masks[starts]
+        chain_order = self._sorted(leaders)
+        bounds = np.r_[starts, len(masks)]
+        groups = []
+        for i in chain_order:
+            lo, hi = bounds[i], bounds[i + 1]
+            groups.append((int(phi[lo]), masks[lo:hi], sign[lo:hi] * sign[lo]))
+        return groups
+
+    def chains(self, max_order: Optional[int] = None) -> List[str]:
+        """별칭 사슬 문자열 (예: 'A + BCD - CE')"""
+        groups = self.alias_groups(max_order)
+        full = max_order is None and self.n_factors <= MAX_FULL_FACTORS
+        names = _name_table(self.labels) if full else None
+        lines = []
+        for _, masks, rel in groups:
+            terms = [names[m] for m in masks.tolist()] if full else [self._name(m) for m in masks.tolist()]
+            parts = [terms[0]]
+            for term, s in zip(terms[1:], rel[1:].tolist()):
+                parts.append(f"{'-' if s < 0 else '+'} {term}")
+            lines.append(" ".join(parts))
+        return lines
+
+    def to_dict(self, max_order: Optional[int] = None) -> Dict:
+        resolution = self.resolution
+        return {
+            "factors": list(self.labels),
+            "runs": self.runs,
+            "generators": self.generators(),
+            "defining_relation": self.defining_relation(),
+            "resolution": resolution,
+            "resolution_label": _ROMAN.get(resolution, str(resolution)) if resolution else "Full",
+            "word_length_pattern": list(self.word_length_pattern),
+            "aliases": self.chains(max_order),
+        }
+
+
+def alias_structure_from_columns(images: Sequence[int], signs: Optional[Sequence[int]] = None,
+                                 labels: Optional[Sequence[str]] = None) -> AliasStructure:
+    """열별 기본 요인 마스크(한 비트 = 기본 요인 열)로 별칭 구조를 만든다."""
+    images = np.asarray(images, dtype=np.int64)
+    k = len(images)
+    signs = np.ones(k, dtype=np.int8) if signs is None else np.asarray(signs, dtype=np.int8)
+    labels = tuple(labels) if labels is not None else factor_labels(k)
+    if len(labels) != k:
+        raise ValueError("요인 이름 수가 열 수와 다릅니다.")
+    if k > 62:
+        raise ValueError("요인은 62개까지 지원합니다.")
+    counts = popcount(images)
+    base_columns = np.flatnonzero(counts == 1)
+    # 같은 기본 요인을 한 번만 기본 열로 보고 나머지는 생성 열로 취급
+    first = {}
+    for c in base_columns.tolist():
+        first.setdefault(int(images[c]), c)
+    base_columns = np.array(sorted(first.values()), dtype=np.int64)
+    n_base = len(base_columns)
+    if n_base == 0 or np.any(images == 0) or any(1 << b not in first for b in range(n_base)):
+        raise ValueError("기본 요인 열이 올바르지 않습니다.")
+    column_of = np.array([first[1 << b] for b in range(n_base)], dtype=np.int64)
+
+    if k - n_base > MAX_GENERATORS:
+        raise ValueError(f"생성 열은 {MAX_GENERATORS}개까지 지원합니다. (정의 관계 단어 2^p 개)")
+
+    base = set(base_columns.tolist())
+    words, word_signs = [], []
+    for c in range(k):
+        if c in base:
+            continue
+        word, s = 1 << c, int(signs[c])
+        for b in range(n_base):
+            if images[c] >> b & 1:
+                word |= 1 << int(column_of[b])
+                s *= int(signs[column_of[b]])
+        words.append(word)
+        word_signs.append(s)
+    group, group_signs = defining_group(words, word_signs)
+    return AliasStructure(labels, images, signs, column_of, group, group_signs)
+
+
+def alias_structure(design_str: str, labels: Optional[Sequence[str]] = None) -> AliasStructure:
+    """pyDOE2 generator 문자열의 별칭 구조"""
+    images, signs, _ = parse_generator(design_str)
+    return alias_structure_from_columns(images, signs, labels)
@@ -0,0 +1,226 @@
+"""
+분기한정(leaps-and-bounds) 전체 부분집합 회귀
+
+스크리닝 설계(Plackett-Burman, 부분요인)에서 크기별 상위 모형을 찾는다.
+전체 모형을 스윕한 교차곱 행렬에서 출발해 변수를 하나씩 역스윕으로 빼며 탐색한다.
+
+- 탐색 트리(포함 트리): 노드는 (포함 집합 S, 추가 후보 R). 자식 i 는 S ∪ {r_i}, 후보 r_(i+1)..
+  S 는 스윕 행렬로, S ∪ R 은 한계(bound) 행렬로 함께 들고 다니며 (Furnival-Wilson 짝 트리)
+  자식으로 내려갈 때 한 번의 스윕/역스윕으로 갱신한다.
+- 한계: 노드의 모든 자손은 S ∪ R 의 부분집합이므로 RSS ≥ RSS(S ∪ R).
+  자손이 가질 수 있는 모든 크기에서 현재 상위 목록의 최악 RSS 가 이 값 이하면 가지치기.
+  후보는 노드마다 한계 모형에서 빼면 RSS 가 크게 늘어나는 순으로 정렬해 뒤쪽 자식이 빨리 잘리게 한다.
+- 같은 크기에서 adj R²/Cp/BIC 는 모두 RSS 의 단조함수이므로 크기별 상위 목록은 RSS 로 유지하고
+  기준별 순위는 마지막에 매긴다.
+- 병렬: 순수 파이썬 분기한정이라 GIL 에 묶이므로 스레드 대신 프로세스로 나눈다.
+  루트의 자식(최상위 가지)을 작업자 수만큼 번갈아 묶어 프로세스마다 따로 탐색하고,
+  가지별 상위 목록을 마지막에 합친다. 각 부분트리 안의 탐색은 정확하므로 결과는 직렬과 같다.
+"""
+
+import heapq
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.parallel import map_chunks
+from utils.stepwise import SweepRegression, reverse_sweep, sweep
+
+CRITERIA = ("adj_r2", "cp", "bic")
+
+
+class _TopModels:
+    """크기별 RSS 상위 m 개 (최대 힙)"""
+
+    def __init__(self, top: int, sizes: Sequence[int]):
+        self.top = top
+        self._heaps: Dict[int, List] = {k: [] for k in sizes}
+
+    def worst(self, k: int) -> float:
+        heap = self._heaps.get(k)
+        if heap is None:
+            return -np.inf
+        if len(heap) < self.top:
+            return np.inf
+        return -heap[0][0]
+
+    def offer(self, k: int, rss: float, members: tuple):
+        heap = self._heaps.get(k)
+        if heap is None:
+            return
+        if len(heap) < self.top:
+            heapq.heappush(heap, (-rss, members))
+        elif rss < -heap[0][0]:
+            heapq.heapreplace(heap, (-rss, members))
+
+    def can_prune(self, rss_bound: float, k_min: int, k_max: int) -> bool:
+        return all(self.worst(k) <= rss_bound for k in range(k_min, k_max + 1))
+
+    def items(self):
+        for k, heap in self._heaps.items():
+            for neg_rss, members in heap:
+                yield k, -neg_rss, members
+
+
+def code_factors(df: pd.DataFrame, factors: Sequence[str]) -> np.ndarray:
+    """숫자형은 그대로, 2수준 범주형은 -1/+1 로 코딩한 주효과 설계 행렬"""
+    cols = []
+    for f in factors:
+        values = df[f]
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().all():
+            cols.append(numeric.to_numpy(dtype=float))
+            continue
+        codes, levels = pd.factorize(values, sort=True)
+        if len(levels) != 2:
+            raise ValueError(f"요인 '{f}'은(는) 숫자형이거나 2수준이어야 합니다.")
+        cols.append(np.where(codes == 1, 1.0, -1.0))
+    return np.column_stack(cols) if cols else np.empty((len(df), 0))
+
+
+def _rss_of(A: np.ndarray) -> float:
+    return max(float(A[-1, -1]), 0.0)
+
+
+def _importance(B: np.ndarray, candidates: List[int]) -> List[int]:
+    return sorted(candidates, key=lambda j: B[j, -1] ** 2 / max(-B[j, j], 1e-300), reverse=True)
+
+
+def _children(tops: _TopModels, max_size: int, S_A: np.ndarray, S: tuple, B: np.ndarray, R: List[int]):
+    """(자식 S 행렬, 자식 S, 자식 한계 행렬, 자식 R) 를 차례로 생성 (B 는 소모됨)"""
+    for i, j in enumerate(R):
+        child_R = R[i + 1:]
+        k_child = len(S) + 1
+        k_hi = min(k_child + len(child_R), max_size)
+        if not tops.can_prune(_rss_of(B), k_child, k_hi):
+            child_A = S_A.copy()
+            sweep(child_A, j)
+            yield child_A, S + (j,), B.copy(), _importance(B, child_R)
+        # 이후 자식들은 r_i 를 포함하지 않음
+        reverse_sweep(B, j)
+
+
+def _explore_branches(task) -> Dict[str, Any]:
+    """최상위 가지 묶음을 하나의 상위 목록으로 탐색 (프로세스 작업자용 모듈 최상위 함수)"""
+    branches, max_size, top, deadline = task
+    tops = _TopModels(top, range(1, max_size + 1))
+    counter = {"nodes": 0, "timed_out": False}
+
+    def visit(S_A: np.ndarray, S: tuple, B: np.ndarray, R: List[int]):
+        counter["nodes"] += 1
+        tops.offer(len(S), _rss_of(S_A), S)
+        if len(S) >= max_size or not R:
+            return
+        if deadline is not None and time.monotonic() > deadline:
+            counter["timed_out"] = True
+            return
+        for child in _children(tops, max_size, S_A, S, B, R):
+            visit(*child)
+
+    for branch in branches:
+        visit(*branch)
+    return {"items": list(tops.items()), **counter}
+
+
+def best_subsets(X, y, names: Sequence[str], max_size: Optional[int] = None, top: int = 5,
+                 criterion: str = "adj_r2", time_budget: Optional[float] = 10.0,
+                 max_workers: int = 1) -> Dict[str, Any]:
+    """
+    크기별 상위 top 개 모형을 찾는 분기한정 탐색.
+
+    Args:
+        max_size: 모형 최대 변수 수 (기본: min(p, n - 2))
+        criterion: 전체 순위 기준 "adj_r2" | "cp" | "bic"
+        time_budget: 초 단위 탐색 시간 제한 (None 이면 무제한). 초과 시 complete=False
+        max_workers: 최상위 가지를 나누어 탐색할 프로세스 수 (1 이면 직렬)
+
+    Returns:
+        {"models": DataFrame(size, terms, rss, r_squared, adj_r_squared, cp, bic, rank_in_size),
+         "best", "criterion", "complete", "nodes", "elapsed", "dropped"}
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"지원하지 않는 선택 기준입니다: {criterion}")
+    started = time.monotonic()
+    deadline = None if time_budget is None else started + float(time_budget)
+
+    model = SweepRegression(X, y, names)
+    n = model.n
+    # 공선(별칭) 변수는 전체 모형에 들어가지 못하므로 후보에서 제외
+    dropped = []
+    for j in range(model.p):
+        if model.can_enter(j) and model.df_resid(len(model.active) + 1) >= 0:
+            model.add(j)
+        else:
+            dropped.append(model.names[j])
+    if not model.active:
+        raise ValueError("선택 가능한 후보 변수가 없습니다.")
+
+    p = len(model.active)
+    max_size = min(p, n - 2) if max_size is None else max(1, min(int(max_size), p, n - 2))
+    if max_size < 1:
+        raise ValueError("표본 수가 부족합니다.")
+
+    tops = _TopModels(top, range(1, max_size + 1))
+
+    root_A = model.A.copy()
+    for j in reversed(model.active):
+        reverse_sweep(root_A, j)
+    root_R = _importance(model.A, list(model.active))
+    full_rss = model.rss
+    # 루트에서는 상위 목록이 비어 있어 가지치기가 없으므로 최상위 가지를 모두 미리 만든다
+    branches = list(_children(tops, max_size, root_A, (), model.A.copy(), root_R))
+
+    n_tasks = max(1, min(int(max_workers or 1), len(branches)))
+    # 앞쪽 가지일수록 부분트리가 크므로 번갈아 배분
+    tasks = [(branches[i::n_tasks], max_size, top, deadline) for i in range(n_tasks)]
+    outcomes = map_chunks(_explore_branches, tasks, max_workers=n_tasks, use_processes=True)
+
+    nodes = 1
+    timed_out = False
+    for outcome in outcomes:
+        nodes += outcome["nodes"]
+        timed_out = timed_out or outcome["timed_out"]
+        for k, rss, members in outcome["items"]:
+            tops.offer(k, rss, members)
+
+    df_full = n - p - 1
+    sigma2_full = full_rss / df_full if df_full > 0 else np.nan
+    rows = []
+    for k, rss, members in tops.items():
+        if k > max_size:
+            continue
+        df_resid = n - k - 1
+        r2 = 1 - rss / model.tss if model.tss > 0 else np.nan
+        rows.append({
+            "size": k,
+            "terms": ", ".join(model.names[j] for j in sorted(members)),
+            "rss": rss,
+            "r_squared": r2,
+            "adj_r_squared": 1 - (1 - r2) * (n - 1) / df_resid if df_resid > 0 else np.nan,
+            "cp": rss / sigma2_full - n + 2 * (k + 1) if sigma2_full and sigma2_full > 0 else np.nan,
+            "bic": model.information_criterion(rss, k, "bic"),
+        })
+    models = pd.DataFrame(rows, columns=["size", "terms", "rss", "r_squared", "adj_r_squared", "cp", "bic"])
+    models = models.sort_values(["size", "rss"]).reset_index(drop=True)
+    models["rank_in_size"] = models.groupby("size").cumcount() + 1
+
+    if criterion == "adj_r2":
+        ranked = models.sort_values("adj_r_squared", ascending=False)
+    elif criterion == "cp":
+        # Cp 는 p+1 에 가까울수록 좋음
+        ranked = models.assign(_gap=(models["cp"] - (models["size"] + 1)).abs()).sort_values("_gap")
+    else:
+        ranked = models.sort_values("bic")
+    ranked = ranked.dropna(subset=["adj_r_squared" if criterion == "adj_r2" else criterion])
+    best = ranked.iloc[0].drop(labels=["_gap"], errors="ignore").to_dict() if not ranked.empty else None
+
+    return {
+        "models": models,
+        "best": best,
+        "criterion": criterion,
+        "complete": not timed_out,
+        "nodes": int(nodes),
+        "elapsed": time.monotonic() - started,
+        "dropped": dropped,
+    }
@@ -0,0 +1,183 @@
+"""
+DOE 효과 추정치의 부트스트랩 신뢰구간
+
+모든 재표본 인덱스 행렬을 한 번에 뽑고 OLS 적합을 배치 연산으로 푼다.
+
+- residual: 고정 설계행렬 X 에서 잔차만 재표본 (β* = β̂ + X⁺ e*) -> 행렬곱 1회
+- pairs   : (x_i, y_i) 쌍을 재표본, 배치 정규방정식으로 풀이 (특이 재표본은 제외)
+
+재표본은 utils.parallel.run_seeded_chunks 로 나누어 실행하므로
+작업자 수와 관계없이 같은 seed 면 같은 결과가 나온다.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.parallel import run_seeded_chunks
+
+BOOTSTRAP_METHODS = ("residual", "pairs")
+DEFAULT_CHUNK_SIZE = 500
+
+# 청크 하나의 재표본 인덱스/설계 배열 원소 수 상한 (n 이 크면 청크 크기를 줄임)
+MAX_CHUNK_CELLS = 2_000_000
+
+
+def _bootstrap_chunk(args):
+    """청크 하나의 재표본 계수 (프로세스 풀에서도 호출되는 최상위 함수)"""
+    size, seed_seq, (method, data) = args
+    rng = np.random.default_rng(seed_seq)
+    if method == "residual":
+        beta, resid, pinv_t = data
+        n = resid.size
+        idx = rng.integers(0, n, size=(size, n))
+        # (B, n) @ (n, p) -> (B, p)
+        return beta + resid[idx] @ pinv_t
+
+    X, y, rank = data
+    n, p = X.shape
+    idx = rng.integers(0, n, size=(size, n))
+    Xb = X[idx]                                   # (B, n, p)
+    yb = y[idx]                                   # (B, n)
+    xtx = np.einsum("bnp,bnq->bpq", Xb, Xb)
+    xty = np.einsum("bnp,bn->bp", Xb, yb)
+    betas = np.full((size, p), np.nan)
+    # 재표본에서 수준이 빠지면 원 설계보다 계수가 낮아지므로 해당 재표본은 제외(NaN)
+    ok = np.linalg.matrix_rank(xtx) == rank
+    if ok.any():
+        if rank == p:
+            betas[ok] = np.linalg.solve(xtx[ok], xty[ok][..., None])[..., 0]
+        else:
+            # 별칭(aliasing)이 있는 설계는 statsmodels 와 같이 최소노름 해
+            betas[ok] = (np.linalg.pinv(xtx[ok]) @ xty[ok][..., None])[..., 0]
+    return betas
+
+
+def _percentile_interval(samples: np.ndarray, alpha: float):
+    lower = np.nanquantile(samples, alpha / 2, axis=0)
+    upper = np.nanquantile(samples, 1 - alpha / 2, axis=0)
+    return lower, upper
+
+
+def _bca_interval(samples: np.ndarray, estimate: np.ndarray, jackknife: np.ndarray, alpha: float):
+    """편향 보정 가속(BCa) 구간. 보정이 정의되지 않는 계수는 백분위 구간을 사용."""
+    from scipy.stats import norm
+
+    valid = ~np.isnan(samples).any(axis=1)
+    samples = samples[valid]
+    b = samples.shape[0]
+    below = (samples < estimate).sum(axis=0) + 0.5 * (samples == estimate).sum(axis=0)
+    prop = np.clip(below / b, 1.0 / (2 * b), 1 - 1.0 / (2 * b))
+    z0 = norm.ppf(prop)
+
+    jack_mean = np.nanmean(jackknife, axis=0)
+    diff = jack_mean - jackknife
+    num = np.nansum(diff ** 3, axis=0)
+    den = 6.0 * np.nansum(diff ** 2, axis=0) ** 1.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        accel = np.where(den > 0, num / den, 0.0)
+
+    z_lo, z_hi = norm.ppf(alpha / 2), norm.ppf(1 - alpha / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a_lo = norm.cdf(z0 + (z0 + z_lo) / (1 - accel * (z0 + z_lo)))
+        a_hi = norm.cdf(z0 + (z0 + z_hi) / (1 - accel * (z0 + z_hi)))
+
+    lower = np.empty(samples.shape[1])
+    upper = np.empty(samples.shape[1])
+    pct_lo, pct_hi = _percentile_interval(samples, alpha)
+    for j in range(samples.shape[1]):
+        if np.isfinite(a_lo[j]) and np.isfinite(a_hi[j]):
+            lower[j], upper[j] = np.quantile(samples[:, j], [a_lo[j], a_hi[j]])
+        else:
+            lower[j], upper[j] = pct_lo[j], pct_hi[j]
+    return lower, upper
+
+
+def bootstrap_ols(X, y, terms: Optional[Sequence[str]] = None, n_boot: int = 2000,
+                  method: str = "residual", alpha: float = 0.05, seed: int = 0,
+                  max_workers: int = 1, use_processes: bool = False,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    OLS 계수의 부트스트랩 표준오차와 백분위/BCa 신뢰구간.
+
+    Args:
+        X: 설계행렬 (n, p). 절편 열 포함.
+        y: 반응 (n,)
+        terms: 계수 이름 (기본 x0..)
+        n_boot: 재표본 수
+        method: "residual" (고정 설계, DOE 기본) 또는 "pairs"
+        alpha: 유의수준 (0.05 -> 95% 구간)
+        seed: 난수 시드 (작업자 수와 무관하게 재현)
+        max_workers: 청크 병렬 작업자 수
+        use_processes: True 면 프로세스 풀
+
+    Returns:
+        {"method", "n_boot", "n_valid", "seed", "confidence", "intervals": DataFrame}
+        intervals 열: estimate, std_error, pct_lower, pct_upper, bca_lower, bca_upper
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(f"지원하지 않는 부트스트랩 방식입니다: {method}")
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n, p = X.shape
+    terms = list(terms) if terms is not None else [f"x{j}" for j in range(p)]
+
+    pinv = np.linalg.pinv(X)                      # (p, n)
+    beta = pinv @ y
+    resid = y - X @ beta
+    hat = np.einsum("ij,ji->i", X, pinv)          # 레버리지 h_i
+    rank = np.linalg.matrix_rank(X)
+    if n - rank <= 0:
+        raise ValueError("잔차 자유도가 0이라 부트스트랩을 수행할 수 없습니다.")
+
+    if method == "residual":
+        # 레버리지 보정 후 중심화한 잔차 (h_i ≈ 1 인 점은 정보가 없으므로 0)
+        one_minus_h = 1.0 - hat
+        adj = np.where(one_minus_h > 1e-10, resid / np.sqrt(np.clip(one_minus_h, 1e-10, None)), 0.0)
+        adj = adj - adj.mean()
+        data = (beta, adj, pinv.T.copy())
+    else:
+        data = (X, y, rank)
+
+    # (B, n) 인덱스 행렬 (pairs 는 (B, n, p) 설계) 메모리 제한 - n 으로만 정해지므로 작업자 수와 무관하게 재현
+    cells = n if method == "residual" else n * p
+    chunk_size = max(1, min(int(chunk_size), MAX_CHUNK_CELLS // cells))
+    chunks = run_seeded_chunks(_bootstrap_chunk, (method, data), n_boot, chunk_size, seed=seed,
+                               max_workers=max_workers, use_processes=use_processes)
+    samples = np.vstack(chunks)
+    valid_rows = ~np.isnan(samples).any(axis=1)
+    if valid_rows.sum() < 2:
+        raise ValueError("유효한 부트스트랩 재표본이 부족합니다.")
+
+    # 닫힌 형태 잭나이프: β_(i) = β̂ - X⁺_{:,i} e_i / (1 - h_i)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jackknife = beta[None, :] - (pinv * (resid / (1.0 - hat))).T
+    jackknife[(1.0 - hat) <= 1e-10] = np.nan
+
+    pct_lo, pct_hi = _percentile_interval(samples[valid_rows], alpha)
+    bca_lo, bca_hi = _bca_interval(samples, beta, jackknife, alpha)
+    intervals = pd.DataFrame(
+        {
+            "estimate": beta,
+            "std_error": np.nanstd(samples[valid_rows], axis=0, ddof=1),
+            "pct_lower": pct_lo,
+            "pct_upper": pct_hi,
+            "bca_lower": bca_lo,
+            "bca_upper": bca_hi,
+        },
+        index=terms,
+    )
+    return {
+        "method": method,
+        "n_boot": int(n_boot),
+        "n_valid": int(valid_rows.sum()),
+        "seed": seed,
+        "confidence": 1 - alpha,
+        "intervals": intervals,
+    }
+
+
+def bootstrap_model(model, **kwargs) -> Dict[str, Any]:
+    """statsmodels OLS 결과 객체에서 설계행렬/반응을 꺼내 bootstrap_ols 실행"""
+    return bootstrap_ols(model.model.exog, model.model.endog, terms=model.model.exog_names, **kwargs)
@@ -0,0 +1,123 @@
+"""
+분석 결과용 압축 배열
+
+잔차/적합값/진단량 같은 관측치 길이의 배열을 파이썬 float 리스트 대신 타입이 있는
+NumPy 배열로 보관하고, 저장 시에는 zlib 압축 + base64 바이너리로 인코딩한다.
+불러온 배열은 인코딩된 상태로 두었다가 실제로 값이 필요할 때(상세 보기/API 요청) 디코딩한다.
+
+CompactArray 는 len/반복/인덱싱/np.asarray 를 지원하므로 기존 리스트 소비 코드가 그대로 동작한다.
+"""
+
+import base64
+import zlib
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+ENCODING = "zlib+base64"
+TYPE_TAG = "ndarray"
+
+
+def encode_array(array: np.ndarray) -> Dict[str, Any]:
+    """배열을 JSON 에 넣을 수 있는 압축 바이너리 dict 로 인코딩"""
+    array = np.ascontiguousarray(array)
+    return {
+        "__type__": TYPE_TAG,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "encoding": ENCODING,
+        "data": base64.b64encode(zlib.compress(array.tobytes(), 6)).decode("ascii"),
+    }
+
+
+def decode_array(payload: Dict[str, Any]) -> np.ndarray:
+    """encode_array 의 역변환"""
+    if payload.get("encoding", ENCODING) != ENCODING:
+        raise ValueError(f"지원하지 않는 배열 인코딩입니다: {payload.get('encoding')}")
+    raw = zlib.decompress(base64.b64decode(payload["data"]))
+    array = np.frombuffer(raw, dtype=np.dtype(payload["dtype"]))
+    return array.reshape(payload.get("shape", [-1])).copy()
+
+
+def is_encoded_array(obj: Any) -> bool:
+    return isinstance(obj, dict) and obj.get("__type__") == TYPE_TAG
+
+
+class CompactArray:
+    """타입 배열 또는 인코딩된 페이로드를 감싸고 필요할 때만 디코딩"""
+
+    __slots__ = ("_array", "_payload")
+
+    def __init__(self, array: Optional[np.ndarray] = None, payload: Optional[Dict[str, Any]] = None):
+        self._array = array
+        self._payload = payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "CompactArray":
+        return cls(payload=payload)
+
+    @property
+    def loaded(self) -> bool:
+        return self._array is not None
+
+    @property
+    def array(self) -> np.ndarray:
+        if self._array is None:
+            self._array = decode_array(self._payload)
+        return self._array
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype if self._array is not None else np.dtype(self._payload["dtype"])
+
+    @property
+    def shape(self) -> tuple:
+        return self._array.shape if self._array is not None else tuple(self._payload.get("shape", ()))
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def to_payload(self) -> Dict[str, Any]:
+        """인코딩된 dict (불러온 뒤 접근하지 않은 배열은 재인코딩 없이 그대로 반환)"""
+        if self._payload is None:
+            self._payload = encode_array(self._array)
+        return self._payload
+
+    def tolist(self) -> list:
+        return self.array.tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        # copy=True 면 항상 복사, False 면 복사가 필요할 때 ValueError (NumPy 2 규약), None 이면 필요할 때만
+        array = self.array
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            if copy is False:
+                raise ValueError(f"{array.dtype} → {np.dtype(dtype)} 변환에는 복사가 필요합니다.")
+            return array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __len__(self) -> int:
+        shape = self.shape
+        return int(shape[0]) if shape else 0
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __getitem__(self, item):
+        return self.array[item]
+
+    def __eq__(self, other):
+        if isinstance(other, CompactArray):
+            other = other.array
+        return np.array_equal(self.array, np.asarray(other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "encoded"
+        return f"CompactArray(shape={self.shape}, dtype={self.dtype}, {state})"
+
+
+def compact_array(values, dtype=np.float64) -> CompactArray:
+    """리스트/Series/배열을 CompactArray 로 변환 (dtype=np.float32 로 메모리 절반)"""
+    return CompactArray(np.asarray(values, dtype=dtype))
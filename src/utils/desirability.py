@@ -0,0 +1,244 @@
+"""
+Derringer–Suich 만족도(desirability) 다중 반응 최적화
+
+반응마다 2차 모형(utils.rsm.QuadraticModel)을 같은 코딩([-1, 1])으로 적합하고
+개별 만족도 d_i 의 가중 기하평균 D = Π d_i^(r_i / Σr) 를 최대화한다.
+  최대화  d = ((y - L) / (U - L))^s                (y ≤ L 이면 0, y ≥ U 이면 1)
+  최소화  d = ((U - y) / (U - L))^s                (y ≥ U 이면 0, y ≤ L 이면 1)
+  목표값  d = ((y - L) / (T - L))^s  (L ≤ y ≤ T),  ((U - y) / (U - T))^t  (T ≤ y ≤ U), 범위 밖 0
+
+1단계: 후보점(격자 또는 라틴 하이퍼큐브) 전체를 설계행렬 F(N×p) 와 계수 행렬 [β₁ … β_m] 의
+       한 번의 행렬곱으로 평가한다.
+2단계: D 상위 후보에서 L-BFGS-B(경계 [-1, 1]) 로 국소 개선한다. 재시작은 서로 독립이므로 병렬 실행한다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.rsm import QuadraticModel, coding_from_range, quadratic_design
+
+GOALS = ("maximize", "minimize", "target")
+GOAL_LABELS = {"maximize": "최대화", "minimize": "최소화", "target": "목표값"}
+METHODS = ("lhs", "grid")
+
+# 후보점 최대 개수 (N·p 개의 float 를 한 번에 만듦)
+MAX_CANDIDATES = 200_000
+
+
+def normalize_goals(goals: Sequence[Mapping[str, Any]], data: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    목표 목록 검증/기본값 채우기.
+    각 항목: {"response", "goal", "lower", "upper", "target", "weight", "weight_upper", "importance"}
+    lower/upper 를 생략하면 관측값 최소/최대, 목표값의 target 을 생략하면 중간값을 쓴다.
+    """
+    if not goals:
+        raise ValueError("최적화할 반응을 하나 이상 지정해야 합니다.")
+    normalized = []
+    for item in goals:
+        response = item.get("response")
+        if response not in data.columns:
+            raise ValueError(f"반응 열을 찾을 수 없습니다: {response}")
+        goal = item.get("goal", "maximize")
+        if goal not in GOALS:
+            raise ValueError(f"알 수 없는 목표입니다: {goal} ({', '.join(GOALS)})")
+        observed = pd.to_numeric(data[response], errors="coerce").dropna()
+        lower = float(item["lower"]) if item.get("lower") is not None else float(observed.min())
+        upper = float(item["upper"]) if item.get("upper") is not None else float(observed.max())
+        if not lower < upper:
+            raise ValueError(f"'{response}' 의 하한은 상한보다 작아야 합니다.")
+        target = item.get("target")
+        target = float(target) if target is not None else (lower + upper) / 2
+        if goal == "target" and not lower < target < upper:
+            raise ValueError(f"'{response}' 의 목표값은 하한과 상한 사이여야 합니다.")
+        weight = float(item.get("weight") or 1.0)
+        weight_upper = float(item.get("weight_upper") or weight)
+        importance = float(item.get("importance") or 1.0)
+        if weight <= 0 or weight_upper <= 0 or importance <= 0:
+            raise ValueError(f"'{response}' 의 가중치/중요도는 양수여야 합니다.")
+        normalized.append({
+            "response": response, "goal": goal, "lower": lower, "upper": upper, "target": target,
+            "weight": weight, "weight_upper": weight_upper, "importance": importance,
+        })
+    return normalized
+
+
+def individual_desirability(Y: np.ndarray, goals: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """(N, m) 예측값 → (N, m) 개별 만족도"""
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    d = np.empty_like(Y)
+    for j, g in enumerate(goals):
+        y, L, U, T = Y[:, j], g["lower"], g["upper"], g["target"]
+        if g["goal"] == "maximize":
+            d[:, j] = np.clip((y - L) / (U - L), 0, 1) ** g["weight"]
+        elif g["goal"] == "minimize":
+            d[:, j] = np.clip((U - y) / (U - L), 0, 1) ** g["weight"]
+        else:
+            below = np.clip((y - L) / (T - L), 0, 1) ** g["weight"]
+            above = np.clip((U - y) / (U - T), 0, 1) ** g["weight_upper"]
+            d[:, j] = np.where(y <= T, below, above)
+    return d
+
+
+def overall_desirability(d: np.ndarray, importance: Sequence[float]) -> np.ndarray:
+    """가중 기하평균 (어느 하나라도 0 이면 0)"""
+    r = np.asarray(importance, dtype=float)
+    return np.prod(np.asarray(d) ** (r / r.sum()), axis=1)
+
+
+def latin_hypercube(n: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """[-1, 1]^k 의 라틴 하이퍼큐브 표본 (각 축의 n 등분 구간에 한 점씩)"""
+    u = (rng.permuted(np.tile(np.arange(n), (k, 1)), axis=1).T + rng.random((n, k))) / n
+    return 2 * u - 1
+
+
+def grid_candidates(n: int, k: int) -> np.ndarray:
+    """[-1, 1]^k 의 균등 격자 (축당 ⌊n^(1/k)⌋ 수준, 2 이상 - 2^k ≤ n 일 때만)"""
+    if 2 ** k > n:
+        raise ValueError(f"요인 {k}개의 격자(2^{k}점)가 후보점 수 {n}보다 많습니다.")
+    levels = max(2, int(np.floor(n ** (1.0 / k) + 1e-9)))
+    axes = np.meshgrid(*([np.linspace(-1, 1, levels)] * k), indexing="ij")
+    return np.column_stack([a.ravel() for a in axes])
+
+
+class DesirabilityProblem:
+    """
+    같은 코딩으로 적합한 반응별 2차 모형과 목표.
+    evaluate 는 후보점 전체를 한 번의 행렬곱으로 평가한다.
+    """
+
+    def __init__(self, factors, center, half_range, beta, goals):
+        self.factors = list(factors)
+        self.center = np.asarray(center, dtype=float)
+        self.half_range = np.asarray(half_range, dtype=float)
+        self.beta = np.asarray(beta, dtype=float)  # (p, m)
+        self.goals = list(goals)
+        self.importance = np.array([g["importance"] for g in self.goals])
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, goals: Sequence[Mapping[str, Any]],
+                   factors: Sequence[str]) -> "DesirabilityProblem":
+        """반응별로 결측을 제외하고 적합 (코딩은 요인 전체 범위 기준 공통)"""
+        factors = list(factors)
+        goals = normalize_goals(goals, df)
+        X_all = df[factors].apply(pd.to_numeric, errors="coerce").dropna().to_numpy()
+        center, half = coding_from_range(X_all, factors)
+        betas = []
+        for g in goals:
+            data = df[[g["response"]] + factors].apply(pd.to_numeric, errors="coerce").dropna()
+            model = QuadraticModel.fit(data[factors].to_numpy(), data[g["response"]].to_numpy(), factors,
+                                       response=g["response"], center=center, half_range=half)
+            betas.append(model.beta)
+        return cls(factors, center, half, np.column_stack(betas), goals)
+
+    @property
+    def responses(self) -> List[str]:
+        return [g["response"] for g in self.goals]
+
+    def natural(self, X_coded) -> np.ndarray:
+        return np.asarray(X_coded, dtype=float) * self.half_range + self.center
+
+    def evaluate(self, X_coded):
+        """(예측값 N×m, 개별 만족도 N×m, 종합 만족도 N)"""
+        Y = quadratic_design(np.atleast_2d(X_coded)) @ self.beta
+        d = individual_desirability(Y, self.goals)
+        return Y, d, overall_desirability(d, self.importance)
+
+    def payload(self):
+        """프로세스 실행용 피클 가능한 상태"""
+        return (self.factors, self.center, self.half_range, self.beta, self.goals)
+
+
+def _refine(task):
+    """(x0, payload) → (x, D) - 경계 [-1, 1] 안의 L-BFGS-B 국소 개선"""
+    from scipy.optimize import minimize
+
+    x0, payload = task
+    problem = DesirabilityProblem(*payload)
+    res = minimize(lambda x: -problem.evaluate(x)[2][0], x0, method="L-BFGS-B",
+                   bounds=[(-1.0, 1.0)] * len(x0))
+    x = np.clip(res.x, -1, 1)
+    D = problem.evaluate(x)[2][0]
+    start_D = problem.evaluate(x0)[2][0]
+    return (x, D) if D >= start_D else (np.asarray(x0, dtype=float), start_D)
+
+
+def _select_starts(X: np.ndarray, D: np.ndarray, d: np.ndarray, n_starts: int) -> np.ndarray:
+    """D 상위 후보 (D 가 모두 0 이면 개별 만족도 평균 상위) 중 서로 떨어진 점"""
+    score = D if np.any(D > 0) else d.mean(axis=1)
+    order = np.argsort(-score, kind="stable")
+    starts = []
+    for i in order:
+        if all(np.max(np.abs(X[i] - s)) > 0.1 for s in starts):
+            starts.append(X[i])
+            if len(starts) >= n_starts:
+                break
+    return np.array(starts)
+
+
+def optimize(problem: DesirabilityProblem, method: str = "lhs", n_candidates: int = 5000,
+             n_starts: int = 10, seed: int = 0, max_workers: int = 1,
+             use_processes: bool = False, top: int = 10) -> Dict[str, Any]:
+    """
+    Returns:
+        {"best": {"point", "point_coded", "predictions", "desirabilities", "overall"},
+         "solutions"(DataFrame, D 내림차순), "n_candidates", "n_starts", "method", "candidate_best"}
+    """
+    if method not in METHODS:
+        raise ValueError(f"알 수 없는 후보 생성 방법입니다: {method} ({', '.join(METHODS)})")
+    n_candidates = int(n_candidates)
+    if not 1 <= n_candidates <= MAX_CANDIDATES:
+        raise ValueError(f"후보점 수는 1~{MAX_CANDIDATES} 사이여야 합니다.")
+    k = len(problem.factors)
+    if method == "grid" and 2 ** k > n_candidates:
+        method = "lhs"   # 2수준 격자도 후보점 수를 넘으면 라틴 하이퍼큐브로 (MAX_CANDIDATES 유지)
+    if method == "grid":
+        X = grid_candidates(n_candidates, k)
+    else:
+        X = latin_hypercube(n_candidates, k, np.random.default_rng(seed))
+    _, d, D = problem.evaluate(X)
+    candidate_best = float(D.max())
+
+    starts = _select_starts(X, D, d, max(1, int(n_starts)))
+    tasks = [(x0, problem.payload()) for x0 in starts]
+    if max_workers and max_workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool(max_workers=max_workers) as executor:
+            refined = list(executor.map(_refine, tasks))
+    else:
+        refined = [_refine(task) for task in tasks]
+
+    # 같은 점으로 수렴한 해는 하나만 남김 (재시작 순서 유지 → 결정적)
+    points, scores = [], []
+    for x, value in sorted(refined, key=lambda item: -item[1]):
+        if all(np.max(np.abs(x - p)) > 1e-3 for p in points):
+            points.append(x)
+            scores.append(value)
+    points = np.array(points[:top])
+    Y, d, D = problem.evaluate(points)
+
+    natural = problem.natural(points)
+    solutions = pd.DataFrame(natural, columns=problem.factors)
+    for j, response in enumerate(problem.responses):
+        solutions[response] = Y[:, j]
+    for j, response in enumerate(problem.responses):
+        solutions[f"d({response})"] = d[:, j]
+    solutions["D"] = D
+
+    best = {
+        "point": dict(zip(problem.factors, natural[0].tolist())),
+        "point_coded": dict(zip(problem.factors, points[0].tolist())),
+        "predictions": dict(zip(problem.responses, Y[0].tolist())),
+        "desirabilities": dict(zip(problem.responses, d[0].tolist())),
+        "overall": float(D[0]),
+    }
+    return {
+        "best": best,
+        "solutions": solutions,
+        "n_candidates": int(len(X)),
+        "n_starts": int(len(starts)),
+        "method": method,
+        "candidate_best": candidate_best,
+    }
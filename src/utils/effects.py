@@ -0,0 +1,316 @@
+"""
+2수준 요인/부분요인 설계의 효과 추정 (Yates 알고리즘 = 고속 Walsh–Hadamard 변환)
+
+- 요인을 -1/+1 로 코딩하고 같은 처리 조합(셀)의 반응을 평균한다. (셀마다 반복 수가 같아야 함)
+- 셀이 2^m 개이면 기본 요인 m 개를 골라 셀을 표준(Yates) 순서로 놓고
+  FWHT 한 번(O(N log N))으로 2^m - 1 개 대비를 모두 구한다.
+  나머지 요인은 같은 변환으로 기본 요인 곱(생성 열)을 찾는다. (변환 결과가 한 점에 몰리지 않으면 비정규 설계)
+- 부분요인 설계의 대비는 별칭 사슬 하나를 추정하며 이름은 사슬의 최저 차수 효과를 쓴다. (utils.aliasing)
+- 유의성: Lenth PSE (반복 없이도 가능) 의 개별 ME / 동시 SME 기준, 반복이 있으면 순수오차 t 검정도 함께.
+- 반정규/정규 확률도 좌표와 파레토 순위를 같이 만든다.
+
+Hadamard 행렬 H[i, r] = (-1)^popcount(i & r), 비트 1 = 상위 수준(+1) 이므로
+기본 요인 곱 Π_{b∈i} x_b 의 대비는 (-1)^|i| · (H ȳ)_i 이다.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.aliasing import popcount
+
+# 비트마스크(int64)로 다루는 최대 요인 수
+MAX_FACTORS = 62
+# Lenth PSE 를 계산하는 최소 대비 수
+LENTH_MIN_EFFECTS = 3
+
+
+def fwht(values: np.ndarray) -> np.ndarray:
+    """
+    축 0 (길이 2^m) 방향 Walsh–Hadamard 변환을 제자리에서 수행 (자연 순서, 정규화 없음).
+    values 는 C 연속 실수 배열이어야 하며 같은 배열을 반환한다. 단계마다 절반 크기 임시 버퍼 하나만 쓴다.
+    """
+    n = values.shape[0]
+    if n == 0 or n & (n - 1):
+        raise ValueError("FWHT 길이는 2의 거듭제곱이어야 합니다.")
+    if not values.flags.c_contiguous or not np.issubdtype(values.dtype, np.floating):
+        raise ValueError("FWHT 입력은 C 연속 실수 배열이어야 합니다.")
+    rest = values.shape[1:]
+    scratch = np.empty((n // 2,) + rest, dtype=values.dtype)
+    h = 1
+    while h < n:
+        view = values.reshape((n // (2 * h), 2, h) + rest)
+        lo, hi = view[:, 0], view[:, 1]
+        diff = scratch.reshape((n // (2 * h), h) + rest)
+        np.subtract(lo, hi, out=diff)
+        lo += hi
+        hi[...] = diff
+        h *= 2
+    return values
+
+
+def code_two_level(df: pd.DataFrame, factors: Sequence[str]) -> Tuple[np.ndarray, Dict[str, Tuple[Any, Any]]]:
+    """요인 열 → (상위 수준 여부 (n, k) bool, {요인: (하위 수준, 상위 수준)}). 숫자형은 큰 값이 상위."""
+    bits = np.empty((len(df), len(factors)), dtype=bool)
+    levels = {}
+    for j, f in enumerate(factors):
+        values = df[f]
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().all():
+            values = numeric
+        codes, uniques = pd.factorize(values, sort=True)
+        if len(uniques) != 2 or (codes < 0).any():
+            raise ValueError(f"요인 '{f}'은(는) 2수준이어야 합니다. (수준 {len(uniques)}개)")
+        bits[:, j] = codes == 1
+        levels[f] = tuple(v.item() if hasattr(v, "item") else v for v in uniques)
+    return bits, levels
+
+
+def lenth_pse(effects: np.ndarray) -> float:
+    """Lenth (1989) 의사 표준오차: s0 = 1.5·median|c|, PSE = 1.5·median{|c| : |c| < 2.5·s0}"""
+    abs_effects = np.abs(np.asarray(effects, dtype=float))
+    s0 = 1.5 * np.median(abs_effects)
+    trimmed = abs_effects[abs_effects < 2.5 * s0]
+    return float(1.5 * np.median(trimmed)) if len(trimmed) else float(s0)
+
+
+def probability_quantiles(effects: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(반정규 분위수, 정규 분위수) - 효과 순서 그대로. 순위 기준은 각각 |효과|, 효과."""
+    from scipy.special import ndtri
+
+    effects = np.asarray(effects, dtype=float)
+    m = len(effects)
+    positions = (np.arange(1, m + 1) - 0.5) / m
+    half = np.empty(m)
+    half[np.argsort(np.abs(effects), kind="stable")] = ndtri(0.5 + 0.5 * positions)
+    full = np.empty(m)
+    full[np.argsort(effects, kind="stable")] = ndtri(positions)
+    return half, full
+
+
+def _effect_name(mask: int, labels: Sequence[str]) -> str:
+    names = [labels[i] for i in range(len(labels)) if mask >> i & 1]
+    return ("" if all(len(name) == 1 for name in names) else "*").join(names)
+
+
+def _base_factors(cell_bits: np.ndarray, m: int) -> Tuple[List[int], np.ndarray]:
+    """셀을 서로 다른 2^m 개 조합으로 나누는 기본 요인 열 (앞 열부터 탐욕적으로) 과 셀의 표준 순서 번호"""
+    index = np.zeros(len(cell_bits), dtype=np.int64)
+    base, distinct = [], 1
+    for j in range(cell_bits.shape[1]):
+        if len(base) == m:
+            break
+        trial = index | (cell_bits[:, j] << len(base))
+        count = np.count_nonzero(np.bincount(trial, minlength=2 * distinct))
+        if count == 2 * distinct:
+            base.append(j)
+            index, distinct = trial, count
+    if len(base) < m:
+        raise ValueError("처리 조합이 정규 2수준 (부분)요인 설계를 이루지 않습니다. (DOE ANOVA 를 사용하세요)")
+    return base, index
+
+
+def _generator_images(cell_bits: np.ndarray, order: np.ndarray, columns: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """생성 열의 (기본 요인 마스크, 부호) - 표준 순서 ±1 열을 FWHT 해서 한 점에 몰리는지 확인"""
+    n = len(order)
+    if not len(columns):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int8)
+    X = np.ascontiguousarray(2.0 * cell_bits[order][:, columns] - 1.0)
+    T = fwht(X) / n
+    images = np.argmax(np.abs(T), axis=0)
+    peak = T[images, np.arange(len(columns))]
+    if not np.allclose(np.abs(peak), 1.0) or np.any(np.count_nonzero(np.abs(T) > 1e-9, axis=0) != 1):
+        raise ValueError("요인 열이 기본 요인의 곱이 아닙니다. (비정규 설계는 DOE ANOVA 를 사용하세요)")
+    parity = np.where(popcount(images) % 2 == 1, -1, 1)
+    return images.astype(np.int64), np.where(peak * parity < 0, -1, 1).astype(np.int8)
+
+
+def _effect_terms(labels: Sequence[str], base: Sequence[int], images: np.ndarray, signs: np.ndarray,
+                  m: int) -> Tuple[List[str], np.ndarray, List[str], np.ndarray, Optional[Any]]:
+    """
+    대비 i = 1..2^m-1 별 (효과 이름, 차수, 별칭 사슬, 부호, 별칭 구조).
+    부호: 이름 효과의 열 = 부호 · Π_{b∈i} x_b (완전요인이면 모두 +1)
+    """
+    k = len(labels)
+    n = 1 << m
+    if k == m:
+        sep = "" if all(len(label) == 1 for label in labels) else "*"
+        names = [""]
+        for b in base:
+            names += [f"{name}{sep}{labels[b]}" if name else labels[b] for name in names]
+        orders = popcount(np.arange(n, dtype=np.int64))
+        return names[1:], orders[1:], names[1:], np.ones(n - 1, dtype=np.int8), None
+
+    from utils.aliasing import DEFAULT_ORDER, MAX_FULL_FACTORS, alias_structure_from_columns
+
+    structure = alias_structure_from_columns(images, signs, labels)
+    max_order = None if k <= MAX_FULL_FACTORS else DEFAULT_ORDER
+    # 사슬에 낮은 차수 효과가 없으면 기본 요인 곱 이름을 쓴다
+    column_masks = np.zeros(n, dtype=np.int64)
+    for b, c in enumerate(base):
+        column_masks |= ((np.arange(n, dtype=np.int64) >> b) & 1) << c
+    names = [_effect_name(int(mask), labels) for mask in column_masks]
+    chains = list(names)
+    orders = popcount(column_masks)
+    term_signs = np.ones(n, dtype=np.int8)
+    groups = structure.alias_groups(max_order)
+    leaders = np.array([masks[0] for _, masks, _ in groups], dtype=np.int64)
+    _, leader_signs = structure.effect_images(leaders)
+    for (phi, masks, _), chain, s in zip(groups, structure.chains(max_order), leader_signs.tolist()):
+        leader = int(masks[0])
+        names[phi] = _effect_name(leader, labels)
+        chains[phi] = chain
+        orders[phi] = int(popcount(np.int64(leader)))
+        term_signs[phi] = s
+    return names[1:], orders[1:], chains[1:], term_signs[1:], structure
+
+
+def two_level_effects(bits: np.ndarray, y: np.ndarray, names: Sequence[str], alpha: float = 0.05) -> Dict[str, Any]:
+    """
+    2수준 (부분)요인 설계의 전체 효과 (FWHT).
+
+    Args:
+        bits: (n, k) 상위 수준 여부
+        y: (n,) 반응
+        names: 요인 이름 k 개
+        alpha: Lenth ME/SME 및 순수오차 검정 유의수준
+
+    Returns:
+        {"effects": DataFrame(표준 순서), "mean", "pse", "margin_of_error", "simultaneous_margin",
+         "lenth_df", "active", "runs", "replicates", "n_obs", "base_factors", "generators",
+         "resolution", "pure_error_df", "pure_error_sigma", "total_sum_sq"}
+    """
+    from scipy.special import stdtr, stdtrit
+
+    bits = np.asarray(bits, dtype=bool)
+    y = np.asarray(y, dtype=float)
+    n, k = bits.shape
+    if k == 0 or len(names) != k:
+        raise ValueError("요인 이름 수가 요인 열 수와 다릅니다.")
+    if k > MAX_FACTORS:
+        raise ValueError(f"요인은 {MAX_FACTORS}개까지 지원합니다.")
+    if len(y) != n or not np.isfinite(y).all():
+        raise ValueError("반응 값이 요인 행 수와 다르거나 결측이 있습니다.")
+    if not 0 < alpha < 1:
+        raise ValueError("유의수준은 0과 1 사이여야 합니다.")
+
+    codes = bits.astype(np.int64) @ (np.int64(1) << np.arange(k, dtype=np.int64))
+    cells, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+    replicates = int(counts[0])
+    if np.any(counts != replicates):
+        raise ValueError("처리 조합마다 반복 수가 같아야 합니다. (불균형 설계는 DOE ANOVA 를 사용하세요)")
+    n_cells = len(cells)
+    m = n_cells.bit_length() - 1
+    if n_cells < 2 or n_cells != 1 << m:
+        raise ValueError(f"서로 다른 처리 조합 수({n_cells})가 2의 거듭제곱이 아닙니다. (정규 2수준 설계가 아님)")
+    means = np.bincount(inverse, weights=y, minlength=n_cells) / replicates
+
+    # 기본 요인으로 셀을 표준 순서에 놓고 나머지 요인은 기본 요인 곱으로 표현
+    cell_bits = (cells[:, None] >> np.arange(k, dtype=np.int64)) & 1
+    base, index = _base_factors(cell_bits, m)
+    order = np.empty(n_cells, dtype=np.int64)
+    order[index] = np.arange(n_cells)
+    generated = [j for j in range(k) if j not in set(base)]
+    gen_images, gen_signs = _generator_images(cell_bits, order, generated)
+    images = np.zeros(k, dtype=np.int64)
+    signs = np.ones(k, dtype=np.int8)
+    images[base] = np.int64(1) << np.arange(m, dtype=np.int64)
+    images[generated] = gen_images
+    signs[generated] = gen_signs
+
+    contrasts = fwht(np.ascontiguousarray(means[order]))
+    parity = np.where(popcount(np.arange(n_cells, dtype=np.int64)) % 2 == 1, -1.0, 1.0)
+    terms, orders, chains, term_signs, structure = _effect_terms(list(names), base, images, signs, m)
+    effects = 2.0 * contrasts[1:] * parity[1:] * term_signs / n_cells
+    grand_mean = float(contrasts[0] / n_cells)
+
+    total_ss = float(np.sum((y - y.mean()) ** 2))
+    sum_sq = n * effects ** 2 / 4.0
+    table = pd.DataFrame({
+        "term": terms,
+        "order": orders.astype(int),
+        "effect": effects,
+        "coefficient": effects / 2.0,
+        "sum_sq": sum_sq,
+        "contribution": sum_sq / total_ss * 100.0 if total_ss > 0 else np.zeros(len(effects)),
+    })
+    if structure is not None:
+        table["aliases"] = chains
+
+    n_effects = len(effects)
+    pse = me = sme = lenth_df = None
+    active: List[str] = []
+    if n_effects >= LENTH_MIN_EFFECTS:
+        pse = lenth_pse(effects)
+        lenth_df = n_effects / 3.0
+        gamma = (1.0 + (1.0 - alpha) ** (1.0 / n_effects)) / 2.0
+        me = float(stdtrit(lenth_df, 1.0 - alpha / 2.0) * pse)
+        sme = float(stdtrit(lenth_df, gamma) * pse)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_lenth = np.where(pse > 0, effects / pse, np.nan)
+        table["t_lenth"] = t_lenth
+        table["p_lenth"] = 2.0 * stdtr(lenth_df, -np.abs(t_lenth))
+        table["significant"] = np.abs(effects) > me if pse > 0 else False
+        table["simultaneous"] = np.abs(effects) > sme if pse > 0 else False
+        active = table["term"][table["significant"]].tolist()
+
+    pure_df = n - n_cells
+    pure_sigma = None
+    if pure_df > 0:
+        residuals = y - means[inverse]
+        pure_sigma = float(np.sqrt(np.sum(residuals ** 2) / pure_df))
+        se = 2.0 * pure_sigma / np.sqrt(n)
+        table["se"] = se
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_values = np.where(se > 0, effects / se, np.nan)
+        table["t_value"] = t_values
+        table["p_value"] = 2.0 * stdtr(pure_df, -np.abs(t_values))
+
+    half, full = probability_quantiles(effects)
+    table["half_normal_q"] = half
+    table["normal_q"] = full
+    pareto = np.argsort(-np.abs(effects), kind="stable")
+    rank = np.empty(n_effects, dtype=int)
+    rank[pareto] = np.arange(1, n_effects + 1)
+    table["pareto_rank"] = rank
+
+    return {
+        "effects": table,
+        "mean": grand_mean,
+        "pse": pse,
+        "margin_of_error": me,
+        "simultaneous_margin": sme,
+        "lenth_df": lenth_df,
+        "alpha": alpha,
+        "active": active,
+        "runs": n_cells,
+        "replicates": replicates,
+        "n_obs": int(n),
+        "base_factors": [names[j] for j in base],
+        "generators": structure.generators() if structure is not None else [],
+        "resolution": structure.resolution if structure is not None else None,
+        "pure_error_df": int(pure_df),
+        "pure_error_sigma": pure_sigma,
+        "total_sum_sq": total_ss,
+    }
+
+
+def effects_from_frame(df: pd.DataFrame, response: str, factors: Sequence[str], alpha: float = 0.05) -> Dict[str, Any]:
+    """데이터프레임의 2수준 요인 열/반응 열로 two_level_effects (결측 행 제외, 수준은 "levels" 에 기록)"""
+    factors = list(factors)
+    missing = [c for c in [response] + factors if c not in df.columns]
+    if missing:
+        raise ValueError(f"열을 찾을 수 없습니다: {', '.join(missing)}")
+    frame = df[[response] + factors].copy()
+    frame[response] = pd.to_numeric(frame[response], errors="coerce")
+    frame = frame.dropna()
+    bits, levels = code_two_level(frame, factors)
+    result = two_level_effects(bits, frame[response].to_numpy(dtype=float), factors, alpha=alpha)
+    result["levels"] = levels
+    return result
+
+
+def two_level_factors(df: pd.DataFrame, exclude: Sequence[str] = ()) -> List[str]:
+    """결측을 뺀 값이 정확히 2개인 열 (요인 자동 선택용)"""
+    return [c for c in df.columns if c not in exclude and df[c].dropna().nunique() == 2]
@@ -4,6 +4,7 @@
 
 import os
 import json
+import tempfile
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
@@ -152,6 +153,37 @@ def save_json_file(data: Any, file_path: str,
     except Exception:
         return False
 
+def write_json_atomic(data: Any, file_path, **dump_kwargs) -> bool:
+    """
+    JSON 을 같은 디렉토리의 고유한 임시 파일에 쓴 뒤 os.replace 로 바꿔 넣습니다.
+    여러 스레드/프로세스가 동시에 기록해도 읽는 쪽은 온전한 파일만 봅니다. (캐시 파일용)
+    
+    Args:
+        data: 저장할 데이터
+        file_path: 저장할 파일 경로
+        **dump_kwargs: json.dump 옵션
+        
+    Returns:
+        bool: 저장 성공 여부 (실패 시 임시 파일은 지움)
+    """
+    path = Path(file_path)
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, prefix=f'{path.name}.',
+                                         suffix='.tmp', delete=False) as f:
+            tmp = f.name
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        return False
+
 def get_file_info(file_path: str) -> Dict[str, Any]:
     """
     파일의 정보를 가져옵니다.
@@ -1,24 +1,160 @@
 """
 폰트 관리 유틸리티
 matplotlib 한글 폰트 설정 및 관리
+
+한글 폰트 탐색 결과(폰트 이름/파일 경로)는 디스크에 캐시하고, 첫 차트를 그릴 때 한 번만 확인한다.
+캐시 키는 운영체제 + matplotlib 버전 + 폰트 디렉터리 mtime 이므로 폰트를 설치/삭제하면 다시 탐색한다.
+캐시 파일 위치는 DOE_FONT_CACHE 환경 변수로 바꿀 수 있다. (기본: matplotlib 캐시 디렉터리)
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from pathlib import Path
-import platform
+import json
 import os
+import platform
+from pathlib import Path
+
+from utils.file_utils import write_json_atomic
+
+CACHE_VERSION = 1
+
+# 어떤 한글 폰트도 없을 때 사용하는 기본 폰트
+FALLBACK_FONTS = ['DejaVu Sans', 'Arial', 'sans-serif']
+
+
+def _font_directories():
+    """시스템/사용자 폰트 디렉터리 목록 (존재 여부와 무관)"""
+    import matplotlib as mpl
+    import matplotlib.font_manager as fm
+
+    system = platform.system()
+    if system == 'Windows':
+        dirs = [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')]
+        if os.environ.get('LOCALAPPDATA'):
+            dirs.append(os.path.join(os.environ['LOCALAPPDATA'], 'Microsoft', 'Windows', 'Fonts'))
+    elif system == 'Darwin':
+        dirs = list(fm.OSXFontDirectories)
+    else:
+        dirs = list(fm.X11FontDirectories)
+    dirs.append(os.path.join(mpl.get_data_path(), 'fonts', 'ttf'))
+    return dirs
+
+
+def font_directory_stamp(depth=2):
+    """폰트 디렉터리(하위 depth 단계까지)의 mtime 목록 - 폰트 설치/삭제 감지용 캐시 키"""
+    stamp = []
+
+    def visit(path, level):
+        try:
+            stamp.append([path, os.stat(path).st_mtime_ns])
+            if level < depth:
+                with os.scandir(path) as entries:
+                    subdirs = sorted(e.path for e in entries if e.is_dir(follow_symlinks=False))
+                for sub in subdirs:
+                    visit(sub, level + 1)
+        except OSError:
+            pass
+
+    for directory in _font_directories():
+        visit(os.path.normpath(directory), 0)
+    return stamp
+
+
+def default_cache_path():
+    override = os.environ.get('DOE_FONT_CACHE')
+    if override:
+        return Path(override)
+    import matplotlib as mpl
+
+    return Path(mpl.get_cachedir()) / 'statiwebapp-korean-font.json'
+
 
 class FontManager:
-    """폰트 관리 클래스"""
+    """폰트 관리 클래스 (폰트 탐색은 첫 사용 시 지연 수행)"""
     
-    def __init__(self):
-        self.available_fonts = self.get_available_korean_fonts()
+    def __init__(self, cache_path=None):
+        self.cache_path = Path(cache_path) if cache_path else None
         self.current_font = None
-        self.setup_default_font()
-    
+        self.font_path = None
+        self._available_fonts = None
+        self.cache_hit = None  # 마지막 탐색이 디스크 캐시에서 왔는지 (미탐색이면 None)
+
+    @property
+    def available_fonts(self):
+        """사용 가능한 폰트 목록 (한글 폰트 우선, 마지막은 기본 폰트)"""
+        if self._available_fonts is None:
+            self._resolve()
+        return self._available_fonts
+
+    def _cache_key(self):
+        import matplotlib as mpl
+
+        return {
+            'version': CACHE_VERSION,
+            'system': platform.system(),
+            'matplotlib': mpl.__version__,
+            'font_dirs': font_directory_stamp(),
+        }
+
+    def _resolve(self):
+        """디스크 캐시 확인 → 없거나 오래됐으면 폰트 목록을 탐색하고 캐시에 기록"""
+        path = self.cache_path or default_cache_path()
+        key = self._cache_key()
+        cached = self._read_cache(path)
+        if cached is not None and cached.get('key') == key and self._usable(cached.get('font_path')):
+            self._available_fonts = list(cached['fonts'])
+            self.font_path = cached.get('font_path')
+            self.cache_hit = True
+            self._register_font_file()
+            return
+
+        self._available_fonts = self.get_available_korean_fonts()
+        self.font_path = self._find_font_file(self._available_fonts[0])
+        self.cache_hit = False
+        self._write_cache(path, {'key': key, 'fonts': self._available_fonts, 'font_path': self.font_path})
+
+    @staticmethod
+    def _usable(font_path):
+        return font_path is None or os.path.exists(font_path)
+
+    @staticmethod
+    def _read_cache(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and isinstance(data.get('fonts'), list) and data['fonts'] else None
+
+    @staticmethod
+    def _write_cache(path, data):
+        # 캐시는 최적화일 뿐이므로 기록 실패는 무시
+        write_json_atomic(data, path, ensure_ascii=False)
+
+    @staticmethod
+    def _find_font_file(font_name):
+        """폰트 이름 → 파일 경로 (matplotlib 에 등록되지 않은 이름이면 None)"""
+        import matplotlib.font_manager as fm
+
+        try:
+            return fm.findfont(fm.FontProperties(family=font_name), fallback_to_default=False)
+        except ValueError:
+            return None
+
+    def _register_font_file(self):
+        """캐시된 폰트 파일이 matplotlib 폰트 목록에 없으면 등록 (matplotlib 캐시보다 나중에 설치된 폰트)"""
+        if not self.font_path:
+            return
+        import matplotlib.font_manager as fm
+
+        if all(entry.fname != self.font_path for entry in fm.fontManager.ttflist):
+            try:
+                fm.fontManager.addfont(self.font_path)
+            except (OSError, RuntimeError, ValueError):
+                self.font_path = None
+
     def get_available_korean_fonts(self):
         """사용 가능한 한글 폰트 목록 반환"""
+        import matplotlib.font_manager as fm
+
         korean_fonts = []
         
         # 시스템별 기본 한글 폰트
@@ -38,6 +174,7 @@ class FontManager:
             ],
             'Linux': [
                 'NanumGothic', 'NanumBarunGothic',
+                'Noto Sans CJK KR', 'Noto Sans KR',
                 'UnDotum', 'UnBatang'
             ]
         }
@@ -53,29 +190,30 @@ class FontManager:
                 korean_fonts.append(font)
         
         # 기본 폰트도 추가
-        korean_fonts.extend(['DejaVu Sans', 'Arial', 'sans-serif'])
+        korean_fonts.extend(FALLBACK_FONTS)
         
         return korean_fonts
     
     def setup_default_font(self):
-        """기본 한글 폰트 설정"""
+        """기본 한글 폰트 설정 (탐색은 최초 1회, 이후 호출은 rcParams 적용만)"""
+        import matplotlib as mpl
+
         if self.available_fonts:
             self.set_font(self.available_fonts[0])
         else:
             # 폰트가 없으면 기본 설정
-            plt.rcParams['font.family'] = ['sans-serif']
-            plt.rcParams['axes.unicode_minus'] = False
+            mpl.rcParams['font.family'] = ['sans-serif']
+            mpl.rcParams['axes.unicode_minus'] = False
     
     def set_font(self, font_name):
         """지정된 폰트로 설정"""
+        import matplotlib as mpl
+
         try:
-            plt.rcParams['font.family'] = [font_name, 'DejaVu Sans', 'sans-serif']
-            plt.rcParams['axes.unicode_minus'] = False
+            mpl.rcParams['font.family'] = [font_name, 'DejaVu Sans', 'sans-serif']
+            mpl.rcParams['axes.unicode_minus'] = False
             self.current_font = font_name
             
-            # 폰트 캐시 새로고침
-            plt.rcParams['font.size'] = plt.rcParams['font.size']
-            
             return True
         except Exception as e:
             print(f"폰트 설정 실패: {e}")
@@ -91,6 +229,8 @@ class FontManager:
     
     def test_font(self, font_name):
         """폰트 테스트"""
+        import matplotlib.pyplot as plt
+
         try:
             # 임시로 폰트 설정해보기
             original_font = plt.rcParams['font.family'].copy()
@@ -108,7 +248,16 @@ class FontManager:
         except Exception:
             return False
 
-# 전역 폰트 매니저 인스턴스
+    def clear_cache(self):
+        """디스크 캐시 삭제 (다음 사용 시 다시 탐색)"""
+        self._available_fonts = None
+        self.cache_hit = None
+        try:
+            (self.cache_path or default_cache_path()).unlink()
+        except OSError:
+            pass
+
+# 전역 폰트 매니저 인스턴스 (생성 시 폰트 탐색을 하지 않음)
 font_manager = FontManager()
 
 def get_font_manager():
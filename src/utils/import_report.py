@@ -0,0 +1,100 @@
+"""
+import 시간 보고서
+
+새 인터프리터에서 `python -X importtime -c "import <모듈>"` 을 실행해 모듈별 import 시간을 집계한다.
+(현재 프로세스에 이미 로드된 모듈의 영향을 받지 않도록 하위 프로세스에서 측정)
+
+사용 예 (src 디렉터리에서):
+    python -m utils.import_report webapp.app
+    python -m utils.import_report views.main_window --top 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+
+# 시작 시 로드되지 않아야 하는 무거운 라이브러리
+HEAVY_MODULES = ("scipy", "statsmodels", "sklearn", "seaborn", "matplotlib", "pyDOE2", "PySide6")
+
+
+def parse_importtime(text: str) -> List[Dict[str, object]]:
+    """-X importtime 출력 → [{"module", "self_us", "cumulative_us", "depth"}] (import 순서)"""
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 머리글 행
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        rows.append({
+            "module": stripped,
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": (len(name) - len(stripped)) // 2,
+        })
+    return rows
+
+
+def import_report(target: str, env: Optional[Dict[str, str]] = None, timeout: float = 300) -> Dict[str, object]:
+    """
+    target 모듈의 콜드 import 보고서.
+
+    Returns:
+        {"target", "total_ms", "modules": 누적 시간 내림차순 행 목록, "heavy": 로드된 무거운 라이브러리}
+    """
+    run_env = dict(os.environ)
+    run_env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if env:
+        run_env.update(env)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=str(SRC_DIR), env=run_env, capture_output=True, text=True, timeout=timeout,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"'{target}' import 실패:\n{proc.stderr.strip().splitlines()[-1:]}")
+    rows = parse_importtime(proc.stderr)
+    loaded = {row["module"] for row in rows}
+    total = next((row["cumulative_us"] for row in reversed(rows) if row["module"] == target), None)
+    if total is None:
+        total = sum(row["cumulative_us"] for row in rows if row["depth"] == 0)
+    return {
+        "target": target,
+        "total_ms": total / 1000.0,
+        "modules": sorted(rows, key=lambda row: row["cumulative_us"], reverse=True),
+        "heavy": [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def format_report(report: Dict[str, object], top: int = 20) -> str:
+    lines = [
+        f"import {report['target']}: {report['total_ms']:.1f} ms",
+        f"무거운 라이브러리: {', '.join(report['heavy']) or '없음'}",
+        "",
+        f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈",
+    ]
+    for row in report["modules"][:top]:
+        lines.append(f"{row['cumulative_us'] / 1000:10.1f} {row['self_us'] / 1000:10.1f}  {row['module']}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="모듈별 import 시간 보고서")
+    parser.add_argument("targets", nargs="*", default=["webapp.app", "views.main_window"])
+    parser.add_argument("--top", type=int, default=20, help="표시할 모듈 수 (누적 시간 순)")
+    args = parser.parse_args(argv)
+    for i, target in enumerate(args.targets):
+        if i:
+            print()
+        print(format_report(import_report(target), top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
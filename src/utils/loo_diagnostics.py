@@ -0,0 +1,83 @@
+"""
+닫힌 형태의 PRESS / 예측 R² 와 leave-one-out 진단
+
+n 개 모형을 재적합하지 않고 열 피벗 QR 의 Q 에서 햇 행렬 대각만 구한다. (n×n 햇 행렬은 만들지 않음)
+  h_i = ||Q_i||², e_(i) = e_i / (1 - h_i)
+QR 이후 모든 진단량은 O(n·rank) 로 계산된다.
+"""
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+# 이 값 이상인 레버리지는 1 로 보고 해당 관측치의 LOO 잔차를 정의하지 않음
+LEVERAGE_ONE_TOL = 1 - 1e-10
+
+# 관측치별 배열 결과 키
+ARRAY_KEYS = ("leverage", "studentized_residuals", "externally_studentized", "cooks_distance")
+
+
+def hat_diagonal(X: np.ndarray) -> Tuple[np.ndarray, int]:
+    """(햇 행렬 대각, 계수) - 계수 부족 설계는 피벗 QR 로 유효 열만 사용"""
+    from scipy.linalg import qr
+
+    X = np.asarray(X, dtype=float)
+    q, r, _ = qr(X, mode="economic", pivoting=True)
+    diag = np.abs(np.diag(r))
+    tol = diag[0] * max(X.shape) * np.finfo(float).eps if diag.size else 0.0
+    rank = int((diag > tol).sum())
+    q = q[:, :rank]
+    return np.einsum("ij,ij->i", q, q), rank
+
+
+def loo_diagnostics(X, y) -> Dict[str, Any]:
+    """
+    OLS 의 leave-one-out 진단.
+
+    Returns:
+        {"press", "predicted_r_squared", "leverage", "studentized_residuals"(내부),
+         "externally_studentized", "cooks_distance", "high_leverage", "influential", "rank"}
+        관측치별 값은 ndarray. leverage 가 1 인 관측치(포화 설계 등)의 LOO 값은 NaN, press 도 NaN 이 된다.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    h, rank = hat_diagonal(X)
+    beta = np.linalg.lstsq(X, y, rcond=None)[0]
+    e = y - X @ beta
+    df_resid = n - rank
+
+    one = h >= LEVERAGE_ONE_TOL
+    denom = np.where(one, np.nan, 1 - h)
+    loo_resid = e / denom
+    press = float(np.sum(loo_resid ** 2)) if not one.any() else np.nan
+    tss = float(np.sum((y - y.mean()) ** 2))
+    predicted_r2 = 1 - press / tss if tss > 0 and np.isfinite(press) else np.nan
+
+    if df_resid > 0:
+        s2 = float(e @ e) / df_resid
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_int = e / np.sqrt(s2 * denom)
+            # 외부 스튜던트화: i 번째를 뺀 분산 추정 (닫힌 형태)
+            ext_arg = (df_resid - 1) / (df_resid - r_int ** 2)
+            r_ext = r_int * np.sqrt(np.where(ext_arg > 0, ext_arg, np.nan)) if df_resid > 1 else np.full(n, np.nan)
+            cooks = r_int ** 2 * h / (rank * denom)
+    else:
+        r_int = r_ext = cooks = np.full(n, np.nan)
+
+    return {
+        "press": press,
+        "predicted_r_squared": float(predicted_r2),
+        "leverage": h,
+        "studentized_residuals": np.asarray(r_int, dtype=float),
+        "externally_studentized": np.asarray(r_ext, dtype=float),
+        "cooks_distance": np.asarray(cooks, dtype=float),
+        "high_leverage": np.flatnonzero(h > 2 * rank / n).tolist(),
+        "influential": np.flatnonzero(np.nan_to_num(cooks) > 4 / n).tolist(),
+        "rank": rank,
+    }
+
+
+def model_diagnostics(model) -> Dict[str, Any]:
+    """statsmodels OLS 적합 결과용 loo_diagnostics"""
+    return loo_diagnostics(model.model.exog, model.model.endog)
@@ -0,0 +1,467 @@
+"""
+2^(k-p) 부분요인 설계의 최소 aberration generator 검색
+
+기본 요인 m = k - p 개(런 2^m)일 때 설계 열은 GF(2)^m 의 0 이 아닌 벡터(비트마스크)이고,
+설계는 기본 열 e_1..e_m 과 생성 열 p 개의 집합이다. 기본 요인을 바꿔 잡는 것(GL(m, 2))과 열 순서만 다른
+설계는 같은 설계(동형)로 본다.
+- 단어 길이 패턴(WLP): 설계 열이 만드는 코드의 무게 분포 B 를 u ∈ GF(2)^m 로 세고 MacWilliams 항등식
+  A_j = 2^-m Σ_i B_i K_j(i) (K: Krawtchouk 다항식)로 구한다. 정의 관계 2^p 개를 펼치지 않는다.
+- 불변량: WLP 와 열별 글자 패턴(그 열을 뺀 설계와의 WLP 차이)을 정렬한 것
+- 동형 검사: 불변량이 겹치는 설계만 정준형을 구한다. 글자 패턴 순서가 정해진 설계 열 기저 B 를 모두 골라
+  B 좌표로 나타낸 열 집합(정렬) 중 사전식 최소가 정준형이다. 기저가 MAX_BASES 를 넘으면 판정하지 않고 따로 둔다.
+  (다른 설계를 같다고 보는 일은 없다)
+- 검색: 생성 열을 하나씩 늘리며 단계마다 동형류 대표만 남긴다. (Chen–Sun–Wu 순차 확장)
+  최소 aberration 설계는 해상도가 최대이므로 해상도 V 제약부터 IV, III 순으로 내려가며 처음 찾은 결과를 쓴다.
+  조합 C(후보 열, p) 이 EXHAUSTIVE_LIMIT 이하이면 전수 평가한다. 단계별 대표가 max_classes 를 넘으면
+  WLP 가 좋은 대표만 남기고 결과에 exhaustive=False 로 표시한다.
+  time_budget(초)이 지나면 남은 청크를 건너뛰고 이후 단계는 최선 대표 하나로만 확장해 바로 끝낸다. (exhaustive=False)
+찾은 설계는 디스크 카탈로그(JSON)에 저장해 다음 요청에 바로 쓴다. (DOE_FRACTIONAL_CATALOGUE 로 경로 변경)
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from functools import lru_cache
+from itertools import combinations, islice
+from math import comb
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from utils.aliasing import MAX_GENERATORS, alias_structure, popcount
+from utils.file_utils import write_json_atomic
+
+CATALOGUE_VERSION = 1
+MAX_RUN_EXPONENT = 7          # 런 128 까지
+EXHAUSTIVE_LIMIT = 200_000    # 전수 평가할 최대 조합 수
+MAX_CLASSES = 2000            # 단계별 동형류 대표 상한
+RESOLUTION_START = 5          # 검색을 시작할 해상도 제약
+MAX_BASES = 5_000             # 정준형 계산 시 설계당 기저 후보 상한
+_CHUNK_CELLS = 2_000_000      # 청크당 (설계 수 · 2^m · k) 상한
+_CANONICAL_CHUNK = 64         # 정준형 청크당 설계 수 (시간 상한을 자주 확인하도록 작게)
+_INT64_FACTORS = 40           # 이 요인 수까지 Krawtchouk 곱을 int64 로 (넘으면 파이썬 정수)
+
+
+# ---------------------------------------------------------------------------
+# 단어 길이 패턴 / 불변량
+# ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _krawtchouk(k: int) -> np.ndarray:
+    """K[i, j] = K_j(i) = Σ_s (-1)^s C(i, s) C(k - i, j - s)"""
+    table = [[sum((-1) ** s * comb(i, s) * comb(k - i, j - s) for s in range(j + 1)) for j in range(k + 1)]
+             for i in range(k + 1)]
+    return np.array(table, dtype=np.int64 if k <= _INT64_FACTORS else object)
+
+
+def word_length_patterns(columns: np.ndarray, m: int) -> np.ndarray:
+    """
+    설계 열 집합 (n, k) → (n, k + 1) A_j (길이 j 인 정의 단어 수)
+    열은 서로 독립일 필요가 없다. (같은 코드 단어가 2^(m - rank) 번 세어지므로 2^m 으로 나누면 됨)
+    """
+    columns = np.asarray(columns, dtype=np.int64)
+    n, k = columns.shape
+    u = np.arange(1 << m, dtype=np.int64)
+    weights = (popcount(columns[:, None, :] & u[None, :, None]) & 1).sum(axis=2, dtype=np.int64)  # (n, 2^m)
+    offsets = (k + 1) * np.arange(n)[:, None]
+    B = np.bincount((weights + offsets).ravel(), minlength=n * (k + 1)).reshape(n, k + 1)
+    K = _krawtchouk(k)
+    A = B @ K if K.dtype != object else B.astype(object) @ K
+    return (A // (1 << m)).astype(np.int64)
+
+
+def letter_profiles(columns: np.ndarray, m: int) -> np.ndarray:
+    """(n, k, k + 1): 열 d 를 포함하는 길이 j 단어 수 = A_j(설계) - A_j(열 d 를 뺀 설계)"""
+    columns = np.asarray(columns, dtype=np.int64)
+    n, k = columns.shape
+    full = word_length_patterns(columns, m)
+    keep = np.array([[c for c in range(k) if c != d] for d in range(k)])
+    reduced = word_length_patterns(columns[:, keep].reshape(n * k, k - 1), m).reshape(n, k, k)
+    reduced = np.concatenate([reduced, np.zeros((n, k, 1), dtype=np.int64)], axis=2)
+    return full[:, None, :] - reduced
+
+
+def _signature(wlp: np.ndarray, profile: np.ndarray) -> bytes:
+    rows = profile[np.lexsort(profile.T[::-1])]
+    return wlp.tobytes() + rows.tobytes()
+
+
+def _pair_relations(columns: np.ndarray, m: int) -> np.ndarray:
+    """
+    (n, k, k) 열 쌍 (a, c) 의 관계: a^c 가 설계 열이면 길이 3 단어 {a, c, a^c} 가 있다.
+    여기에 {a, c} 를 포함하는 길이 4 단어 수 (x^y = a^c 인 다른 열 쌍 수)를 더해 부호화한다.
+    """
+    n, k = columns.shape
+    rows = np.arange(n)[:, None]
+    member = np.zeros((n, 1 << m), dtype=np.int64)
+    member[rows, columns] = 1
+    pairs = columns[:, :, None] ^ columns[:, None, :]                            # (n, k, k)
+    counts = np.zeros((n, 1 << m), dtype=np.int64)
+    np.add.at(counts, (np.broadcast_to(rows[:, :, None], pairs.shape), pairs), 1)   # 순서쌍 xor 분포
+    in3 = member[rows[:, :, None], pairs]
+    n4 = (counts[rows[:, :, None], pairs] - 2) // 2
+    return np.where(pairs == 0, -1, in3 + 2 * n4)
+
+
+def canonical_forms(columns: np.ndarray, m: int, profiles: Optional[np.ndarray] = None) -> List[Optional[bytes]]:
+    """
+    설계마다 정준형 bytes (동형 설계끼리 같음). 기저 후보가 MAX_BASES 를 넘는 설계는 None.
+    columns: (n, k) 설계 열, profiles: letter_profiles 결과 (n, k, k + 1)
+
+    개별화-세분화: 열 키 = 글자 패턴 해시. 기저를 한 자리씩 고를 때마다 아직 생성되지 않은 열 중
+    (키 빈도, 키) 가 가장 작은 칸의 열을 모두 시도하고, 고른 열과의 관계(_pair_relations)로 키를 세분화한다.
+    이렇게 얻은 순서 기저 집합은 동형 사상과 함께 옮겨지므로 B 좌표 열 집합의 최소가 정준형이 된다.
+    모든 설계의 기저를 함께 넓힌다. (owner = 설계 번호)
+    """
+    columns = np.asarray(columns, dtype=np.int64)
+    n, k = columns.shape
+    if profiles is None:
+        profiles = letter_profiles(columns, m)
+    weights = np.random.default_rng(0).integers(1, 1 << 62, size=profiles.shape[2])
+    keys = (profiles * weights).sum(axis=2)                     # (n, k) int64 (넘침은 순환)
+    relations = _pair_relations(columns, m)
+    index = np.arange(1 << m)
+
+    owner = np.arange(n)
+    bases = np.zeros((n, 0), dtype=np.int64)
+    span = np.zeros((n, 1 << m), dtype=bool)
+    span[:, 0] = True
+    overflow = np.zeros(n, dtype=bool)
+    for _ in range(m):
+        r = np.arange(len(owner))[:, None]
+        cols = columns[owner]                                   # (r, k)
+        free = ~span[r, cols]
+        same = (keys[:, :, None] == keys[:, None, :]) & free[:, None, :]
+        frequency = np.where(free, same.sum(axis=2), k + 1)
+        least = frequency.min(axis=1, keepdims=True)
+        best_key = np.where(frequency == least, keys, np.iinfo(np.int64).max).min(axis=1, keepdims=True)
+        parent, pick = np.nonzero(free & (frequency == least) & (keys == best_key))
+        counts = np.bincount(owner[parent], minlength=n)
+        overflow |= counts > MAX_BASES
+        keep = ~overflow[owner[parent]]
+        parent, pick = parent[keep], pick[keep]
+        owner = owner[parent]
+        bases = np.hstack([bases[parent], pick[:, None]])
+        keys = keys[parent] * np.int64(1_000_003) + relations[owner, pick]
+        span = span[parent]
+        span |= span[np.arange(len(parent))[:, None], index[None, :] ^ cols[parent, pick][:, None]]
+
+    B = columns[owner[:, None], bases]                          # (r, m)
+    V = np.zeros((len(B), 1), dtype=np.int64)
+    for i in range(m):
+        V = np.hstack([V, V ^ B[:, i:i + 1]])                   # V[:, c] = Σ c_i B_i
+    inverse = np.empty_like(V)                                  # 벡터 → B 좌표
+    np.put_along_axis(inverse, V, np.broadcast_to(index, V.shape), axis=1)
+    coords = np.sort(inverse[np.arange(len(B))[:, None], columns[owner]], axis=1)
+    best = np.lexsort(tuple(coords.T[::-1]) + (owner,))
+    owners, first = np.unique(owner[best], return_index=True)
+    forms: List[Optional[bytes]] = [None] * n
+    for d, i in zip(owners.tolist(), best[first].tolist()):
+        forms[d] = coords[i].tobytes()
+    return forms
+
+
+def canonical_form(columns: Sequence[int], m: int) -> Optional[bytes]:
+    """설계 하나의 정준형 (canonical_forms 참조)"""
+    return canonical_forms(np.asarray(columns, dtype=np.int64)[None, :], m)[0]
+
+
+# ---------------------------------------------------------------------------
+# 검색
+# ---------------------------------------------------------------------------
+def _pool(m: int, min_resolution: int) -> np.ndarray:
+    """생성 열 후보: 무게 min_resolution - 1 이상 (무게, 값 순)"""
+    masks = np.arange(1, 1 << m, dtype=np.int64)
+    weights = popcount(masks)
+    masks = masks[weights >= max(2, min_resolution - 1)]
+    return masks[np.lexsort((masks, popcount(masks)))]
+
+
+def _columns(generators: np.ndarray, m: int) -> np.ndarray:
+    base = np.broadcast_to(np.int64(1) << np.arange(m, dtype=np.int64), (len(generators), m))
+    return np.hstack([base, generators])
+
+
+def _rank(wlp: np.ndarray) -> np.ndarray:
+    """A_3, A_4, ... 사전식 순서 (동률은 앞선 것 먼저)"""
+    return np.lexsort(wlp[:, 3:][:, ::-1].T)
+
+
+def _evaluate(task):
+    """(생성 열 (n, j), m, 최소 해상도, 글자 패턴 여부) → (WLP, 해상도 통과 여부, 통과한 설계의 글자 패턴)"""
+    generators, m, min_resolution, with_profiles = task
+    columns = _columns(generators, m)
+    wlp = word_length_patterns(columns, m)
+    ok = ~np.any(wlp[:, 1:min_resolution] > 0, axis=1)
+    profiles = letter_profiles(columns[ok], m) if with_profiles and ok.any() else None
+    return wlp, ok, profiles
+
+
+def _canonical(task):
+    generators, m, profiles = task
+    return canonical_forms(_columns(generators, m), m, profiles)
+
+
+def _chunk_size(generators: int, m: int) -> int:
+    """청크당 설계 수 (글자 패턴이 k 번의 WLP 계산이므로 2^m · k² 에 비례)"""
+    return max(1, _CHUNK_CELLS // ((1 << m) * (m + generators) ** 2 // 4 + 1))
+
+
+def _chunks(array: np.ndarray, size: int) -> List[np.ndarray]:
+    if not len(array):
+        return [array]
+    return [array[i:i + size] for i in range(0, len(array), size)]
+
+
+def _map_until(func, tasks: List, executor: Optional[ProcessPoolExecutor], deadline: Optional[float],
+               required: bool = True):
+    """
+    (결과 목록, 모두 실행했는지) - 결과는 앞에서부터 끊김 없이 끝난 작업의 것 (tasks[:len(결과)])
+    executor 가 있으면 작업을 모두 제출해 as_completed 로 기다리다가 deadline 이 지나면 남은 작업을 취소한다.
+    required 면 첫 작업은 deadline 과 무관하게 끝까지 실행한다.
+    """
+    if executor is None:
+        results = []
+        for task in tasks:
+            if (results or not required) and _expired(deadline):
+                return results, False
+            results.append(func(task))
+        return results, True
+    futures = [executor.submit(func, task) for task in tasks]
+    if required and futures:
+        futures[0].result()
+    timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            future.result()     # 작업 예외는 바로 전파
+    except FuturesTimeout:
+        for future in futures:
+            future.cancel()
+    results = []
+    for future in futures:
+        if future.cancelled() or not future.done():
+            break
+        results.append(future.result())
+    return results, len(results) == len(tasks)
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.perf_counter() > deadline
+
+
+def _extend(reps: np.ndarray, pool: np.ndarray) -> np.ndarray:
+    """대표마다 후보 열 하나씩 추가 (정렬 후 중복 제거)"""
+    n, j = reps.shape
+    cand = np.hstack([np.repeat(reps, len(pool), axis=0), np.tile(pool, n)[:, None]])
+    fresh = ~np.any(cand[:, :j] == cand[:, j:], axis=1)
+    return np.unique(np.sort(cand[fresh], axis=1), axis=0)
+
+
+def _search_exhaustive(m: int, p: int, pool: np.ndarray, min_resolution: int,
+                       executor: Optional[ProcessPoolExecutor], deadline: Optional[float] = None):
+    tasks, combos = [], combinations(pool.tolist(), p)
+    size = _chunk_size(p, m)
+    dtype = np.dtype((np.int64, p))
+    while True:
+        chunk = np.fromiter(islice(combos, size), dtype=dtype)
+        if not len(chunk):
+            break
+        tasks.append((chunk.reshape(-1, p), m, min_resolution, False))
+    results, complete = _map_until(_evaluate, tasks, executor, deadline)
+    generators = np.vstack([task[0][ok] for task, (_, ok, _) in zip(tasks, results)])
+    wlp = np.vstack([w[ok] for w, ok, _ in results])
+    return generators, wlp, complete
+
+
+def _search_sequential(m: int, p: int, pool: np.ndarray, min_resolution: int,
+                       executor: Optional[ProcessPoolExecutor], max_classes: int, deadline: Optional[float] = None):
+    reps = np.zeros((1, 0), dtype=np.int64)
+    exhaustive = True
+    for level in range(1, p + 1):
+        cand = _extend(reps, pool)
+        last = level == p
+        size = _chunk_size(level, m)
+        tasks = [(chunk, m, min_resolution, not last) for chunk in _chunks(cand, size)]
+        results, complete = _map_until(_evaluate, tasks, executor, deadline)
+        exhaustive &= complete
+        ok = np.concatenate([r[1] for r in results])
+        cand, wlp = cand[:len(ok)][ok], np.vstack([r[0] for r in results])[ok]
+        if not len(cand):
+            break
+        if last:
+            return cand, wlp, exhaustive
+
+        profiles = np.concatenate([r[2] for r in results if r[2] is not None])
+        signatures = [_signature(w, p) for w, p in zip(wlp, profiles)]
+        groups: Dict[bytes, List[int]] = {}
+        for i, sig in enumerate(signatures):
+            groups.setdefault(sig, []).append(i)
+        shared = np.array(sorted(i for idx in groups.values() if len(idx) > 1 for i in idx), dtype=np.int64)
+        # 정준형을 못 구한 설계(None)는 따로 둔다
+        forms: Dict[int, Optional[bytes]] = dict.fromkeys(shared.tolist())
+        if len(shared):
+            tasks = [(cand[idx], m, profiles[idx]) for idx in _chunks(shared, _CANONICAL_CHUNK)]
+            parts, _ = _map_until(_canonical, tasks, executor, deadline, required=False)
+            forms.update(zip(shared.tolist(), [f for part in parts for f in part]))
+        seen, keep = set(), []
+        for i, sig in enumerate(signatures):
+            form = forms.get(i, b"")
+            key = sig + (form if form is not None else b"?" + i.to_bytes(8, "little"))
+            if key not in seen:
+                seen.add(key)
+                keep.append(i)
+        keep = np.array(keep, dtype=np.int64)
+        limit = 1 if _expired(deadline) else max_classes
+        if len(keep) > limit:
+            keep = np.sort(keep[_rank(wlp[keep])[:limit]])
+            exhaustive = False
+        reps = cand[keep]
+    return np.zeros((0, p), dtype=np.int64), np.zeros((0, m + p + 1), dtype=np.int64), exhaustive
+
+
+def search(factors: int, m: int, min_resolution: int = 3, max_workers: int = 1,
+           max_classes: int = MAX_CLASSES, time_budget: Optional[float] = None) -> Dict:
+    """
+    요인 factors 개, 기본 요인 m 개(런 2^m)의 최소 aberration 생성 열 (기본 요인 비트마스크)
+    time_budget(초, None 이면 무제한)을 넘기면 그때까지의 최선을 exhaustive=False 로 반환한다.
+    반환: {"generators", "word_length_pattern", "exhaustive", "classes"}
+    """
+    p = factors - m
+    if p <= 0:
+        return {"generators": [], "word_length_pattern": [0] * (factors + 1), "exhaustive": True, "classes": 1}
+    deadline = time.perf_counter() + time_budget if time_budget else None
+    # 모든 단계가 하나의 프로세스 풀을 쓴다. (max_workers ≤ 1 이면 직렬)
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers and max_workers > 1 else None
+    try:
+        # 중간에 끊긴 높은 해상도 탐색이 있으면 낮은 해상도 결과도 최적이라 보장할 수 없다
+        complete = True
+        # 최소 aberration 설계는 해상도도 최대이므로 높은 해상도 제약(후보 열이 적음)부터 시도한다.
+        for resolution in range(max(min_resolution, RESOLUTION_START), min_resolution - 1, -1):
+            pool = _pool(m, resolution)
+            if len(pool) < p:
+                continue
+            if comb(len(pool), p) <= EXHAUSTIVE_LIMIT:
+                generators, wlp, exhaustive = _search_exhaustive(m, p, pool, resolution, executor, deadline)
+                classes = None
+            else:
+                generators, wlp, exhaustive = _search_sequential(m, p, pool, resolution, executor, max_classes,
+                                                                 deadline)
+                classes = len(generators)
+            exhaustive &= complete
+            if len(generators):
+                break
+            complete = exhaustive
+        else:
+            raise ValueError(f"해상도 {min_resolution} 이상인 2^({factors}-{p}) 설계가 없습니다.")
+    finally:
+        if executor is not None:
+            # 시간 상한으로 취소된 작업을 기다리지 않는다
+            executor.shutdown(wait=False, cancel_futures=True)
+    best = _rank(wlp)[0]
+    return {
+        "generators": sorted(int(g) for g in generators[best]),
+        "word_length_pattern": [int(a) for a in wlp[best]],
+        "exhaustive": bool(exhaustive),
+        "classes": classes,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 카탈로그
+# ---------------------------------------------------------------------------
+def default_catalogue_path() -> Path:
+    override = os.environ.get("DOE_FRACTIONAL_CATALOGUE")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "statiwebapp" / "fractional-catalogue.json"
+
+
+def load_catalogue(path: Optional[Path] = None) -> Dict[str, Dict]:
+    try:
+        with open(path or default_catalogue_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CATALOGUE_VERSION:
+        return {}
+    designs = data.get("designs")
+    return designs if isinstance(designs, dict) else {}
+
+
+def _write_catalogue(path: Path, designs: Dict[str, Dict]):
+    # 카탈로그는 캐시일 뿐이므로 기록 실패는 무시
+    write_json_atomic({"version": CATALOGUE_VERSION, "designs": designs}, path, indent=1, sort_keys=True)
+
+
+def _better(new: Dict, old: Optional[Dict]) -> bool:
+    if old is None:
+        return True
+    if new["exhaustive"] != old.get("exhaustive"):
+        return new["exhaustive"]
+    return new["word_length_pattern"][3:] < list(old.get("word_length_pattern", []))[3:]
+
+
+def design_string(generators: Sequence[int], m: int) -> str:
+    """pyDOE2 generator 문자열 (기본 요인 a, b, ... 다음에 생성 열)"""
+    letters = [chr(ord("a") + i) for i in range(m)]
+    terms = ["".join(letters[i] for i in range(m) if g >> i & 1) for g in generators]
+    return " ".join(letters + terms)
+
+
+def minimum_aberration(factors: int, runs: int, min_resolution: int = 3, max_workers: int = 1,
+                       max_classes: int = MAX_CLASSES, use_catalogue: bool = True,
+                       catalogue_path: Optional[Path] = None, time_budget: Optional[float] = None) -> Dict:
+    """
+    요인 수와 런 예산(2^m ≤ runs 인 최대 m)으로 최소 aberration 2^(k-p) 설계를 찾는다.
+    time_budget: 탐색 시간 상한(초) - 넘기면 근사 결과(exhaustive=False)
+    반환: design_str(pyDOE2), generators, resolution, word_length_pattern(A_1..A_k), exhaustive, source
+    """
+    factors, runs = int(factors), int(runs)
+    if factors < 2:
+        raise ValueError("요인은 2개 이상이어야 합니다.")
+    if runs < 4:
+        raise ValueError("런 수는 4 이상이어야 합니다.")
+    m = min(factors, runs.bit_length() - 1)
+    if m > MAX_RUN_EXPONENT:
+        raise ValueError(f"런 수는 {1 << MAX_RUN_EXPONENT} 이하로 지정하세요.")
+    if factors > (1 << m) - 1:
+        raise ValueError(f"런 {1 << m}에는 요인을 최대 {(1 << m) - 1}개까지 배치할 수 있습니다.")
+    if factors - m > MAX_GENERATORS:
+        raise ValueError(f"생성 열(p)은 {MAX_GENERATORS}개까지 지원합니다.")
+
+    start = time.perf_counter()
+    path = Path(catalogue_path) if catalogue_path else default_catalogue_path()
+    key = f"{factors}-{m}"
+    catalogue = load_catalogue(path) if use_catalogue else {}
+    entry = catalogue.get(key)
+    source = "catalogue"
+    # 카탈로그의 완전 탐색 결과가 해상도 조건을 못 맞추면 그런 설계는 없다 (최소 aberration = 최대 해상도)
+    if entry is None or not entry.get("exhaustive"):
+        found = search(factors, m, min_resolution=min_resolution, max_workers=max_workers, max_classes=max_classes,
+                       time_budget=time_budget)
+        source = "search"
+        if use_catalogue and _better(found, entry):
+            catalogue[key] = found
+            _write_catalogue(path, catalogue)
+        if entry is None or _better(found, entry):
+            entry = found
+
+    design_str = design_string(entry["generators"], m)
+    aliasing = alias_structure(design_str)
+    resolution = aliasing.resolution
+    if resolution is not None and resolution < min_resolution:
+        raise ValueError(f"해상도 {min_resolution} 이상인 2^({factors}-{factors - m}) 설계가 없습니다.")
+    return {
+        "factors": factors,
+        "runs": 1 << m,
+        "design_str": design_str,
+        "generators": aliasing.generators(),
+        "resolution": resolution,
+        "word_length_pattern": list(entry["word_length_pattern"][1:]),
+        "exhaustive": bool(entry.get("exhaustive", True)),
+        "classes": entry.get("classes"),
+        "source": source,
+        "elapsed": time.perf_counter() - start,
+    }
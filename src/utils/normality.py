@@ -0,0 +1,230 @@
+"""
+정규성 검정 서비스
+
+표본 크기에 따라 검정을 선택하고, 여러 열을 작업자 풀에서 병렬로 검정한다.
+결과는 (데이터셋, 열, 열 버전) 키로 캐시되어 값이 바뀐 열만 다시 검정한다.
+
+- n < 3            : 데이터 부족
+- n <= 5000        : Shapiro-Wilk (scipy p-값 정확도 한계)
+- n <= 50000       : Anderson-Darling (꼬리에 민감, 정렬 1회)
+- 그 이상          : D'Agostino-Pearson K² (모멘트 기반, O(n))
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+SHAPIRO_MAX_N = 5000
+ANDERSON_MAX_N = 50000
+# 결과 캐시 항목 수 상한 - 셀을 고칠 때마다 열 버전(키)이 바뀌므로 오래 안 쓴 것부터 버림
+CACHE_SIZE = 512
+
+TEST_NAMES = {
+    "shapiro": "Shapiro-Wilk",
+    "anderson": "Anderson-Darling",
+    "dagostino": "D'Agostino-Pearson",
+}
+
+
+def select_normality_test(n: int) -> Optional[str]:
+    """표본 크기에 맞는 검정 이름 (부족하면 None)"""
+    if n < 3:
+        return None
+    if n <= SHAPIRO_MAX_N:
+        return "shapiro"
+    if n <= ANDERSON_MAX_N:
+        return "anderson"
+    return "dagostino"
+
+
+def _anderson_darling(x: np.ndarray) -> Tuple[float, float]:
+    """
+    평균/분산을 추정한 정규분포에 대한 A² 통계량과 p-값.
+    p-값은 D'Agostino & Stephens (1986) 의 보정 A*² 근사식을 사용한다.
+    """
+    from scipy import stats
+
+    n = x.size
+    z = np.sort((x - x.mean()) / x.std(ddof=1))
+    i = np.arange(1, n + 1)
+    a2 = -n - np.mean((2 * i - 1) * (stats.norm.logcdf(z) + stats.norm.logsf(z[::-1])))
+    a_star = a2 * (1 + 0.75 / n + 2.25 / n ** 2)
+    if a_star >= 153.467:
+        # 근사식의 이차항이 커지는 구간 -> p-값 0
+        p = 0.0
+    elif a_star >= 0.6:
+        p = np.exp(1.2937 - 5.709 * a_star + 0.0186 * a_star ** 2)
+    elif a_star >= 0.34:
+        p = np.exp(0.9177 - 4.279 * a_star - 1.38 * a_star ** 2)
+    elif a_star >= 0.2:
+        p = 1 - np.exp(-8.318 + 42.796 * a_star - 59.938 * a_star ** 2)
+    else:
+        p = 1 - np.exp(-13.436 + 101.14 * a_star - 223.73 * a_star ** 2)
+    return float(a2), float(min(max(p, 0.0), 1.0))
+
+
+def normality_test(values, alpha: float = 0.05) -> Dict[str, Any]:
+    """
+    결측을 제외한 값으로 정규성 검정 수행.
+
+    Returns:
+        {"test", "test_name", "n", "statistic", "p_value", "normal", "alpha"}
+        데이터가 부족하면 test 가 None 이고 나머지 값도 None.
+    """
+    x = np.asarray(values, dtype=float)
+    x = x[~np.isnan(x)]
+    n = int(x.size)
+    test = select_normality_test(n)
+    result = {"test": test, "test_name": TEST_NAMES.get(test), "n": n,
+              "statistic": None, "p_value": None, "normal": None, "alpha": alpha}
+    if test is None:
+        return result
+    if np.ptp(x) == 0:
+        # 상수 열은 검정 불가 (분산 0)
+        result.update(statistic=float("nan"), p_value=0.0, normal=False)
+        return result
+
+    from scipy import stats
+
+    if test == "shapiro":
+        stat, p_value = stats.shapiro(x)
+    elif test == "anderson":
+        stat, p_value = _anderson_darling(x)
+    else:
+        stat, p_value = stats.normaltest(x)
+    result.update(statistic=float(stat), p_value=float(p_value), normal=bool(p_value > alpha))
+    return result
+
+
+def _test_column(args):
+    """프로세스 풀용 최상위 함수"""
+    column, values, alpha = args
+    return column, normality_test(values, alpha)
+
+
+class NormalityTestService:
+    """
+    열 단위 정규성 검정을 작업자 풀에서 실행하고 결과를 캐시.
+
+    submit() 의 콜백은 작업자 스레드에서 호출되므로 Qt 뷰에서는
+    Signal 로 메인 스레드에 전달해야 한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, use_processes: bool = False, alpha: float = 0.05,
+                 cache_size: int = CACHE_SIZE):
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.alpha = alpha
+        self.cache_size = cache_size
+        self._executor = None
+        self._cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _get_executor(self):
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+
+    def cached(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def submit(self, columns: Dict[str, Tuple[Hashable, Any]],
+               callback: Callable[[str, Dict[str, Any]], None], track: bool = True) -> int:
+        """
+        열별 검정 요청.
+
+        Args:
+            columns: {열 이름: (캐시 키, 값 배열 또는 배열을 반환하는 함수)}.
+                캐시 키가 None 이면 캐시하지 않음. 함수는 캐시 미스일 때만 호출된다.
+            callback: callback(열 이름, 결과). 캐시 적중은 즉시, 나머지는 완료 순서대로 호출.
+            track: True 면 새 세대로 등록. cancel() 또는 다음 submit() 이후
+                이전 세대 결과는 전달되지 않는다.
+
+        Returns:
+            요청 세대 번호 (track=False 면 None)
+        """
+        generation = None
+        if track:
+            with self._lock:
+                self._generation += 1
+                generation = self._generation
+
+        pending = []
+        for column, (key, values) in columns.items():
+            hit = self.cached(key) if key is not None else None
+            if hit is not None:
+                callback(column, hit)
+            else:
+                pending.append((column, key, values))
+
+        executor = self._get_executor() if pending else None
+        for column, key, values in pending:
+            if callable(values):
+                values = values()
+            future = executor.submit(_test_column, (column, np.asarray(values, dtype=float), self.alpha))
+            future.add_done_callback(
+                lambda f, c=column, k=key: self._on_done(f, c, k, generation, callback)
+            )
+        return generation
+
+    def _on_done(self, future, column, key, generation, callback):
+        if future.cancelled():
+            return
+        try:
+            _, result = future.result()
+        except Exception as exc:
+            # 실패한 열도 결과로 전달 (캐시하지 않음)
+            result = {"test": None, "test_name": None, "n": None, "statistic": None,
+                      "p_value": None, "normal": None, "alpha": self.alpha, "error": str(exc)}
+            key = None
+        with self._lock:
+            if key is not None:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            current = generation is None or generation == self._generation
+        if current:
+            callback(column, result)
+
+    def run(self, columns: Dict[str, Tuple[Hashable, Any]]) -> Dict[str, Dict[str, Any]]:
+        """모든 열을 검정하고 완료될 때까지 기다린 결과 (입력 열 순서)"""
+        done = threading.Event()
+        results: Dict[str, Dict[str, Any]] = {}
+        lock = threading.Lock()
+
+        def collect(column, result):
+            with lock:
+                results[column] = result
+                if len(results) == len(columns):
+                    done.set()
+
+        if not columns:
+            return {}
+        self.submit(columns, collect, track=False)
+        done.wait()
+        return {column: results[column] for column in columns}
+
+    def cancel(self):
+        """진행 중인 요청의 결과 전달을 중단"""
+        with self._lock:
+            self._generation += 1
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self):
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
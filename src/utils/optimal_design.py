@@ -0,0 +1,327 @@
+"""
+D-/I-최적 설계 생성 (후보점 Fedorov 교환 알고리즘)
+
+요인은 [-1, 1] 로 코딩한 후보 격자(제약조건을 만족하는 점만)에서 고른다.
+설계 행 x_i 를 후보 x_j 로 바꾸는 교환의 효과를 정보행렬 역행렬 A = M⁻¹ 만으로 계산한다.
+  d_i = f_iᵀ A f_i,  d_j = f_jᵀ A f_j,  c_ij = f_iᵀ A f_j
+  D: det 비율  Δ = (1 + d_j)(1 - d_i) + c_ij²
+  I: tr(A W) 변화 (W = 후보 영역의 모멘트 행렬) - 추가/제거 두 번의 Sherman–Morrison 갱신으로 닫힌 식
+행 하나당 모든 후보의 교환 효과를 V = A Fᵀ (p×N) 로 구하고, 가장 좋은 교환을 적용한 뒤
+A, V(I 기준은 W V 도), d_j 와 log det M 을 rank-one 갱신한다. (교환마다 p×p 역행렬이나 A Fᵀ 를 다시 구하지 않음)
+반올림 오차가 쌓이지 않도록 패스가 끝날 때마다 한 번 처음부터 다시 계산한다.
+
+고정 런(fixed runs)은 M 에 포함하되 교환하지 않는다.
+무작위 시작점은 utils.parallel.run_seeded_chunks 로 병렬 실행한다. (같은 seed 면 작업자 수와 무관)
+time_budget 은 모든 시작점을 합친 시간 상한이다. 넘기면 진행 중인 교환을 멈추고 그때까지의 최선을 반환한다. (timed_out=True)
+"""
+
+import time
+from itertools import product
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.parallel import run_seeded_chunks
+from utils.rsm import quadratic_design
+
+MODELS = ("linear", "interaction", "quadratic")
+CRITERIA = ("D", "I")
+
+# 후보점 최대 개수 (교환 한 번에 p×N 행렬을 만듦)
+MAX_CANDIDATES = 50_000
+
+# 상대 개선이 이 값보다 작으면 교환하지 않음
+EXCHANGE_TOL = 1e-9
+
+
+def model_matrix(X: np.ndarray, model: str = "quadratic") -> np.ndarray:
+    """코딩 단위 (N, k) → (N, p) 모형 행렬 (절편, 1차[, 교호][, 제곱])"""
+    X = np.asarray(X, dtype=float)
+    if model == "quadratic":
+        return quadratic_design(X)
+    k = X.shape[1]
+    if model == "linear":
+        return np.column_stack([np.ones(len(X)), X])
+    if model == "interaction":
+        iu, ju = np.triu_indices(k, 1)
+        return np.column_stack([np.ones(len(X)), X, X[:, iu] * X[:, ju]])
+    raise ValueError(f"알 수 없는 모형입니다: {model} ({', '.join(MODELS)})")
+
+
+def candidate_grid(k: int, levels: int) -> np.ndarray:
+    """[-1, 1]^k 의 levels 수준 격자"""
+    if levels < 2:
+        raise ValueError("후보 격자 수준 수는 2 이상이어야 합니다.")
+    if levels ** k > MAX_CANDIDATES:
+        raise ValueError(f"후보점이 너무 많습니다. ({levels}^{k} > {MAX_CANDIDATES})")
+    return np.array(list(product(np.linspace(-1, 1, levels), repeat=k)))
+
+
+def constraint_mask(X_natural: np.ndarray, factors: Sequence[str],
+                    constraints: Optional[Sequence[Mapping[str, Any]]]) -> np.ndarray:
+    """
+    선형 제약 lower ≤ Σ a_f · x_f ≤ upper (원 단위) 을 만족하는 행.
+    각 제약: {"coefficients": {요인: 계수} 또는 [계수...], "lower": 하한, "upper": 상한}
+    """
+    mask = np.ones(len(X_natural), dtype=bool)
+    for constraint in constraints or ():
+        coefficients = constraint.get("coefficients") or {}
+        if isinstance(coefficients, Mapping):
+            unknown = [f for f in coefficients if f not in factors]
+            if unknown:
+                raise ValueError(f"제약조건의 요인을 찾을 수 없습니다: {', '.join(unknown)}")
+            a = np.array([float(coefficients.get(f, 0.0)) for f in factors])
+        else:
+            a = np.asarray(coefficients, dtype=float)
+            if a.shape != (len(factors),):
+                raise ValueError("제약조건 계수 개수가 요인 수와 다릅니다.")
+        value = X_natural @ a
+        if constraint.get("lower") is not None:
+            mask &= value >= float(constraint["lower"]) - 1e-9
+        if constraint.get("upper") is not None:
+            mask &= value <= float(constraint["upper"]) + 1e-9
+    return mask
+
+
+def parse_constraint(text: str, factors: Sequence[str]) -> Dict[str, Any]:
+    """
+    "F1 + 2*F2 <= 10", "-F1 + 0.5 F3 >= -1" 형식 → constraint_mask 형식 dict
+    """
+    import re
+
+    match = re.fullmatch(r"\s*(.+?)\s*(<=|>=)\s*([-+]?[\d.]+(?:[eE][-+]?\d+)?)\s*", text)
+    if not match:
+        raise ValueError(f"제약조건 형식을 알 수 없습니다: {text} (예: F1 + 2*F2 <= 10)")
+    lhs, op, bound = match.groups()
+    coefficients: Dict[str, float] = {}
+    for sign, coef, name in re.findall(r"([-+]?)\s*([\d.]+(?:[eE][-+]?\d+)?)?\s*\*?\s*([A-Za-z_가-힣][\w가-힣]*)",
+                                       lhs):
+        if name not in factors:
+            raise ValueError(f"제약조건의 요인을 찾을 수 없습니다: {name}")
+        value = float(coef) if coef else 1.0
+        coefficients[name] = coefficients.get(name, 0.0) + (-value if sign == "-" else value)
+    if not coefficients:
+        raise ValueError(f"제약조건에 요인이 없습니다: {text}")
+    key = "upper" if op == "<=" else "lower"
+    return {"coefficients": coefficients, key: float(bound)}
+
+
+def _initial_rows(F: np.ndarray, F_fixed: np.ndarray, n_free: int, rng: np.random.Generator) -> np.ndarray:
+    """무작위 순서로 모형 공간을 채우는(계수 추정 가능한) 후보를 먼저 고르고 나머지는 무작위"""
+    p = F.shape[1]
+    basis = np.zeros((0, p))
+    for f in F_fixed:
+        r = f - basis.T @ (basis @ f)
+        if np.linalg.norm(r) > 1e-8 * max(np.linalg.norm(f), 1.0):
+            basis = np.vstack([basis, r / np.linalg.norm(r)])
+    rows = []
+    for j in rng.permutation(len(F)):
+        if len(basis) >= p or len(rows) >= n_free:
+            break
+        f = F[j]
+        r = f - basis.T @ (basis @ f)
+        if np.linalg.norm(r) > 1e-8 * max(np.linalg.norm(f), 1.0):
+            basis = np.vstack([basis, r / np.linalg.norm(r)])
+            rows.append(j)
+    if len(basis) < p:
+        raise ValueError("후보점/런 수로는 모형의 모든 계수를 추정할 수 없습니다.")
+    rows.extend(rng.integers(0, len(F), n_free - len(rows)).tolist())
+    return np.array(rows)
+
+
+def _criterion(A: np.ndarray, logdet: float, W: np.ndarray, criterion: str) -> float:
+    """작을수록 좋은 값 (D: -log det M, I: tr(M⁻¹ W))"""
+    return -logdet if criterion == "D" else float(np.sum(A * W))
+
+
+def _rank_one(F: np.ndarray, W: Optional[np.ndarray], A: np.ndarray, V: np.ndarray, dj: np.ndarray,
+              WV: Optional[np.ndarray], v: np.ndarray, scale: float):
+    """A += scale · v vᵀ 에 맞춰 V = A Fᵀ, d_j = f_jᵀ A f_j, W V 를 제자리 갱신 (O(pN))"""
+    Fv = F @ v
+    A += scale * np.outer(v, v)
+    V += scale * np.outer(v, Fv)
+    dj += scale * Fv ** 2
+    if WV is not None:
+        WV += scale * np.outer(W @ v, Fv)
+
+
+def exchange(F: np.ndarray, F_fixed: np.ndarray, rows: np.ndarray, criterion: str = "D",
+             W: Optional[np.ndarray] = None, max_passes: int = 100,
+             deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    후보 행렬 F(N×p) 에서 설계 행 rows 를 교환해 개선 (고정 런 F_fixed 는 유지).
+    deadline(time.monotonic 기준)이 지나면 현재 설계에서 멈춘다.
+
+    Returns:
+        {"rows", "logdet", "value"(작을수록 좋음), "passes", "exchanges", "timed_out"}
+    """
+    rows = np.array(rows)
+    FT = F.T
+
+    def refresh():
+        X = np.vstack([F_fixed, F[rows]])
+        M = X.T @ X
+        sign, logdet = np.linalg.slogdet(M)
+        A = np.linalg.inv(M)
+        V = A @ FT                                       # (p, N) 열 v_j = A f_j
+        return sign, float(logdet), A, V, np.einsum("ij,ij->j", FT, V)
+
+    sign, logdet, A, V, dj = refresh()
+    if sign <= 0:
+        raise ValueError("시작 설계의 정보행렬이 특이합니다.")
+    WV = W @ V if criterion == "I" else None
+    exchanges = 0
+    passes = 0
+    timed_out = False
+    for passes in range(1, max_passes + 1):
+        if passes > 1:
+            # 누적 반올림 오차 정리 (패스마다 한 번)
+            _, logdet, A, V, dj = refresh()
+            if WV is not None:
+                WV = W @ V
+        improved = False
+        for pos in range(len(rows)):
+            if deadline is not None and time.monotonic() > deadline:
+                timed_out = True
+                break
+            i = rows[pos]
+            u = V[:, i]                                  # A f_i
+            di = float(dj[i])
+            cij = F @ u                                  # f_iᵀ A f_j
+            if criterion == "D":
+                gain = (1 + dj) * (1 - di) + cij ** 2    # det 비율
+                j = int(np.argmax(gain))
+                if gain[j] <= 1 + EXCHANGE_TOL:
+                    continue
+                logdet += float(np.log(gain[j]))
+            else:
+                q = np.einsum("ij,ij->j", V, WV)         # v_jᵀ W v_j
+                alpha = cij / (1 + dj)
+                uWu = float(u @ WV[:, i])
+                uWv = u @ WV
+                denom = 1 - di + alpha * cij             # 1 - f_iᵀ A₁ f_i
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    change = -q / (1 + dj) + (uWu - 2 * alpha * uWv + alpha ** 2 * q) / denom
+                change[~(denom > 1e-12)] = np.inf
+                j = int(np.argmin(change))
+                current = float(np.sum(A * W))
+                if not change[j] < -EXCHANGE_TOL * current:
+                    continue
+                logdet += float(np.log((1 + dj[j]) * (1 - di) + cij[j] ** 2))
+            # A ← (M + f_j f_jᵀ - f_i f_iᵀ)⁻¹ : Sherman–Morrison 두 번 (f_j 추가 후 f_i 제거)
+            _rank_one(F, W, A, V, dj, WV, V[:, j].copy(), -1 / (1 + dj[j]))
+            w = V[:, i].copy()                           # 추가 후의 A f_i
+            _rank_one(F, W, A, V, dj, WV, w, 1 / (1 - float(F[i] @ w)))
+            rows[pos] = j
+            exchanges += 1
+            improved = True
+        if timed_out or not improved:
+            break
+    return {"rows": rows, "logdet": logdet, "value": _criterion(A, logdet, W, criterion),
+            "passes": passes, "exchanges": exchanges, "timed_out": timed_out}
+
+
+def _exchange_start(task):
+    """run_seeded_chunks 작업: 청크 크기만큼 무작위 시작 → 가장 좋은 결과"""
+    size, seed_seq, (F, F_fixed, n_free, criterion, W, max_passes, deadline) = task
+    rng = np.random.default_rng(seed_seq)
+    best = None
+    timed_out = False
+    for _ in range(size):
+        result = exchange(F, F_fixed, _initial_rows(F, F_fixed, n_free, rng), criterion, W, max_passes, deadline)
+        timed_out = timed_out or result["timed_out"]
+        if best is None or result["value"] < best["value"]:
+            best = result
+    return {**best, "timed_out": timed_out}
+
+
+def design_metrics(F_design: np.ndarray, W: np.ndarray) -> Dict[str, float]:
+    """D-효율(%), 평균 예측분산 tr(M⁻¹W) (σ² 단위), 최대 레버리지"""
+    n, p = F_design.shape
+    M = F_design.T @ F_design
+    sign, logdet = np.linalg.slogdet(M)
+    A = np.linalg.inv(M)
+    return {
+        "log_det": float(logdet),
+        "d_efficiency": float(100 * np.exp(logdet / p) / n),
+        "average_variance": float(np.sum(A * W)),
+        "max_leverage": float(np.max(np.einsum("ij,jk,ik->i", F_design, A, F_design))),
+    }
+
+
+def optimal_design(factors: Sequence[str], runs: int, model: str = "quadratic", criterion: str = "D",
+                   bounds: Optional[Sequence[Sequence[float]]] = None, levels: Optional[int] = None,
+                   constraints: Optional[Sequence[Mapping[str, Any]]] = None,
+                   fixed_runs: Optional[Sequence[Sequence[float]]] = None, n_starts: int = 10, seed: int = 0,
+                   max_workers: int = 1, use_processes: bool = False, max_passes: int = 100,
+                   time_budget: Optional[float] = None) -> Dict[str, Any]:
+    """
+    D-/I-최적 설계.
+
+    Args:
+        bounds: 요인별 (하한, 상한) 원 단위 (기본 [-1, 1])
+        levels: 후보 격자 수준 수 (기본: 2차 모형 3, 그 외 2)
+        constraints: 선형 제약 (constraint_mask 참고)
+        fixed_runs: 반드시 포함할 런 (원 단위, runs 에 포함)
+        time_budget: 모든 시작점을 합친 시간 상한(초, None 이면 무제한). 넘기면 timed_out=True
+
+    Returns:
+        {"design"(DataFrame, 원 단위), "model", "criterion", "runs", "n_fixed", "n_candidates", "n_parameters",
+         "d_efficiency", "average_variance", "max_leverage", "log_det", "n_starts", "timed_out"}
+    """
+    deadline = None if time_budget is None else time.monotonic() + float(time_budget)
+    factors = list(factors)
+    k = len(factors)
+    if k < 1:
+        raise ValueError("요인이 하나 이상 필요합니다.")
+    if model not in MODELS:
+        raise ValueError(f"알 수 없는 모형입니다: {model} ({', '.join(MODELS)})")
+    if criterion not in CRITERIA:
+        raise ValueError(f"알 수 없는 기준입니다: {criterion} ({', '.join(CRITERIA)})")
+    bounds = np.array(bounds if bounds is not None else [(-1.0, 1.0)] * k, dtype=float)
+    if bounds.shape != (k, 2) or np.any(bounds[:, 1] <= bounds[:, 0]):
+        raise ValueError("요인 범위는 요인마다 (하한 < 상한) 이어야 합니다.")
+    center, half = bounds.mean(axis=1), (bounds[:, 1] - bounds[:, 0]) / 2
+
+    coded = candidate_grid(k, int(levels or (3 if model == "quadratic" else 2)))
+    coded = coded[constraint_mask(coded * half + center, factors, constraints)]
+    if len(coded) == 0:
+        raise ValueError("제약조건을 만족하는 후보점이 없습니다.")
+    F = model_matrix(coded, model)
+    p = F.shape[1]
+
+    fixed = np.asarray(fixed_runs if fixed_runs is not None else np.zeros((0, k)), dtype=float).reshape(-1, k)
+    F_fixed = model_matrix((fixed - center) / half, model) if len(fixed) else np.zeros((0, p))
+    runs = int(runs)
+    n_free = runs - len(fixed)
+    if runs < p:
+        raise ValueError(f"{model} 모형의 계수 {p}개를 추정하려면 런이 {p}개 이상 필요합니다.")
+    if n_free < 1:
+        raise ValueError("고정 런 외에 교환할 런이 하나 이상 있어야 합니다.")
+
+    # I-기준 가중치: 후보 영역(제약 반영) 위의 모멘트 행렬
+    W = F.T @ F / len(F)
+    n_starts = max(1, int(n_starts))
+    results = run_seeded_chunks(
+        _exchange_start, (F, F_fixed, n_free, criterion, W, max_passes, deadline), n_starts, 1,
+        seed=seed, max_workers=max_workers, use_processes=use_processes,
+    )
+    best = min(results, key=lambda result: result["value"])
+
+    design = pd.DataFrame(np.vstack([fixed, coded[best["rows"]] * half + center]), columns=factors)
+    if len(fixed):
+        design.insert(0, "Fixed", [True] * len(fixed) + [False] * n_free)
+    metrics = design_metrics(np.vstack([F_fixed, F[best["rows"]]]), W)
+    return {
+        "design": design,
+        "model": model,
+        "criterion": criterion,
+        "runs": runs,
+        "n_fixed": int(len(fixed)),
+        "n_candidates": int(len(F)),
+        "n_parameters": int(p),
+        "n_starts": n_starts,
+        "timed_out": any(result["timed_out"] for result in results),
+        **metrics,
+    }
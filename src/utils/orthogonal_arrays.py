@@ -0,0 +1,249 @@
+"""
+직교배열(OA) 생성 카탈로그
+
+표를 손으로 적어 두지 않고 구성법으로 만든다. 수준은 0 부터 시작하는 정수이다. (표시는 호출 측에서 +1)
+- 2수준, 2의 거듭제곱 런(L4, L8, L16, L32, L64): GF(2) 위의 Rao–Hamming (= Sylvester 아다마르)
+  열 순서는 다구치 표준(a, b, ab, c, ac, bc, abc, ...)과 같다.
+- 2수준, 그 외 런(L12, L20, L24, L28, L44, L48): Paley I 아다마르 행렬 (q ≡ 3 mod 4 인 소수 거듭제곱 q, 런 q + 1)
+- 3/4/5수준(L9, L27, L81, L16(4^5), L64(4^21), L25): GF(q) 위의 Rao–Hamming (Bose)
+  행은 GF(q)^r 의 모든 벡터, 열은 마지막 0 이 아닌 좌표가 1 인 계수 벡터 c, 값은 내적 x·c
+- 혼합(L18 = 2^1 3^7, L36 = 2^11 3^12): GF(3) 차분 행렬 D(r, r; 3) 의 행 i, 이동 j 로
+  3수준 열 D[i, k] + j 를 만들고 행 번호 i 쪽에 2수준 열(L18: i // 3 와 i % 3, L36: L12 의 i 행)을 붙인다.
+
+만든 배열은 강도 2 검사를 통과해야 카탈로그에 올라가며 이름별로 한 번만 만든다. (lru_cache, 읽기 전용)
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations, product
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+# GF(p^n) 의 기약 다항식 계수 (낮은 차수부터, 최고차 1)
+_IRREDUCIBLE = {
+    4: (2, (1, 1, 1)),        # x² + x + 1
+    8: (2, (1, 1, 0, 1)),     # x³ + x + 1
+    9: (3, (1, 0, 1)),        # x² + 1
+    16: (2, (1, 1, 0, 0, 1)), # x⁴ + x + 1
+    25: (5, (2, 0, 1)),       # x² + 2
+    27: (3, (1, 2, 0, 1)),    # x³ + 2x + 1
+}
+
+# GF(3) 차분 행렬 D(r, r; 3): 두 열의 차에 0/1/2 가 r/3 번씩 나타남
+_DIFFERENCE_SCHEMES = {
+    6: (
+        (0, 0, 0, 0, 0, 0),
+        (0, 0, 2, 1, 2, 1),
+        (0, 1, 2, 2, 1, 0),
+        (0, 2, 1, 2, 0, 1),
+        (0, 2, 0, 1, 1, 2),
+        (0, 1, 1, 0, 2, 2),
+    ),
+    12: (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        (0, 2, 0, 1, 0, 2, 2, 2, 1, 1, 0, 1),
+        (0, 0, 1, 0, 2, 1, 1, 2, 2, 1, 0, 2),
+        (0, 2, 2, 1, 2, 1, 0, 0, 1, 0, 1, 2),
+        (0, 2, 1, 2, 2, 0, 2, 1, 0, 1, 1, 0),
+        (0, 1, 1, 2, 0, 1, 2, 0, 2, 0, 2, 1),
+        (0, 2, 1, 0, 1, 2, 1, 0, 1, 2, 2, 0),
+        (0, 1, 2, 1, 1, 0, 0, 2, 2, 1, 2, 0),
+        (0, 0, 2, 2, 1, 2, 1, 2, 0, 0, 1, 1),
+        (0, 1, 0, 0, 2, 2, 0, 1, 2, 2, 1, 1),
+        (0, 0, 0, 1, 1, 1, 2, 1, 0, 2, 2, 2),
+        (0, 1, 2, 2, 0, 0, 1, 1, 1, 2, 0, 2),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def galois_field(q: int) -> Tuple[np.ndarray, np.ndarray]:
+    """GF(q) 의 (덧셈표, 곱셈표). 원소는 0..q-1 정수 (p진 자릿수 = 다항식 계수)"""
+    if q in _IRREDUCIBLE:
+        p, poly = _IRREDUCIBLE[q]
+    elif q >= 2 and all(q % d for d in range(2, int(q ** 0.5) + 1)):
+        p, poly = q, (0, 1)
+    else:
+        raise ValueError(f"지원하지 않는 유한체 크기입니다: {q}")
+    n = len(poly) - 1
+    digits = np.array([[(x // p ** i) % p for i in range(n)] for x in range(q)])
+    weights = p ** np.arange(n)
+
+    add = ((digits[:, None, :] + digits[None, :, :]) % p) @ weights
+    mul = np.zeros((q, q), dtype=int)
+    for a in range(q):
+        for b in range(q):
+            prod = np.convolve(digits[a], digits[b]) % p
+            for deg in range(len(prod) - 1, n - 1, -1):  # x^n = -(poly 나머지) 로 차수 낮춤
+                c = prod[deg]
+                if c:
+                    prod[deg - n:deg + 1] = (prod[deg - n:deg + 1] - c * np.array(poly)) % p
+            mul[a, b] = int(prod[:n] @ weights)
+    if any(sorted(mul[a, 1:]) != list(range(1, q)) for a in range(1, q)):
+        raise ValueError(f"GF({q}) 다항식이 기약이 아닙니다.")
+    return add, mul
+
+
+def rao_hamming(q: int, r: int) -> np.ndarray:
+    """OA(q^r, (q^r - 1)/(q - 1), q, 2) - 다구치 열 순서 (a, b, ab, [ab²], c, ...)"""
+    add, mul = galois_field(q)
+    rows = np.array(list(product(range(q), repeat=r)))
+    columns = []
+    for last in range(r):
+        for head in product(range(q), repeat=last):
+            columns.append(tuple(reversed(head)) + (1,) + (0,) * (r - last - 1))
+    C = np.array(columns)
+    values = np.zeros((len(rows), len(C)), dtype=int)
+    for i in range(r):
+        values = add[values, mul[rows[:, i][:, None], C[:, i][None, :]]]
+    return values
+
+
+def paley(q: int) -> np.ndarray:
+    """Paley I 아다마르 행렬(차수 q + 1)에서 얻은 2수준 OA(q + 1, q, 2, 2)"""
+    if q % 4 != 3:
+        raise ValueError("Paley I 구성은 q ≡ 3 (mod 4) 가 필요합니다.")
+    add, mul = galois_field(q)
+    neg = np.argmin(add, axis=1)                       # add[x, neg[x]] = 0
+    squares = set(np.diag(mul)[1:].tolist())
+    chi = np.array([0] + [1 if x in squares else -1 for x in range(1, q)])
+    Q = chi[add[np.arange(q)[None, :], neg[:, None]]]  # χ(a_j - a_i)
+    H = np.eye(q + 1, dtype=int)
+    H[0, 1:] = 1
+    H[1:, 0] = -1
+    H[1:, 1:] += Q
+    H = H * H[:, :1]                                   # 첫 열을 +1 로 정규화
+    return (H[:, 1:] < 0).astype(int)
+
+
+def _difference_scheme_oa(r: int, two_level: np.ndarray) -> np.ndarray:
+    """행 (i, j): [2수준 열(i) | D[i, k] + j (mod 3)]"""
+    D = np.array(_DIFFERENCE_SCHEMES[r])
+    i, j = np.divmod(np.arange(3 * r), 3)
+    return np.column_stack([two_level[i], (D[i] + j[:, None]) % 3])
+
+
+def _l18() -> np.ndarray:
+    i = np.arange(6)
+    return _difference_scheme_oa(6, np.column_stack([i // 3, i % 3]))
+
+
+def _l36() -> np.ndarray:
+    return _difference_scheme_oa(12, paley(11))
+
+
+@dataclass(frozen=True)
+class ArraySpec:
+    """카탈로그 항목 (name 예: "L18(2^1 3^7)")"""
+
+    name: str
+    runs: int
+    levels: Tuple[Tuple[int, int], ...]  # ((수준 수, 열 수), ...) 열 순서대로
+    builder: Callable[[], np.ndarray]
+
+    @property
+    def columns(self) -> int:
+        return sum(count for _, count in self.levels)
+
+    @property
+    def column_levels(self) -> List[int]:
+        return [level for level, count in self.levels for _ in range(count)]
+
+
+def _spec(runs, levels, builder) -> ArraySpec:
+    label = " ".join(f"{level}^{count}" for level, count in levels)
+    return ArraySpec(f"L{runs}({label})", runs, tuple(levels), builder)
+
+
+CATALOGUE: Dict[str, ArraySpec] = {spec.name: spec for spec in (
+    _spec(4, [(2, 3)], lambda: rao_hamming(2, 2)),
+    _spec(8, [(2, 7)], lambda: rao_hamming(2, 3)),
+    _spec(9, [(3, 4)], lambda: rao_hamming(3, 2)),
+    _spec(12, [(2, 11)], lambda: paley(11)),
+    _spec(16, [(2, 15)], lambda: rao_hamming(2, 4)),
+    _spec(16, [(4, 5)], lambda: rao_hamming(4, 2)),
+    _spec(18, [(2, 1), (3, 7)], _l18),
+    _spec(20, [(2, 19)], lambda: paley(19)),
+    _spec(24, [(2, 23)], lambda: paley(23)),
+    _spec(25, [(5, 6)], lambda: rao_hamming(5, 2)),
+    _spec(27, [(3, 13)], lambda: rao_hamming(3, 3)),
+    _spec(28, [(2, 27)], lambda: paley(27)),
+    _spec(32, [(2, 31)], lambda: rao_hamming(2, 5)),
+    _spec(36, [(2, 11), (3, 12)], _l36),
+    _spec(44, [(2, 43)], lambda: paley(43)),
+    _spec(48, [(2, 47)], lambda: paley(47)),
+    _spec(64, [(2, 63)], lambda: rao_hamming(2, 6)),
+    _spec(64, [(4, 21)], lambda: rao_hamming(4, 3)),
+    _spec(81, [(3, 40)], lambda: rao_hamming(3, 4)),
+)}
+
+# 짧은 이름 → 기본 배열 (같은 런 수면 먼저 등록한 2수준/혼합 배열)
+ALIASES: Dict[str, str] = {}
+for _name, _spec_item in CATALOGUE.items():
+    ALIASES.setdefault(f"L{_spec_item.runs}", _name)
+
+
+def resolve(name: str) -> ArraySpec:
+    """"L8", "l16(4^5)", "L18(2^1 3^7)" 등 → ArraySpec (없으면 ValueError)"""
+    key = " ".join(str(name).strip().upper().split())
+    key = ALIASES.get(key, key)
+    spec = CATALOGUE.get(key)
+    if spec is None:
+        raise ValueError(f"지원하지 않는 직교배열입니다: {name} (지원: {', '.join(CATALOGUE)})")
+    return spec
+
+
+@lru_cache(maxsize=None)
+def orthogonal_array(name: str) -> np.ndarray:
+    """카탈로그 배열 (0 부터 시작하는 수준, 읽기 전용). 처음 만들 때 강도 2 를 검증한다."""
+    spec = resolve(name)
+    if spec.name != name:
+        return orthogonal_array(spec.name)
+    array = np.ascontiguousarray(spec.builder(), dtype=np.int8)
+    if array.shape != (spec.runs, spec.columns) or not is_orthogonal(array, 2, spec.column_levels):
+        raise RuntimeError(f"{spec.name} 구성 검증에 실패했습니다.")
+    array.setflags(write=False)
+    return array
+
+
+def is_orthogonal(array: np.ndarray, strength: int = 2, levels=None) -> bool:
+    """
+    강도 t 검사: 모든 t 열 조합에서 수준 조합이 같은 횟수로 나타나는지.
+    조합마다 혼합 진법 코드를 만들어 한 번의 bincount 로 센다.
+    """
+    A = np.asarray(array, dtype=np.int64)
+    n, m = A.shape
+    if strength < 1 or strength > m:
+        return strength <= 0
+    levels = np.asarray(levels if levels is not None else A.max(axis=0) + 1, dtype=np.int64)
+    subsets = np.array(list(combinations(range(m), strength)))
+    sizes = np.prod(levels[subsets], axis=1)
+    if np.any(n % sizes):
+        return False
+    width = int(sizes.max())
+    codes = np.zeros((n, len(subsets)), dtype=np.int64)
+    for pos in range(strength):
+        cols = subsets[:, pos]
+        codes = codes * levels[cols] + A[:, cols]
+    offsets = np.arange(len(subsets)) * width
+    counts = np.bincount((codes + offsets).ravel(), minlength=len(subsets) * width).reshape(len(subsets), width)
+    expected = (n // sizes)[:, None] * (np.arange(width)[None, :] < sizes[:, None])
+    return bool(np.array_equal(counts, expected))
+
+
+def strength(array: np.ndarray, max_strength: int = 4, levels=None) -> int:
+    """배열이 만족하는 가장 큰 강도 (0 이면 균형도 아님)"""
+    t = 0
+    while t < min(max_strength, np.shape(array)[1]) and is_orthogonal(array, t + 1, levels):
+        t += 1
+    return t
+
+
+def catalogue() -> List[Dict[str, object]]:
+    """[{"name", "runs", "levels": {수준: 열 수}, "columns"}] 런 수 순"""
+    return [
+        {"name": spec.name, "runs": spec.runs, "levels": {level: count for level, count in spec.levels},
+         "columns": spec.columns}
+        for spec in CATALOGUE.values()
+    ]
@@ -0,0 +1,35 @@
+"""
+재현 가능한 청크 병렬 실행 도우미
+
+전체 작업량을 고정 크기 청크로 나누고 SeedSequence.spawn 으로 청크별 시드를 만든다.
+청크 구성은 작업자 수와 무관하므로 같은 seed 면 직렬/스레드/프로세스 실행 결과가 같다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, List
+
+import numpy as np
+
+
+def run_seeded_chunks(func: Callable, payload: Any, total: int, chunk_size: int, seed: int = 0,
+                      max_workers: int = 1, use_processes: bool = False) -> List[Any]:
+    """
+    func((size, seed_seq, payload)) 를 청크마다 호출하고 결과를 청크 순서대로 반환.
+
+    seed 는 정수 또는 정수 시퀀스(예: [seed, 항 번호])이다.
+    use_processes=True 이면 func 와 payload 는 피클 가능해야 한다. (모듈 최상위 함수)
+    """
+    sizes = [min(chunk_size, total - start) for start in range(0, total, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(size, seed_seq, payload) for size, seed_seq in zip(sizes, seeds)]
+
+    return map_chunks(func, tasks, max_workers=max_workers, use_processes=use_processes)
+
+
+def map_chunks(func: Callable, tasks: List[Any], max_workers: int = 1, use_processes: bool = False) -> List[Any]:
+    """func(task) 를 작업마다 호출하고 결과를 작업 순서대로 반환 (작업이 하나뿐이면 직렬)"""
+    if max_workers and max_workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool(max_workers=min(max_workers, len(tasks))) as executor:
+            return list(executor.map(func, tasks))
+    return [func(task) for task in tasks]
@@ -0,0 +1,206 @@
+"""
+순열검정 ANOVA
+
+정규성 가정이 어려운 반응(치우친 계수형 등)에 대해 F 분포 대신 순열 분포로 p-값을 구한다.
+순열 수 × 그룹 수 행렬 연산으로 한 청크의 F 통계량을 한 번에 계산하고,
+청크 크기로 메모리를 제한하며 청크는 스레드/프로세스로 나누어 실행할 수 있다.
+
+- 일원 배치: 그룹 코드 원-핫 행렬 G 를 미리 만들어 두고 순열된 y 행렬 @ G 로 그룹 합을 구함.
+  총제곱합은 순열에 불변이므로 SS_between 만 비교하면 된다.
+- 다요인(DOE): 항별 Freedman-Lane 순열 (축소 모형 잔차를 순열), Type II 제곱합.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.parallel import run_seeded_chunks
+
+# 한 청크의 순열 행렬 원소 수 상한 (float64 기준 약 64MB)
+MAX_CHUNK_ELEMENTS = 8_000_000
+
+
+def _default_chunk_size(n: int) -> int:
+    return int(max(1, min(2000, MAX_CHUNK_ELEMENTS // max(n, 1))))
+
+
+def _permuted_rows(rng, values: np.ndarray, size: int) -> np.ndarray:
+    """values 를 행마다 독립적으로 섞은 (size, n) 행렬"""
+    return rng.permuted(np.tile(values, (size, 1)), axis=1)
+
+
+def _basis(X: np.ndarray) -> np.ndarray:
+    """열공간의 정규직교 기저 (계수 부족 설계 허용)"""
+    if X.shape[1] == 0:
+        return X
+    u, s, _ = np.linalg.svd(X, full_matrices=False)
+    tol = s[0] * max(X.shape) * np.finfo(float).eps if s.size else 0.0
+    return u[:, : int((s > tol).sum())]
+
+
+def _rss(Y: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """행별 잔차제곱합 ||y - QQ'y||² (Y: (P, n))"""
+    R = Y - (Y @ Q) @ Q.T
+    return np.einsum("ij,ij->i", R, R)
+
+
+def _permutation_chunk(args) -> int:
+    """청크 하나에서 관측 통계량 이상인 순열 통계량 개수 (프로세스 풀용 최상위 함수)"""
+    size, seed_seq, (kind, data) = args
+    rng = np.random.default_rng(seed_seq)
+
+    if kind == "oneway":
+        y, onehot, counts, stat_obs = data
+        sums = _permuted_rows(rng, y, size) @ onehot          # (size, k)
+        ssb = (sums * sums / counts).sum(axis=1)
+        return int((ssb >= stat_obs * (1 - 1e-12)).sum())
+
+    fitted_red, resid_red, q_red, q_term, q_full, df_term, df_resid, f_obs = data
+    Y = fitted_red + _permuted_rows(rng, resid_red, size)
+    ss_term = _rss(Y, q_red) - _rss(Y, q_term)
+    f_perm = (ss_term / df_term) / (_rss(Y, q_full) / df_resid)
+    return int((f_perm >= f_obs * (1 - 1e-12)).sum())
+
+
+def _count_exceedances(kind, data, n_obs, n_permutations, seed, chunk_size, max_workers, use_processes) -> int:
+    chunk_size = chunk_size or _default_chunk_size(n_obs)
+    counts = run_seeded_chunks(_permutation_chunk, (kind, data), n_permutations, chunk_size, seed=seed,
+                               max_workers=max_workers, use_processes=use_processes)
+    return int(sum(counts))
+
+
+def permutation_oneway(y, groups, n_permutations: int = 4999, seed: int = 0,
+                       chunk_size: Optional[int] = None, max_workers: int = 1,
+                       use_processes: bool = False) -> Dict[str, Any]:
+    """
+    일원 배치 순열 ANOVA.
+
+    Returns:
+        {"f_statistic", "p_value"(순열), "p_value_f"(F 분포), "df_between", "df_within",
+         "group_count", "n_permutations"}
+    """
+    from scipy import stats
+
+    y = np.asarray(y, dtype=float)
+    codes, levels = pd.factorize(pd.Series(groups), sort=True)
+    mask = (codes >= 0) & ~np.isnan(y)
+    y, codes = y[mask], codes[mask]
+    k, n = len(levels), y.size
+    if k < 2:
+        raise ValueError("ANOVA에는 최소 2개 이상의 그룹이 필요합니다.")
+    if n - k <= 0:
+        raise ValueError("표본 수가 부족합니다.")
+
+    onehot = np.zeros((n, k))
+    onehot[np.arange(n), codes] = 1.0
+    counts = onehot.sum(axis=0)
+    sums = y @ onehot
+    ssb_raw = float((sums * sums / counts).sum())
+    correction = y.sum() ** 2 / n
+    ss_between = ssb_raw - correction
+    ss_within = float(((y - y.mean()) ** 2).sum()) - ss_between
+    df_between, df_within = k - 1, n - k
+    f_stat = (ss_between / df_between) / (ss_within / df_within) if ss_within > 0 else np.inf
+
+    exceed = _count_exceedances("oneway", (y, onehot, counts, ssb_raw), n, n_permutations,
+                                seed, chunk_size, max_workers, use_processes)
+    return {
+        "f_statistic": float(f_stat),
+        "p_value": (exceed + 1) / (n_permutations + 1),
+        "p_value_f": float(stats.f.sf(f_stat, df_between, df_within)),
+        "ss_between": ss_between,
+        "ss_within": ss_within,
+        "df_between": df_between,
+        "df_within": df_within,
+        "group_count": k,
+        "n_permutations": int(n_permutations),
+    }
+
+
+def _design_terms(df: pd.DataFrame, factors: Sequence[str], interactions: bool) -> List[Tuple[str, frozenset, np.ndarray]]:
+    """(항 이름, 요인 집합, 처리 대비 더미 열) 목록. 이름은 statsmodels 의 C(f) 표기와 같다."""
+    dummies = {}
+    for f in factors:
+        codes, levels = pd.factorize(df[f], sort=True)
+        d = np.zeros((len(df), len(levels)))
+        d[np.arange(len(df)), codes] = 1.0
+        dummies[f] = d[:, 1:]
+    terms = [(f"C({f})", frozenset([f]), dummies[f]) for f in factors]
+    if interactions:
+        for i, f1 in enumerate(factors):
+            for f2 in factors[i + 1:]:
+                cols = (dummies[f1][:, :, None] * dummies[f2][:, None, :]).reshape(len(df), -1)
+                terms.append((f"C({f1}):C({f2})", frozenset([f1, f2]), cols))
+    return terms
+
+
+def permutation_anova(df: pd.DataFrame, response: str, factors: Sequence[str], interactions: bool = False,
+                      n_permutations: int = 4999, seed: int = 0, chunk_size: Optional[int] = None,
+                      max_workers: int = 1, use_processes: bool = False) -> Dict[str, Any]:
+    """
+    요인별 순열 p-값이 포함된 ANOVA 표.
+
+    Returns:
+        {"anova": DataFrame(sum_sq, df, F, PR(>F), PR(perm)), "method", "n_permutations", "seed"}
+    """
+    from scipy import stats
+
+    factors = list(factors)
+    data = df[[response] + factors].copy()
+    data[response] = pd.to_numeric(data[response], errors="coerce")
+    data = data.dropna().reset_index(drop=True)
+    y = data[response].to_numpy(dtype=float)
+    n = y.size
+
+    if len(factors) == 1 and not interactions:
+        res = permutation_oneway(y, data[factors[0]], n_permutations, seed, chunk_size, max_workers, use_processes)
+        anova = pd.DataFrame(
+            {
+                "sum_sq": [res["ss_between"], res["ss_within"]],
+                "df": [float(res["df_between"]), float(res["df_within"])],
+                "F": [res["f_statistic"], np.nan],
+                "PR(>F)": [res["p_value_f"], np.nan],
+                "PR(perm)": [res["p_value"], np.nan],
+            },
+            index=[f"C({factors[0]})", "Residual"],
+        )
+        return {"anova": anova, "method": "oneway", "n_permutations": int(n_permutations), "seed": seed}
+
+    terms = _design_terms(data, factors, interactions)
+    intercept = np.ones((n, 1))
+
+    def basis_of(selected):
+        return _basis(np.hstack([intercept] + [cols for _, _, cols in selected]))
+
+    q_full = basis_of(terms)
+    df_resid = n - q_full.shape[1]
+    if df_resid <= 0:
+        raise ValueError("잔차 자유도가 0입니다.")
+    rss_full = float(_rss(y[None, :], q_full)[0])
+
+    rows = []
+    for t_index, (name, members, _) in enumerate(terms):
+        # Type II: 이 항을 포함하는 고차항을 제외한 모형 대비 추가 제곱합
+        reduced = [t for t in terms if t[0] != name and not members <= t[1]]
+        q_red = basis_of(reduced)
+        q_term = basis_of(reduced + [terms[t_index]])
+        df_term = q_term.shape[1] - q_red.shape[1]
+        if df_term <= 0:
+            rows.append((name, np.nan, 0.0, np.nan, np.nan, np.nan))
+            continue
+        ss_term = float(_rss(y[None, :], q_red)[0] - _rss(y[None, :], q_term)[0])
+        f_obs = (ss_term / df_term) / (rss_full / df_resid)
+
+        fitted_red = (y @ q_red) @ q_red.T
+        resid_red = y - fitted_red
+        payload = (fitted_red, resid_red, q_red, q_term, q_full, df_term, df_resid, f_obs)
+        exceed = _count_exceedances("freedman_lane", payload, n, n_permutations, [seed, t_index],
+                                    chunk_size, max_workers, use_processes)
+        rows.append((name, ss_term, float(df_term), f_obs, float(stats.f.sf(f_obs, df_term, df_resid)),
+                     (exceed + 1) / (n_permutations + 1)))
+
+    rows.append(("Residual", rss_full, float(df_resid), np.nan, np.nan, np.nan))
+    anova = pd.DataFrame(rows, columns=["term", "sum_sq", "df", "F", "PR(>F)", "PR(perm)"]).set_index("term")
+    anova.index.name = None
+    return {"anova": anova, "method": "Freedman-Lane", "n_permutations": int(n_permutations), "seed": seed}
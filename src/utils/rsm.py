@@ -0,0 +1,246 @@
+"""
+2차 반응표면(RSM) 엔진: 정준분석, 정상점, 격자 예측
+
+요인은 데이터 범위를 [-1, 1] 로 코딩해 적합한다. (최소/최대 → -1/+1)
+  y = b0 + xᵀb + xᵀBx,  B 는 대칭 (B_ii = β_ii, B_ij = β_ij / 2)
+  정상점   x_s = -½ B⁻¹ b,  ŷ_s = b0 + ½ x_sᵀ b
+  정준분석 B = V Λ Vᵀ → 고유값이 모두 음수면 최대, 모두 양수면 최소, 부호가 섞이면 안장점
+            0 에 가까운 고유값은 능선(ridge)으로 표시하고 종류 판정에서 뺀다. (모두 0 이면 "능선")
+코딩은 요인별 양의 배율 변환이므로 고유값 부호(정상점의 종류)는 원 단위와 같다. (실베스터 관성 법칙)
+
+격자 예측은 2차항 설계행렬 F(N×p) 와 [β | C] 의 한 번의 행렬곱으로 예측값과 표준오차를 함께 구한다.
+  ŷ = Fβ,  se(ŷ) = sqrt(diag(F C Fᵀ)) = sqrt(rowsum((F C) ∘ F))   (C = σ² (XᵀX)⁻¹)
+n×n 이나 N×N 행렬은 만들지 않는다.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# |λ| 가 max(|λ|, |b|) 의 이 비율 이하이면 능선(ridge)으로 표시
+RIDGE_TOL = 0.01
+
+# 격자 한 변의 최대 점 수 (resolution²·p 개의 float 를 한 번에 만듦)
+MAX_RESOLUTION = 1000
+
+
+def quadratic_term_names(factors: Sequence[str]) -> List[str]:
+    """statsmodels 공식 "y ~ A + B + A:B + I(A**2) + I(B**2)" 와 같은 항 이름/순서"""
+    k = len(factors)
+    return (["Intercept"] + list(factors)
+            + [f"{factors[i]}:{factors[j]}" for i in range(k) for j in range(i + 1, k)]
+            + [f"I({f} ** 2)" for f in factors])
+
+
+def quadratic_design(X: np.ndarray) -> np.ndarray:
+    """(N, k) 요인 값 → (N, p) 2차 모형 설계행렬 (절편, 1차, 교호, 제곱 순)"""
+    X = np.asarray(X, dtype=float)
+    n, k = X.shape
+    iu, ju = np.triu_indices(k, 1)
+    F = np.empty((n, 1 + 2 * k + iu.size))
+    F[:, 0] = 1.0
+    F[:, 1:1 + k] = X
+    np.multiply(X[:, iu], X[:, ju], out=F[:, 1 + k:1 + k + iu.size])
+    np.square(X, out=F[:, 1 + k + iu.size:])
+    return F
+
+
+def coding_from_range(X: np.ndarray, factors: Sequence[str]):
+    """(center, half_range) - 요인별 최소/최대를 -1/+1 로 코딩"""
+    X = np.asarray(X, dtype=float)
+    lo, hi = X.min(axis=0), X.max(axis=0)
+    half = (hi - lo) / 2
+    if np.any(half <= 0):
+        constant = [f for f, h in zip(factors, half) if h <= 0]
+        raise ValueError(f"값이 하나뿐인 요인이 있습니다: {', '.join(constant)}")
+    return (hi + lo) / 2, half
+
+
+class QuadraticModel:
+    """
+    코딩 단위로 적합한 2차 반응표면 모형.
+
+    Attributes:
+        factors: 요인 이름
+        center, half_range: 코딩 변환 (x_coded = (x - center) / half_range)
+        beta: 코딩 단위 계수 (quadratic_term_names 순서)
+        cov: 계수 공분산 σ²(XᵀX)⁻¹ (잔차 자유도 0 이면 NaN)
+    """
+
+    def __init__(self, factors, beta, cov, sigma2, df_resid, center, half_range, response=None):
+        self.factors = list(factors)
+        self.response = response
+        self.beta = np.asarray(beta, dtype=float)
+        self.cov = np.asarray(cov, dtype=float)
+        self.sigma2 = float(sigma2)
+        self.df_resid = int(df_resid)
+        self.center = np.asarray(center, dtype=float)
+        self.half_range = np.asarray(half_range, dtype=float)
+
+    # 적합 ---------------------------------------------------------------
+    @classmethod
+    def fit(cls, X, y, factors: Sequence[str], response: Optional[str] = None,
+            center=None, half_range=None) -> "QuadraticModel":
+        """center/half_range 를 주면 그 코딩으로 적합 (여러 반응을 같은 코딩으로 맞출 때)"""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        k = X.shape[1]
+        p = 1 + 2 * k + k * (k - 1) // 2
+        if X.shape[0] < p:
+            raise ValueError(f"2차 모형에는 최소 {p}개 관측치가 필요합니다. (현재 {X.shape[0]}개)")
+        if center is None or half_range is None:
+            center, half = coding_from_range(X, factors)
+        else:
+            center, half = np.asarray(center, dtype=float), np.asarray(half_range, dtype=float)
+
+        F = quadratic_design((X - center) / half)
+        beta, _, rank, _ = np.linalg.lstsq(F, y, rcond=None)
+        if rank < p:
+            raise ValueError("설계가 2차 모형을 추정하기에 부족합니다. (계수 부족)")
+        resid = y - F @ beta
+        df_resid = X.shape[0] - p
+        sigma2 = float(resid @ resid) / df_resid if df_resid > 0 else np.nan
+        cov = sigma2 * np.linalg.inv(F.T @ F)
+        return cls(factors, beta, cov, sigma2, df_resid, center, half, response=response)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, response: str, factors: Sequence[str]) -> "QuadraticModel":
+        """숫자 변환 후 결측 행을 제외하고 적합"""
+        data = df[[response] + list(factors)].apply(pd.to_numeric, errors="coerce").dropna()
+        return cls.fit(data[list(factors)].to_numpy(), data[response].to_numpy(), factors, response=response)
+
+    # 계수 ---------------------------------------------------------------
+    @property
+    def k(self) -> int:
+        return len(self.factors)
+
+    @property
+    def b0(self) -> float:
+        return float(self.beta[0])
+
+    @property
+    def b(self) -> np.ndarray:
+        """1차 계수 벡터 (코딩 단위)"""
+        return self.beta[1:1 + self.k]
+
+    @property
+    def B(self) -> np.ndarray:
+        """2차 계수 대칭 행렬 (코딩 단위)"""
+        k = self.k
+        iu, ju = np.triu_indices(k, 1)
+        B = np.diag(self.beta[1 + k + iu.size:])
+        B[iu, ju] = B[ju, iu] = self.beta[1 + k:1 + k + iu.size] / 2
+        return B
+
+    def coded(self, X) -> np.ndarray:
+        return (np.asarray(X, dtype=float) - self.center) / self.half_range
+
+    def natural(self, X_coded) -> np.ndarray:
+        return np.asarray(X_coded, dtype=float) * self.half_range + self.center
+
+    # 정상점/정준분석 ------------------------------------------------------
+    def canonical_analysis(self, ridge_tol: float = RIDGE_TOL) -> Dict[str, Any]:
+        """
+        Returns:
+            {"nature": "최대"|"최소"|"안장점"|"능선", "ridge", "eigenvalues", "eigenvectors"(DataFrame),
+             "stationary_point"(원 단위 dict 또는 None), "stationary_point_coded", "stationary_response",
+             "stationary_se", "within_region"(코딩 단위 ±1 안), "B"(DataFrame), "b"(Series)}
+        """
+        B, b = self.B, self.b
+        eigenvalues, eigenvectors = np.linalg.eigh(B)
+        # 크기 기준: 2차/1차 계수 중 큰 값 (평면 모형의 수치 잡음 고유값도 0 으로 보도록)
+        scale = max(float(np.max(np.abs(eigenvalues))), float(np.max(np.abs(b))), np.finfo(float).tiny)
+        near_zero = np.abs(eigenvalues) <= ridge_tol * scale
+
+        # 0 에 가까운 고유값은 종류 판정에서 빼고 ridge 로 표시
+        significant = eigenvalues[~near_zero]
+        if significant.size == 0:
+            nature = "능선"
+        elif np.all(significant < 0):
+            nature = "최대"
+        elif np.all(significant > 0):
+            nature = "최소"
+        else:
+            nature = "안장점"
+
+        result = {
+            "nature": nature,
+            "ridge": bool(np.any(near_zero)),
+            "eigenvalues": eigenvalues.tolist(),
+            "eigenvectors": pd.DataFrame(eigenvectors, index=self.factors,
+                                         columns=[f"w{i + 1}" for i in range(self.k)]),
+            "B": pd.DataFrame(B, index=self.factors, columns=self.factors),
+            "b": pd.Series(b, index=self.factors),
+            "stationary_point": None,
+            "stationary_point_coded": None,
+            "stationary_response": None,
+            "stationary_se": None,
+            "within_region": None,
+        }
+        # B 가 수치적으로 특이하면 정상점이 정의되지 않음 (무한히 먼 능선)
+        if np.any(np.abs(eigenvalues) <= np.sqrt(np.finfo(float).eps) * scale):
+            return result
+
+        xs = -0.5 * np.linalg.solve(B, b)
+        fit, se = self.predict_coded(xs[None, :])
+        result.update({
+            "stationary_point": dict(zip(self.factors, self.natural(xs).tolist())),
+            "stationary_point_coded": dict(zip(self.factors, xs.tolist())),
+            "stationary_response": float(self.b0 + 0.5 * xs @ b),
+            "stationary_se": float(se[0]),
+            "within_region": bool(np.all(np.abs(xs) <= 1 + 1e-9)),
+        })
+        return result
+
+    # 예측 ---------------------------------------------------------------
+    def predict_coded(self, X_coded):
+        """(예측값, 평균 예측 표준오차) - 한 번의 행렬곱 F @ [β | C]"""
+        F = quadratic_design(X_coded)
+        FC = F @ np.column_stack([self.beta, self.cov])
+        fit = FC[:, 0]
+        var = np.einsum("ij,ij->i", FC[:, 1:], F)
+        return fit, np.sqrt(np.maximum(var, 0))
+
+    def predict(self, X):
+        """원 단위 (N, k) 요인 값의 (예측값, 표준오차)"""
+        return self.predict_coded(self.coded(X))
+
+    def grid(self, x_factor: str, y_factor: str, resolution: int = 100,
+             x_range: Optional[Sequence[float]] = None, y_range: Optional[Sequence[float]] = None,
+             fixed: Optional[Mapping[str, float]] = None) -> Dict[str, Any]:
+        """
+        두 요인을 격자로, 나머지 요인은 고정값(기본: 중심)으로 두고 예측한다.
+
+        Returns:
+            {"x_factor", "y_factor", "x"(nx), "y"(ny), "fit"(ny×nx), "se"(ny×nx), "fixed"}
+        """
+        if x_factor not in self.factors or y_factor not in self.factors or x_factor == y_factor:
+            raise ValueError("격자 요인은 모형의 서로 다른 두 요인이어야 합니다.")
+        resolution = int(resolution)
+        if not 2 <= resolution <= MAX_RESOLUTION:
+            raise ValueError(f"격자 해상도는 2~{MAX_RESOLUTION} 사이여야 합니다.")
+        ix, iy = self.factors.index(x_factor), self.factors.index(y_factor)
+        lo, hi = self.center - self.half_range, self.center + self.half_range
+        xs = np.linspace(*(x_range if x_range is not None else (lo[ix], hi[ix])), resolution)
+        ys = np.linspace(*(y_range if y_range is not None else (lo[iy], hi[iy])), resolution)
+
+        base = self.center.copy()
+        for name, value in (fixed or {}).items():
+            if name in self.factors:
+                base[self.factors.index(name)] = float(value)
+        gx, gy = np.meshgrid(xs, ys)
+        X = np.broadcast_to(base, (gx.size, self.k)).copy()
+        X[:, ix] = gx.ravel()
+        X[:, iy] = gy.ravel()
+
+        fit, se = self.predict(X)
+        return {
+            "x_factor": x_factor,
+            "y_factor": y_factor,
+            "x": xs,
+            "y": ys,
+            "fit": fit.reshape(gx.shape),
+            "se": se.reshape(gx.shape),
+            "fixed": {f: float(v) for f, v in zip(self.factors, base) if f not in (x_factor, y_factor)},
+        }
@@ -0,0 +1,334 @@
+"""
+공간 채움(space-filling) 설계 - 컴퓨터 실험/시뮬레이션용
+
+- latin_hypercube: 열마다 독립 순열 (한 번의 argsort 로 벡터화), 칸 안 무작위 위치 또는 칸 중앙
+- maximin_lhs: 한 열 안에서 두 행의 수준을 맞바꾸는(LHS 유지) 모의 담금질로
+  Morris–Mitchell φ_p = (Σ_{i<j} d_ij^-p)^(1/p) 를 최소화한다. (p 가 크면 최소 거리 최대화와 같음)
+  거리는 수준 번호(정수) 단위의 제곱거리 행렬로 들고 다녀 누적 오차가 없다.
+  열 k 에서 행 i1, i2 의 값 a, b 를 바꾸면 두 행의 거리만 바뀌고
+    Δd²(i1, j) = (b - a)(a + b - 2 x_jk),  Δd²(i2, j) = -Δd²(i1, j)
+  이므로 제안 한 번의 평가와 적용이 O(n) 이다. φ_p 의 합은 행별 합 벡터로 들고 다닌다.
+  무작위 재시작은 utils.parallel.run_seeded_chunks 로 나눠 실행한다. (같은 seed 면 작업자 수와 무관)
+  time_budget 은 전체 한도이며 재시작마다 time_budget / restarts 초씩 쓴다.
+- low_discrepancy: scipy.stats.qmc 의 Sobol / Halton 수열 (스크램블)
+
+설계는 [0, 1)^d 단위 입방체에서 만들고 요인 범위로 옮긴다.
+"""
+
+import time
+import warnings
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.parallel import run_seeded_chunks
+
+KINDS = ("lhs", "maximin_lhs", "sobol", "halton")
+
+# 거리 지표(최소 거리, φ_p) 계산 시 한 번에 처리할 행 수
+DISTANCE_CHUNK = 1024
+
+# 중심 L2 불일치도는 O(n²d) 이므로 이 런 수까지만 계산
+DISCREPANCY_MAX_RUNS = 2000
+
+# maximin 담금질은 시작마다 (n, n) 정수 거리 행렬을 들고 있으므로 (4000런 ≈ 64MB) 이 런 수까지만
+MAXIMIN_MAX_RUNS = 4000
+
+# 담금질 온도 (φ_p 상대 증가율 단위): 시작 → 끝, 기하 냉각
+ANNEAL_T0 = 0.01
+ANNEAL_T_END = 1e-5
+
+# φ_p 합이 이 배수만큼 줄면 척도를 다시 잡음 (증분 합의 자릿수 손실 방지)
+RESCALE_DROP = 1e6
+
+
+def _check_size(n: int, d: int):
+    if int(n) < 2:
+        raise ValueError("런 수는 2 이상이어야 합니다.")
+    if int(d) < 1:
+        raise ValueError("요인이 하나 이상 필요합니다.")
+
+
+def _lhs_levels(n: int, d: int, rng: np.random.Generator) -> np.ndarray:
+    """(d, n) 정수 수준 배열 - 행마다 0..n-1 의 독립 순열"""
+    return np.argsort(rng.random((d, n)), axis=1)
+
+
+def latin_hypercube(n: int, d: int, seed=None, centered: bool = False) -> np.ndarray:
+    """
+    (n, d) 라틴 하이퍼큐브 [0, 1)^d.
+    centered=True 이면 칸 중앙 (i + 0.5)/n, 아니면 칸 안 균등 위치.
+    """
+    _check_size(n, d)
+    rng = np.random.default_rng(seed)
+    return _unit_design(_lhs_levels(n, d, rng), rng, centered)
+
+
+def _unit_design(levels: np.ndarray, rng: np.random.Generator, centered: bool) -> np.ndarray:
+    """(d, n) 수준 → (n, d) 단위 입방체 좌표"""
+    n = levels.shape[1]
+    offset = 0.5 if centered else rng.random(levels.shape)
+    return ((levels + offset) / n).T
+
+
+def _squared_distances(levels: np.ndarray, dtype) -> np.ndarray:
+    """
+    (d, n) 정수 수준의 (n, n) 제곱거리 행렬. 대각선은 dtype 최댓값(φ_p 항 ≈ 0).
+    정수 좌표의 Gram 계산은 float64 로도 정확하다. (값 ≤ d·n² ≪ 2^53)
+    """
+    X = levels.T.astype(float)
+    sq = np.einsum("ij,ij->i", X, X)
+    n = len(X)
+    D = np.empty((n, n), dtype=dtype)
+    for start in range(0, n, DISTANCE_CHUNK):
+        stop = min(start + DISTANCE_CHUNK, n)
+        block = sq[start:stop, None] + sq[None, :] - 2.0 * (X[start:stop] @ X.T)
+        D[start:stop] = np.rint(block)
+    np.fill_diagonal(D, np.iinfo(dtype).max)
+    return D
+
+
+def _anneal(levels: np.ndarray, iterations: int, p: float, rng: np.random.Generator,
+            deadline: Optional[float]) -> Dict[str, Any]:
+    """
+    열 내 교환 모의 담금질 (levels 를 제자리에서 바꿈).
+    φ_p 항은 d² 를 현재 최소 d² 로 나눈 척도에서 계산한다. (가장 큰 항 = 1)
+    p 가 크면 가장 가까운 쌍이 사라질 때 합이 몇 자릿수씩 줄어 증분 합의 정밀도가 사라지므로,
+    합이 RESCALE_DROP 배 줄면 척도를 다시 잡고 정확한 정수 D 에서 행별 합을 새로 구한다.
+    """
+    d, n = levels.shape
+    dtype = np.int32 if d * (n - 1) ** 2 < np.iinfo(np.int32).max // 2 else np.int64
+    D = _squared_distances(levels, dtype)
+    half_p = p / 2.0
+    row_sums = np.empty(n)
+    inv_scale = 0.0
+
+    def terms(d2):
+        return np.power(d2 * inv_scale, -half_p)
+
+    def rescale():
+        nonlocal inv_scale
+        inv_scale = 1.0 / float(D.min())
+        for start in range(0, n, DISTANCE_CHUNK):
+            row_sums[start:start + DISTANCE_CHUNK] = terms(D[start:start + DISTANCE_CHUNK]).sum(axis=1)
+        return row_sums.sum() / 2
+
+    total = rescale()
+    best_total, best_levels = total, levels.copy()
+
+    cooling = (ANNEAL_T_END / ANNEAL_T0) ** (1.0 / max(iterations - 1, 1))
+    temperature = ANNEAL_T0
+    columns = rng.integers(0, d, size=iterations)
+    rows = rng.integers(0, n, size=(iterations, 2))
+    critical = rng.random(iterations) < 0.5
+    uniforms = rng.random(iterations)
+    accepted = done = 0
+    for it in range(iterations):
+        if deadline is not None and it % 64 == 0 and time.perf_counter() > deadline:
+            break
+        done += 1
+        # 절반은 φ_p 기여가 가장 큰(가까운 이웃이 있는) 행을 움직인다
+        i1 = int(np.argmax(row_sums)) if critical[it] else int(rows[it, 0])
+        i2 = int(rows[it, 1])
+        if i1 == i2:
+            i2 = (i2 + 1) % n
+        k = int(columns[it])
+        col = levels[k]
+        a, b = int(col[i1]), int(col[i2])
+
+        delta = (b - a) * (a + b - 2 * col)
+        new1 = D[i1] + delta
+        new2 = D[i2] - delta
+        new1[i1] = new2[i2] = D[i1, i1]
+        new1[i2] = new2[i1] = D[i1, i2]
+        terms1, terms2 = terms(new1), terms(new2)
+        sum1, sum2 = terms1.sum(), terms2.sum()
+        candidate = total + (sum1 - row_sums[i1]) + (sum2 - row_sums[i2])
+
+        change = (max(candidate, 0.0) / total) ** (1.0 / p) - 1.0
+        if change <= 0 or uniforms[it] < np.exp(-change / temperature):
+            row_sums += (terms1 - terms(D[i1])) + (terms2 - terms(D[i2]))
+            row_sums[i1], row_sums[i2] = sum1, sum2
+            D[i1], D[:, i1] = new1, new1
+            D[i2], D[:, i2] = new2, new2
+            col[i1], col[i2] = b, a
+            total = candidate
+            accepted += 1
+            if total < best_total:
+                best_total = total
+                best_levels[:] = levels
+            if total < 1.0 / RESCALE_DROP:
+                old_scale = inv_scale
+                total = rescale()
+                best_total *= (old_scale / inv_scale) ** half_p
+        temperature *= cooling
+
+    # 추적한 합 → 단위 입방체 φ_p (좌표 = 수준 / n)
+    phi_p = best_total ** (1.0 / p) * n * np.sqrt(inv_scale)
+    return {"levels": best_levels, "phi_p": float(phi_p), "iterations": done, "accepted": accepted}
+
+
+def _maximin_start(task):
+    """run_seeded_chunks 작업: 청크 크기만큼 무작위 LHS 에서 담금질 → 최소 거리가 가장 큰 결과"""
+    size, seed_seq, (n, d, iterations, p, time_budget) = task
+    rng = np.random.default_rng(seed_seq)
+    best = None
+    for _ in range(size):
+        deadline = time.perf_counter() + time_budget if time_budget else None
+        levels = _lhs_levels(n, d, rng)
+        initial = _level_min_distance(levels)
+        result = _anneal(levels, iterations, p, rng, deadline)
+        result["initial_min_distance"] = initial
+        result["min_distance"] = _level_min_distance(result["levels"])
+        if best is None or result["min_distance"] > best["min_distance"]:
+            best = result
+    return best
+
+
+def _level_min_distance(levels: np.ndarray) -> float:
+    """(d, n) 수준의 단위 입방체 최소 거리"""
+    return distance_metrics(levels.T / levels.shape[1], p=None)["min_distance"]
+
+
+def maximin_lhs(n: int, d: int, seed=None, restarts: int = 4, iterations: Optional[int] = None, p: float = 50.0,
+                centered: bool = True, time_budget: Optional[float] = None, max_workers: int = 1,
+                use_processes: bool = False) -> Dict[str, Any]:
+    """
+    maximin 라틴 하이퍼큐브.
+
+    Args:
+        restarts: 무작위 시작 수 (최소 거리가 가장 큰 결과 채택)
+        iterations: 시작마다 교환 제안 수 (기본 max(5000, 20n))
+        p: φ_p 지수 (클수록 최소 거리 위주)
+        time_budget: 전체 최대 초 - 재시작마다 time_budget / restarts 초 (넘으면 그때까지의 최선)
+
+    Returns:
+        {"design"(n×d 단위 입방체), "min_distance", "phi_p", "initial_min_distance",
+         "restarts", "iterations", "accepted", "elapsed"}
+    """
+    _check_size(n, d)
+    n, d = int(n), int(d)
+    if n > MAXIMIN_MAX_RUNS:
+        raise ValueError(f"maximin LHS 는 {MAXIMIN_MAX_RUNS}런까지 지원합니다. (더 크면 lhs/sobol 사용)")
+    if p <= 0:
+        raise ValueError("φ_p 지수 p 는 양수여야 합니다.")
+    restarts = max(1, int(restarts))
+    iterations = int(iterations) if iterations is not None else max(5000, 20 * n)
+    per_start = time_budget / restarts if time_budget else None
+    start = time.perf_counter()
+    results = run_seeded_chunks(
+        _maximin_start, (n, d, iterations, float(p), per_start), restarts, 1,
+        seed=seed, max_workers=max_workers, use_processes=use_processes,
+    )
+    best = max(results, key=lambda result: result["min_distance"])
+
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(restarts + 1)[-1])
+    design = _unit_design(best["levels"], rng, centered)
+    metrics = distance_metrics(design, p=p)
+    return {
+        "design": design,
+        **metrics,
+        "initial_min_distance": float(max(result["initial_min_distance"] for result in results)),
+        "restarts": restarts,
+        "iterations": int(sum(result["iterations"] for result in results)),
+        "accepted": int(sum(result["accepted"] for result in results)),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def low_discrepancy(n: int, d: int, kind: str = "sobol", seed=None, scramble: bool = True) -> np.ndarray:
+    """(n, d) Sobol / Halton 점. Sobol 은 n 이 2의 거듭제곱일 때 균형이 맞다."""
+    from scipy.stats import qmc
+
+    _check_size(n, d)
+    if kind == "sobol":
+        engine = qmc.Sobol(d=int(d), scramble=scramble, seed=seed)
+    elif kind == "halton":
+        engine = qmc.Halton(d=int(d), scramble=scramble, seed=seed)
+    else:
+        raise ValueError(f"알 수 없는 저불일치 수열입니다: {kind} (sobol, halton)")
+    with warnings.catch_warnings():
+        # 2의 거듭제곱이 아닌 Sobol 런 수 경고 - 결과의 "balanced" 로 알린다
+        warnings.simplefilter("ignore", UserWarning)
+        return engine.random(int(n))
+
+
+def distance_metrics(design: np.ndarray, p: Optional[float] = 50.0) -> Dict[str, float]:
+    """
+    단위 입방체 설계의 최소 점간 거리와 φ_p (p=None 이면 최소 거리만).
+    행 블록 단위 Gram 계산으로 n×n 행렬을 한꺼번에 만들지 않는다.
+    """
+    X = np.asarray(design, dtype=float)
+    n = len(X)
+    sq = np.einsum("ij,ij->i", X, X)
+    min_d2 = np.inf
+    log_terms = []
+    for start in range(0, n - 1, DISTANCE_CHUNK):
+        stop = min(start + DISTANCE_CHUNK, n)
+        block = sq[start:stop, None] + sq[None, start:] - 2.0 * (X[start:stop] @ X[start:].T)
+        upper = np.triu(np.ones(block.shape, dtype=bool), k=1)
+        d2 = np.maximum(block[upper], 0.0)
+        min_d2 = min(min_d2, float(d2.min()))
+        if p is not None:
+            # log Σ d^-p 를 블록마다 log-sum-exp 로 (작은 거리에서 넘침 방지)
+            logs = -0.5 * p * np.log(np.maximum(d2, 1e-300))
+            peak = logs.max()
+            log_terms.append(peak + np.log(np.exp(logs - peak).sum()))
+    metrics = {"min_distance": float(np.sqrt(min_d2))}
+    if p is not None:
+        log_terms = np.array(log_terms)
+        peak = log_terms.max()
+        metrics["phi_p"] = float(np.exp((peak + np.log(np.exp(log_terms - peak).sum())) / p))
+    return metrics
+
+
+def space_filling_design(factors: Sequence[str], runs: int, kind: str = "maximin_lhs",
+                         bounds: Optional[Sequence[Sequence[float]]] = None, seed=0, centered: Optional[bool] = None,
+                         scramble: bool = True, restarts: int = 4, iterations: Optional[int] = None, p: float = 50.0,
+                         time_budget: Optional[float] = None, max_workers: int = 1,
+                         use_processes: bool = False) -> Dict[str, Any]:
+    """
+    공간 채움 설계.
+
+    Args:
+        kind: "lhs", "maximin_lhs", "sobol", "halton"
+        bounds: 요인별 (하한, 상한) 원 단위 (기본 [0, 1])
+        centered: LHS 칸 중앙 사용 (기본 maximin_lhs 만 True)
+
+    Returns:
+        {"design"(DataFrame, 원 단위), "kind", "runs", "factors", "min_distance", "phi_p",
+         "discrepancy"(런 수가 많으면 None), "balanced"(Sobol), maximin_lhs 는 탐색 정보 추가}
+        거리 지표는 단위 입방체 기준이다.
+    """
+    factors = list(factors)
+    k, runs = len(factors), int(runs)
+    _check_size(runs, k)
+    if kind not in KINDS:
+        raise ValueError(f"알 수 없는 공간 채움 설계입니다: {kind} ({', '.join(KINDS)})")
+    bounds = np.array(bounds if bounds is not None else [(0.0, 1.0)] * k, dtype=float)
+    if bounds.shape != (k, 2) or np.any(bounds[:, 1] <= bounds[:, 0]):
+        raise ValueError("요인 범위는 요인마다 (하한 < 상한) 이어야 합니다.")
+
+    info: Dict[str, Any] = {}
+    if kind == "maximin_lhs":
+        info = maximin_lhs(runs, k, seed=seed, restarts=restarts, iterations=iterations, p=p,
+                           centered=True if centered is None else centered, time_budget=time_budget,
+                           max_workers=max_workers, use_processes=use_processes)
+        unit = info.pop("design")
+    elif kind == "lhs":
+        unit = latin_hypercube(runs, k, seed=seed, centered=bool(centered))
+        info = distance_metrics(unit, p=p)
+    else:
+        unit = low_discrepancy(runs, k, kind=kind, seed=seed, scramble=scramble)
+        info = distance_metrics(unit, p=p)
+        if kind == "sobol":
+            info["balanced"] = bool(runs & (runs - 1) == 0)
+
+    discrepancy = None
+    if runs <= DISCREPANCY_MAX_RUNS:
+        from scipy.stats import qmc
+
+        discrepancy = float(qmc.discrepancy(unit, method="CD"))
+    design = pd.DataFrame(bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0]), columns=factors)
+    return {"design": design, "kind": kind, "runs": runs, "factors": k, **info, "discrepancy": discrepancy}
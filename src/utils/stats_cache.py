@@ -0,0 +1,328 @@
+"""
+데이터셋별 기술통계 캐시
+
+DataTableView 에서 행 추가/셀 편집이 일어날 때 전체 프레임을 다시 훑지 않고
+열별 모멘트를 증분 갱신한다. ResultsView / ProjectExplorer / ChartView 는
+describe()/mean()/std() 대신 이 캐시를 읽는다.
+
+- 모멘트: 기준점(shift)을 뺀 거듭제곱 합(S1, S2, S3) -> 추가/제거가 O(1)
+- 최솟값/최댓값: 극값이 제거될 때만 해당 열을 다시 계산
+- 분위수/최빈값 등 순서 통계: 열 버전별로 지연 계산 후 캐시
+"""
+
+import itertools
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _to_float(value) -> Optional[float]:
+    """셀 값을 숫자로 해석한다. 숫자가 아니거나 결측이면 None."""
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    if np.isnan(result):
+        return None
+    return result
+
+
+class ColumnMoments:
+    """숫자형 열 하나의 증분 모멘트"""
+
+    __slots__ = ("n", "missing", "shift", "s1", "s2", "s3", "_min", "_max", "extrema_dirty")
+
+    def __init__(self):
+        self.n = 0
+        self.missing = 0
+        self.shift = 0.0
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.s3 = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+        self.extrema_dirty = False
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "ColumnMoments":
+        moments = cls()
+        values = np.asarray(values, dtype=float)
+        valid = values[~np.isnan(values)]
+        moments.missing = int(values.size - valid.size)
+        if valid.size:
+            # 기준점을 평균 근처로 잡아 거듭제곱 합의 수치 오차를 줄인다
+            moments.shift = float(valid.mean())
+            moments.add_values(valid)
+        return moments
+
+    def add_values(self, valid: np.ndarray):
+        """결측이 제거된 값들을 추가한다."""
+        if valid.size == 0:
+            return
+        d = valid - self.shift
+        self.n += int(valid.size)
+        self.s1 += float(d.sum())
+        self.s2 += float((d * d).sum())
+        self.s3 += float((d * d * d).sum())
+        self._min = min(self._min, float(valid.min()))
+        self._max = max(self._max, float(valid.max()))
+
+    def add_value(self, x: Optional[float]):
+        if x is None:
+            self.missing += 1
+            return
+        d = x - self.shift
+        self.n += 1
+        self.s1 += d
+        self.s2 += d * d
+        self.s3 += d * d * d
+        if not self.extrema_dirty:
+            self._min = min(self._min, x)
+            self._max = max(self._max, x)
+
+    def remove_value(self, x: Optional[float]):
+        if x is None:
+            self.missing = max(0, self.missing - 1)
+            return
+        d = x - self.shift
+        self.n -= 1
+        self.s1 -= d
+        self.s2 -= d * d
+        self.s3 -= d * d * d
+        # 극값이 빠지면 다음 조회 때 다시 계산
+        if x <= self._min or x >= self._max:
+            self.extrema_dirty = True
+
+    @property
+    def mean(self) -> float:
+        return self.shift + self.s1 / self.n if self.n else float("nan")
+
+    def central_moments(self):
+        """(m2, m3): 편향 중심 모멘트"""
+        n = self.n
+        mu = self.s1 / n
+        m2 = self.s2 / n - mu * mu
+        m3 = self.s3 / n - 3 * mu * self.s2 / n + 2 * mu ** 3
+        return max(m2, 0.0), m3
+
+    @property
+    def std(self) -> float:
+        if self.n < 2:
+            return float("nan")
+        m2, _ = self.central_moments()
+        return float(np.sqrt(m2 * self.n / (self.n - 1)))
+
+    @property
+    def skew(self) -> float:
+        """pandas Series.skew() 와 같은 보정 왜도(G1)"""
+        n = self.n
+        if n < 3:
+            return float("nan")
+        m2, m3 = self.central_moments()
+        if m2 <= 1e-14 * max(1.0, self.shift * self.shift):
+            return 0.0
+        g1 = m3 / m2 ** 1.5
+        return float(np.sqrt(n * (n - 1)) / (n - 2) * g1)
+
+    def set_extrema(self, col_min: float, col_max: float):
+        self._min, self._max = col_min, col_max
+        self.extrema_dirty = False
+
+
+class DatasetStatsCache:
+    """
+    데이터셋 하나의 통계 캐시.
+
+    column_version(col)은 해당 열이 바뀔 때마다 증가하므로
+    column_key(col)을 다른 캐시(예: 정규성 검정 결과)의 키로 사용할 수 있다.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        self.cache_id = next(self._ids)
+        self._df: Optional[pd.DataFrame] = None
+        self._moments: Dict[str, ColumnMoments] = {}
+        self._versions: Dict[str, int] = {}
+        self._lazy: Dict[tuple, Any] = {}
+        self.data_version = 0
+        if df is not None:
+            self.rebuild(df)
+
+    # 갱신 ----------------------------------------------------------------
+    def rebuild(self, df: Optional[pd.DataFrame]):
+        """전체 프레임으로 캐시를 새로 만든다."""
+        self._df = df
+        self._moments = {}
+        self._lazy = {}
+        if df is not None:
+            for col in df.columns:
+                self._rebuild_column(col)
+        self.data_version += 1
+
+    def bind(self, df: Optional[pd.DataFrame]):
+        """통계 변경 없이 참조할 프레임만 교체한다. (예: 동일 내용의 복사본)"""
+        self._df = df
+
+    def _rebuild_column(self, col):
+        self._versions[col] = self._versions.get(col, 0) + 1
+        series = self._df[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            self._moments[col] = ColumnMoments.from_values(series.to_numpy(dtype=float, na_value=np.nan))
+        else:
+            self._moments.pop(col, None)
+
+    def invalidate_column(self, col):
+        """열 타입 변경 등 증분 처리가 불가능한 경우 해당 열만 다시 계산한다."""
+        if self._df is None or col not in self._df.columns:
+            self._moments.pop(col, None)
+            self._versions[col] = self._versions.get(col, 0) + 1
+        else:
+            self._rebuild_column(col)
+        self.data_version += 1
+
+    def on_append(self, rows: pd.DataFrame, df: pd.DataFrame):
+        """행이 뒤에 추가되었을 때 추가된 행만 반영한다."""
+        self._df = df
+        if rows is None or len(rows) == 0:
+            return
+        for col in df.columns:
+            if col not in rows.columns:
+                continue
+            moments = self._moments.get(col)
+            kind_changed = (moments is not None) != (
+                pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+            )
+            if kind_changed:
+                # 예: None 행 추가로 int 열이 object 로 바뀐 경우
+                self._rebuild_column(col)
+                continue
+            self._versions[col] = self._versions.get(col, 0) + 1
+            if moments is None:
+                continue
+            values = pd.to_numeric(rows[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            valid = values[~np.isnan(values)]
+            moments.missing += int(values.size - valid.size)
+            moments.add_values(valid)
+        self.data_version += 1
+
+    def on_cell_edit(self, col, old_value, new_value, df: pd.DataFrame):
+        """셀 하나가 바뀌었을 때 해당 열의 모멘트만 O(1)로 갱신한다."""
+        self._df = df
+        moments = self._moments.get(col)
+        is_numeric = pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+        if (moments is not None) != is_numeric:
+            self._rebuild_column(col)
+        else:
+            self._versions[col] = self._versions.get(col, 0) + 1
+            if moments is not None:
+                moments.remove_value(_to_float(old_value))
+                moments.add_value(_to_float(new_value))
+        self.data_version += 1
+
+    # 조회 ----------------------------------------------------------------
+    @property
+    def columns(self) -> List[str]:
+        return [] if self._df is None else list(self._df.columns)
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [c for c in self.columns if c in self._moments]
+
+    @property
+    def categorical_columns(self) -> List[str]:
+        if self._df is None:
+            return []
+        return [c for c in self.columns if c not in self._moments
+                and (pd.api.types.is_object_dtype(self._df[c])
+                     or pd.api.types.is_string_dtype(self._df[c])
+                     or isinstance(self._df[c].dtype, pd.CategoricalDtype))]
+
+    def column_version(self, col) -> int:
+        return self._versions.get(col, 0)
+
+    def column_key(self, col) -> tuple:
+        """캐시 인스턴스/열/버전을 묶은 키 (값이 바뀌면 달라짐)"""
+        return (self.cache_id, col, self.column_version(col))
+
+    def _memo(self, kind: str, col, compute):
+        key = (kind, col)
+        version = self.column_version(col)
+        cached = self._lazy.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = compute()
+        self._lazy[key] = (version, value)
+        return value
+
+    def _extrema(self, col, moments: ColumnMoments):
+        if moments.extrema_dirty:
+            values = self._df[col].to_numpy(dtype=float, na_value=np.nan)
+            if moments.n:
+                moments.set_extrema(float(np.nanmin(values)), float(np.nanmax(values)))
+            else:
+                moments.set_extrema(np.inf, -np.inf)
+        if not moments.n:
+            return float("nan"), float("nan")
+        return moments._min, moments._max
+
+    def quantiles(self, col, qs=(0.25, 0.5, 0.75)) -> List[float]:
+        """열 버전별로 캐시되는 분위수 (편집된 열만 다시 계산)"""
+        qs = tuple(qs)
+
+        def compute():
+            values = self._df[col].to_numpy(dtype=float, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                return [float("nan")] * len(qs)
+            return np.quantile(values, qs).tolist()
+
+        return self._memo(("quantiles", qs), col, compute)
+
+    def column_stats(self, col) -> Dict[str, float]:
+        """숫자형 열의 count/mean/std/min/max/missing/skew"""
+        moments = self._moments[col]
+        col_min, col_max = self._extrema(col, moments)
+        return {
+            "count": float(moments.n),
+            "mean": moments.mean,
+            "std": moments.std,
+            "min": col_min,
+            "max": col_max,
+            "missing": int(moments.missing),
+            "skew": moments.skew,
+        }
+
+    def describe(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """numeric_data.describe() 와 같은 형태의 요약표"""
+        columns = self.numeric_columns if columns is None else columns
+        data = {}
+        for col in columns:
+            s = self.column_stats(col)
+            q25, q50, q75 = self.quantiles(col)
+            data[col] = [s["count"], s["mean"], s["std"], s["min"], q25, q50, q75, s["max"]]
+        index = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        return pd.DataFrame(data, index=index, columns=columns, dtype=float)
+
+    def missing_counts(self) -> pd.Series:
+        """열별 결측값 개수 (숫자형은 캐시, 나머지는 열 버전별 지연 계산)"""
+        counts = {}
+        for col in self.columns:
+            moments = self._moments.get(col)
+            if moments is not None:
+                counts[col] = moments.missing
+            else:
+                counts[col] = self._memo("missing", col, lambda c=col: int(self._df[c].isna().sum()))
+        return pd.Series(counts, dtype="int64")
+
+    def categorical_summary(self, col) -> Dict[str, Any]:
+        """범주형 열의 고유값 수/최빈값 (열 버전별 캐시)"""
+        def compute():
+            series = self._df[col]
+            mode = series.mode()
+            return {"unique": int(series.nunique()), "mode": mode.iloc[0] if len(mode) > 0 else "N/A"}
+
+        return self._memo("categorical", col, compute)
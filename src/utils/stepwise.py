@@ -0,0 +1,270 @@
+"""
+스윕(sweep) 연산자 기반 단계적 회귀
+
+중심화한 [X y] 의 교차곱 행렬을 한 번 만든 뒤, 변수 추가/제거를 해당 피벗의
+스윕/역스윕(O(p²))으로 처리한다. 재적합 없이 스윕된 행렬에서 바로
+잔차제곱합, 계수, (X'X)⁻¹ 를 읽는다.
+
+스윕된 집합 S 에 대해 (y 는 마지막 행/열)
+- RSS            = A[y, y]
+- β_j (j ∈ S)    = A[j, y]
+- (X_S'X_S)⁻¹    = -A[S, S]
+- j ∉ S 추가 시 RSS 감소량 = A[j, y]² / A[j, j]
+- j ∈ S 제거 시 RSS 증가량 = A[j, y]² / (-A[j, j])
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DIRECTIONS = ("stepwise", "forward", "backward")
+CRITERIA = ("aic", "bic", "pvalue")
+
+
+def sweep(A: np.ndarray, k: int) -> None:
+    """피벗 k 에 대한 스윕 (제자리 연산)"""
+    d = A[k, k]
+    col = A[:, k].copy()
+    row = A[k, :] / d
+    A -= np.outer(col, row)
+    A[k, :] = row
+    A[:, k] = col / d
+    A[k, k] = -1.0 / d
+
+
+def reverse_sweep(A: np.ndarray, k: int) -> None:
+    """sweep(A, k) 를 되돌리는 역스윕 (제자리 연산)"""
+    d = A[k, k]
+    col = A[:, k].copy()
+    row = A[k, :] / d
+    A -= np.outer(col, row)
+    A[k, :] = -row
+    A[:, k] = -col / d
+    A[k, k] = -1.0 / d
+
+
+class SweepRegression:
+    """교차곱 행렬을 스윕해 가며 부분집합 회귀를 평가"""
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, names: Sequence[str]):
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.n, self.p = X.shape
+        self.names = list(names)
+        self.x_mean = X.mean(axis=0)
+        self.y_mean = y.mean()
+        Z = np.column_stack([X - self.x_mean, y - self.y_mean])
+        self.A = Z.T @ Z
+        self.tss = float(self.A[-1, -1])
+        self._diag0 = np.diag(self.A)[:-1].copy()
+        self.active: List[int] = []
+
+    # 상태 ---------------------------------------------------------------
+    @property
+    def rss(self) -> float:
+        return max(float(self.A[-1, -1]), 0.0)
+
+    def df_resid(self, k: Optional[int] = None) -> int:
+        k = len(self.active) if k is None else k
+        return self.n - k - 1
+
+    def can_enter(self, j: int, tol: float = 1e-10) -> bool:
+        """거의 공선인 변수는 추가하지 않음 (잔여 분산 비율이 tol 이하)"""
+        return self._diag0[j] > 0 and self.A[j, j] > tol * self._diag0[j]
+
+    def add(self, j: int):
+        sweep(self.A, j)
+        self.active.append(j)
+
+    def remove(self, j: int):
+        reverse_sweep(self.A, j)
+        self.active.remove(j)
+
+    # 후보 평가 -----------------------------------------------------------
+    def rss_if_added(self, j: int) -> float:
+        return self.rss - self.A[j, -1] ** 2 / self.A[j, j]
+
+    def rss_if_removed(self, j: int) -> float:
+        return self.rss + self.A[j, -1] ** 2 / (-self.A[j, j])
+
+    def information_criterion(self, rss: float, k: int, kind: str) -> float:
+        """statsmodels OLS 의 aic/bic 와 같은 정의 (k: 절편 제외 변수 수)"""
+        n = self.n
+        llf = -n / 2.0 * (np.log(2 * np.pi * max(rss, 1e-300) / n) + 1)
+        params = k + 1
+        penalty = 2 * params if kind == "aic" else np.log(n) * params
+        return float(-2 * llf + penalty)
+
+    def partial_f_pvalue(self, rss_small: float, rss_large: float, df_large: int) -> float:
+        """변수 하나 차이의 부분 F 검정 p-값"""
+        from scipy import stats
+
+        if df_large <= 0 or rss_large <= 0:
+            return 0.0 if rss_small > rss_large else 1.0
+        f = (rss_small - rss_large) / (rss_large / df_large)
+        return float(stats.f.sf(max(f, 0.0), 1, df_large))
+
+    # 현재 모형 요약 -------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        from scipy import stats
+
+        idx = list(self.active)
+        k = len(idx)
+        df_resid = self.df_resid()
+        rss = self.rss
+        beta = self.A[idx, -1] if idx else np.array([])
+        sigma2 = rss / df_resid if df_resid > 0 else np.nan
+        cov = -self.A[np.ix_(idx, idx)] * sigma2 if idx else np.empty((0, 0))
+        intercept = self.y_mean - float(self.x_mean[idx] @ beta) if idx else self.y_mean
+        # 절편 분산: σ²/n + x̄' Cov(β) x̄
+        var0 = sigma2 / self.n + (float(self.x_mean[idx] @ cov @ self.x_mean[idx]) if idx else 0.0)
+
+        names = ["Intercept"] + [self.names[j] for j in idx]
+        coef = np.concatenate([[intercept], beta])
+        se = np.sqrt(np.concatenate([[var0], np.diag(cov)]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = coef / se
+        p_values = 2 * stats.t.sf(np.abs(t), df_resid) if df_resid > 0 else np.full(len(coef), np.nan)
+        r2 = 1 - rss / self.tss if self.tss > 0 else np.nan
+        adj_r2 = 1 - (1 - r2) * (self.n - 1) / df_resid if df_resid > 0 else np.nan
+        return {
+            "coefficients": pd.Series(coef, index=names),
+            "std_errors": pd.Series(se, index=names),
+            "p_values": pd.Series(p_values, index=names),
+            "r_squared": float(r2),
+            "adj_r_squared": float(adj_r2),
+            "rss": rss,
+            "aic": self.information_criterion(rss, k, "aic"),
+            "bic": self.information_criterion(rss, k, "bic"),
+        }
+
+
+def stepwise_select(X, y, names: Sequence[str], direction: str = "stepwise", criterion: str = "aic",
+                    alpha_enter: float = 0.15, alpha_remove: float = 0.15,
+                    max_steps: Optional[int] = None) -> Dict[str, Any]:
+    """
+    단계적/전진/후진 변수 선택.
+
+    Args:
+        direction: "stepwise" | "forward" | "backward"
+        criterion: "aic" | "bic" | "pvalue" (pvalue 는 alpha_enter/alpha_remove 부분 F 검정)
+
+    Returns:
+        {"selected", "path", "coefficients", "std_errors", "p_values",
+         "r_squared", "adj_r_squared", "aic", "bic", "fitted", "residuals", ...}
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"지원하지 않는 선택 방향입니다: {direction}")
+    if criterion not in CRITERIA:
+        raise ValueError(f"지원하지 않는 선택 기준입니다: {criterion}")
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    model = SweepRegression(X, y, names)
+    p = model.p
+    max_steps = max_steps or 4 * p + 10
+    path: List[Dict[str, Any]] = []
+
+    def record(action: str, term: Optional[str], p_value: Optional[float] = None):
+        k = len(model.active)
+        path.append({
+            "step": len(path),
+            "action": action,
+            "term": term,
+            "p_value": p_value,
+            "n_terms": k,
+            "rss": model.rss,
+            "r_squared": 1 - model.rss / model.tss if model.tss > 0 else np.nan,
+            "aic": model.information_criterion(model.rss, k, "aic"),
+            "bic": model.information_criterion(model.rss, k, "bic"),
+        })
+
+    if direction == "backward":
+        for j in range(p):
+            if model.can_enter(j) and model.df_resid(len(model.active) + 1) > 0:
+                model.add(j)
+    record("start", None)
+
+    visited = {frozenset(model.active)}
+
+    def best_addition():
+        if direction == "backward":
+            return None
+        k_new = len(model.active) + 1
+        if model.df_resid(k_new) <= 0:
+            return None
+        best = None
+        for j in range(p):
+            if j in model.active or not model.can_enter(j):
+                continue
+            if frozenset(model.active + [j]) in visited:
+                continue
+            rss_new = model.rss_if_added(j)
+            if criterion == "pvalue":
+                score = model.partial_f_pvalue(model.rss, rss_new, model.df_resid(k_new))
+                ok = score < alpha_enter
+            else:
+                score = model.information_criterion(rss_new, k_new, criterion)
+                ok = score < model.information_criterion(model.rss, k_new - 1, criterion) - 1e-10
+            if ok and (best is None or score < best[1]):
+                best = (j, score)
+        return best
+
+    def best_removal():
+        if direction == "forward" or not model.active:
+            return None
+        k_new = len(model.active) - 1
+        worst = None
+        for j in model.active:
+            if frozenset(set(model.active) - {j}) in visited and direction == "stepwise":
+                continue
+            rss_new = model.rss_if_removed(j)
+            if criterion == "pvalue":
+                score = model.partial_f_pvalue(rss_new, model.rss, model.df_resid())
+                ok = score > alpha_remove
+                better = worst is None or score > worst[1]
+            else:
+                score = model.information_criterion(rss_new, k_new, criterion)
+                ok = score < model.information_criterion(model.rss, k_new + 1, criterion) - 1e-10
+                better = worst is None or score < worst[1]
+            if ok and better:
+                worst = (j, score)
+        return worst
+
+    for _ in range(max_steps):
+        changed = False
+        add = best_addition()
+        if add is not None:
+            j = add[0]
+            p_enter = model.partial_f_pvalue(model.rss, model.rss_if_added(j), model.df_resid(len(model.active) + 1))
+            model.add(j)
+            visited.add(frozenset(model.active))
+            record("add", model.names[j], p_enter)
+            changed = True
+        remove = best_removal()
+        if remove is not None:
+            j = remove[0]
+            p_remove = model.partial_f_pvalue(model.rss_if_removed(j), model.rss, model.df_resid())
+            model.remove(j)
+            visited.add(frozenset(model.active))
+            record("remove", model.names[j], p_remove)
+            changed = True
+        if not changed:
+            break
+
+    summary = model.summary()
+    selected = [model.names[j] for j in model.active]
+    coef = summary["coefficients"]
+    fitted = coef["Intercept"] + X[:, model.active] @ coef[selected].to_numpy() if selected else np.full(len(y), coef["Intercept"])
+    summary.update({
+        "direction": direction,
+        "criterion": criterion,
+        "selected": selected,
+        "candidates": list(names),
+        "path": pd.DataFrame(path),
+        "n_obs": int(model.n),
+        "fitted": np.asarray(fitted, dtype=float),
+        "residuals": y - fitted,
+    })
+    return summary
@@ -0,0 +1,403 @@
+"""
+스트리밍(out-of-core) 기술통계 엔진
+
+파일 전체를 메모리에 올리지 않고 청크 단위로 기술통계량을 누적한다.
+- 열별 누적기: count, mean, M2(Welford), min, max, NaN 개수
+- 누적기 병합: Chan et al. 병렬 분산 공식
+- 근사 분위수: 병합 가능한 t-digest 방식 스케치
+결과는 AnalysisController.run_basic_statistics 와 같은 summary 구조로 변환된다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNKSIZE = 200_000
+DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+class QuantileSketch:
+    """
+    병합 가능한 근사 분위수 스케치 (t-digest 단순화 버전).
+
+    centroid(평균, 가중치)를 평균 기준으로 정렬해 보관하고,
+    k1 스케일 함수 k(q) = δ/(2π)·asin(2q-1) 의 정수 구간마다 하나의 centroid로 압축한다.
+    압축은 정렬 + reduceat 으로 벡터화되어 있어 청크 크기에 선형으로 동작한다.
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+
+    @property
+    def total_weight(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray):
+        """NaN 이 제거된 1차원 값 배열을 추가한다."""
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        self._compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(values.size)]),
+        )
+
+    def merge(self, other: "QuantileSketch"):
+        """다른 스케치를 현재 스케치에 병합한다."""
+        if other.weights.size == 0:
+            return
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        order = np.argsort(means, kind="mergesort")
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+        if means.size <= self.compression or total <= 0:
+            self.means, self.weights = means, weights
+            return
+
+        # 각 항목의 중심 분위수 -> 스케일 함수 구간 번호
+        cumulative = np.cumsum(weights) - weights / 2.0
+        q = np.clip(cumulative / total, 0.0, 1.0)
+        k = self.compression / (2.0 * np.pi) * np.arcsin(2.0 * q - 1.0)
+        bucket = np.floor(k).astype(np.int64)
+
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.means, self.weights = merged_means, merged_weights
+
+    def quantiles(self, qs: Iterable[float], min_value: float, max_value: float) -> List[float]:
+        """분위수 목록을 근사 계산한다. (양 끝은 정확한 min/max 로 고정)"""
+        qs = list(qs)
+        total = self.total_weight
+        if total <= 0:
+            return [float("nan")] * len(qs)
+        if self.means.size == 1:
+            return [float(self.means[0])] * len(qs)
+
+        # centroid 중심의 순위 위치(0..total-1)와 양 끝점(min/max)으로 선형 보간.
+        # 압축되지 않은 경우 pandas 기본(linear) 분위수와 같은 값이 된다.
+        centers = np.cumsum(self.weights) - (self.weights + 1.0) / 2.0
+        positions = np.concatenate([[0.0], centers, [total - 1.0]])
+        values = np.concatenate([[min_value], self.means, [max_value]])
+        targets = np.asarray(qs, dtype=float) * (total - 1.0)
+        return np.interp(targets, positions, values).tolist()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"compression": self.compression, "means": self.means.tolist(), "weights": self.weights.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(compression=int(data.get("compression", 200)))
+        sketch.means = np.asarray(data.get("means", []), dtype=float)
+        sketch.weights = np.asarray(data.get("weights", []), dtype=float)
+        return sketch
+
+
+class StreamingStatistics:
+    """
+    열별 기술통계 누적기.
+
+    update(chunk)로 DataFrame 청크를 추가하고, merge(other)로 다른 스레드/프로세스에서
+    계산한 부분 결과를 합친다. 모든 상태가 열 단위 NumPy 배열이라 피클링/병합 비용이 작다.
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, compression: int = 200):
+        self.compression = compression
+        self.columns: List[str] = []
+        self.dtypes: Dict[str, Any] = {}
+        self.rows = 0
+        self.count = np.empty(0, dtype=np.int64)
+        self.mean = np.empty(0, dtype=float)
+        self.m2 = np.empty(0, dtype=float)
+        self.min = np.empty(0, dtype=float)
+        self.max = np.empty(0, dtype=float)
+        self.nan_count = np.empty(0, dtype=np.int64)
+        self.sketches: List[QuantileSketch] = []
+        if columns:
+            self._add_columns(list(columns))
+
+    # 상태 관리 ------------------------------------------------------------
+    def _add_columns(self, new_columns: List[str]):
+        k = len(new_columns)
+        if k == 0:
+            return
+        self.columns.extend(new_columns)
+        self.count = np.concatenate([self.count, np.zeros(k, dtype=np.int64)])
+        self.mean = np.concatenate([self.mean, np.zeros(k)])
+        self.m2 = np.concatenate([self.m2, np.zeros(k)])
+        self.min = np.concatenate([self.min, np.full(k, np.inf)])
+        self.max = np.concatenate([self.max, np.full(k, -np.inf)])
+        # 이미 지나간 행은 해당 열이 없었으므로 결측으로 본다
+        self.nan_count = np.concatenate([self.nan_count, np.full(k, self.rows, dtype=np.int64)])
+        self.sketches.extend(QuantileSketch(self.compression) for _ in range(k))
+
+    def _merge_moments(self, n_b, mean_b, m2_b, min_b, max_b):
+        """Chan 병렬 공식으로 (n, mean, M2)를 병합한다."""
+        n_a = self.count
+        n = n_a + n_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean_b - self.mean
+            safe_n = np.where(n > 0, n, 1)
+            self.mean = np.where(n > 0, self.mean + delta * (n_b / safe_n), 0.0)
+            self.m2 = self.m2 + m2_b + delta * delta * (n_a * n_b / safe_n)
+        self.count = n
+        self.min = np.minimum(self.min, min_b)
+        self.max = np.maximum(self.max, max_b)
+
+    # 입력 ----------------------------------------------------------------
+    def update(self, chunk: pd.DataFrame):
+        """DataFrame 청크의 숫자형 열을 누적한다."""
+        if chunk is None or len(chunk) == 0:
+            return
+        if not self.columns:
+            numeric = chunk.select_dtypes(include=[np.number])
+            self._add_columns([str(c) for c in numeric.columns])
+            self.dtypes.update({str(c): numeric[c].dtype for c in numeric.columns})
+        else:
+            # 이후 청크에서 처음 보이는 숫자형 열도 추적
+            seen = set(self.columns)
+            extra = [str(c) for c in chunk.select_dtypes(include=[np.number]).columns if str(c) not in seen]
+            if extra:
+                self._add_columns(extra)
+                self.dtypes.update({c: chunk[c].dtype for c in extra})
+
+        n_rows = len(chunk)
+        values = np.empty((n_rows, len(self.columns)), dtype=float)
+        for j, col in enumerate(self.columns):
+            if col in chunk.columns:
+                series = chunk[col]
+                if not pd.api.types.is_numeric_dtype(series):
+                    # CSV 청크별 타입 추론 차이 -> 숫자로 강제 변환 (변환 실패는 결측)
+                    series = pd.to_numeric(series, errors="coerce")
+                values[:, j] = series.to_numpy(dtype=float, na_value=np.nan)
+            else:
+                values[:, j] = np.nan
+
+        valid = ~np.isnan(values)
+        n_b = valid.sum(axis=0).astype(np.int64)
+        has = n_b > 0
+        safe_n = np.where(has, n_b, 1)
+        filled = np.where(valid, values, 0.0)
+        mean_b = filled.sum(axis=0) / safe_n
+        centered = np.where(valid, values - mean_b, 0.0)
+        m2_b = (centered * centered).sum(axis=0)
+        min_b = np.where(valid, values, np.inf).min(axis=0)
+        max_b = np.where(valid, values, -np.inf).max(axis=0)
+
+        self._merge_moments(n_b, mean_b, m2_b, min_b, max_b)
+        self.nan_count = self.nan_count + (n_rows - n_b)
+        self.rows += n_rows
+
+        for j in np.flatnonzero(has):
+            self.sketches[j].update(values[valid[:, j], j])
+
+    def merge(self, other: "StreamingStatistics") -> "StreamingStatistics":
+        """다른 누적기를 병합한다. (열 구성이 달라도 이름 기준으로 정렬)"""
+        if other.rows == 0 and not other.columns:
+            return self
+        missing = [c for c in other.columns if c not in self.columns]
+        self._add_columns(missing)
+        for c in missing:
+            self.dtypes[c] = other.dtypes.get(c)
+
+        index = {c: i for i, c in enumerate(self.columns)}
+        k = len(self.columns)
+        n_b = np.zeros(k, dtype=np.int64)
+        mean_b = np.zeros(k)
+        m2_b = np.zeros(k)
+        min_b = np.full(k, np.inf)
+        max_b = np.full(k, -np.inf)
+        nan_b = np.full(k, other.rows, dtype=np.int64)
+        for j, col in enumerate(other.columns):
+            i = index[col]
+            n_b[i] = other.count[j]
+            mean_b[i] = other.mean[j]
+            m2_b[i] = other.m2[j]
+            min_b[i] = other.min[j]
+            max_b[i] = other.max[j]
+            nan_b[i] = other.nan_count[j]
+            self.sketches[i].merge(other.sketches[j])
+
+        self._merge_moments(n_b, mean_b, m2_b, min_b, max_b)
+        self.nan_count = self.nan_count + nan_b
+        self.rows += other.rows
+        return self
+
+    # 출력 ----------------------------------------------------------------
+    def to_summary(self) -> pd.DataFrame:
+        """pandas.DataFrame.describe()와 같은 형태의 요약표를 만든다."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.where(self.count > 1, np.sqrt(self.m2 / np.maximum(self.count - 1, 1)), np.nan)
+        has = self.count > 0
+        data = {}
+        for j, col in enumerate(self.columns):
+            if has[j]:
+                q25, q50, q75 = self.sketches[j].quantiles([0.25, 0.5, 0.75], self.min[j], self.max[j])
+                col_min, col_max, col_mean = self.min[j], self.max[j], self.mean[j]
+            else:
+                q25 = q50 = q75 = col_min = col_max = col_mean = np.nan
+            data[col] = [float(self.count[j]), col_mean, std[j], col_min, q25, q50, q75, col_max]
+        return pd.DataFrame(data, index=DESCRIBE_INDEX, columns=self.columns, dtype=float)
+
+    def to_result(self, description: str = "") -> Dict[str, Any]:
+        """run_basic_statistics 와 동일한 구조의 결과 dict 를 만든다."""
+        return {
+            "type": "기초 통계",
+            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "status": "완료",
+            "description": description or f"{len(self.columns)}개 변수의 기초 통계량 (스트리밍)",
+            "results": {
+                "summary": self.to_summary(),
+                "missing_values": pd.Series(self.nan_count, index=self.columns, dtype="int64"),
+                "data_types": pd.Series([self.dtypes.get(c) for c in self.columns], index=self.columns, dtype=object),
+                "variable_count": len(self.columns),
+                "observation_count": int(self.rows),
+            },
+        }
+
+
+# 청크 리더 ----------------------------------------------------------------
+def iter_csv_chunks(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE, encoding: Optional[str] = None,
+                    **read_kwargs) -> Iterator[pd.DataFrame]:
+    """CSV 파일을 청크 단위로 읽는다. 인코딩 미지정 시 utf-8 -> cp949 -> latin-1 순으로 시도."""
+    encodings = [encoding] if encoding else ["utf-8", "cp949", "latin-1"]
+    last_error = None
+    for enc in encodings:
+        try:
+            # 첫 청크를 읽어 인코딩을 검증한 뒤 나머지를 이어서 반환
+            reader = pd.read_csv(file_path, encoding=enc, chunksize=chunksize, **read_kwargs)
+            first = next(reader, None)
+        except (UnicodeDecodeError, UnicodeError) as exc:
+            last_error = exc
+            continue
+        if first is None:
+            return
+        yield first
+        # 이미 청크를 내보냈으므로 뒤쪽 청크의 디코딩 오류는 다른 인코딩으로 다시 읽지 않고 같은 오류로 알린다
+        try:
+            yield from reader
+        except (UnicodeDecodeError, UnicodeError) as exc:
+            raise ValueError(f"CSV 파일을 읽을 수 없습니다: {exc} (인코딩 {enc}, 첫 청크 이후)") from exc
+        return
+    raise ValueError(f"CSV 파일을 읽을 수 없습니다: {last_error}")
+
+
+def iter_parquet_chunks(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                        row_groups: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+    """Parquet 파일을 배치 단위로 읽는다. (pyarrow 필요)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.") from exc
+
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=chunksize, row_groups=row_groups):
+        yield batch.to_pandas()
+
+
+def iter_file_chunks(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE, **kwargs) -> Iterator[pd.DataFrame]:
+    """확장자에 맞는 청크 리더를 선택한다."""
+    ext = Path(file_path).suffix.lower()
+    if ext in (".csv", ".txt"):
+        return iter_csv_chunks(file_path, chunksize=chunksize, **kwargs)
+    if ext in (".parquet", ".pq"):
+        return iter_parquet_chunks(file_path, chunksize=chunksize, **kwargs)
+    raise ValueError(f"스트리밍을 지원하지 않는 파일 형식입니다: {ext}")
+
+
+# 병렬 집계 ----------------------------------------------------------------
+def _summarize_chunk(chunk: pd.DataFrame, compression: int) -> StreamingStatistics:
+    partial = StreamingStatistics(compression=compression)
+    partial.update(chunk)
+    return partial
+
+
+def _summarize_parquet_row_groups(file_path: str, row_groups: List[int], chunksize: int,
+                                  compression: int) -> StreamingStatistics:
+    partial = StreamingStatistics(compression=compression)
+    for chunk in iter_parquet_chunks(file_path, chunksize=chunksize, row_groups=row_groups):
+        partial.update(chunk)
+    return partial
+
+
+def summarize_chunks(chunks: Iterable[pd.DataFrame], max_workers: int = 1,
+                     compression: int = 200) -> StreamingStatistics:
+    """
+    청크 이터러블을 집계한다.
+
+    max_workers > 1 이면 스레드 풀에서 청크별 부분 결과를 만들고 병합한다.
+    (NumPy 정렬/리덕션은 GIL 을 놓으므로 스레드로도 병렬 효과가 있다.)
+    동시에 메모리에 올라가는 청크는 최대 max_workers * 2 개로 제한한다.
+    """
+    total = StreamingStatistics(compression=compression)
+    if max_workers <= 1:
+        for chunk in chunks:
+            total.update(chunk)
+        return total
+
+    # 열 순서를 원본과 같게 유지하기 위해 부분 결과는 제출 순서대로 병합한다
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_summarize_chunk, chunk, compression))
+            if len(pending) >= max_workers * 2:
+                total.merge(pending.pop(0).result())
+        for future in pending:
+            total.merge(future.result())
+    return total
+
+
+def summarize_file(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE, max_workers: int = 1,
+                   use_processes: bool = False, compression: int = 200, **reader_kwargs) -> StreamingStatistics:
+    """
+    파일 하나를 스트리밍으로 집계한다.
+
+    Parquet + use_processes=True 인 경우 row group 을 프로세스별로 나눠 독립적으로 읽고
+    부분 결과만 주고받는다. CSV 는 순차 읽기가 필요하므로 청크 계산만 스레드로 분산한다.
+    """
+    ext = Path(file_path).suffix.lower()
+    if use_processes and max_workers > 1 and ext in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.") from exc
+        n_groups = pq.ParquetFile(file_path).num_row_groups
+        groups = [list(range(n_groups))[i::max_workers] for i in range(max_workers)]
+        groups = [g for g in groups if g]
+        total = StreamingStatistics(compression=compression)
+        with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+            futures = [pool.submit(_summarize_parquet_row_groups, file_path, g, chunksize, compression) for g in groups]
+            for future in futures:
+                total.merge(future.result())
+        return total
+
+    chunks = iter_file_chunks(file_path, chunksize=chunksize, **reader_kwargs)
+    return summarize_chunks(chunks, max_workers=max_workers, compression=compression)
+
+
+def summarize_files(file_paths: List[str], chunksize: int = DEFAULT_CHUNKSIZE, max_workers: int = 2,
+                    compression: int = 200) -> StreamingStatistics:
+    """여러 파일(예: 분할 저장된 CSV)을 프로세스별로 집계한 뒤 병합한다."""
+    total = StreamingStatistics(compression=compression)
+    if max_workers <= 1 or len(file_paths) <= 1:
+        for path in file_paths:
+            total.merge(summarize_file(path, chunksize=chunksize, compression=compression))
+        return total
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+        futures = [pool.submit(summarize_file, path, chunksize, 1, False, compression) for path in file_paths]
+        for future in futures:
+            total.merge(future.result())
+    return total
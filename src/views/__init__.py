@@ -1,10 +1,20 @@
 """
 Views 패키지
-GUI 관련 뷰 클래스들을 포함합니다.
+GUI 관련 뷰 클래스들을 포함합니다. (각 뷰 모듈은 처음 사용할 때 로드)
 """
 
-from views.main_window import MainWindow
-from views.data_view import DataTableView
-from views.chart_view import ChartView
+from importlib import import_module
 
-__all__ = ['MainWindow', 'DataTableView', 'ChartView'] 
\ No newline at end of file
+_LAZY = {
+    'MainWindow': 'views.main_window',
+    'DataTableView': 'views.data_view',
+    'ChartView': 'views.chart_view',
+}
+
+__all__ = ['MainWindow', 'DataTableView', 'ChartView']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name]), name)
+    raise AttributeError(f"module 'views' has no attribute {name!r}")
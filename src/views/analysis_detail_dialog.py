@@ -221,6 +221,8 @@ class AnalysisDetailDialog(QDialog):
             self.populate_regression()
         elif self.analysis_type == "DOE ANOVA":
             self.populate_doe_anova()
+        elif self.analysis_type == "단계적 회귀":
+            self.populate_stepwise_regression()
         else:
             # 그 밖의 분석 유형은 공통 ANOVA/회귀 정보로 요약
             self.populate_generic_anova()
@@ -423,6 +425,13 @@ class AnalysisDetailDialog(QDialog):
 • F-통계량과 p-값을 통해 유의한 요인을 식별할 수 있습니다
 • 계수를 통해 효과 방향과 크기를 해석할 수 있습니다
         """
+        extra_lines = (
+            self._loo_summary_lines(results)
+            + self._bootstrap_summary_lines(results)
+            + self._best_subsets_summary_lines(results)
+        )
+        if extra_lines:
+            summary = summary.strip() + "\n\n" + "\n".join(extra_lines)
         self.summary_text.setText(summary.strip())
 
         # 핵심 지표 테이블
@@ -454,7 +463,7 @@ class AnalysisDetailDialog(QDialog):
         self.figure.clear()
         residuals = results.get("residuals")
         fitted = results.get("fitted")
-        if self._plot_residual_diagnostics(residuals, fitted):
+        if self._plot_residual_diagnostics(residuals, fitted, results):
             pass
         elif isinstance(anova_df, pd.DataFrame) and "F" in anova_df.columns:
             ax = self.figure.add_subplot(111)
@@ -483,8 +492,57 @@ class AnalysisDetailDialog(QDialog):
         self.application_text.setText("유의한 요인 조합을 생산 조건에 반영하고, 추가 실험으로 미세 조정하세요.")
         self.suggestions_text.setText("주효과/상호작용 플롯, 잔차 QQ 플롯, 예측값 vs 잔차 플롯을 추가로 확인하세요.")
 
-    def _plot_residual_diagnostics(self, residuals, fitted):
-        """잔차 진단 플롯(Residuals vs Fitted, QQ)"""
+    def _bootstrap_summary_lines(self, results, max_terms=10):
+        """계수 부트스트랩 구간 요약 (results["bootstrap"] 가 있을 때)"""
+        boot = results.get("bootstrap")
+        if not isinstance(boot, dict) or not isinstance(boot.get("intervals"), pd.DataFrame):
+            return []
+        intervals = boot["intervals"]
+        level = int(round(boot.get("confidence", 0.95) * 100))
+        lines = [f"🎯 계수 부트스트랩 {level}% 구간 ({boot.get('method')}, B={boot.get('n_boot')}):"]
+        for term, row in intervals.head(max_terms).iterrows():
+            lines.append(
+                f"• {term}: {row['estimate']:.4g} "
+                f"[백분위 {row['pct_lower']:.4g}, {row['pct_upper']:.4g}] "
+                f"[BCa {row['bca_lower']:.4g}, {row['bca_upper']:.4g}]"
+            )
+        if len(intervals) > max_terms:
+            lines.append(f"• ... 외 {len(intervals) - max_terms}개 항")
+        return lines
+
+    def _best_subsets_summary_lines(self, results, max_sizes=8):
+        """크기별 최적 부분집합 모형 요약 (results["best_subsets"] 가 있을 때)"""
+        search = results.get("best_subsets")
+        if not isinstance(search, dict) or not isinstance(search.get("models"), pd.DataFrame):
+            return []
+        models = search["models"]
+        firsts = models[models["rank_in_size"] == 1].head(max_sizes)
+        lines = ["🧩 크기별 최적 부분집합 모형" + ("" if search.get("complete", True) else " (시간 제한으로 중단)") + ":"]
+        for _, row in firsts.iterrows():
+            lines.append(f"• {int(row['size'])}개: {row['terms']} (adj R² {row['adj_r_squared']:.3f}, Cp {row['cp']:.2f})")
+        return lines
+
+    def _loo_summary_lines(self, results):
+        """PRESS/예측 R² 및 영향 관측치 요약 (results["press"] 가 있을 때)"""
+        if "predicted_r_squared" not in results:
+            return []
+        press = results.get("press")
+        pred_r2 = results.get("predicted_r_squared")
+        lines = ["🔁 Leave-one-out 진단:"]
+        if press is None or pd.isna(press):
+            lines.append("• PRESS/예측 R²: 레버리지 1인 관측치가 있어 계산할 수 없습니다")
+        else:
+            lines.append(f"• PRESS: {press:.4g}, 예측 R²: {pred_r2:.3f}")
+        high = results.get("high_leverage") or []
+        influential = results.get("influential") or []
+        if high:
+            lines.append(f"• 고레버리지 관측치 (h > 2p/n): {', '.join(str(i + 1) for i in high[:10])}")
+        if influential:
+            lines.append(f"• 영향 관측치 (Cook's D > 4/n): {', '.join(str(i + 1) for i in influential[:10])}")
+        return lines
+
+    def _plot_residual_diagnostics(self, residuals, fitted, diagnostics=None):
+        """잔차 진단 플롯(Residuals vs Fitted, QQ) - LOO 진단이 있으면 레버리지/Cook 거리도 표시"""
         if residuals is None or fitted is None or stats is None:
             return False
         try:
@@ -492,9 +550,15 @@ class AnalysisDetailDialog(QDialog):
             fit = np.asarray(fitted, dtype=float)
             if len(res) != len(fit) or len(res) == 0:
                 return False
+            diagnostics = diagnostics or {}
+            leverage = diagnostics.get("leverage")
+            cooks = diagnostics.get("cooks_distance")
+            student = diagnostics.get("studentized_residuals")
+            has_loo = all(v is not None and len(v) == len(res) for v in (leverage, cooks, student))
 
             self.figure.clear()
-            ax1 = self.figure.add_subplot(1, 2, 1)
+            rows = 2 if has_loo else 1
+            ax1 = self.figure.add_subplot(rows, 2, 1)
             ax1.scatter(fit, res, alpha=0.7)
             ax1.axhline(0, color='gray', linestyle='--')
             ax1.set_xlabel("Fitted")
@@ -502,16 +566,84 @@ class AnalysisDetailDialog(QDialog):
             ax1.set_title("Residuals vs Fitted")
             ax1.grid(True, alpha=0.3)
 
-            ax2 = self.figure.add_subplot(1, 2, 2)
+            ax2 = self.figure.add_subplot(rows, 2, 2)
             stats.probplot(res, dist="norm", plot=ax2)
             ax2.set_title("QQ Plot")
             ax2.grid(True, alpha=0.3)
 
+            if has_loo:
+                n = len(res)
+                lev = np.asarray(leverage, dtype=float)
+                cook = np.asarray(cooks, dtype=float)
+                ax3 = self.figure.add_subplot(2, 2, 3)
+                ax3.scatter(lev, np.asarray(student, dtype=float), alpha=0.7)
+                ax3.axhline(0, color='gray', linestyle='--')
+                rank = diagnostics.get("rank")
+                if rank:
+                    ax3.axvline(2 * rank / n, color='red', linestyle=':', linewidth=1)
+                ax3.set_xlabel("Leverage")
+                ax3.set_ylabel("Studentized Residuals")
+                ax3.set_title("Residuals vs Leverage")
+                ax3.grid(True, alpha=0.3)
+
+                ax4 = self.figure.add_subplot(2, 2, 4)
+                idx = np.arange(1, n + 1)
+                ax4.vlines(idx, 0, np.nan_to_num(cook), alpha=0.8)
+                ax4.axhline(4 / n, color='red', linestyle=':', linewidth=1)
+                ax4.set_xlabel("Observation")
+                ax4.set_ylabel("Cook's D")
+                ax4.set_title("Cook's Distance")
+                ax4.grid(True, alpha=0.3)
+
             self.figure.tight_layout()
             return True
         except Exception:
             return False
 
+    def populate_stepwise_regression(self):
+        """단계적 회귀: 최종 계수 표와 선택 경로"""
+        results = self.result_data.get("results", {})
+        coefficients = results.get("coefficients")
+        p_values = results.get("p_values")
+        path = results.get("path")
+
+        summary_lines = [
+            f"반응 변수: {results.get('dependent_var', 'N/A')}",
+            f"선택 방향/기준: {results.get('direction', 'N/A')} / {results.get('criterion', 'N/A')}",
+            f"선택된 변수: {', '.join(results.get('selected', [])) or '(없음)'}",
+            f"후보 변수: {len(results.get('candidates', []))}개, 관측치: {results.get('observations', 'N/A')}",
+        ]
+        for key, label in (("r_squared", "R²"), ("adj_r_squared", "Adj. R²"), ("aic", "AIC"), ("bic", "BIC")):
+            val = results.get(key)
+            if val is not None and not pd.isna(val):
+                summary_lines.append(f"{label}: {val:.3f}")
+        self.summary_text.setText("\n".join(summary_lines))
+
+        rows = list(coefficients.items()) if isinstance(coefficients, pd.Series) else []
+        self.metrics_table.setRowCount(len(rows))
+        self.metrics_table.setColumnCount(3)
+        self.metrics_table.setHorizontalHeaderLabels(["변수", "회귀계수", "p-value"])
+        for i, (name, coef) in enumerate(rows):
+            self.metrics_table.setItem(i, 0, QTableWidgetItem(str(name)))
+            self.metrics_table.setItem(i, 1, QTableWidgetItem(f"{coef:.4g}"))
+            pval = p_values.get(name) if isinstance(p_values, pd.Series) else None
+            self.metrics_table.setItem(i, 2, QTableWidgetItem("" if pval is None or pd.isna(pval) else f"{pval:.3g}"))
+
+        if isinstance(path, pd.DataFrame):
+            self.populate_data_table(path)
+
+        self.figure.clear()
+        if not self._plot_residual_diagnostics(results.get("residuals"), results.get("fitted")):
+            if isinstance(path, pd.DataFrame) and not path.empty:
+                ax = self.figure.add_subplot(111)
+                criterion = results.get("criterion", "aic")
+                col = criterion if criterion in path.columns else "aic"
+                ax.plot(path["step"], path[col], marker="o")
+                ax.set_title("단계별 선택 기준 변화")
+                ax.set_xlabel("단계")
+                ax.set_ylabel(col.upper())
+        self.canvas.draw()
+
     def populate_generic_anova(self):
         """기타 분석 유형용 기본 채움: ANOVA 표와 간단 요약"""
         results = self.result_data.get("results", {})
@@ -532,6 +664,14 @@ class AnalysisDetailDialog(QDialog):
         formula = results.get("formula")
         if formula:
             summary_lines.append(f"모델식: {formula}")
+        extra_lines = (
+            self._loo_summary_lines(results)
+            + self._bootstrap_summary_lines(results)
+            + self._best_subsets_summary_lines(results)
+        )
+        if extra_lines:
+            summary_lines.append("")
+            summary_lines.extend(extra_lines)
         self.summary_text.setText("\n".join(summary_lines))
 
         # 핵심 지표 테이블: 상위 F 또는 p 기준
@@ -559,7 +699,7 @@ class AnalysisDetailDialog(QDialog):
 
         # 시각화 탭: 잔차 진단이 있으면 우선 표시, 없으면 F-바차트
         self.figure.clear()
-        if self._plot_residual_diagnostics(residuals, fitted):
+        if self._plot_residual_diagnostics(residuals, fitted, results):
             pass
         elif isinstance(anova_df, pd.DataFrame) and "F" in anova_df.columns:
             df_plot = anova_df.copy()
@@ -0,0 +1,62 @@
+"""
+오래 걸리는 계산을 GUI 스레드 밖(QThreadPool)에서 실행하는 도우미
+결과/오류 콜백은 GUI 스레드에서 호출된다.
+"""
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+class _TaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class _Task(QRunnable):
+    def __init__(self, func: Callable[[], Any], signals: _TaskSignals):
+        super().__init__()
+        self._func = func
+        self._signals = signals
+
+    def run(self):
+        try:
+            result = self._func()
+        except Exception as e:
+            self._signals.failed.emit(e)
+            return
+        self._signals.finished.emit(result)
+
+
+class BackgroundTask(QObject):
+    """GUI 스레드에서 만든 수신 객체 - 작업 스레드의 신호를 받아 콜백을 호출"""
+
+    _running = set()
+
+    def __init__(self, on_done: Callable[[Any], None], on_error: Optional[Callable[[Exception], None]] = None):
+        super().__init__()
+        self._on_done = on_done
+        self._on_error = on_error
+        self.signals = _TaskSignals()
+        self.signals.finished.connect(self._finished)
+        self.signals.failed.connect(self._failed)
+
+    @Slot(object)
+    def _finished(self, result):
+        BackgroundTask._running.discard(self)
+        self._on_done(result)
+
+    @Slot(object)
+    def _failed(self, error):
+        BackgroundTask._running.discard(self)
+        if self._on_error is not None:
+            self._on_error(error)
+
+
+def run_in_background(func: Callable[[], Any], on_done: Callable[[Any], None],
+                      on_error: Optional[Callable[[Exception], None]] = None) -> BackgroundTask:
+    """func() 를 전역 스레드 풀에서 실행하고 끝나면 on_done(결과) / on_error(예외)"""
+    task = BackgroundTask(on_done, on_error)
+    BackgroundTask._running.add(task)   # 끝날 때까지 참조 유지
+    QThreadPool.globalInstance().start(_Task(func, task.signals))
+    return task
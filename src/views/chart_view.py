@@ -6,14 +6,13 @@ matplotlib을 사용한 차트 표시 위젯
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import seaborn as sns
 import pandas as pd
 import numpy as np
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QComboBox, QLabel, QSplitter, QScrollArea,
-    QGroupBox, QCheckBox, QSpinBox
+    QGroupBox, QCheckBox, QSpinBox, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal
 
@@ -51,6 +50,8 @@ class ChartView(QWidget):
         super().__init__()
         
         self.data = None
+        self._data_columns = None
+        self.stats_cache = None
         self.current_axes = []
         self._recreating_chart = False  # 차트 재생성 중 플래그
         self.chart_controller = None  # ChartController 참조 (나중에 설정)
@@ -192,10 +193,25 @@ class ChartView(QWidget):
         # 변수 선택이 변경되었을 때의 처리 (필요시 구현)
         pass
     
-    def set_data(self, data):
-        """데이터 설정"""
+    def set_data(self, data, stats_cache=None):
+        """
+        데이터 설정
+
+        stats_cache 가 주어지면 열 구성이 그대로인 편집(행 추가/셀 수정)에서는
+        변수 목록을 다시 만들지 않아 사용자의 변수 선택이 유지된다.
+        """
+        # data 는 데이터 뷰와 공유되는 객체일 수 있으므로 열 목록은 따로 기억해 비교
+        previous_columns = self._data_columns
         self.data = data
-        self.update_variable_lists()
+        self.stats_cache = stats_cache
+        self._data_columns = list(data.columns) if data is not None else None
+        columns_unchanged = (
+            stats_cache is not None
+            and previous_columns is not None
+            and self._data_columns == previous_columns
+        )
+        if not columns_unchanged:
+            self.update_variable_lists()
         self.update_ui_state()
         self.update_chart_type_availability()
     
@@ -267,8 +283,12 @@ class ChartView(QWidget):
                     item.setEnabled(False)
             return
 
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = self.data.select_dtypes(exclude=[np.number]).columns.tolist()
+        if self.stats_cache is not None:
+            numeric_cols = self.stats_cache.numeric_columns
+            categorical_cols = [c for c in self.data.columns if c not in set(numeric_cols)]
+        else:
+            numeric_cols = self.data.select_dtypes(include=[np.number]).columns.tolist()
+            categorical_cols = self.data.select_dtypes(exclude=[np.number]).columns.tolist()
 
         has_numeric = len(numeric_cols) > 0
         has_numeric2 = len(numeric_cols) >= 2
@@ -804,10 +824,126 @@ class ChartView(QWidget):
             return None
         return getattr(self, 'current_chart_info', None)
     
+    def show_response_surface(self, response, factors, x_var, y_var, kind="등고선도", resolution=100, fixed=None):
+        """2차 반응표면 등고선도/3D 표면도 (MainWindow 메뉴에서 호출)"""
+        if self.data is None or self.data.empty:
+            return False
+        from core.charts import draw_response_contour, draw_response_surface, response_surface_grid
+        from core.errors import ChartError
+
+        try:
+            model, grid = response_surface_grid(self.data, response, factors, x_var, y_var,
+                                                resolution=resolution, fixed=fixed)
+        except ChartError as e:
+            QMessageBox.warning(self, e.title, e.message)
+            return False
+
+        figure = self.canvas.figure
+        figure.clear()
+        if kind == "3D 표면도":
+            ax = figure.add_subplot(111, projection="3d")
+            draw_response_surface(figure, ax, model, grid)
+        else:
+            ax = figure.add_subplot(111)
+            draw_response_contour(figure, ax, model, grid, data=self.data)
+            if self.show_legend_check.isChecked() and ax.get_legend_handles_labels()[0]:
+                ax.legend(loc="upper right", fontsize=8)
+        self.canvas.draw()
+        self.current_axes = [ax]
+
+        import datetime
+        self.current_chart_info = {
+            'type': kind,
+            'chart_type': kind,
+            'x_var': x_var,
+            'y_var': y_var,
+            'x_variable': x_var,
+            'y_variable': y_var,
+            'group_var': None,
+            'group_variable': None,
+            'timestamp': datetime.datetime.now().strftime("%H:%M:%S"),
+            'description': f"{kind} - {response} ({x_var} × {y_var})",
+            'options': {'response': response, 'factors': list(factors), 'resolution': resolution,
+                        'fixed': fixed},
+        }
+        if not self._recreating_chart:
+            self.chart_updated.emit()
+        return True
+
+    def show_effects_chart(self, response, factors=None, kind="파레토 차트", half_normal=True, alpha=0.05, top=30):
+        """2수준 효과 파레토 차트/효과 정규확률도 (MainWindow 메뉴에서 호출)"""
+        if self.data is None or self.data.empty:
+            return False
+        from core.charts import draw_effects_pareto, draw_effects_probability, factorial_effects_table
+        from core.errors import ChartError
+
+        try:
+            estimates = factorial_effects_table(self.data, response, factors, alpha=alpha)
+        except ChartError as e:
+            QMessageBox.warning(self, e.title, e.message)
+            return False
+
+        figure = self.canvas.figure
+        figure.clear()
+        ax = figure.add_subplot(111)
+        if kind == "정규확률도":
+            draw_effects_probability(figure, ax, estimates, response, half_normal=half_normal)
+        else:
+            draw_effects_pareto(figure, ax, estimates, response, top=top)
+        if self.show_legend_check.isChecked() and ax.get_legend_handles_labels()[0]:
+            ax.legend(loc="lower right", fontsize=8)
+        if self.show_grid_check.isChecked():
+            ax.grid(True, alpha=0.3)
+        figure.tight_layout()
+        self.canvas.draw()
+        self.current_axes = [ax]
+
+        import datetime
+        factors = list(estimates["levels"])
+        self.current_chart_info = {
+            'type': kind,
+            'chart_type': kind,
+            'x_var': None,
+            'y_var': response,
+            'x_variable': None,
+            'y_variable': response,
+            'group_var': None,
+            'group_variable': None,
+            'timestamp': datetime.datetime.now().strftime("%H:%M:%S"),
+            'description': f"{kind} - {response} ({len(estimates['effects'])}개 효과)",
+            'options': {'response': response, 'factors': factors, 'half_normal': half_normal, 'alpha': alpha,
+                        'top': top},
+        }
+        if not self._recreating_chart:
+            self.chart_updated.emit()
+        return True
+
     def display_chart(self, chart_info):
         """차트 정보를 받아서 차트를 표시"""
         if not chart_info or self.data is None or self.data.empty:
             return
+        chart_type = chart_info.get('type') or chart_info.get('chart_type')
+        options = chart_info.get('options') or {}
+        if chart_type in ("등고선도", "3D 표면도") and options.get('response'):
+            self._recreating_chart = True
+            try:
+                self.show_response_surface(
+                    options['response'], options.get('factors'),
+                    chart_info.get('x_var') or chart_info.get('x_variable'),
+                    chart_info.get('y_var') or chart_info.get('y_variable'),
+                    kind=chart_type, resolution=options.get('resolution', 100), fixed=options.get('fixed'))
+            finally:
+                self._recreating_chart = False
+            return
+        if chart_type in ("파레토 차트", "정규확률도") and options.get('response'):
+            self._recreating_chart = True
+            try:
+                self.show_effects_chart(options['response'], options.get('factors'), kind=chart_type,
+                                        half_normal=options.get('half_normal', True),
+                                        alpha=options.get('alpha', 0.05), top=options.get('top', 30))
+            finally:
+                self._recreating_chart = False
+            return
         try:
             self._recreating_chart = True
             # 호환 키 처리
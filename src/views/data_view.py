@@ -26,6 +26,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction, QKeyEvent
 from PySide6.QtWidgets import QStyledItemDelegate, QAbstractItemDelegate
 
+from utils.stats_cache import DatasetStatsCache
+
 
 class DataTableDelegate(QStyledItemDelegate):
     """셀 편집 중 좌우 방향키로 셀 이동/커밋 처리"""
@@ -62,6 +64,8 @@ class DataTableView(QWidget):
         self._df_full: Optional[pd.DataFrame] = None  # 숨긴 열을 포함한 전체 데이터
         self.hidden_columns: List[str] = []
         self._updating = False  # 내부 업데이트 루프 방지용 플래그
+        # 보이는 데이터(self.df)의 증분 통계 캐시 (결과/탐색기/차트 뷰가 읽음)
+        self.stats_cache = DatasetStatsCache()
         self._build_ui()
         self._connect_signals()
 
@@ -134,10 +138,14 @@ class DataTableView(QWidget):
         self._apply_hidden_columns()
         self.data_changed.emit()
 
-    def get_data(self) -> Optional[pd.DataFrame]:
+    def get_data(self, copy: bool = True) -> Optional[pd.DataFrame]:
+        """
+        현재(보이는 열) 데이터.
+        copy=False 는 읽기 전용 공유용 - data_changed 마다 전체 복사를 피한다. (수정 금지)
+        """
         if self.df is None:
             return None
-        return self.df.copy()
+        return self.df.copy() if copy else self.df
 
     def clear_data(self):
         self.df = None
@@ -150,6 +158,7 @@ class DataTableView(QWidget):
             self.table.setColumnCount(0)
         finally:
             self._updating = False
+        self.stats_cache.rebuild(None)
         self._update_ui_state()
         self.data_changed.emit()
 
@@ -207,8 +216,12 @@ class DataTableView(QWidget):
             return
         if list(self.df.columns) != list(df.columns):
             raise ValueError("컬럼 구성이 일치하지 않아 병합할 수 없습니다.")
+        start = len(self.df)
         self.df = pd.concat([self.df, df], ignore_index=True)
-        self._update_table_from_dataframe()
+        self._append_full_rows(df)
+        # 추가된 행만 테이블/통계 캐시에 반영
+        self._append_table_rows(start)
+        self.stats_cache.on_append(df, self.df)
         self.data_changed.emit()
 
     # 테이블 <-> DataFrame -------------------------------------------------
@@ -229,10 +242,41 @@ class DataTableView(QWidget):
         finally:
             self._updating = False
 
+        # 전체 갱신 경로(삽입/삭제/타입 변경 등)는 캐시도 새로 계산
+        self.stats_cache.rebuild(self.df)
         self._update_ui_state()
         # 열 폭 균등/제한 적용
         self._adjust_column_widths()
 
+    def _append_table_rows(self, start: int):
+        """start 행부터 끝까지만 테이블에 추가 (기존 행은 다시 그리지 않음)"""
+        self._updating = True
+        try:
+            self.table.setRowCount(len(self.df))
+            for i, row in enumerate(self.df.iloc[start:].itertuples(index=False), start=start):
+                for j, value in enumerate(row):
+                    text = "" if pd.isna(value) else str(value)
+                    self.table.setItem(i, j, QTableWidgetItem(text))
+        finally:
+            self._updating = False
+        self._update_ui_state()
+
+    def _append_full_rows(self, rows: pd.DataFrame):
+        """숨긴 열을 포함한 전체 데이터에도 같은 행 추가 (숨긴 열은 빈 값)"""
+        if self._df_full is None:
+            return
+        self._df_full = pd.concat([self._df_full, rows.reindex(columns=self._df_full.columns)], ignore_index=True)
+
+    @staticmethod
+    def _parse_cell_text(value: str):
+        """셀 텍스트를 값으로 변환 (빈 문자열은 None, 숫자 변환 실패 시 문자열 유지)"""
+        if value == "":
+            return None
+        try:
+            return int(value) if value.isdigit() else float(value)
+        except ValueError:
+            return value
+
     def _apply_hidden_columns(self):
         """숨긴 열을 제외한 뷰를 갱신"""
         if self._df_full is None:
@@ -309,15 +353,7 @@ class DataTableView(QWidget):
             row = []
             for j in range(self.table.columnCount()):
                 item = self.table.item(i, j)
-                value = item.text() if item else ""
-                if value == "":
-                    row.append(None)
-                else:
-                    # 숫자 변환 시도, 실패 시 문자열 유지
-                    try:
-                        row.append(int(value) if value.isdigit() else float(value))
-                    except ValueError:
-                        row.append(value)
+                row.append(self._parse_cell_text(item.text() if item else ""))
             data.append(row)
 
         visible_df = pd.DataFrame(data, columns=headers)
@@ -344,9 +380,12 @@ class DataTableView(QWidget):
     # 행/열 조작 -----------------------------------------------------------
     def add_row(self):
         if self.df is not None:
-            new_row = {col: None for col in self.df.columns}
-            self.df = pd.concat([self.df, pd.DataFrame([new_row])], ignore_index=True)
-            self._update_table_from_dataframe()
+            new_row = pd.DataFrame([{col: None for col in self.df.columns}])
+            start = len(self.df)
+            self.df = pd.concat([self.df, new_row], ignore_index=True)
+            self._append_full_rows(new_row)
+            self._append_table_rows(start)
+            self.stats_cache.on_append(new_row, self.df)
         else:
             row = self.table.rowCount()
             self.table.insertRow(row)
@@ -501,13 +540,55 @@ class DataTableView(QWidget):
         else:
             self.info_label.setText("데이터 없음")
 
-    def _on_item_changed(self, _item):
+    def _on_item_changed(self, item):
         if self._updating:
             return
-        self._update_dataframe_from_table()
+        if not self._update_cell_from_item(item):
+            self._update_dataframe_from_table()
+            self.stats_cache.rebuild(self.df)
         self._update_ui_state()
         self.data_changed.emit()
 
+    def _update_cell_from_item(self, item) -> bool:
+        """
+        편집된 셀 하나만 DataFrame/통계 캐시에 반영.
+        테이블과 DataFrame 모양이 다르면 False (전체 재구성 필요).
+        """
+        if (
+            item is None
+            or self.df is None
+            or self.table.rowCount() != len(self.df)
+            or self.table.columnCount() != len(self.df.columns)
+        ):
+            return False
+        row, col = item.row(), item.column()
+        name = self.df.columns[col]
+        value = self._parse_cell_text(item.text())
+        old_value = self.df.iat[row, col]
+        dtype = self.df[name].dtype
+
+        in_place = True
+        if pd.api.types.is_float_dtype(dtype) and (value is None or isinstance(value, (int, float))):
+            self.df.iat[row, col] = float("nan") if value is None else float(value)
+        elif pd.api.types.is_integer_dtype(dtype) and isinstance(value, int):
+            self.df.iat[row, col] = value
+        else:
+            # 타입이 바뀔 수 있는 경우 해당 열만 전체 재구성과 같은 규칙으로 다시 추론
+            values = self.df[name].tolist()
+            values[row] = value
+            self.df[name] = pd.Series(values, index=self.df.index)
+            in_place = False
+
+        if self._df_full is not None and name in self._df_full.columns:
+            if len(self._df_full) != len(self.df):
+                return False
+            if in_place and self._df_full[name].dtype == dtype:
+                self._df_full.iat[row, self._df_full.columns.get_loc(name)] = self.df.iat[row, col]
+            else:
+                self._df_full[name] = self.df[name].to_numpy()
+        self.stats_cache.on_cell_edit(name, old_value, value, self.df)
+        return True
+
     def _on_selection_changed(self):
         self._update_ui_state()
         self.selection_changed.emit()
@@ -17,18 +17,21 @@ from PySide6.QtWidgets import (
     QFormLayout, QSpinBox, QCheckBox, QDialogButtonBox, QListWidget, QComboBox,
     QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QTimer, Slot
+from PySide6.QtCore import Qt, Signal, QTimer, Slot, QCoreApplication
 from PySide6.QtGui import QAction, QIcon, QKeySequence, QFont
 
 from views.data_view import DataTableView
 from views.chart_view import ChartView
 from views.project_explorer import ProjectExplorer
+from views.background import run_in_background
 from controllers.project_controller import ProjectController
 from controllers.data_controller import DataController
 from controllers.analysis_controller import AnalysisController
 from controllers.chart_controller import ChartController
 from controllers.design_controller import DesignController
-from models.project import Project
+from core.registry import get_analysis
+from utils.space_filling import MAXIMIN_MAX_RUNS
+from models.project import Project, deserialize_value, serialize_value
 import pandas as pd
 import numpy as np
 
@@ -46,6 +49,9 @@ class MainWindow(QMainWindow):
     file_opened = Signal(str)
     data_imported = Signal(object)
     analysis_requested = Signal(str)
+
+    # 혼합물 격자 점이 이보다 많으면 데이터 표 대신 CSV 스트리밍 저장
+    MIXTURE_GRID_LIMIT = 200_000
     
     def __init__(self):
         super().__init__()
@@ -107,7 +113,8 @@ class MainWindow(QMainWindow):
             
             # 분석 결과 저장
             if hasattr(self.project_explorer, 'analysis_history'):
-                project_data['analysis_results'] = self.project_explorer.analysis_history.copy()
+                # DataFrame/결과 배열은 타입 정보를 유지해 저장 (배열은 압축 바이너리)
+                project_data['analysis_results'] = serialize_value(self.project_explorer.analysis_history)
             
             # 차트 히스토리 저장
             if hasattr(self.project_explorer, 'chart_history'):
@@ -154,11 +161,12 @@ class MainWindow(QMainWindow):
             
             # 분석 결과 복원
             if project_data.get('analysis_results') and hasattr(self, 'project_explorer'):
-                self.project_explorer.analysis_history = project_data['analysis_results'].copy()
+                analysis_results = deserialize_value(project_data['analysis_results'])
+                self.project_explorer.analysis_history = list(analysis_results)
                 
                 # 분석 트리 업데이트
                 self.project_explorer.analysis_tree.clear()
-                for result in project_data['analysis_results']:
+                for result in analysis_results:
                     self.project_explorer.add_analysis_result(
                         result.get('type', '알 수 없음'),
                         result,
@@ -618,6 +626,18 @@ class MainWindow(QMainWindow):
         self.split_plot_action.setStatusTip("제약조건이 있는 인수들을 고려한 설계를 생성합니다")
         self.split_plot_action.triggered.connect(self.create_split_plot_design)
         special_menu.addAction(self.split_plot_action)
+
+        # D/I-최적 설계
+        self.optimal_design_action = QAction("최적 설계 (D/I-optimal)(&P)", self)
+        self.optimal_design_action.setStatusTip("후보점 교환 알고리즘으로 런 수/제약조건에 맞는 최적 설계를 생성합니다")
+        self.optimal_design_action.triggered.connect(self.create_optimal_design)
+        special_menu.addAction(self.optimal_design_action)
+
+        # 공간 채움 설계 (컴퓨터 실험)
+        self.space_filling_action = QAction("공간 채움 설계 (LHS/Sobol)(&L)", self)
+        self.space_filling_action.setStatusTip("시뮬레이션용 라틴 하이퍼큐브, maximin LHS, Sobol/Halton 설계를 생성합니다")
+        self.space_filling_action.triggered.connect(self.create_space_filling_design)
+        special_menu.addAction(self.space_filling_action)
         
         doe_menu.addSeparator()
         
@@ -641,6 +661,12 @@ class MainWindow(QMainWindow):
         self.doe_anova_action.triggered.connect(self.run_doe_anova_dialog)
         doe_screening_menu.addAction(self.doe_anova_action)
 
+        # ANOVA 계수 부트스트랩 구간 (재표본 비용이 있어 선택)
+        self.bootstrap_ci_action = QAction("ANOVA에 부트스트랩 신뢰구간 포함", self)
+        self.bootstrap_ci_action.setCheckable(True)
+        self.bootstrap_ci_action.setStatusTip("DOE/주효과 ANOVA 계수의 부트스트랩 백분위/BCa 구간(2000회)을 함께 계산합니다.")
+        doe_analysis_menu.addAction(self.bootstrap_ci_action)
+
         self.doe_fractional_action = QAction("부분요인 ANOVA", self)
         self.doe_fractional_action.setStatusTip("부분요인설계 데이터에 대해 해석 가능한 효과로 ANOVA를 수행합니다.")
         self.doe_fractional_action.triggered.connect(self.run_fractional_factorial_anova)
@@ -651,6 +677,17 @@ class MainWindow(QMainWindow):
         self.doe_plackett_action.triggered.connect(self.run_plackett_burman_analysis)
         doe_screening_menu.addAction(self.doe_plackett_action)
 
+        # PB 분석에 크기별 상위 부분집합 모형 첨부 (분기한정 탐색 비용이 있어 선택)
+        self.pb_subsets_action = QAction("Plackett-Burman 분석에 상위 부분집합 모형 포함", self)
+        self.pb_subsets_action.setCheckable(True)
+        self.pb_subsets_action.setStatusTip("주효과 ANOVA와 함께 크기별 상위 5개 부분집합 모형을 탐색합니다. (최대 10초)")
+        doe_screening_menu.addAction(self.pb_subsets_action)
+
+        self.doe_effects_action = QAction("2수준 효과 분석 (Yates)", self)
+        self.doe_effects_action.setStatusTip("2수준 (부분)요인 설계의 전체 효과를 Yates 알고리즘으로 추정하고 Lenth 기준으로 판정합니다.")
+        self.doe_effects_action.triggered.connect(self.run_factorial_effects)
+        doe_screening_menu.addAction(self.doe_effects_action)
+
         # DOE 분석 - 최적화
         doe_optimization_menu = doe_analysis_menu.addMenu("최적화 분석")
         self.doe_rsm_action = QAction("반응표면분석 (RSM)", self)
@@ -668,6 +705,11 @@ class MainWindow(QMainWindow):
         self.doe_ccd_action.triggered.connect(self.run_ccd_analysis)
         doe_optimization_menu.addAction(self.doe_ccd_action)
 
+        self.doe_desirability_action = QAction("다중 반응 최적화 (만족도)", self)
+        self.doe_desirability_action.setStatusTip("반응별 2차 모델의 만족도(desirability)를 최대화하는 요인 조건을 찾습니다.")
+        self.doe_desirability_action.triggered.connect(self.run_desirability_optimization)
+        doe_optimization_menu.addAction(self.doe_desirability_action)
+
         # DOE 분석 - 견고성/직교배열
         doe_robust_menu = doe_analysis_menu.addMenu("견고성/직교배열 분석")
         self.doe_orthogonal_action = QAction("직교배열 분석", self)
@@ -1114,9 +1156,11 @@ class MainWindow(QMainWindow):
         self.doe_anova_action.setEnabled(doe_ready)
         self.doe_fractional_action.setEnabled(doe_ready)
         self.doe_plackett_action.setEnabled(doe_ready)
+        self.doe_effects_action.setEnabled(doe_ready)
         self.doe_rsm_action.setEnabled(has_numeric2)
         self.doe_box_behnken_action.setEnabled(has_numeric2)
         self.doe_ccd_action.setEnabled(has_numeric2)
+        self.doe_desirability_action.setEnabled(has_numeric3)
         self.doe_orthogonal_action.setEnabled(doe_ready)
         self.doe_taguchi_action.setEnabled(doe_ready)
         self.doe_mixture_action.setEnabled(has_numeric2)
@@ -1378,14 +1422,12 @@ class MainWindow(QMainWindow):
             if options is None:
                 return
             df = self.design_controller.create_fractional_factorial(options["design_str"])
+            aliasing = df.attrs["aliasing"]
             df = self._apply_randomization(df, randomize=options["randomize"], seed=options["seed"])
             df = self._apply_replication(df, repeats=options["replicates"])
             factors = df.shape[1]
-            self._update_design_result(
-                df,
-                "부분요인설계",
-                self._format_design_summary("부분요인설계", df, factors),
-            )
+            summary = self._format_design_summary("부분요인설계", df, factors)
+            self._update_design_result(df, "부분요인설계", f"{summary}\n{self._format_alias_summary(aliasing)}")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"설계를 생성하는 중 오류가 발생했습니다:\n{e}")
 
@@ -1470,12 +1512,14 @@ class MainWindow(QMainWindow):
     
     def create_orthogonal_array_design(self):
         """Create orthogonal array (Taguchi)"""
-        designs = ["L4 (2-level, up to 3 factors)", "L8 (2-level, up to 7 factors)", "L9 (3-level, up to 4 factors)"]
-        design_choice, ok = QInputDialog.getItem(self, "Select Orthogonal Array", "Choose design:", designs, 1, False)
+        arrays = self.design_controller.list_orthogonal_arrays()
+        labels = [f"{a['name']} (up to {a['columns']} factors)" for a in arrays]
+        default = next(i for i, a in enumerate(arrays) if a["name"].startswith("L8("))
+        design_choice, ok = QInputDialog.getItem(self, "Select Orthogonal Array", "Choose design:", labels, default, False)
         if not ok or not design_choice:
             return
-        design_code = design_choice.split()[0]
-        max_factors = {"L4": 3, "L8": 7, "L9": 4}[design_code]
+        spec = arrays[labels.index(design_choice)]
+        design_code, max_factors = spec["name"], spec["columns"]
         factors, ok = QInputDialog.getInt(self, "Factors", f"Number of factors (max {max_factors}):", min(2, max_factors), 1, max_factors)
         if not ok:
             return
@@ -1493,18 +1537,27 @@ class MainWindow(QMainWindow):
         self.create_orthogonal_array_design()
     
     def create_mixture_design(self):
-        """Mixture design (simplex lattice)"""
+        """Mixture design (simplex lattice / centroid / extreme vertices)"""
+        from controllers.mixture_design import lattice_size
+
         options = self._show_mixture_design_dialog()
         if options is None:
             return
         components = options["components"]
         degree = options["degree"]
+        kind = options["kind"]
         component_names = options["component_names"]
 
         try:
-            lattice_points = self._generate_simplex_lattice(components, degree)
-            df = pd.DataFrame(lattice_points, columns=component_names)
+            # 격자 점이 표에 올리기에 너무 많으면 CSV 로 스트리밍 저장
+            if kind == "lattice" and lattice_size(components, degree) > self.MIXTURE_GRID_LIMIT:
+                self._stream_mixture_design(options)
+                return
 
+            df = self.design_controller.create_mixture_design(
+                components, kind=kind, degree=degree, lower=options["lower"], upper=options["upper"],
+                component_names=component_names, edge_centroids=options["edge_centroids"],
+            )
             sums = df.sum(axis=1)
             tol = 1e-6
             invalid = (sums - 1.0).abs() > tol
@@ -1519,17 +1572,54 @@ class MainWindow(QMainWindow):
 
             df = self._apply_randomization(df, randomize=options["randomize"], seed=options["seed"])
             df = self._apply_replication(df, repeats=options["replicates"])
+            kind_label = {"lattice": "Simplex Lattice", "centroid": "Simplex Centroid",
+                          "extreme_vertices": "Extreme Vertices"}[kind]
             summary = (
-                "Mixture Design (Simplex Lattice)\n"
+                f"Mixture Design ({kind_label})\n"
                 f"Components: {components}\n"
-                f"Degree: {degree}\n"
-                f"Runs: {len(df)}\n"
+                + (f"Degree: {degree}\n" if kind == "lattice" else "")
+                + (f"Bounds: {self._format_mixture_bounds(options)}\n" if options["lower"] or options["upper"] else "")
+                + f"Runs: {len(df)}\n"
                 "Sum check: OK (sum=1)"
             )
-            self._update_design_result(df, f"Mixture (q={components}, m={degree})", summary)
+            label = f"Mixture (q={components}, m={degree})" if kind == "lattice" else f"Mixture {kind_label} (q={components})"
+            self._update_design_result(df, label, summary)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create mixture design:\n{str(e)}")
 
+    def _format_mixture_bounds(self, options):
+        lower = options["lower"] or [0.0] * options["components"]
+        upper = options["upper"] or [1.0] * options["components"]
+        return ", ".join(f"{n}:{lo:g}-{hi:g}" for n, lo, hi in zip(options["component_names"], lower, upper))
+
+    def _stream_mixture_design(self, options):
+        """큰 격자를 청크 단위로 CSV 파일에 저장"""
+        from controllers.mixture_design import lattice_size
+
+        total = lattice_size(options["components"], options["degree"])
+        reply = QMessageBox.question(
+            self, "Mixture Design",
+            f"The lattice has {total:,} candidate points, too many for the data grid.\n"
+            "Write them to a CSV file in streaming mode?",
+        )
+        if reply != QMessageBox.Yes:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save mixture candidates", "", "CSV files (*.csv)")
+        if not file_path:
+            return
+        rows = 0
+        with open(file_path, "w", newline="", encoding="utf-8") as handle:
+            chunks = self.design_controller.iter_mixture_design(
+                options["components"], kind="lattice", degree=options["degree"], lower=options["lower"],
+                upper=options["upper"], component_names=options["component_names"],
+            )
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(handle, index=False, header=(i == 0))
+                rows += len(chunk)
+                self.status_label.setText(f"Writing mixture candidates... {rows:,} rows")
+                QCoreApplication.processEvents()
+        self.status_label.setText(f"Mixture candidates saved ({rows:,} rows): {file_path}")
+
     def create_split_plot_design(self):
         """Split-plot design"""
         options = self._show_split_plot_dialog()
@@ -1538,51 +1628,118 @@ class MainWindow(QMainWindow):
 
         wp_levels = options["whole_levels"]
         sp_levels = options["subplot_levels"]
-        randomize_whole = options["randomize_whole"]
-        randomize_subplot = options["randomize_subplot"]
-        seed = options["seed"]
-        seed_per_block = options["seed_per_block"]
-        replicates = options["replicates"]
-
         try:
-            whole_df = self.design_controller.create_full_factorial(wp_levels)
-            whole_df.columns = [f"W{i+1}" for i in range(len(wp_levels))]
-            subplot_df = self.design_controller.create_full_factorial(sp_levels)
-            subplot_df.columns = [f"S{i+1}" for i in range(len(sp_levels))]
-
-            if randomize_whole:
-                whole_df = self._apply_randomization(whole_df, True, seed=seed)
-
-            rows = []
-            for idx, w_row in whole_df.iterrows():
-                if randomize_subplot:
-                    if seed is None:
-                        sub_seed = None
-                    else:
-                        sub_seed = seed + idx if seed_per_block else seed
-                    sub_df = self._apply_randomization(subplot_df, True, seed=sub_seed)
-                else:
-                    sub_df = subplot_df
-                for _, s_row in sub_df.iterrows():
-                    row = {**w_row.to_dict(), **s_row.to_dict()}
-                    row["WholePlot"] = idx + 1
-                    rows.append(row)
-
-            df = pd.DataFrame(rows)
-            df = self._apply_replication(df, repeats=replicates)
-
+            df = self.design_controller.create_split_plot(
+                wp_levels, sp_levels, replicates=options["replicates"],
+                randomize_whole=options["randomize_whole"], randomize_subplot=options["randomize_subplot"],
+                seed=options["seed"], seed_per_block=options["seed_per_block"],
+            )
+            whole_runs = df["WholePlot"].nunique() // options["replicates"]
             summary = (
                 "Split-Plot Design\n"
                 f"Whole-plot factors: {len(wp_levels)}\n"
                 f"Sub-plot factors: {len(sp_levels)}\n"
-                f"Whole runs: {len(whole_df)}\n"
-                f"Sub runs per whole: {len(subplot_df)}\n"
+                f"Whole runs: {whole_runs}\n"
+                f"Sub runs per whole: {len(df) // (whole_runs * options['replicates'])}\n"
+                f"Replicates: {options['replicates']}\n"
                 f"Total runs: {len(df)}"
             )
             self._update_design_result(df, "Split-Plot Design", summary)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create split-plot design:\n{str(e)}")
 
+    def create_optimal_design(self):
+        """D/I-최적 설계 (후보 격자 교환 알고리즘)"""
+        options = self._show_optimal_design_dialog()
+        if options is None:
+            return
+        # 교환 알고리즘은 시간 한도까지 걸릴 수 있으므로 작업 스레드에서 생성
+        self.optimal_design_action.setEnabled(False)
+        self.status_label.setText("최적 설계 생성 중...")
+        run_in_background(
+            lambda: self.design_controller.create_optimal_design(
+                options["factors"], options["runs"], model=options["model"], criterion=options["criterion"],
+                bounds=options["bounds"], levels=options["levels"], constraints=options["constraints"],
+                fixed_runs=options["fixed_runs"], n_starts=options["n_starts"], seed=options["seed"] or 0,
+                max_workers=os.cpu_count() or 1, time_budget=options["time_budget"],
+            ),
+            lambda df: self._show_optimal_design_result(df, options),
+            self._optimal_design_failed,
+        )
+
+    def _optimal_design_failed(self, error):
+        self.optimal_design_action.setEnabled(True)
+        self.status_label.setText("준비")
+        QMessageBox.critical(self, "오류", f"설계를 생성하는 중 오류가 발생했습니다:\n{error}")
+
+    def _show_optimal_design_result(self, df, options):
+        self.optimal_design_action.setEnabled(True)
+        self.status_label.setText("준비")
+        try:
+            info = df.attrs["optimal_design"]
+            df = self._apply_randomization(df, randomize=options["randomize"], seed=options["seed"])
+            df = self._apply_replication(df, repeats=options["replicates"])
+            summary = (
+                f"{info['criterion']}-최적 설계 ({info['model']} 모형)\n"
+                f"요인 수: {options['factors']}\n"
+                f"런 수: {len(df)} (고정 런 {info['n_fixed']}개)\n"
+                f"모형 계수: {info['n_parameters']}개, 후보점: {info['n_candidates']}개\n"
+                f"D-효율: {info['d_efficiency']:.1f}%\n"
+                f"평균 예측분산: {info['average_variance']:.4f} σ²\n"
+                f"최대 레버리지: {info['max_leverage']:.3f}"
+            )
+            if info.get("timed_out"):
+                summary += f"\n참고: 시간 한도({options['time_budget']:.0f}초)에 도달해 그때까지의 최선 설계입니다."
+            self._update_design_result(df, f"{info['criterion']}-최적 설계 ({options['factors']}요인)", summary)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"설계를 생성하는 중 오류가 발생했습니다:\n{e}")
+
+    def create_space_filling_design(self):
+        """공간 채움 설계 (LHS, maximin LHS, Sobol, Halton)"""
+        options = self._show_space_filling_dialog()
+        if options is None:
+            return
+        # maximin 담금질은 시간 한도까지 걸릴 수 있으므로 작업 스레드에서 생성
+        self.space_filling_action.setEnabled(False)
+        self.status_label.setText("공간 채움 설계 생성 중...")
+        run_in_background(
+            lambda: self.design_controller.create_space_filling_design(
+                options["factors"], options["runs"], kind=options["kind"], bounds=options["bounds"],
+                seed=options["seed"], restarts=options["restarts"], time_budget=options["time_budget"],
+            ),
+            lambda df: self._show_space_filling_result(df, options),
+            self._space_filling_failed,
+        )
+
+    def _space_filling_failed(self, error):
+        self.space_filling_action.setEnabled(True)
+        self.status_label.setText("준비")
+        QMessageBox.critical(self, "오류", f"설계를 생성하는 중 오류가 발생했습니다:\n{error}")
+
+    def _show_space_filling_result(self, df, options):
+        self.space_filling_action.setEnabled(True)
+        self.status_label.setText("준비")
+        try:
+            info = df.attrs["space_filling"]
+            lines = [
+                f"공간 채움 설계 ({options['label']})",
+                f"요인 수: {options['factors']}",
+                f"런 수: {len(df)}",
+                f"최소 점간 거리: {info['min_distance']:.4f} (단위 입방체)",
+                f"φ_p: {info['phi_p']:.4f}",
+            ]
+            if info.get("discrepancy") is not None:
+                lines.append(f"중심 L2 불일치도: {info['discrepancy']:.6f}")
+            if options["kind"] == "maximin_lhs":
+                lines.append(f"무작위 LHS 최소 거리: {info['initial_min_distance']:.4f} "
+                             f"(재시작 {info['restarts']}회, 교환 {info['accepted']}/{info['iterations']})")
+            if info.get("balanced") is False:
+                lines.append("참고: Sobol 수열은 런 수가 2의 거듭제곱일 때 균형이 맞습니다.")
+            self._update_design_result(df, f"공간 채움 설계 ({options['label']}, {options['factors']}요인)",
+                                       "\n".join(lines))
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"설계를 생성하는 중 오류가 발생했습니다:\n{e}")
+
     def create_custom_design(self):
         """Custom design"""
         choice_box = QMessageBox(self)
@@ -1645,20 +1802,6 @@ class MainWindow(QMainWindow):
         )
         self._update_design_result(df, "Custom Design", summary)
 
-    def _generate_simplex_lattice(self, components: int, degree: int):
-        # Generate simplex-lattice points where sum(parts)=degree.
-        points = []
-
-        def _recurse(parts_left, remaining, current):
-            if parts_left == 1:
-                points.append(current + [remaining])
-                return
-            for i in range(remaining + 1):
-                _recurse(parts_left - 1, remaining - i, current + [i])
-
-        _recurse(components, degree, [])
-        return [[v / degree for v in row] for row in points]
-
     def _apply_randomization(self, df, randomize: bool, seed=None):
         if df is None or df.empty or not randomize:
             return df
@@ -1677,6 +1820,25 @@ class MainWindow(QMainWindow):
         )
         return f"{name}\n요인 수: {factors}\n런 수: {runs}\n수준 요약: {level_summary}"
 
+    def _format_alias_summary(self, aliasing, max_lines: int = 15) -> str:
+        """부분요인설계 해상도/정의 관계/별칭 사슬 (2차 교호작용까지) 요약"""
+        info = aliasing.to_dict(max_order=2)
+        labels = ", ".join(f"{label}=F{i+1}" for i, label in enumerate(info["factors"]))
+        words = aliasing.words()
+        relation = " = ".join(["I"] + words[:max_lines]) + (" = ..." if len(words) > max_lines else "")
+        lines = [
+            f"해상도: {info['resolution_label']}",
+            f"요인 기호: {labels}",
+            f"정의 관계: {relation}",
+            f"단어 길이 패턴: {tuple(info['word_length_pattern'][2:])}",
+            "별칭 구조 (2차 교호작용까지):",
+        ]
+        chains = info["aliases"]
+        lines += [f"  {chain}" for chain in chains[:max_lines]]
+        if len(chains) > max_lines:
+            lines.append(f"  ... 외 {len(chains) - max_lines}개")
+        return "\n".join(lines)
+
     def _update_design_result(self, df: pd.DataFrame, label: str, summary: str):
         # 반응 변수 열이 없으면 기본 Response 열 추가
         if "Response" not in df.columns:
@@ -1731,18 +1893,34 @@ class MainWindow(QMainWindow):
         form_layout = QFormLayout()
 
         comp_spin = QSpinBox()
-        comp_spin.setRange(2, 10)
+        comp_spin.setRange(2, 30)
         comp_spin.setValue(3)
         form_layout.addRow("Components", comp_spin)
 
+        kind_combo = QComboBox()
+        kinds = {"Simplex lattice": "lattice", "Simplex centroid": "centroid", "Extreme vertices": "extreme_vertices"}
+        kind_combo.addItems(list(kinds))
+        form_layout.addRow("Design", kind_combo)
+
         degree_spin = QSpinBox()
-        degree_spin.setRange(2, 10)
+        degree_spin.setRange(1, 100)
         degree_spin.setValue(3)
         form_layout.addRow("Degree", degree_spin)
 
         name_input = QLineEdit("C1, C2, C3")
         form_layout.addRow("Component names (comma separated)", name_input)
 
+        lower_input = QLineEdit()
+        lower_input.setPlaceholderText("e.g. 0.1, 0.2, 0 (empty: 0)")
+        form_layout.addRow("Lower bounds", lower_input)
+
+        upper_input = QLineEdit()
+        upper_input.setPlaceholderText("e.g. 0.6, 0.5, 0.4 (empty: 1)")
+        form_layout.addRow("Upper bounds", upper_input)
+
+        edge_check = QCheckBox("Add edge midpoints (extreme vertices)")
+        form_layout.addRow("", edge_check)
+
         note_label = QLabel("Sum-to-1 check will be validated after generation.")
         form_layout.addRow("", note_label)
 
@@ -1772,10 +1950,30 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Input Error", "Component names must be unique.")
             return None
 
+        bounds = {}
+        for key, widget in (("lower", lower_input), ("upper", upper_input)):
+            text = widget.text().strip()
+            if not text:
+                bounds[key] = None
+                continue
+            try:
+                values = [float(v) for v in text.split(",") if v.strip()]
+            except ValueError:
+                QMessageBox.warning(self, "Input Error", f"Invalid {key} bounds.")
+                return None
+            if len(values) != components:
+                QMessageBox.warning(self, "Input Error", f"{key.capitalize()} bound count does not match components.")
+                return None
+            bounds[key] = values
+
         options = self._finalize_common_options(common)
         options["components"] = components
+        options["kind"] = kinds[kind_combo.currentText()]
         options["degree"] = int(degree_spin.value())
         options["component_names"] = raw_names
+        options["lower"] = bounds["lower"]
+        options["upper"] = bounds["upper"]
+        options["edge_centroids"] = edge_check.isChecked()
         return options
 
     def _show_split_plot_dialog(self):
@@ -1941,6 +2139,49 @@ class MainWindow(QMainWindow):
         design_input = QLineEdit("a b ab")
         form_layout.addRow("Generator 문자열:", design_input)
 
+        # 최소 aberration 생성 열 탐색: 요인 수 + 런 예산 → generator 문자열 채움
+        search_row = QHBoxLayout()
+        ma_factors_spin = QSpinBox()
+        ma_factors_spin.setRange(3, 40)
+        ma_factors_spin.setValue(6)
+        ma_runs_spin = QSpinBox()
+        ma_runs_spin.setRange(4, 128)
+        ma_runs_spin.setValue(16)
+        search_btn = QPushButton("최소 aberration 탐색")
+        search_row.addWidget(QLabel("요인"))
+        search_row.addWidget(ma_factors_spin)
+        search_row.addWidget(QLabel("런"))
+        search_row.addWidget(ma_runs_spin)
+        search_row.addWidget(search_btn)
+        form_layout.addRow("Generator 탐색:", search_row)
+        search_label = QLabel("")
+        form_layout.addRow("", search_label)
+
+        def on_search():
+            # 큰 탐색은 수십 초 걸릴 수 있으므로 작업 스레드에서 실행 (시간 상한 초과 시 근사 결과)
+            search_btn.setEnabled(False)
+            search_label.setText("탐색 중...")
+            factors, runs = ma_factors_spin.value(), ma_runs_spin.value()
+            run_in_background(lambda: self.design_controller.find_min_aberration(
+                factors, runs, max_workers=os.cpu_count() or 1), on_found, on_failed)
+
+        def on_failed(error):
+            search_btn.setEnabled(True)
+            search_label.setText("")
+            QMessageBox.warning(dialog, "탐색 오류", str(error))
+
+        def on_found(info):
+            search_btn.setEnabled(True)
+            design_input.setText(info["design_str"])
+            wlp = ", ".join(str(a) for a in info["word_length_pattern"][2:6])
+            p = info["factors"] - info["runs"].bit_length() + 1
+            search_label.setText(
+                f"2^({info['factors']}-{p}) 해상도 {info['resolution'] or '-'}, WLP (A3..A6) = ({wlp})"
+                + ("" if info["exhaustive"] else " · 근사 탐색")
+            )
+
+        search_btn.clicked.connect(on_search)
+
         common = self._add_common_design_controls(form_layout)
 
         layout.addLayout(form_layout)
@@ -2065,6 +2306,188 @@ class MainWindow(QMainWindow):
         options["alpha"] = alpha
         return options
 
+    def _show_optimal_design_dialog(self):
+        from utils.optimal_design import parse_constraint
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("최적 설계 옵션")
+        layout = QVBoxLayout(dialog)
+        form_layout = QFormLayout()
+
+        factors_spin = QSpinBox()
+        factors_spin.setRange(1, 10)
+        factors_spin.setValue(3)
+        form_layout.addRow("요인 수:", factors_spin)
+
+        runs_spin = QSpinBox()
+        runs_spin.setRange(2, 200)
+        runs_spin.setValue(15)
+        form_layout.addRow("런 수 (고정 런 포함):", runs_spin)
+
+        model_combo = QComboBox()
+        models = {"2차 (quadratic)": "quadratic", "교호작용 (interaction)": "interaction", "1차 (linear)": "linear"}
+        model_combo.addItems(list(models))
+        form_layout.addRow("모형:", model_combo)
+
+        criterion_combo = QComboBox()
+        criterion_combo.addItems(["D", "I"])
+        form_layout.addRow("최적 기준:", criterion_combo)
+
+        levels_spin = QSpinBox()
+        levels_spin.setRange(0, 21)
+        levels_spin.setValue(0)
+        levels_spin.setSpecialValueText("자동")
+        form_layout.addRow("후보 격자 수준:", levels_spin)
+
+        bounds_input = QLineEdit()
+        bounds_input.setPlaceholderText("예: 0:10, 20:80 (비우면 -1:1)")
+        form_layout.addRow("요인 범위:", bounds_input)
+
+        constraints_input = QLineEdit()
+        constraints_input.setPlaceholderText("예: F1 + F2 <= 1; F1 - F3 >= -1.5")
+        form_layout.addRow("선형 제약:", constraints_input)
+
+        fixed_input = QLineEdit()
+        fixed_input.setPlaceholderText("예: 0,0,0; 1,1,1")
+        form_layout.addRow("고정 런:", fixed_input)
+
+        starts_spin = QSpinBox()
+        starts_spin.setRange(1, 50)
+        starts_spin.setValue(10)
+        form_layout.addRow("무작위 시작 수:", starts_spin)
+
+        budget_spin = QSpinBox()
+        budget_spin.setRange(1, 60)
+        budget_spin.setValue(30)
+        budget_spin.setSuffix(" 초")
+        form_layout.addRow("전체 시간 한도:", budget_spin)
+
+        common = self._add_common_design_controls(form_layout)
+
+        layout.addLayout(form_layout)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+
+        if dialog.exec() != QDialog.Accepted:
+            return None
+
+        factors = int(factors_spin.value())
+        names = [f"F{i+1}" for i in range(factors)]
+        try:
+            bounds = None
+            if bounds_input.text().strip():
+                bounds = [[float(v) for v in item.split(":")] for item in bounds_input.text().split(",")]
+                if len(bounds) != factors or any(len(b) != 2 for b in bounds):
+                    raise ValueError("요인 범위는 요인마다 '하한:상한' 형식이어야 합니다.")
+            constraints = [parse_constraint(item, names) for item in constraints_input.text().split(";")
+                           if item.strip()]
+            fixed_runs = [[float(v) for v in item.split(",")] for item in fixed_input.text().split(";")
+                          if item.strip()]
+            if any(len(run) != factors for run in fixed_runs):
+                raise ValueError("고정 런은 요인 수만큼 값을 가져야 합니다.")
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return None
+
+        options = self._finalize_common_options(common)
+        options.update({
+            "factors": factors,
+            "runs": int(runs_spin.value()),
+            "model": models[model_combo.currentText()],
+            "criterion": criterion_combo.currentText(),
+            "levels": int(levels_spin.value()) or None,
+            "bounds": bounds,
+            "constraints": constraints,
+            "fixed_runs": fixed_runs or None,
+            "n_starts": int(starts_spin.value()),
+            "time_budget": float(budget_spin.value()),
+        })
+        return options
+
+    def _show_space_filling_dialog(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("공간 채움 설계 옵션")
+        layout = QVBoxLayout(dialog)
+        form_layout = QFormLayout()
+
+        factors_spin = QSpinBox()
+        factors_spin.setRange(1, 100)
+        factors_spin.setValue(5)
+        form_layout.addRow("요인 수:", factors_spin)
+
+        runs_spin = QSpinBox()
+        runs_spin.setRange(2, 20000)
+        runs_spin.setValue(50)
+        runs_spin.setToolTip(f"maximin LHS 는 {MAXIMIN_MAX_RUNS}런까지")
+        form_layout.addRow("런 수:", runs_spin)
+
+        kinds = {
+            "maximin LHS": "maximin_lhs",
+            "라틴 하이퍼큐브 (LHS)": "lhs",
+            "Sobol 수열": "sobol",
+            "Halton 수열": "halton",
+        }
+        kind_combo = QComboBox()
+        kind_combo.addItems(list(kinds))
+        form_layout.addRow("설계 종류:", kind_combo)
+
+        bounds_input = QLineEdit()
+        bounds_input.setPlaceholderText("예: 0:10, 20:80 (비우면 0:1)")
+        form_layout.addRow("요인 범위:", bounds_input)
+
+        restarts_spin = QSpinBox()
+        restarts_spin.setRange(1, 16)
+        restarts_spin.setValue(4)
+        form_layout.addRow("maximin 재시작 수:", restarts_spin)
+
+        budget_spin = QSpinBox()
+        budget_spin.setRange(1, 120)
+        budget_spin.setValue(30)
+        budget_spin.setSuffix(" 초")
+        form_layout.addRow("전체 시간 한도:", budget_spin)
+
+        seed_check = QCheckBox("고정 시드 사용")
+        seed_spin = QSpinBox()
+        seed_spin.setRange(0, 99999)
+        seed_spin.setValue(42)
+        seed_spin.setEnabled(False)
+        seed_check.toggled.connect(seed_spin.setEnabled)
+        form_layout.addRow("시드:", seed_spin)
+        form_layout.addRow("", seed_check)
+
+        layout.addLayout(form_layout)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+
+        if dialog.exec() != QDialog.Accepted:
+            return None
+
+        factors = int(factors_spin.value())
+        bounds = None
+        if bounds_input.text().strip():
+            try:
+                bounds = [[float(v) for v in item.split(":")] for item in bounds_input.text().split(",")]
+                if len(bounds) != factors or any(len(b) != 2 for b in bounds):
+                    raise ValueError("요인 범위는 요인마다 '하한:상한' 형식이어야 합니다.")
+            except ValueError as e:
+                QMessageBox.warning(self, "입력 오류", str(e))
+                return None
+
+        return {
+            "factors": factors,
+            "runs": int(runs_spin.value()),
+            "kind": kinds[kind_combo.currentText()],
+            "label": kind_combo.currentText(),
+            "bounds": bounds,
+            "restarts": int(restarts_spin.value()),
+            "time_budget": float(budget_spin.value()),
+            "seed": int(seed_spin.value()) if seed_check.isChecked() else None,
+        }
+
     def run_doe_anova_dialog(self):
         """현재 데이터에서 요인/반응을 선택해 DOE ANOVA 실행"""
         df = self.data_view.get_data()
@@ -2107,21 +2530,33 @@ class MainWindow(QMainWindow):
         response, factors = self._prompt_response_and_factors(df, title="Plackett-Burman 분석", max_factors=None)
         if not response or not factors:
             return
-        # 주효과 중심
-        self.analysis_controller.run_main_effects_anova(df, response, factors, analysis_type="Plackett-Burman 분석")
+        # 주효과 중심 (+ 메뉴에서 켠 경우 크기별 상위 부분집합 모형)
+        self.analysis_controller.run_main_effects_anova(
+            df, response, factors, analysis_type="Plackett-Burman 분석",
+            best_subsets_top=5 if self.pb_subsets_action.isChecked() else 0,
+            **self._bootstrap_options()
+        )
 
-    def _prompt_response_and_factors(self, df, title="DOE ANOVA", max_factors=None):
-        """반응/요인 입력 공통 처리"""
+    def _prompt_response_and_factors(self, df, title="DOE ANOVA", max_factors=None, default_factors=None,
+                                     default_response=None):
+        """
+        반응/요인 입력 공통 처리
+        default_factors: 반응 이름 → 기본 요인 목록 (기본: 반응 외 전체 열)
+        """
         numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
         if not numeric_cols:
             QMessageBox.information(self, "알림", "숫자형 반응 변수가 필요합니다.")
             return None, None
 
-        response, ok = QInputDialog.getItem(self, title, "반응 변수를 선택하세요:", numeric_cols, 0, False)
+        current = numeric_cols.index(default_response) if default_response in numeric_cols else 0
+        response, ok = QInputDialog.getItem(self, title, "반응 변수를 선택하세요:", numeric_cols, current, False)
         if not ok or not response:
             return None, None
 
-        default_factors = [c for c in df.columns if c != response]
+        if default_factors is not None:
+            default_factors = list(default_factors(response))
+        else:
+            default_factors = [c for c in df.columns if c != response]
         if max_factors:
             default_factors = default_factors[:max_factors]
         factor_text, ok = QInputDialog.getText(
@@ -2145,6 +2580,48 @@ class MainWindow(QMainWindow):
             return None, None
         return response, factors
 
+    def run_stepwise_regression_dialog(self):
+        """반응/후보 변수와 선택 방향·기준을 입력받아 단계적 회귀 실행"""
+        df = self.data_view.get_data()
+        if df is None or df.empty:
+            QMessageBox.information(self, "알림", "분석할 데이터가 없습니다.")
+            return
+        numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        response, ok = QInputDialog.getItem(self, "단계적 회귀", "반응 변수를 선택하세요:", numeric_cols, 0, False)
+        if not ok or not response:
+            return
+        candidates = [c for c in numeric_cols if c != response]
+        text, ok = QInputDialog.getText(
+            self, "단계적 회귀", "후보 변수 열 이름을 쉼표로 구분해 입력하세요:", text=",".join(candidates)
+        )
+        if not ok:
+            return
+        predictors = [c.strip() for c in text.split(",") if c.strip()]
+        missing = [c for c in predictors if c not in df.columns]
+        if not predictors or missing:
+            QMessageBox.information(self, "알림", "후보 변수를 확인하세요." + (f" ({', '.join(missing)})" if missing else ""))
+            return
+
+        directions = {"단계적 (stepwise)": "stepwise", "전진 선택 (forward)": "forward", "후진 제거 (backward)": "backward"}
+        direction, ok = QInputDialog.getItem(self, "단계적 회귀", "선택 방향:", list(directions), 0, False)
+        if not ok:
+            return
+        criteria = {"AIC": "aic", "BIC": "bic", "p-값 (진입/제거 0.15)": "pvalue"}
+        criterion, ok = QInputDialog.getItem(self, "단계적 회귀", "선택 기준:", list(criteria), 0, False)
+        if not ok:
+            return
+
+        self.status_label.setText("단계적회귀분석을 수행 중입니다...")
+        self.analysis_controller.run_stepwise_regression(
+            df, response, predictors, direction=directions[direction], criterion=criteria[criterion]
+        )
+
+    def _bootstrap_options(self):
+        """메뉴에서 켠 경우에만 부트스트랩 구간 계산 (CPU 수만큼 스레드)"""
+        if not self.bootstrap_ci_action.isChecked():
+            return {}
+        return {"bootstrap_samples": 2000, "max_workers": os.cpu_count() or 1}
+
     def _run_doe_anova(self, df, response, factors):
         """공통 DOE ANOVA 실행"""
         model_df = df[[response] + factors].copy()
@@ -2152,7 +2629,7 @@ class MainWindow(QMainWindow):
             model_df[f] = model_df[f].astype("category")
 
         self.status_label.setText(f"{response} ~ {', '.join(factors)} ANOVA 실행 중...")
-        self.analysis_controller.run_doe_anova(model_df, response, factors)
+        self.analysis_controller.run_doe_anova(model_df, response, factors, **self._bootstrap_options())
 
     def _run_main_effects_anova(self, df, response, factors, analysis_type):
         """주효과만 포함한 ANOVA 실행"""
@@ -2160,7 +2637,8 @@ class MainWindow(QMainWindow):
         for f in factors:
             model_df[f] = model_df[f].astype("category")
         self.status_label.setText(f"{analysis_type} 실행 중...")
-        self.analysis_controller.run_main_effects_anova(model_df, response, factors, analysis_type=analysis_type)
+        self.analysis_controller.run_main_effects_anova(model_df, response, factors, analysis_type=analysis_type,
+                                                        **self._bootstrap_options())
 
     def _run_rsm_quadratic(self, df, response, factors, analysis_type):
         model_df = df[[response] + factors].copy()
@@ -2200,6 +2678,87 @@ class MainWindow(QMainWindow):
             return
         self._run_rsm_quadratic(df, response, factors, analysis_type="CCD 분석")
 
+    def run_factorial_effects(self):
+        """2수준 (부분)요인 효과 분석"""
+        if not self.data_view.has_data():
+            QMessageBox.information(self, "알림", "분석할 데이터가 없습니다.")
+            return
+        self.analysis_requested.emit("doe_factorial_effects")
+
+    def run_factorial_effects_dialog(self):
+        """반응/2수준 요인을 입력받아 Yates(FWHT) 효과 분석 실행"""
+        from utils.effects import two_level_factors
+
+        df = self.data_view.get_data()
+        if df is None or df.empty:
+            QMessageBox.information(self, "알림", "분석할 데이터가 없습니다.")
+            return
+        response, factors = self._prompt_response_and_factors(
+            df, title="2수준 효과 분석", default_factors=lambda response: two_level_factors(df, exclude=(response,)))
+        if not response or not factors:
+            return
+        self.status_label.setText("2수준 효과 분석을 수행 중입니다...")
+        self.analysis_controller.run_factorial_effects(df, response, factors)
+
+    def run_desirability_optimization(self):
+        """다중 반응 만족도 최적화"""
+        if not self.data_view.has_data():
+            QMessageBox.information(self, "알림", "분석할 데이터가 없습니다.")
+            return
+        self.analysis_requested.emit("doe_desirability")
+
+    def run_desirability_dialog(self):
+        """반응별 목표와 요인을 입력받아 만족도 최적화 실행"""
+        df = self.data_view.get_data()
+        if df is None or df.empty:
+            QMessageBox.information(self, "알림", "분석할 데이터가 없습니다.")
+            return
+        numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        text, ok = QInputDialog.getText(
+            self, "만족도 최적화", "요인 열 이름을 쉼표로 구분해 입력하세요:", text=",".join(numeric_cols[:2])
+        )
+        if not ok:
+            return
+        factors = [c.strip() for c in text.split(",") if c.strip()]
+        candidates = [c for c in numeric_cols if c not in factors]
+        text, ok = QInputDialog.getText(
+            self, "만족도 최적화", "반응 열 이름을 쉼표로 구분해 입력하세요:", text=",".join(candidates)
+        )
+        if not ok:
+            return
+        responses = [c.strip() for c in text.split(",") if c.strip()]
+        missing = [c for c in factors + responses if c not in df.columns]
+        if not factors or not responses or missing:
+            QMessageBox.information(self, "알림", "요인/반응 열을 확인하세요." + (f" ({', '.join(missing)})" if missing else ""))
+            return
+
+        goal_names = {"최대화": "maximize", "최소화": "minimize", "목표값": "target"}
+        goals = []
+        for response in responses:
+            observed = pd.to_numeric(df[response], errors="coerce").dropna()
+            label, ok = QInputDialog.getItem(self, "만족도 최적화", f"'{response}' 의 목표:", list(goal_names), 0, False)
+            if not ok:
+                return
+            lower, ok = QInputDialog.getDouble(self, "만족도 최적화", f"'{response}' 하한 (만족도 0/1 경계):",
+                                               float(observed.min()), -1e12, 1e12, 4)
+            if not ok:
+                return
+            upper, ok = QInputDialog.getDouble(self, "만족도 최적화", f"'{response}' 상한 (만족도 0/1 경계):",
+                                               float(observed.max()), -1e12, 1e12, 4)
+            if not ok:
+                return
+            goal = {"response": response, "goal": goal_names[label], "lower": lower, "upper": upper}
+            if goal["goal"] == "target":
+                target, ok = QInputDialog.getDouble(self, "만족도 최적화", f"'{response}' 목표값:",
+                                                    (lower + upper) / 2, lower, upper, 4)
+                if not ok:
+                    return
+                goal["target"] = target
+            goals.append(goal)
+
+        self.status_label.setText("만족도 최적화를 수행 중입니다...")
+        self.analysis_controller.run_desirability_optimization(df, goals, factors, max_workers=os.cpu_count() or 1)
+
     def run_orthogonal_analysis(self):
         df = self.data_view.get_data()
         if df is None or df.empty:
@@ -2487,18 +3046,21 @@ class MainWindow(QMainWindow):
         """데이터 변경 이벤트"""
         # 차트 뷰, 결과 뷰, 프로젝트 탐색기에 데이터 전달
         if self.data_view.has_data():
-            data = self.data_view.get_data()
+            # 편집마다 전체 복사하지 않도록 읽기 전용으로 공유
+            data = self.data_view.get_data(copy=False)
+            # 행 추가/셀 편집 시 증분 갱신된 통계 캐시를 각 뷰가 공유
+            stats_cache = self.data_view.stats_cache
             
             # 차트 뷰 초기화 및 새 데이터 설정
             self.chart_view.clear_charts()
-            self.chart_view.set_data(data)
+            self.chart_view.set_data(data, stats_cache=stats_cache)
             
             # 결과 뷰 초기화 및 새 데이터 설정
             self.results_view.clear_results()
-            self.results_view.set_data(data)
+            self.results_view.set_data(data, stats_cache=stats_cache)
             
             # 프로젝트 탐색기에 새 데이터 설정 (분석 결과 자동 초기화됨)
-            self.project_explorer.set_data(data, "현재 데이터")
+            self.project_explorer.set_data(data, "현재 데이터", stats_cache=stats_cache)
         else:
             # 데이터가 없으면 모든 뷰 초기화
             self.chart_view.clear_charts()
@@ -2616,8 +3178,8 @@ class MainWindow(QMainWindow):
         # 추가적인 UI 업데이트가 필요한 경우 여기에 작성
         pass
 
-    @Slot(str, dict)
-    def on_analysis_completed(self, analysis_type: str, result: dict):
+    @Slot(str, object)
+    def on_analysis_completed(self, analysis_type: str, result):
         """분석 완료 시 호출되는 슬롯"""
         # 프로젝트에 분석 결과 추가
         self.project_controller.current_project.add_analysis(result)
@@ -3205,9 +3767,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "알림", "차트를 생성할 데이터가 없습니다.")
             return
         
-        self.status_label.setText("등고선도를 생성합니다...")
-        self.tab_widget.setCurrentWidget(self.chart_view)
-        # TODO: 반응표면 모델 기반 등고선도 생성
+        self._create_response_surface_chart("등고선도")
     
     def create_surface_plot(self):
         """3D 표면도 생성"""
@@ -3215,9 +3775,31 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "알림", "차트를 생성할 데이터가 없습니다.")
             return
         
-        self.status_label.setText("3D 표면도를 생성합니다...")
-        self.tab_widget.setCurrentWidget(self.chart_view)
-        # TODO: 반응표면 모델 기반 3D 표면도 생성
+        self._create_response_surface_chart("3D 표면도")
+
+    def _create_response_surface_chart(self, kind):
+        """반응/요인을 입력받아 2차 모형 반응표면 차트 생성 (요인이 3개 이상이면 나머지는 중심값)"""
+        df = self.data_view.get_data()
+        response, factors = self._prompt_response_and_factors(df, title=kind)
+        if not response or not factors:
+            return
+        if len(factors) < 2:
+            QMessageBox.information(self, "알림", "반응표면에는 요인이 2개 이상 필요합니다.")
+            return
+        x_var, y_var = factors[0], factors[1]
+        if len(factors) > 2:
+            x_var, ok = QInputDialog.getItem(self, kind, "X축 요인:", factors, 0, False)
+            if not ok:
+                return
+            rest = [f for f in factors if f != x_var]
+            y_var, ok = QInputDialog.getItem(self, kind, "Y축 요인:", rest, 0, False)
+            if not ok:
+                return
+
+        self.status_label.setText(f"{kind}를 생성합니다...")
+        if self.chart_view.show_response_surface(response, factors, x_var, y_var, kind=kind):
+            self.tab_widget.setCurrentWidget(self.chart_view)
+            self.status_label.setText(f"{kind}가 생성되었습니다.")
     
     def create_pareto_chart(self):
         """파레토 차트 생성"""
@@ -3225,9 +3807,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "알림", "차트를 생성할 데이터가 없습니다.")
             return
         
-        self.status_label.setText("파레토 차트를 생성합니다...")
-        self.tab_widget.setCurrentWidget(self.chart_view)
-        # TODO: 효과 크기 기반 파레토 차트 생성
+        self._create_effects_chart("파레토 차트")
     
     def create_normal_plot(self):
         """정규확률도 생성"""
@@ -3235,9 +3815,31 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "알림", "차트를 생성할 데이터가 없습니다.")
             return
         
-        self.status_label.setText("정규확률도를 생성합니다...")
-        self.tab_widget.setCurrentWidget(self.chart_view)
-        # TODO: Q-Q 플롯 생성
+        self._create_effects_chart("정규확률도")
+
+    def _create_effects_chart(self, kind):
+        """반응/2수준 요인을 입력받아 효과(Yates/FWHT) 파레토 차트 또는 (반)정규확률도 생성"""
+        from utils.effects import two_level_factors
+
+        df = self.data_view.get_data()
+        numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        default_response = next((c for c in reversed(numeric_cols) if df[c].dropna().nunique() > 2), None)
+        response, factors = self._prompt_response_and_factors(
+            df, title=kind, default_factors=lambda response: two_level_factors(df, exclude=(response,)),
+            default_response=default_response)
+        if not response or not factors:
+            return
+        half_normal = True
+        if kind == "정규확률도":
+            choice, ok = QInputDialog.getItem(self, kind, "확률도 종류:", ["반정규확률도", "정규확률도"], 0, False)
+            if not ok:
+                return
+            half_normal = choice == "반정규확률도"
+
+        self.status_label.setText(f"{kind}를 생성합니다...")
+        if self.chart_view.show_effects_chart(response, factors, kind=kind, half_normal=half_normal):
+            self.tab_widget.setCurrentWidget(self.chart_view)
+            self.status_label.setText(f"{kind}가 생성되었습니다.")
     
     def create_correlation_heatmap(self):
         """상관행렬 히트맵 생성"""
@@ -4103,16 +4705,14 @@ class MainWindow(QMainWindow):
     def handle_analysis_request(self, request):
         """분석 요청 처리"""
         try:
-            if request == "basic_stats":
-                self.run_basic_statistics()
-            elif request == "one_way_anova":
-                self.run_one_way_anova()
-            elif request == "two_way_anova":
-                self.run_two_way_anova()
-            elif request == "correlation_analysis":
-                self.run_correlation_analysis_impl()
+            try:
+                spec = get_analysis(request)
+            except KeyError:
+                spec = None
+            if spec is not None and spec.desktop_handler:
+                getattr(self, spec.desktop_handler)()
             elif request in ["multi_way_anova", "repeated_anova", "simple_regression", 
-                           "multiple_regression", "stepwise_regression", "nonlinear_regression",
+                           "multiple_regression", "nonlinear_regression",
                            "mann_whitney_test", "kruskal_wallis_test", "wilcoxon_test",
                            "pca_analysis", "cluster_analysis", "discriminant_analysis"]:
                 # 아직 구현되지 않은 분석들
@@ -4121,7 +4721,6 @@ class MainWindow(QMainWindow):
                     "repeated_anova": "반복측정분산분석", 
                     "simple_regression": "단순회귀분석",
                     "multiple_regression": "다중회귀분석",
-                    "stepwise_regression": "단계적회귀분석",
                     "nonlinear_regression": "비선형회귀분석",
                     "correlation_analysis": "상관분석",
                     "mann_whitney_test": "Mann-Whitney U 검정",
@@ -16,6 +16,8 @@ from datetime import datetime
 import json
 from pathlib import Path
 
+from utils.stats_cache import DatasetStatsCache
+
 class ProjectExplorer(QWidget):
     """프로젝트 탐색기 클래스"""
     
@@ -28,6 +30,8 @@ class ProjectExplorer(QWidget):
         super().__init__()
         
         self.current_data = None
+        self.stats_cache = None
+        self._stats_cache_token = None
         self.analysis_history = []
         self.chart_history = []
         self.project_name = "새 프로젝트"
@@ -218,13 +222,21 @@ class ProjectExplorer(QWidget):
         self.chart_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.chart_list.customContextMenuRequested.connect(self.show_chart_context_menu)
     
-    def set_data(self, data, description="데이터"):
-        """데이터 설정"""
+    def set_data(self, data, description="데이터", stats_cache=None):
+        """
+        데이터 설정
+
+        stats_cache: DataTableView 의 DatasetStatsCache. 주어지면 전체 비교(equals) 대신
+        캐시 버전으로 변경 여부를 판단하고 트리 통계도 캐시에서 읽는다.
+        """
         # 새로운 데이터가 로드되면 기존 분석 결과 초기화
         data_changed = False
+        cache_token = (id(stats_cache), stats_cache.data_version) if stats_cache is not None else None
         if data is not None:
             if self.current_data is None:
                 data_changed = True
+            elif cache_token is not None and self._stats_cache_token is not None:
+                data_changed = cache_token != self._stats_cache_token
             else:
                 try:
                     # 데이터 형태나 내용이 다르면 변경된 것으로 간주
@@ -242,6 +254,11 @@ class ProjectExplorer(QWidget):
         
         self.current_data = data
         self.current_data_description = description
+        self._stats_cache_token = cache_token
+        if data is not None:
+            self.stats_cache = stats_cache if stats_cache is not None else DatasetStatsCache(data)
+        else:
+            self.stats_cache = None
         
         if data is not None:
             # 데이터 정보 업데이트
@@ -293,17 +310,22 @@ class ProjectExplorer(QWidget):
         columns_item.setText(0, "📋 컬럼")
         columns_item.setText(1, f"{len(data.columns)}개")
         
+        cache = self._cache_for(data)
+        numeric_set = set(cache.numeric_columns)
         for col in data.columns:
             col_item = QTreeWidgetItem(columns_item)
             col_item.setText(0, str(col))
             
             # 컬럼 타입과 기본 통계
-            if pd.api.types.is_numeric_dtype(data[col]):
+            if col in numeric_set:
+                col_type = "숫자형"
+                stats = f"평균: {cache.column_stats(col)['mean']:.2f}"
+            elif pd.api.types.is_numeric_dtype(data[col]):
                 col_type = "숫자형"
                 stats = f"평균: {data[col].mean():.2f}"
             else:
                 col_type = "범주형"
-                stats = f"고유값: {data[col].nunique()}개"
+                stats = f"고유값: {cache.categorical_summary(col)['unique']}개"
             
             col_item.setText(1, f"{col_type} | {stats}")
             col_item.setData(0, Qt.UserRole, {"type": "column", "column": col, "data": data})
@@ -314,7 +336,7 @@ class ProjectExplorer(QWidget):
         stats_item.setText(1, "기본 통계량")
         
         # 숫자형 컬럼 통계
-        numeric_cols = data.select_dtypes(include=['number']).columns
+        numeric_cols = cache.numeric_columns
         if len(numeric_cols) > 0:
             numeric_item = QTreeWidgetItem(stats_item)
             numeric_item.setText(0, "숫자형 변수")
@@ -323,12 +345,13 @@ class ProjectExplorer(QWidget):
             for col in numeric_cols[:5]:  # 최대 5개만 표시
                 stat_item = QTreeWidgetItem(numeric_item)
                 stat_item.setText(0, col)
-                mean_val = data[col].mean()
-                std_val = data[col].std()
+                col_stats = cache.column_stats(col)
+                mean_val = col_stats["mean"]
+                std_val = col_stats["std"]
                 stat_item.setText(1, f"μ={mean_val:.2f}, σ={std_val:.2f}")
         
         # 범주형 컬럼 통계
-        categorical_cols = data.select_dtypes(include=['object', 'category']).columns
+        categorical_cols = cache.categorical_columns
         if len(categorical_cols) > 0:
             categorical_item = QTreeWidgetItem(stats_item)
             categorical_item.setText(0, "범주형 변수")
@@ -337,13 +360,20 @@ class ProjectExplorer(QWidget):
             for col in categorical_cols[:5]:  # 최대 5개만 표시
                 cat_item = QTreeWidgetItem(categorical_item)
                 cat_item.setText(0, col)
-                unique_count = data[col].nunique()
-                most_common = data[col].mode().iloc[0] if len(data[col].mode()) > 0 else "N/A"
+                cat_summary = cache.categorical_summary(col)
+                unique_count = cat_summary["unique"]
+                most_common = cat_summary["mode"]
                 cat_item.setText(1, f"고유값: {unique_count}, 최빈값: {most_common}")
         
         # 트리 확장
         self.data_tree.expandAll()
     
+    def _cache_for(self, data):
+        """현재 데이터의 통계 캐시 (다른 데이터면 새로 계산)"""
+        if self.stats_cache is not None and data is self.current_data:
+            return self.stats_cache
+        return DatasetStatsCache(data)
+    
     def add_analysis_result(self, analysis_type, result, status="완료"):
         """분석 결과 추가"""
         item = QTreeWidgetItem(self.analysis_tree)
@@ -461,6 +491,16 @@ class ProjectExplorer(QWidget):
         col_data = data[col_name]
         summary = f"📋 {col_name} 컬럼 정보\n"
         
+        cache = self.stats_cache if data is self.current_data else None
+        if cache is not None and col_name in cache.numeric_columns:
+            col_stats = cache.column_stats(col_name)
+            summary += f"• 타입: 숫자형\n"
+            summary += f"• 평균: {col_stats['mean']:.3f}\n"
+            summary += f"• 표준편차: {col_stats['std']:.3f}\n"
+            summary += f"• 최솟값: {col_stats['min']:.3f}\n"
+            summary += f"• 최댓값: {col_stats['max']:.3f}\n"
+            summary += f"• 결측값: {col_stats['missing']}개"
+            return summary
         if pd.api.types.is_numeric_dtype(col_data):
             summary += f"• 타입: 숫자형\n"
             summary += f"• 평균: {col_data.mean():.3f}\n"
@@ -626,6 +666,8 @@ class ProjectExplorer(QWidget):
     def clear_project(self):
         """프로젝트 초기화"""
         self.current_data = None
+        self.stats_cache = None
+        self._stats_cache_token = None
         self.analysis_history.clear()
         self.chart_history.clear()
         
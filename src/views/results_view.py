@@ -9,24 +9,42 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QSplitter,
     QPushButton, QFrame, QGridLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QPixmap, QPainter
+from collections.abc import Mapping
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import queue
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from utils.stats_cache import DatasetStatsCache
+from utils.normality import NormalityTestService
+
 class ResultsView(QWidget):
     """분석 결과 종합 뷰"""
     
+    # 작업자 스레드의 열별 정규성 검정 결과 도착 알림 (결과는 큐로 전달)
+    normality_result_ready = Signal()
+    
     def __init__(self):
         super().__init__()
         
         self.current_data = None
+        self.stats_cache = None
         self.analysis_results = {}
         
+        # 정규성 검정: 작업자 풀 + 열 버전별 결과 캐시
+        self.normality_service = NormalityTestService()
+        self._normality_generation = 0
+        self._normality_columns = []
+        self._normality_results = {}
+        self._normality_render_pending = False
+        self._normality_queue = queue.SimpleQueue()
+        self.normality_result_ready.connect(self._on_normality_result)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -161,10 +179,16 @@ class ResultsView(QWidget):
         
         layout.addWidget(suggestions_group)
     
-    def set_data(self, data):
-        """데이터 설정 및 기초 분석 수행"""
+    def set_data(self, data, stats_cache=None):
+        """
+        데이터 설정 및 기초 분석 수행
+
+        stats_cache: DataTableView 가 증분 갱신하는 DatasetStatsCache.
+        없으면 data 로 새로 계산한다.
+        """
         self.current_data = data
         if data is not None:
+            self.stats_cache = stats_cache if stats_cache is not None else DatasetStatsCache(data)
             self.update_summary()
             self.perform_basic_analysis()
             self.generate_interpretation()
@@ -176,7 +200,7 @@ class ResultsView(QWidget):
         
         data = self.current_data
         summary_text = f"📊 데이터: {data.shape[0]}행 × {data.shape[1]}열 | "
-        summary_text += f"숫자형: {len(data.select_dtypes(include=['number']).columns)}개 | "
+        summary_text += f"숫자형: {len(self.stats_cache.numeric_columns)}개 | "
         summary_text += f"범주형: {len(data.select_dtypes(include=['object', 'category']).columns)}개"
         
         self.data_summary_label.setText(summary_text)
@@ -189,7 +213,8 @@ class ResultsView(QWidget):
             return
         
         # 숫자형 데이터만 선택
-        numeric_data = self.current_data.select_dtypes(include=['number'])
+        numeric_columns = self.stats_cache.numeric_columns
+        numeric_data = self.current_data[numeric_columns]
         
         if numeric_data.empty:
             self.stats_table.setRowCount(1)
@@ -197,8 +222,8 @@ class ResultsView(QWidget):
             self.stats_table.setItem(0, 0, QTableWidgetItem("숫자형 데이터가 없습니다"))
             return
         
-        # 기술통계량 계산
-        desc_stats = numeric_data.describe()
+        # 기술통계량 (캐시된 모멘트 + 열 버전별 분위수)
+        desc_stats = self.stats_cache.describe(numeric_columns)
         
         # 테이블 설정
         self.stats_table.setRowCount(len(desc_stats.index))
@@ -222,14 +247,21 @@ class ResultsView(QWidget):
         """분포 특성 분석"""
         distribution_text = "📈 변수별 분포 특성:\n\n"
         
+        cache = self.stats_cache
         for col in numeric_data.columns:
-            data_col = numeric_data[col].dropna()
-            
             # 기본 통계
-            mean_val = data_col.mean()
-            median_val = data_col.median()
-            std_val = data_col.std()
-            skew_val = data_col.skew()
+            if cache is not None and col in cache.numeric_columns:
+                col_stats = cache.column_stats(col)
+                mean_val = col_stats["mean"]
+                median_val = cache.quantiles(col, (0.5,))[0]
+                std_val = col_stats["std"]
+                skew_val = col_stats["skew"]
+            else:
+                data_col = numeric_data[col].dropna()
+                mean_val = data_col.mean()
+                median_val = data_col.median()
+                std_val = data_col.std()
+                skew_val = data_col.skew()
             
             distribution_text += f"🔹 {col}:\n"
             distribution_text += f"  • 평균: {mean_val:.3f}\n"
@@ -250,42 +282,83 @@ class ResultsView(QWidget):
         self.distribution_info.setText(distribution_text)
     
     def test_normality(self, numeric_data):
-        """정규성 검정"""
-        normality_text = "🔍 정규성 검정 결과:\n\n"
-        
+        """
+        정규성 검정 (작업자 풀에서 열별로 실행, 끝나는 대로 표시)
+
+        표본 크기에 따라 Shapiro-Wilk / Anderson-Darling / D'Agostino-Pearson 을 선택하며
+        값이 바뀌지 않은 열은 캐시된 결과를 그대로 사용한다.
+        """
         try:
-            from scipy import stats
-            
-            for col in numeric_data.columns:
-                data_col = numeric_data[col].dropna()
-                
-                if len(data_col) < 3:
-                    normality_text += f"🔹 {col}: 데이터 부족\n"
-                    continue
-                
-                # Shapiro-Wilk 검정
-                if len(data_col) <= 5000:  # 샘플 크기 제한
-                    stat, p_value = stats.shapiro(data_col)
-                    test_name = "Shapiro-Wilk"
-                else:
-                    # 큰 샘플의 경우 Kolmogorov-Smirnov 검정
-                    stat, p_value = stats.kstest(data_col, 'norm')
-                    test_name = "Kolmogorov-Smirnov"
-                
-                normality_text += f"🔹 {col} ({test_name}):\n"
-                normality_text += f"  • 검정통계량: {stat:.4f}\n"
-                normality_text += f"  • p-값: {p_value:.4f}\n"
-                
-                if p_value > 0.05:
-                    normality_text += "  • 결론: 정규분포를 따름 (α=0.05)\n"
-                else:
-                    normality_text += "  • 결론: 정규분포를 따르지 않음 (α=0.05)\n"
-                
-                normality_text += "\n"
-                
+            import scipy  # noqa: F401
         except ImportError:
+            normality_text = "🔍 정규성 검정 결과:\n\n"
             normality_text += "정규성 검정을 위해 scipy 패키지가 필요합니다.\n"
             normality_text += "pip install scipy 명령으로 설치해주세요."
+            self.normality_results.setText(normality_text)
+            return
+        
+        self._normality_generation += 1
+        generation = self._normality_generation
+        self._normality_columns = list(numeric_data.columns)
+        self._normality_results = {}
+        
+        cache = self.stats_cache
+        columns = {}
+        for col in numeric_data.columns:
+            key = cache.column_key(col) if cache is not None and col in cache.numeric_columns else None
+            columns[col] = (key, lambda c=col: numeric_data[c].to_numpy(dtype=float, na_value=np.nan))
+        
+        self._render_normality()
+        self.normality_service.submit(columns, lambda col, result: self._post_normality_result(generation, col, result))
+    
+    def _post_normality_result(self, generation, column, result):
+        """작업자 스레드에서 호출: 결과를 큐에 넣고 GUI 스레드에 알림"""
+        self._normality_queue.put((generation, column, result))
+        self.normality_result_ready.emit()
+    
+    def _on_normality_result(self):
+        """열별 검정 결과 수신 (이전 요청 결과는 무시)"""
+        received = False
+        while True:
+            try:
+                generation, column, result = self._normality_queue.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._normality_generation:
+                self._normality_results[column] = result
+                received = True
+        # 결과가 몰려 들어올 때 화면 갱신을 한 번으로 묶음
+        if received and not self._normality_render_pending:
+            self._normality_render_pending = True
+            QTimer.singleShot(50, self._render_normality)
+    
+    def _render_normality(self):
+        """수신된 정규성 검정 결과를 열 순서대로 표시"""
+        self._normality_render_pending = False
+        normality_text = "🔍 정규성 검정 결과:\n\n"
+        
+        for col in self._normality_columns:
+            result = self._normality_results.get(col)
+            if result is None:
+                normality_text += f"🔹 {col}: 검정 중...\n\n"
+                continue
+            if result.get("error"):
+                normality_text += f"🔹 {col}: 검정 실패 ({result['error']})\n\n"
+                continue
+            if result["test"] is None:
+                normality_text += f"🔹 {col}: 데이터 부족\n"
+                continue
+            
+            normality_text += f"🔹 {col} ({result['test_name']}, n={result['n']}):\n"
+            normality_text += f"  • 검정통계량: {result['statistic']:.4f}\n"
+            normality_text += f"  • p-값: {result['p_value']:.4f}\n"
+            
+            if result["normal"]:
+                normality_text += "  • 결론: 정규분포를 따름 (α=0.05)\n"
+            else:
+                normality_text += "  • 결론: 정규분포를 따르지 않음 (α=0.05)\n"
+            
+            normality_text += "\n"
         
         self.normality_results.setText(normality_text)
     
@@ -460,16 +533,23 @@ class ResultsView(QWidget):
 
         # 표 형태로 보여줄 수 있는 결과 (예: ANOVA 테이블)
         anova_df = None
-        if isinstance(result, dict):
+        if isinstance(result, Mapping):
             anova_df = result.get("results", {}).get("anova")
         if anova_df is not None:
             layout.addWidget(self._create_table_widget(anova_df))
+        effects_df = result.get("results", {}).get("effects") if isinstance(result, Mapping) else None
+        if isinstance(effects_df, pd.DataFrame):
+            # 2수준 효과: 파레토 순서로 주요 열만
+            columns = [c for c in ("term", "effect", "coefficient", "contribution", "t_lenth", "p_lenth",
+                                   "p_value", "aliases") if c in effects_df.columns]
+            layout.addWidget(self._create_table_widget(
+                effects_df.sort_values("pareto_rank")[columns].head(100).set_index("term")))
         
         return group_box
 
     def _format_result_summary(self, analysis_type, result):
         """결과 요약을 보기 좋게 문자열로 구성"""
-        if not isinstance(result, dict):
+        if not isinstance(result, Mapping):
             return str(result)
 
         lines = []
@@ -497,6 +577,41 @@ class ResultsView(QWidget):
             for key in ("independent_var", "dependent_var", "variable_count", "observation_count"):
                 if key in details:
                     lines.append(f"{key}: {details[key]}")
+        elif analysis_type == "2수준 효과 분석":
+            lines.append(f"반응 변수: {details.get('response', 'N/A')}")
+            lines.append(f"처리 조합 {details.get('runs')}개 × 반복 {details.get('replicates')}, "
+                         f"관측치 {details.get('n_obs')}")
+            generators = details.get("generators") or []
+            if generators:
+                lines.append(f"생성 열: {', '.join(generators)} (해상도 {details.get('resolution')})")
+            lines.append(f"전체 평균: {details.get('mean', 0):.4g}")
+            if details.get("pse") is not None:
+                lines.append(f"Lenth PSE = {details.get('pse'):.4g}, ME = {details.get('margin_of_error'):.4g}, "
+                             f"SME = {details.get('simultaneous_margin'):.4g}")
+            active = details.get("active") or []
+            lines.append(f"유의 효과: {', '.join(active) if active else '없음'}")
+        elif analysis_type == "만족도 최적화":
+            lines.append(f"종합 만족도 D: {details.get('overall_desirability', 0):.4f}")
+            point = details.get("best_point") or {}
+            lines.append("최적 조건: " + ", ".join(f"{k}={v:.4g}" for k, v in point.items()))
+            predictions = details.get("predictions") or {}
+            desirabilities = details.get("desirabilities") or {}
+            for response, value in predictions.items():
+                lines.append(f"  {response}: 예측 {value:.4g}, d = {desirabilities.get(response, 0):.3f}")
+            lines.append(f"후보점 {details.get('n_candidates')}개 ({details.get('method')}), "
+                         f"국소 최적화 시작점 {details.get('n_starts')}개")
+
+        canonical = details.get("canonical_analysis") if isinstance(details, Mapping) else None
+        if isinstance(canonical, Mapping):
+            # RSM 정준분석: 정상점 종류/위치/예측값
+            lines.append(f"정상점 종류: {canonical.get('nature')}" + (" (능선)" if canonical.get("ridge") else ""))
+            point = canonical.get("stationary_point")
+            if point:
+                lines.append("정상점: " + ", ".join(f"{k}={v:.4g}" for k, v in point.items())
+                             + ("" if canonical.get("within_region") else " (실험 영역 밖)"))
+                lines.append(f"정상점 예측값: {canonical.get('stationary_response'):.4g}")
+            eigenvalues = canonical.get("eigenvalues") or []
+            lines.append("고유값: " + ", ".join(f"{v:.4g}" for v in eigenvalues))
 
         # fallback: 다른 키도 간략히 추가 (원본 데이터 제외)
         for key, value in result.items():
@@ -584,7 +699,7 @@ class ResultsView(QWidget):
 
         # 상태 라벨 업데이트
         status = "완료"
-        if isinstance(result, dict):
+        if isinstance(result, Mapping):
             status = result.get("status", status)
         self.analysis_status_label.setText(f"{analysis_type} - {status}")
         self.analysis_status_label.setStyleSheet("font-size: 12px; color: green; padding: 10px;")
@@ -610,6 +725,12 @@ class ResultsView(QWidget):
     def clear_results(self):
         """결과 초기화"""
         self.current_data = None
+        self.stats_cache = None
+        # 진행 중인 정규성 검정 결과는 더 이상 표시하지 않음
+        self._normality_generation += 1
+        self.normality_service.cancel()
+        self._normality_columns = []
+        self._normality_results = {}
         self.analysis_results.clear()
         
         # UI 초기화
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Request
 
-from webapp.api.schemas import ApiResponse, DoeAnovaRequest, MainEffectsAnovaRequest, RsmQuadraticRequest
+from core.registry import web_analyses
+from models.analysis_result import AnalysisResult
+from utils.compact_array import CompactArray
+from webapp.api.schemas import ApiResponse
 from webapp.serialization import to_jsonable
 from webapp.services.analysis_runner import AnalysisError, AnalysisRunner
 
@@ -14,6 +18,18 @@ def _store(request):
     return request.app.state.project_store
 
 
+def _summary(result):
+    if isinstance(result, AnalysisResult):
+        return result.summary()
+    # 구버전(dict) 결과: 봉투 텍스트만
+    return {k: result.get(k) for k in ("type", "timestamp", "status", "description") if k in result}
+
+
+def _array_ref(request: Request, project_id: str, index: int) -> str:
+    """히스토리 항목의 배열 엔드포인트 경로 (응답의 배열 자리표시에 ref 로 붙임)"""
+    return f"{request.url_for('analysis_history_item', project_id=project_id, index=str(index)).path}/arrays"
+
+
 def _get_df(project_id: str, request):
     project = _store(request).get(project_id)
     if not project or project.dataframe is None or project.dataframe.empty:
@@ -21,96 +37,87 @@ def _get_df(project_id: str, request):
     return project, project.dataframe
 
 
-@router.post("/projects/{project_id}/basic_statistics", response_model=ApiResponse)
-def basic_statistics(project_id: str, request: Request):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().basic_statistics(df)
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
-
-
-@router.post("/projects/{project_id}/correlation", response_model=ApiResponse)
-def correlation(project_id: str, request: Request):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().correlation(df)
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
-
-
-@router.post("/projects/{project_id}/anova", response_model=ApiResponse)
-def anova(project_id: str, request: Request):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().anova(df)
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
-
-
-@router.post("/projects/{project_id}/regression", response_model=ApiResponse)
-def regression(project_id: str, request: Request):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().regression(df)
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
-
-
-@router.post("/projects/{project_id}/doe_anova", response_model=ApiResponse)
-def doe_anova(project_id: str, request: Request, body: DoeAnovaRequest):
+def _run(spec, project_id: str, request: Request, params: dict):
     project, df = _get_df(project_id, request)
     try:
-        res = AnalysisRunner().doe_anova(df, response=body.response, factors=body.factors)
+        res = AnalysisRunner().run(spec.analysis_id, df, **params)
     except AnalysisError as e:
         raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
     project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
+    index = len(project.analysis_history) - 1
+    return ApiResponse(ok=True, data=to_jsonable(res, array_ref=_array_ref(request, project_id, index)))
+
+
+def _make_endpoint(spec):
+    """레지스트리 항목의 POST 엔드포인트 (본문 타입은 선언된 스키마)"""
+    schema = spec.load_schema()
+    if schema is None:
+        def endpoint(project_id: str, request: Request):
+            return _run(spec, project_id, request, {})
+    else:
+        def endpoint(project_id: str, request: Request, body):
+            return _run(spec, project_id, request, body.model_dump())
+
+        endpoint.__annotations__ = {"project_id": str, "request": Request, "body": schema}
+    endpoint.__name__ = spec.analysis_id
+    endpoint.__doc__ = f"{spec.title} (비용 등급: {spec.cost})"
+    return endpoint
+
+
+for _spec in web_analyses():
+    router.add_api_route(
+        f"/projects/{{project_id}}/{_spec.analysis_id}",
+        _make_endpoint(_spec),
+        methods=["POST"],
+        response_model=ApiResponse,
+        name=_spec.analysis_id,
+    )
+
+
+@router.get("/registry", response_model=ApiResponse)
+def analysis_registry():
+    """웹에서 실행 가능한 분석 목록과 입력 스키마"""
+    items = []
+    for spec in web_analyses():
+        schema = spec.load_schema()
+        items.append({
+            "id": spec.analysis_id,
+            "title": spec.title,
+            "cost": spec.cost,
+            "schema": schema.model_json_schema() if schema is not None else None,
+        })
+    return ApiResponse(ok=True, data=items)
 
 
-@router.post("/projects/{project_id}/main_effects_anova", response_model=ApiResponse)
-def main_effects_anova(project_id: str, request: Request, body: MainEffectsAnovaRequest):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().main_effects_anova(
-            df,
-            response=body.response,
-            factors=body.factors,
-            analysis_type=body.analysis_type,
-        )
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
+@router.get("/projects/{project_id}/history", response_model=ApiResponse)
+def analysis_history(project_id: str, request: Request):
+    project = _store(request).get(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+    # 목록은 요약(가벼운 필드)만 - 표/배열은 /history/{index} 로 요청
+    return ApiResponse(ok=True, data=[to_jsonable(_summary(r)) for r in project.analysis_history])
 
 
-@router.post("/projects/{project_id}/rsm_quadratic", response_model=ApiResponse)
-def rsm_quadratic(project_id: str, request: Request, body: RsmQuadraticRequest):
-    project, df = _get_df(project_id, request)
-    try:
-        res = AnalysisRunner().rsm_quadratic(
-            df,
-            response=body.response,
-            factors=body.factors,
-            analysis_type=body.analysis_type,
-        )
-    except AnalysisError as e:
-        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
-    project.add_analysis(res)
-    return ApiResponse(ok=True, data=to_jsonable(res))
+@router.get("/projects/{project_id}/history/{index}", response_model=ApiResponse)
+def analysis_history_item(project_id: str, index: int, request: Request):
+    project = _store(request).get(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+    if not 0 <= index < len(project.analysis_history):
+        raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
+    return ApiResponse(ok=True, data=to_jsonable(project.analysis_history[index],
+                                                 array_ref=_array_ref(request, project_id, index)))
 
 
-@router.get("/projects/{project_id}/history", response_model=ApiResponse)
-def analysis_history(project_id: str, request: Request):
+@router.get("/projects/{project_id}/history/{index}/arrays/{key}", response_model=ApiResponse)
+def analysis_array(project_id: str, index: int, key: str, request: Request):
+    """분석 결과의 관측치별 배열(residuals, fitted, leverage 등)을 요청 시에만 디코딩해 반환"""
     project = _store(request).get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    return ApiResponse(ok=True, data=to_jsonable(project.analysis_history))
+    if not 0 <= index < len(project.analysis_history):
+        raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
+    value = (project.analysis_history[index].get("results") or {}).get(key)
+    if not isinstance(value, (CompactArray, np.ndarray, list)):
+        raise HTTPException(status_code=404, detail=f"배열 '{key}'을(를) 찾을 수 없습니다")
+    return ApiResponse(ok=True, data={"key": key, "values": to_jsonable(np.asarray(value, dtype=float))})
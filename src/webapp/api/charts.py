@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
 
-from webapp.api.schemas import ApiResponse, CreateChartRequest
+from webapp.api.schemas import ApiResponse, CreateChartRequest, CreateChartsRequest
 from webapp.serialization import to_jsonable
-from webapp.services.chart_service import ChartError, ChartService
+from webapp.services.chart_service import ChartError
 
 
 router = APIRouter(prefix="/charts")
@@ -14,13 +14,22 @@ def _store(request):
     return request.app.state.project_store
 
 
-@router.post("/projects/{project_id}", response_model=ApiResponse)
-def create_chart(project_id: str, request: Request, body: CreateChartRequest):
+def _renderer(request):
+    return request.app.state.chart_service
+
+
+def _project_with_data(request, project_id: str):
     project = _store(request).get(project_id)
     if not project or project.dataframe is None or project.dataframe.empty:
         raise HTTPException(status_code=400, detail="데이터가 없습니다")
+    return project
+
+
+@router.post("/projects/{project_id}", response_model=ApiResponse)
+def create_chart(project_id: str, request: Request, body: CreateChartRequest):
+    project = _project_with_data(request, project_id)
     try:
-        chart_info = ChartService().create_chart_base64(
+        chart_info = _renderer(request).create_chart_base64(
             chart_type=body.chart_type,
             df=project.dataframe,
             x_var=body.x_var,
@@ -34,6 +43,21 @@ def create_chart(project_id: str, request: Request, body: CreateChartRequest):
     return ApiResponse(ok=True, data=to_jsonable(chart_info))
 
 
+@router.post("/projects/{project_id}/batch", response_model=ApiResponse)
+def create_charts(project_id: str, request: Request, body: CreateChartsRequest):
+    """여러 차트를 한 요청으로 렌더링 (하나라도 실패하면 히스토리에 추가하지 않음)"""
+    project = _project_with_data(request, project_id)
+    try:
+        chart_infos = _renderer(request).create_charts_base64(
+            project.dataframe, [chart.model_dump() for chart in body.charts]
+        )
+    except ChartError as e:
+        raise HTTPException(status_code=400, detail={"title": e.title, "message": e.message})
+    for chart_info in chart_infos:
+        project.add_chart(chart_info)
+    return ApiResponse(ok=True, data=to_jsonable(chart_infos))
+
+
 @router.get("/projects/{project_id}/history", response_model=ApiResponse)
 def chart_history(project_id: str, request: Request):
     project = _store(request).get(project_id)
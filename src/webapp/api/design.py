@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from webapp.api.schemas import (
     ApiResponse,
@@ -8,8 +9,14 @@ from webapp.api.schemas import (
     DesignCCDRequest,
     DesignFractionalFactorialRequest,
     DesignFullFactorialRequest,
+    DesignMinAberrationRequest,
+    DesignMixtureRequest,
+    DesignMixtureStreamRequest,
+    DesignOptimalRequest,
     DesignOrthogonalArrayRequest,
     DesignPBRequest,
+    DesignSpaceFillingRequest,
+    DesignSplitPlotRequest,
 )
 from webapp.serialization import to_jsonable
 from webapp.services.design_service import DesignService
@@ -32,10 +39,24 @@ def full_factorial(req: DesignFullFactorialRequest):
 def fractional_factorial(req: DesignFractionalFactorialRequest):
     svc = DesignService()
     try:
-        df = svc.fractional_factorial(req.design_str)
+        df, aliasing = svc.fractional_factorial(req.design_str, alias_order=req.alias_order)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return ApiResponse(ok=True, data=to_jsonable(df))
+    if not req.include_aliasing:
+        return ApiResponse(ok=True, data=to_jsonable(df))
+    return ApiResponse(ok=True, data=to_jsonable({"design": df, "aliasing": aliasing}))
+
+
+@router.post("/min_aberration", response_model=ApiResponse)
+def min_aberration(req: DesignMinAberrationRequest):
+    svc = DesignService()
+    try:
+        df, info = svc.min_aberration(req.factors, req.runs, min_resolution=req.min_resolution,
+                                      alias_order=req.alias_order, time_budget=req.time_budget,
+                                      max_workers=req.max_workers)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ApiResponse(ok=True, data=to_jsonable({"design": df, **info}))
 
 
 @router.post("/plackett_burman", response_model=ApiResponse)
@@ -69,6 +90,11 @@ def ccd(req: DesignCCDRequest):
     return ApiResponse(ok=True, data=to_jsonable(df))
 
 
+@router.get("/orthogonal_arrays", response_model=ApiResponse)
+def orthogonal_arrays():
+    return ApiResponse(ok=True, data=to_jsonable(DesignService().orthogonal_arrays()))
+
+
 @router.post("/orthogonal_array", response_model=ApiResponse)
 def orthogonal_array(req: DesignOrthogonalArrayRequest):
     svc = DesignService()
@@ -77,3 +103,63 @@ def orthogonal_array(req: DesignOrthogonalArrayRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     return ApiResponse(ok=True, data=to_jsonable(df))
+
+
+@router.post("/optimal", response_model=ApiResponse)
+def optimal(req: DesignOptimalRequest):
+    svc = DesignService()
+    options = req.model_dump(exclude={"factors", "runs"})
+    try:
+        df = svc.optimal(req.factors, req.runs, **options)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ApiResponse(ok=True, data=to_jsonable({"design": df, **df.attrs["optimal_design"]}))
+
+
+@router.post("/space_filling", response_model=ApiResponse)
+def space_filling(req: DesignSpaceFillingRequest):
+    svc = DesignService()
+    options = req.model_dump(exclude={"factors", "runs"})
+    try:
+        df = svc.space_filling(req.factors, req.runs, **options)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ApiResponse(ok=True, data=to_jsonable({"design": df, **df.attrs["space_filling"]}))
+
+
+@router.post("/split_plot", response_model=ApiResponse)
+def split_plot(req: DesignSplitPlotRequest):
+    svc = DesignService()
+    try:
+        df = svc.split_plot(req.whole_levels, req.subplot_levels,
+                            **req.model_dump(exclude={"whole_levels", "subplot_levels"}))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ApiResponse(ok=True, data=to_jsonable(df))
+
+
+@router.post("/mixture", response_model=ApiResponse)
+def mixture(req: DesignMixtureRequest):
+    svc = DesignService()
+    try:
+        df = svc.mixture(req.components, **req.model_dump(exclude={"components"}))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ApiResponse(ok=True, data=to_jsonable(df))
+
+
+@router.post("/mixture/stream")
+def mixture_stream(req: DesignMixtureStreamRequest):
+    """매우 큰 후보 집합을 CSV 로 스트리밍 (입력 오류는 첫 청크 전에 400)"""
+    svc = DesignService()
+    chunks = svc.mixture_csv_chunks(req.components, **req.model_dump(exclude={"components"}))
+    try:
+        first = next(chunks, "")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def body():
+        yield first
+        yield from chunks
+
+    return StreamingResponse(body(), media_type="text/csv")
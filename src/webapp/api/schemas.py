@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,6 +21,17 @@ class DesignFullFactorialRequest(BaseModel):
 
 class DesignFractionalFactorialRequest(BaseModel):
     design_str: str
+    alias_order: Optional[int] = Field(default=None, ge=1, description="별칭 사슬에 포함할 최대 효과 차수 (None: 전체)")
+    include_aliasing: bool = Field(default=False, description="True 면 {design, aliasing}, False 면 설계 행 목록")
+
+
+class DesignMinAberrationRequest(BaseModel):
+    factors: int = Field(ge=2, le=27, description="기본 요인 7개 + 생성 열 20개까지")
+    runs: int = Field(ge=4, le=128, description="런 예산 (2^m ≤ runs 인 최대 m 사용)")
+    min_resolution: int = Field(default=3, ge=3, le=5)
+    alias_order: Optional[int] = Field(default=2, ge=1)
+    time_budget: float = Field(default=10.0, gt=0, le=60, description="탐색 시간 상한 (초, 넘기면 근사 결과)")
+    max_workers: int = Field(default=1, ge=1, le=32, description="탐색 프로세스 수 (1 이면 직렬)")
 
 
 class DesignPBRequest(BaseModel):
@@ -40,18 +51,123 @@ class DesignCCDRequest(BaseModel):
 
 class DesignOrthogonalArrayRequest(BaseModel):
     factors: int
-    design: str = "L8"
+    design: str = Field(default="L8", description='카탈로그 이름 (예: "L8", "L16(4^5)", "L36(2^11 3^12)")')
+
+
+class DesignSplitPlotRequest(BaseModel):
+    whole_levels: List[int] = Field(min_length=1, description="전구 요인별 수준 수")
+    subplot_levels: List[int] = Field(min_length=1, description="세구 요인별 수준 수")
+    replicates: int = Field(default=1, ge=1, le=100)
+    randomize_whole: bool = True
+    randomize_subplot: bool = True
+    seed: Optional[int] = None
+    seed_per_block: bool = True
+
+
+class DesignMixtureRequest(BaseModel):
+    components: int = Field(ge=2, le=30)
+    kind: Literal["lattice", "centroid", "extreme_vertices"] = "lattice"
+    degree: int = Field(default=3, ge=1, le=100, description="격자 차수 m (비율 간격 1/m)")
+    lower: Optional[List[float]] = Field(default=None, description="성분별 비율 하한")
+    upper: Optional[List[float]] = Field(default=None, description="성분별 비율 상한")
+    component_names: Optional[List[str]] = None
+    edge_centroids: bool = False
+    overall_centroid: bool = True
+
+
+class DesignMixtureStreamRequest(BaseModel):
+    components: int = Field(ge=2, le=30)
+    kind: Literal["lattice", "extreme_vertices"] = "lattice"
+    degree: int = Field(default=3, ge=1, le=100)
+    lower: Optional[List[float]] = None
+    upper: Optional[List[float]] = None
+    component_names: Optional[List[str]] = None
+    chunk_size: int = Field(default=100_000, ge=1, le=1_000_000)
+
+
+class LinearConstraint(BaseModel):
+    coefficients: Dict[str, float] = Field(description="요인 이름 → 계수 (원 단위)")
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+
+class DesignOptimalRequest(BaseModel):
+    factors: int = Field(ge=1, le=10)
+    runs: int = Field(ge=2, le=200)
+    model: Literal["linear", "interaction", "quadratic"] = "quadratic"
+    criterion: Literal["D", "I"] = "D"
+    factor_names: Optional[List[str]] = None
+    bounds: Optional[List[List[float]]] = Field(default=None, description="요인별 [하한, 상한] (기본 [-1, 1])")
+    levels: Optional[int] = Field(default=None, ge=2, le=21, description="후보 격자 수준 수")
+    constraints: Optional[List[LinearConstraint]] = None
+    fixed_runs: Optional[List[List[float]]] = Field(default=None, description="반드시 포함할 런 (원 단위)")
+    n_starts: int = Field(default=10, ge=1, le=50)
+    seed: int = 0
+    time_budget: float = Field(default=30.0, gt=0, le=60, description="모든 시작점을 합친 시간 상한 (초)")
+
+
+class DesignSpaceFillingRequest(BaseModel):
+    factors: int = Field(ge=1, le=100)
+    runs: int = Field(ge=2, le=20000, description="maximin_lhs 는 4000 이하")
+    kind: Literal["lhs", "maximin_lhs", "sobol", "halton"] = "maximin_lhs"
+    factor_names: Optional[List[str]] = None
+    bounds: Optional[List[List[float]]] = Field(default=None, description="요인별 [하한, 상한] (기본 [0, 1])")
+    seed: Optional[int] = 0
+    restarts: int = Field(default=4, ge=1, le=16, description="maximin 무작위 재시작 수")
+    iterations: Optional[int] = Field(default=None, ge=1, description="재시작마다 교환 제안 수")
+    time_budget: float = Field(default=30.0, gt=0, le=120, description="재시작 전체 최대 초")
 
 
 class DoeAnovaRequest(BaseModel):
     response: str
     factors: List[str]
+    bootstrap_samples: int = Field(default=0, ge=0, le=100_000, description="0 이면 부트스트랩 생략")
+    bootstrap_method: str = "residual"
+    bootstrap_seed: int = 0
+    max_workers: int = Field(default=1, ge=1, le=32, description="부트스트랩 스레드 수")
 
 
 class MainEffectsAnovaRequest(BaseModel):
     response: str
     factors: List[str]
     analysis_type: str = "부분요인 ANOVA"
+    bootstrap_samples: int = Field(default=0, ge=0, le=100_000, description="0 이면 부트스트랩 생략")
+    bootstrap_method: str = "residual"
+    bootstrap_seed: int = 0
+    max_workers: int = Field(default=1, ge=1, le=32, description="부트스트랩 스레드 수")
+
+
+class PermutationAnovaRequest(BaseModel):
+    response: Optional[str] = None
+    factors: List[str] = Field(default_factory=list)
+    interactions: bool = False
+    n_permutations: int = Field(default=4999, ge=1, le=1_000_000)
+    seed: int = 0
+
+
+class StepwiseRegressionRequest(BaseModel):
+    response: str
+    predictors: List[str] = Field(default_factory=list)
+    direction: Literal["stepwise", "forward", "backward"] = "stepwise"
+    criterion: Literal["aic", "bic", "pvalue"] = "aic"
+    alpha_enter: float = Field(default=0.15, gt=0, lt=1)
+    alpha_remove: float = Field(default=0.15, gt=0, lt=1)
+
+
+class BestSubsetsRequest(BaseModel):
+    response: str
+    factors: List[str] = Field(default_factory=list)
+    max_size: Optional[int] = Field(default=None, ge=1)
+    top: int = Field(default=5, ge=1, le=50)
+    criterion: Literal["adj_r2", "cp", "bic"] = "adj_r2"
+    time_budget: float = Field(default=10.0, gt=0, le=300)
+    max_workers: int = Field(default=1, ge=1, le=32, description="최상위 가지를 나누어 탐색할 프로세스 수")
+
+
+class FactorialEffectsRequest(BaseModel):
+    response: str
+    factors: List[str] = Field(default_factory=list, description="2수준 요인 (비우면 값이 2개인 열 전체)")
+    alpha: float = Field(default=0.05, gt=0, lt=1)
 
 
 class RsmQuadraticRequest(BaseModel):
@@ -60,9 +176,42 @@ class RsmQuadraticRequest(BaseModel):
     analysis_type: str = "RSM"
 
 
+class RsmSurfaceRequest(BaseModel):
+    response: str
+    factors: List[str] = Field(min_length=2)
+    x_factor: Optional[str] = None
+    y_factor: Optional[str] = None
+    resolution: int = Field(default=100, ge=2, le=1000)
+    fixed: Optional[Dict[str, float]] = Field(default=None, description="격자 밖 요인의 고정값 (기본: 중심)")
+
+
+class DesirabilityGoal(BaseModel):
+    response: str
+    goal: Literal["maximize", "minimize", "target"] = "maximize"
+    lower: Optional[float] = Field(default=None, description="하한 (기본: 관측 최소)")
+    upper: Optional[float] = Field(default=None, description="상한 (기본: 관측 최대)")
+    target: Optional[float] = Field(default=None, description="목표값 (goal=target, 기본: 중간값)")
+    weight: float = Field(default=1.0, gt=0)
+    weight_upper: Optional[float] = Field(default=None, gt=0, description="목표값 위쪽 가중치 (기본: weight)")
+    importance: float = Field(default=1.0, gt=0)
+
+
+class DesirabilityRequest(BaseModel):
+    goals: List[DesirabilityGoal] = Field(min_length=1)
+    factors: List[str] = Field(min_length=1)
+    method: Literal["lhs", "grid"] = "lhs"
+    n_candidates: int = Field(default=5000, ge=1, le=200_000)
+    n_starts: int = Field(default=10, ge=1, le=100)
+    seed: int = 0
+
+
 class CreateChartRequest(BaseModel):
     chart_type: str
     x_var: Optional[str] = None
     y_var: Optional[str] = None
     group_var: Optional[str] = None
     options: Optional[Dict[str, Any]] = None
+
+
+class CreateChartsRequest(BaseModel):
+    charts: List[CreateChartRequest] = Field(min_length=1, max_length=20)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -17,15 +18,17 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 # 웹/테스트 환경에서는 GUI 백엔드 대신 Agg를 사용(차트 생성 안정화)
-os.environ.setdefault("MPLBACKEND", "Agg")
-try:
-    import matplotlib
-
-    matplotlib.use("Agg")
-except Exception:
-    pass
+# matplotlib 은 첫 차트 요청 때 로드되므로 환경 변수로 지정하고, 이미 로드된 경우에만 직접 전환한다.
+os.environ["MPLBACKEND"] = "Agg"
+if "matplotlib" in sys.modules:
+    try:
+        sys.modules["matplotlib"].use("Agg")
+    except Exception:
+        pass
 
 from webapp.api.router import api_router
+from webapp.services.analysis_runner import shutdown_executors
+from webapp.services.chart_service import ChartService
 from webapp.services.project_store import ProjectStore
 
 
@@ -33,13 +36,22 @@ BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # 분석 실행기(스레드/프로세스 풀) 정리
+    shutdown_executors()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
+        lifespan=_lifespan,
         title="DOE Tool Web API",
         description="데스크톱 DOE Tool의 계산/설계 기능을 웹 API로 제공",
         version="0.1.0",
     )
     app.state.project_store = ProjectStore()
+    app.state.chart_service = ChartService()
     app.include_router(api_router)
 
     static_dir = BASE_DIR / "static"
@@ -2,17 +2,74 @@ from __future__ import annotations
 
 import base64
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
+from models.analysis_result import ResultRecord, plain_names, plain_scalar, result_encoders
+from utils.compact_array import CompactArray
+
+
+def _frame_to_jsonable(value: pd.DataFrame) -> dict:
+    return {
+        "__type__": "DataFrame",
+        "columns": [str(c) for c in value.columns.tolist()],
+        "index": [str(i) for i in value.index.tolist()],
+        "data": value.where(pd.notnull(value), None).to_dict(orient="records"),
+    }
+
+
+def _series_to_jsonable(value: pd.Series) -> dict:
+    return {
+        "__type__": "Series",
+        "name": str(value.name) if value.name is not None else None,
+        "index": [str(i) for i in value.index.tolist()],
+        "data": value.where(pd.notnull(value), None).to_dict(),
+    }
+
+
+def _array_stub(value: CompactArray) -> dict:
+    """웹 응답용 배열 자리표시 (값은 /history/{i}/arrays/{key} 로 요청)"""
+    return {"__type__": "ArrayRef", "shape": list(value.shape), "dtype": value.dtype.str}
+
+
+def _attach_array_refs(data: Any, array_ref: str) -> Any:
+    """results 의 배열 자리표시에 arrays 엔드포인트 경로(ref)를 붙인다."""
+    results = data.get("results") if isinstance(data, dict) else None
+    if isinstance(results, dict):
+        for key, item in results.items():
+            if isinstance(item, dict) and item.get("__type__") == "ArrayRef":
+                item["ref"] = f"{array_ref}/{key}"
+    return data
+
+
+# 결과 객체 필드 종류별 인코더 (스키마 경로: 필드마다 타입 검사를 반복하지 않음)
+_RESULT_ENCODERS = result_encoders(
+    lambda value: to_jsonable(value),
+    frame=(pd.DataFrame, _frame_to_jsonable),
+    series=(pd.Series, _series_to_jsonable),
+    array=(CompactArray, _array_stub),
+    scalar=lambda v: to_jsonable(plain_scalar(v)),
+    names=lambda v: [str(x) for x in plain_names(v)],
+)
+
+
+def to_jsonable(value: Any, array_ref: Optional[str] = None) -> Any:
+    """
+    임의의 파이썬/넘파이/판다스 객체를 JSON 직렬화 가능한 형태로 변환한다.
+    CompactArray 는 shape/dtype 자리표시로만 보낸다. array_ref(히스토리 항목의 arrays 경로)를 주면
+    분석 결과(results)의 배열마다 값을 받을 경로 ref 를 붙인다.
+    """
+    if array_ref is not None:
+        return _attach_array_refs(to_jsonable(value), array_ref)
 
-def to_jsonable(value: Any) -> Any:
-    """임의의 파이썬/넘파이/판다스 객체를 JSON 직렬화 가능한 형태로 변환한다."""
     if value is None:
         return None
 
+    if isinstance(value, ResultRecord):
+        return value.encode(_RESULT_ENCODERS, to_jsonable)
+
     if isinstance(value, (str, int, float, bool)):
         return value
 
@@ -25,21 +82,15 @@ def to_jsonable(value: Any) -> Any:
     if isinstance(value, np.ndarray):
         return value.tolist()
 
+    if isinstance(value, CompactArray):
+        # 관측치 길이 결과 배열은 응답에 싣지 않음 (값은 arrays 엔드포인트로 요청)
+        return _array_stub(value)
+
     if isinstance(value, pd.DataFrame):
-        return {
-            "__type__": "DataFrame",
-            "columns": [str(c) for c in value.columns.tolist()],
-            "index": [str(i) for i in value.index.tolist()],
-            "data": value.where(pd.notnull(value), None).to_dict(orient="records"),
-        }
+        return _frame_to_jsonable(value)
 
     if isinstance(value, pd.Series):
-        return {
-            "__type__": "Series",
-            "name": str(value.name) if value.name is not None else None,
-            "index": [str(i) for i in value.index.tolist()],
-            "data": value.where(pd.notnull(value), None).to_dict(),
-        }
+        return _series_to_jsonable(value)
 
     if isinstance(value, dict):
         return {str(k): to_jsonable(v) for k, v in value.items()}
@@ -1,63 +1,79 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict
 
 import pandas as pd
 
-from controllers.analysis_controller import AnalysisController
+from core.registry import CHEAP, CPU, HEAVY, get_analysis
+from core.errors import AnalysisError
 
 
-class AnalysisError(RuntimeError):
-    def __init__(self, title: str, message: str):
-        super().__init__(f"{title}: {message}")
-        self.title = title
-        self.message = message
+def run_analysis(analysis_id: str, df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, Any]:
+    """레지스트리 진입점을 현재 프로세스/스레드에서 실행 (프로세스 풀 작업 함수)"""
+    spec = get_analysis(analysis_id)
+    service_cls, method = spec.load_entry_point()
+    return getattr(service_cls(), method)(df, **spec.prepare(params))
 
 
-def _run_with_signals(invoker: Callable[[AnalysisController], None]) -> Dict[str, Any]:
-    controller = AnalysisController()
-    holder: Dict[str, Any] = {}
+# 비용 등급별 실행기 ---------------------------------------------------------
+# DOE_HEAVY_EXECUTOR=thread 로 두면 HEAVY 도 스레드 풀에서 실행 (프로세스 생성이 어려운 환경용)
+# 작은 표는 HEAVY 라도 스레드 풀에서 실행 - 피클/프로세스 간 전송 비용이 계산보다 크다
+PROCESS_MIN_CELLS = 200_000
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
 
-    def on_completed(name: str, result: dict):
-        holder["name"] = name
-        holder["result"] = result
 
-    def on_error(title: str, message: str):
-        holder["error"] = (title, message)
+def _create_executor(cost: str) -> Executor:
+    workers = max(1, (os.cpu_count() or 2) - 1)
+    if cost == HEAVY and os.environ.get("DOE_HEAVY_EXECUTOR", "process") == "process":
+        import multiprocessing
 
-    controller.analysis_completed.connect(on_completed)
-    controller.error_occurred.connect(on_error)
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"analysis-{cost}")
 
-    invoker(controller)
 
-    if "error" in holder:
-        title, message = holder["error"]
-        raise AnalysisError(title, message)
-    if "result" not in holder:
-        raise AnalysisError("분석 오류", "분석 결과가 생성되지 않았습니다.")
-    return holder["result"]
+def executor_for(cost: str) -> Executor | None:
+    """CHEAP 은 None(요청 스레드에서 바로 실행), CPU 는 스레드 풀, HEAVY 는 프로세스 풀"""
+    if cost == CHEAP:
+        return None
+    with _executors_lock:
+        executor = _executors.get(cost)
+        if executor is None:
+            executor = _executors[cost] = _create_executor(cost if cost == HEAVY else CPU)
+        return executor
 
 
-class AnalysisRunner:
-    """Qt 의존 컨트롤러를 웹에서 안전하게 실행하기 위한 래퍼."""
-
-    def basic_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_basic_statistics(df))
-
-    def correlation(self, df: pd.DataFrame) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_correlation_analysis(df))
-
-    def anova(self, df: pd.DataFrame) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_anova(df))
+def shutdown_executors() -> None:
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
 
-    def regression(self, df: pd.DataFrame) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_regression(df))
 
-    def doe_anova(self, df: pd.DataFrame, response: str, factors: list[str]) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_doe_anova(df, response=response, factors=factors))
-
-    def main_effects_anova(self, df: pd.DataFrame, response: str, factors: list[str], analysis_type: str) -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_main_effects_anova(df, response=response, factors=factors, analysis_type=analysis_type))
-
-    def rsm_quadratic(self, df: pd.DataFrame, response: str, factors: list[str], analysis_type: str = "RSM") -> Dict[str, Any]:
-        return _run_with_signals(lambda c: c.run_rsm_quadratic(df, response=response, factors=factors, analysis_type=analysis_type))
+class AnalysisRunner:
+    """코어 분석(core.analysis)을 레지스트리/실행기 규칙에 따라 실행하는 웹 서비스."""
+
+    def run(self, analysis_id: str, df: pd.DataFrame, **params) -> Dict[str, Any]:
+        """레지스트리의 분석을 비용 등급에 맞는 실행기에서 실행"""
+        spec = get_analysis(analysis_id)
+        if not spec.web:
+            raise AnalysisError("분석 오류", f"웹에서 실행할 수 없는 분석입니다: {analysis_id}")
+        executor = executor_for(spec.cost)
+        if executor is None:
+            return run_analysis(analysis_id, df, params)
+        if isinstance(executor, ProcessPoolExecutor):
+            # 프로세스에는 요청이 쓰는 열만 피클해서 보낸다
+            columns = spec.used_columns(df.columns, spec.prepare(params))
+            if columns is not None:
+                df = df[columns]
+            if df.size < PROCESS_MIN_CELLS:
+                executor = executor_for(CPU)
+        return executor.submit(run_analysis, analysis_id, df, params).result()
+
+    def streaming_statistics(self, file_path: str, chunksize: int = 200_000, max_workers: int = 1) -> Dict[str, Any]:
+        from core.analysis import AnalysisService
+
+        return AnalysisService().streaming_statistics(file_path, chunksize=chunksize, max_workers=max_workers)
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Iterable, List
 
 import pandas as pd
 
-from controllers.chart_controller import ChartController
+from core.charts import ChartBuilder, FigurePool
+from core.errors import ChartError
 from webapp.serialization import fig_to_base64_png
 
 
-class ChartError(RuntimeError):
-    def __init__(self, title: str, message: str):
-        super().__init__(f"{title}: {message}")
-        self.title = title
-        self.message = message
-
-
 class ChartService:
+    """
+    웹 차트 렌더러. 앱 수명 동안 하나를 두고 재사용한다. (app.state.chart_service)
+    ChartBuilder(폰트 설정, 차트 유형 표)는 첫 요청 때 한 번 만들고,
+    Figure 는 FigurePool 로 스레드별 하나를 비워 가며 다시 쓴다.
+    """
+
     _CHART_TYPE_ALIASES: dict[str, str] = {
-        # ASCII codes (web-friendly) -> ChartController labels
+        # ASCII codes (web-friendly) -> ChartBuilder labels
         "histogram": "히스토그램",
         "boxplot": "박스플롯",
         "scatter": "산점도",
@@ -26,8 +27,24 @@ class ChartService:
         "correlation_matrix": "상관행렬",
         "main_effects": "주효과도",
         "interaction": "상호작용도",
+        "contour": "등고선도",
+        "surface": "3D 표면도",
+        "pareto": "파레토 차트",
+        "normal_plot": "정규확률도",
     }
 
+    def __init__(self):
+        self._builder: ChartBuilder | None = None
+        self._builder_lock = threading.Lock()
+
+    @property
+    def builder(self) -> ChartBuilder:
+        if self._builder is None:
+            with self._builder_lock:
+                if self._builder is None:
+                    self._builder = ChartBuilder(figure_pool=FigurePool())
+        return self._builder
+
     def _normalize_chart_type(self, chart_type: str) -> str:
         if not chart_type:
             return chart_type
@@ -45,7 +62,7 @@ class ChartService:
         chart_type = self._normalize_chart_type(chart_type)
 
         if chart_type in {"주효과도", "상호작용도"}:
-            # ChartController는 범주형(object/category) 요인을 요구한다.
+            # ChartBuilder는 범주형(object/category) 요인을 요구한다.
             # DOE 데이터가 -1/1, 0/1 같은 숫자형으로 들어오는 경우가 많아,
             # 웹 어댑터에서만 임시로 범주형으로 변환해 호환성을 높인다.
             # (프로젝트의 원본 데이터프레임은 변경하지 않음)
@@ -54,14 +71,7 @@ class ChartService:
                 if col and col in df.columns:
                     df[col] = df[col].astype(str).astype("category")
 
-        controller = ChartController()
-        holder: Dict[str, Any] = {}
-
-        def on_error(title: str, message: str):
-            holder["error"] = (title, message)
-
-        controller.error_occurred.connect(on_error)
-        chart_info = controller.create_chart(
+        chart_info = self.builder.create_chart(
             chart_type=chart_type,
             dataframe=df,
             x_var=x_var,
@@ -70,24 +80,27 @@ class ChartService:
             options=options,
         )
 
-        if "error" in holder:
-            title, message = holder["error"]
-            raise ChartError(title, message)
-        if chart_info is None:
-            raise ChartError("차트 오류", "차트 생성에 실패했습니다.")
-
         fig = chart_info.get("figure")
         if fig is None:
             raise ChartError("차트 오류", "Figure가 생성되지 않았습니다.")
 
-        image_base64 = fig_to_base64_png(fig)
-        try:
-            import matplotlib.pyplot as plt
-
-            plt.close(fig)
-        except Exception:
-            pass
-
+        # 풀의 Figure 는 다음 렌더링 때 지워지므로 바로 이미지로 변환하고 참조를 버린다.
         chart_info = {k: v for k, v in chart_info.items() if k != "figure"}
-        chart_info["image_base64_png"] = image_base64
+        chart_info["image_base64_png"] = fig_to_base64_png(fig)
         return chart_info
+
+    def create_charts_base64(self, df: pd.DataFrame, charts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 차트를 한 번에 렌더링 (같은 Figure 를 순서대로 재사용).
+
+        charts: create_chart_base64 인자(chart_type, x_var, y_var, group_var, options) dict 목록
+        Raises:
+            ChartError: 어느 하나라도 실패하면 (메시지에 몇 번째 차트인지 표시)
+        """
+        results = []
+        for i, spec in enumerate(charts):
+            try:
+                results.append(self.create_chart_base64(df=df, **spec))
+            except ChartError as e:
+                raise ChartError(e.title, f"[{i + 1}번째 차트] {e.message}") from e
+        return results
@@ -12,8 +12,18 @@ class DesignService:
     def full_factorial(self, levels: list[int]) -> pd.DataFrame:
         return self._controller.create_full_factorial(levels)
 
-    def fractional_factorial(self, design_str: str) -> pd.DataFrame:
-        return self._controller.create_fractional_factorial(design_str)
+    def fractional_factorial(self, design_str: str, alias_order: int | None = None) -> tuple[pd.DataFrame, dict]:
+        """(설계, 별칭 구조 dict)"""
+        df = self._controller.create_fractional_factorial(design_str)
+        return df, df.attrs["aliasing"].to_dict(alias_order)
+
+    def min_aberration(self, factors: int, runs: int, min_resolution: int = 3,
+                       alias_order: int | None = None, time_budget: float = 10.0,
+                       max_workers: int = 1) -> tuple[pd.DataFrame, dict]:
+        """(최소 aberration 설계, 탐색 정보 + 별칭 구조 dict)"""
+        df = self._controller.create_min_aberration_design(factors, runs, min_resolution=min_resolution,
+                                                           max_workers=max_workers, time_budget=time_budget)
+        return df, {**df.attrs["min_aberration"], "aliasing": df.attrs["aliasing"].to_dict(alias_order)}
 
     def plackett_burman(self, factors: int) -> pd.DataFrame:
         return self._controller.create_plackett_burman(factors)
@@ -26,3 +36,23 @@ class DesignService:
 
     def orthogonal_array(self, factors: int, design: str = "L8") -> pd.DataFrame:
         return self._controller.create_orthogonal_array(factors, design=design)
+
+    def orthogonal_arrays(self) -> list[dict]:
+        return self._controller.list_orthogonal_arrays()
+
+    def optimal(self, factors: int, runs: int, **options) -> pd.DataFrame:
+        return self._controller.create_optimal_design(factors, runs, **options)
+
+    def space_filling(self, factors: int, runs: int, **options) -> pd.DataFrame:
+        return self._controller.create_space_filling_design(factors, runs, **options)
+
+    def mixture(self, components: int, **options) -> pd.DataFrame:
+        return self._controller.create_mixture_design(components, **options)
+
+    def mixture_csv_chunks(self, components: int, chunk_size: int = 100_000, **options):
+        """CSV 텍스트 청크 (첫 청크에 머리글)"""
+        for i, chunk in enumerate(self._controller.iter_mixture_design(components, chunk_size=chunk_size, **options)):
+            yield chunk.to_csv(index=False, header=(i == 0))
+
+    def split_plot(self, whole_levels: list[int], subplot_levels: list[int], **options) -> pd.DataFrame:
+        return self._controller.create_split_plot(whole_levels, subplot_levels, **options)
@@ -79,6 +79,10 @@ function isSeries(v) {
   return isPlainObject(v) && v.__type__ === 'Series' && Array.isArray(v.index);
 }
 
+function isArrayRef(v) {
+  return isPlainObject(v) && v.__type__ === 'ArrayRef' && Array.isArray(v.shape);
+}
+
 function parseMaybeNumber(v) {
   if (typeof v === 'number') return v;
   if (typeof v !== 'string') return null;
@@ -174,6 +178,33 @@ function renderSeries(s, { maxItems = 80 } = {}) {
   return wrap;
 }
 
+// 관측치별 결과 배열: 응답에는 shape/dtype 만 있고 값은 ref(arrays 엔드포인트)로 요청
+function renderArrayRef(v) {
+  const wrap = h('div', {}, h('div', { class: 'small text-muted mb-1' }, `배열 ${v.shape.join('×')} (${v.dtype})`));
+  if (!v.ref) return wrap;
+  const body = h('div', {});
+  const btn = h('button', { type: 'button', class: 'btn btn-sm btn-outline-secondary' }, '값 불러오기');
+  btn.addEventListener('click', async () => {
+    btn.disabled = true;
+    try {
+      const resp = await api(v.ref);
+      const values = resp.data?.values || [];
+      const index = values.map((_, i) => String(i + 1));
+      const data = Object.fromEntries(values.map((x, i) => [index[i], x]));
+      clearEl(body);
+      body.appendChild(renderSeries({ name: resp.data?.key, index, data }));
+      btn.remove();
+    } catch (e) {
+      clearEl(body);
+      body.appendChild(h('div', { class: 'alert alert-danger py-2 px-3 mb-0 mt-2' }, String(e.message || e)));
+      btn.disabled = false;
+    }
+  });
+  wrap.appendChild(btn);
+  wrap.appendChild(body);
+  return wrap;
+}
+
 function renderKeyValueTable(obj) {
   const dl = h('dl', { class: 'row mb-0' });
   for (const [k, v] of Object.entries(obj || {})) {
@@ -191,6 +222,7 @@ function renderAny(v, depth = 0) {
 
   if (isDf(v)) return renderDataFrame(v);
   if (isSeries(v)) return renderSeries(v);
+  if (isArrayRef(v)) return renderArrayRef(v);
 
   if (Array.isArray(v)) {
     if (v.length === 0) return h('span', { class: 'text-muted' }, '(비어있음)');
@@ -619,9 +651,31 @@ async function designFractional() {
   const resp = await api('/api/v1/design/fractional_factorial', {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({ design_str })
+    body: JSON.stringify({ design_str, include_aliasing: true })
   });
   renderApiResult('designOut', resp.data);
+  const out = document.getElementById('designOut');
+  if (out && out.tagName !== 'PRE') {
+    clearEl(out);
+    out.appendChild(renderFractionalDesign(resp.data));
+  }
+}
+
+function renderFractionalDesign(data) {
+  // { design, aliasing }: 설계표 + 해상도/정의 관계/별칭 사슬
+  const info = data?.aliasing || {};
+  const badges = h('div', { class: 'mb-2' },
+    h('span', { class: 'badge text-bg-primary me-1' }, `Resolution ${info.resolution_label ?? '-'}`),
+    h('span', { class: 'badge text-bg-secondary me-1' }, `${info.runs ?? ''}런`),
+    ...(info.generators || []).map(g => h('span', { class: 'badge text-bg-light me-1' }, g)));
+  const aliases = h('details', { class: 'mt-2' },
+    h('summary', { class: 'small fw-semibold' }, '별칭 사슬'),
+    h('div', { class: 'mt-2' }, renderAny(info.aliases || [], 1)));
+  return h('div', {},
+    badges,
+    h('div', { class: 'small text-muted mb-2' }, info.defining_relation || ''),
+    renderAny(data?.design, 0),
+    aliases);
 }
 
 async function designPB() {
@@ -806,6 +860,39 @@ async function loadAnalysisHistory() {
   const pid = await ensureProject(false);
   const resp = await api(`/api/v1/analysis/projects/${pid}/history`);
   renderApiResult('historyOut', resp.data);
+  const out = document.getElementById('historyOut');
+  if (!out || !Array.isArray(resp.data) || resp.data.length === 0) return;
+
+  // 목록은 요약만 오므로 항목마다 /history/{index} 로 전체 결과를 불러오는 상세 보기
+  clearEl(out);
+  resp.data.forEach((item, index) => out.appendChild(renderHistoryItem(pid, item, index)));
+}
+
+function renderHistoryItem(pid, item, index) {
+  const title = [item?.type, item?.timestamp].filter(Boolean).join(' · ') || `분석 ${index + 1}`;
+  const detail = h('div', { class: 'mt-2' });
+  const btn = h('button', { type: 'button', class: 'btn btn-sm btn-outline-secondary' }, '상세 보기');
+  btn.addEventListener('click', async () => {
+    btn.disabled = true;
+    try {
+      const resp = await api(`/api/v1/analysis/projects/${pid}/history/${index}`);
+      clearEl(detail);
+      detail.appendChild(renderAny(resp.data, 0));
+      btn.remove();
+    } catch (e) {
+      clearEl(detail);
+      detail.appendChild(h('div', { class: 'alert alert-danger py-2 px-3 mb-0' }, String(e.message || e)));
+      btn.disabled = false;
+    }
+  });
+
+  return h('div', { class: 'border rounded bg-white p-2 mb-2' },
+    h('div', { class: 'fw-semibold' }, `${index + 1}. ${title}`),
+    item?.description ? h('div', { class: 'text-muted mb-1' }, item.description) : null,
+    isPlainObject(item?.summary) ? renderKeyValueTable(item.summary) : null,
+    btn,
+    detail,
+  );
 }
 
 async function loadChartHistory() {
@@ -27,6 +27,32 @@ try:
     from test_analysis_controller import TestAnalysisController
     from test_chart_controller import TestChartController
     from test_utils import TestDataUtils, TestFileUtils
+    from test_streaming_stats import TestStreamingStatistics
+    from test_stats_cache import TestDatasetStatsCache
+    from test_normality import TestNormalityService
+    from test_bootstrap import TestBootstrap
+    from test_permutation_anova import TestPermutationAnova
+    from test_stepwise import TestStepwiseRegression
+    from test_best_subsets import TestBestSubsets
+    from test_loo_diagnostics import TestLooDiagnostics
+    from test_compact_array import TestCompactArray
+    from test_analysis_result import TestAnalysisResult
+    from test_analysis_registry import TestAnalysisRegistry
+    from test_core import TestAnalysisCore
+    from test_import_report import TestImportReport
+    from test_font_manager import TestFontManager
+    from test_chart_renderer import TestChartRenderer
+    from test_rsm import TestRsm
+    from test_desirability import TestDesirability
+    from test_optimal_design import TestOptimalDesign
+    from test_orthogonal_arrays import TestOrthogonalArrays
+    from test_mixture_design import TestMixtureDesign
+    from test_split_plot import TestSplitPlot
+    from test_aliasing import TestAliasing
+    from test_min_aberration import TestMinAberration
+    from test_effects import TestEffects
+    from test_space_filling import TestSpaceFilling
+    from test_background import TestBackground
 except ImportError as e:
     print(f"테스트 모듈 임포트 오류: {e}")
     print("src 디렉토리의 모든 모듈이 올바르게 구현되어 있는지 확인해주세요.")
@@ -49,7 +75,33 @@ def create_test_suite(test_pattern=None):
         'analysis': TestAnalysisController,
         'chart': TestChartController,
         'utils_data': TestDataUtils,
-        'utils_file': TestFileUtils
+        'utils_file': TestFileUtils,
+        'streaming_stats': TestStreamingStatistics,
+        'stats_cache': TestDatasetStatsCache,
+        'normality': TestNormalityService,
+        'bootstrap': TestBootstrap,
+        'permutation_anova': TestPermutationAnova,
+        'stepwise': TestStepwiseRegression,
+        'best_subsets': TestBestSubsets,
+        'loo_diagnostics': TestLooDiagnostics,
+        'compact_array': TestCompactArray,
+        'analysis_result': TestAnalysisResult,
+        'analysis_registry': TestAnalysisRegistry,
+        'core': TestAnalysisCore,
+        'import_report': TestImportReport,
+        'font_manager': TestFontManager,
+        'chart_renderer': TestChartRenderer,
+        'rsm': TestRsm,
+        'desirability': TestDesirability,
+        'optimal_design': TestOptimalDesign,
+        'orthogonal_arrays': TestOrthogonalArrays,
+        'mixture_design': TestMixtureDesign,
+        'split_plot': TestSplitPlot,
+        'aliasing': TestAliasing,
+        'min_aberration': TestMinAberration,
+        'effects': TestEffects,
+        'space_filling': TestSpaceFilling,
+        'background': TestBackground,
     }
     
     if test_pattern is None:
@@ -85,7 +137,32 @@ def print_test_info():
         ("Analysis Controller", "통계 분석 로직"),
         ("Chart Controller", "차트 생성 로직"),
         ("Data Utils", "데이터 처리 유틸리티"),
-        ("File Utils", "파일 처리 유틸리티")
+        ("File Utils", "파일 처리 유틸리티"),
+        ("Streaming Stats", "스트리밍 기술통계"),
+        ("Stats Cache", "증분 통계 캐시"),
+        ("Normality", "정규성 검정 서비스"),
+        ("Bootstrap", "DOE 효과 부트스트랩"),
+        ("Permutation ANOVA", "순열검정 ANOVA"),
+        ("Stepwise", "단계적 회귀"),
+        ("Best Subsets", "분기한정 부분집합 회귀"),
+        ("LOO Diagnostics", "PRESS/LOO 진단"),
+        ("Compact Array", "결과 배열 압축 저장"),
+        ("Analysis Result", "슬롯 기반 결과 객체"),
+        ("Analysis Registry", "분석 레지스트리"),
+        ("Core", "Qt 비의존 분석 코어"),
+        ("Import Report", "지연 import/시작 시간 보고서"),
+        ("Font Manager", "한글 폰트 탐색 캐시"),
+        ("Chart Renderer", "Figure 재사용 웹 차트 렌더러"),
+        ("RSM", "반응표면 정준분석/격자 예측"),
+        ("Desirability", "만족도 다중 반응 최적화"),
+        ("Optimal Design", "D/I-최적 설계 교환 알고리즘"),
+        ("Orthogonal Arrays", "직교배열 카탈로그/강도 검사"),
+        ("Mixture Design", "혼합물 격자/중심/제약 꼭짓점"),
+        ("Split-Plot Design", "분할구 설계 벡터화 생성"),
+        ("Aliasing", "부분요인 별칭 구조/해상도"),
+        ("Min Aberration", "최소 aberration 생성 열 탐색"),
+        ("Effects", "Yates/FWHT 효과, Lenth PSE"),
+        ("Space Filling", "maximin LHS, Sobol/Halton 설계"),
     ]
     
     print("테스트 모듈:")
@@ -0,0 +1,108 @@
+"""
+부분요인 설계 별칭 구조(비트마스크 정의 관계) 단위 테스트
+"""
+
+import sys
+import os
+import time
+import unittest
+from unittest import mock
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+import utils.aliasing as aliasing_module
+from utils.aliasing import alias_structure, alias_structure_from_columns, popcount
+
+
+def _column(design, mask):
+    """효과 마스크의 대비 열 (설계 열 곱)"""
+    cols = [i for i in range(design.shape[1]) if mask >> i & 1]
+    return np.prod(design[:, cols], axis=1)
+
+
+class TestAliasing(unittest.TestCase):
+    """별칭 구조 테스트"""
+
+    def test_resolution_iii_design(self):
+        info = alias_structure("a b c ab ac").to_dict()
+        self.assertEqual(info["generators"], ["D = AB", "E = AC"])
+        self.assertEqual(info["defining_relation"], "I = ABD = ACE = BCDE")
+        self.assertEqual(info["resolution"], 3)
+        self.assertEqual(info["resolution_label"], "III")
+        self.assertEqual(info["word_length_pattern"], [0, 0, 2, 1, 0])
+        self.assertEqual(info["aliases"][0], "A + BD + CE + ABCDE")
+        self.assertEqual(len(info["aliases"]), 7)
+
+    def test_negative_generator(self):
+        aliasing = alias_structure("a b c -abc")
+        self.assertEqual(aliasing.defining_relation(), "I = -ABCD")
+        self.assertEqual(aliasing.resolution, 4)
+        self.assertIn("AB - CD", aliasing.chains(max_order=2))
+
+    def test_chains_match_design_columns(self):
+        """사슬 안 효과 열은 설계에서 실제로 (부호 포함) 같아야 함"""
+        design_str = "a b c d -abc abd"
+        design = DesignController().create_fractional_factorial(design_str).to_numpy()
+        aliasing = alias_structure(design_str)
+        for _, masks, rel in aliasing.alias_groups():
+            leader = _column(design, int(masks[0]))
+            for mask, sign in zip(masks.tolist(), rel.tolist()):
+                np.testing.assert_array_equal(_column(design, mask), sign * leader)
+        for word, sign in zip(aliasing.group[1:].tolist(), aliasing.group_signs[1:].tolist()):
+            self.assertTrue(np.all(_column(design, word) == sign))
+
+    def test_full_factorial_has_no_words(self):
+        aliasing = alias_structure("a b c")
+        self.assertIsNone(aliasing.resolution)
+        self.assertEqual(aliasing.to_dict()["resolution_label"], "Full")
+        self.assertEqual(len(aliasing.chains()), 7)
+
+    def test_max_order(self):
+        aliasing = alias_structure("a b c ab ac")
+        self.assertEqual(aliasing.chains(max_order=1), ["A", "B", "C", "D", "E"])
+        self.assertEqual(aliasing.chains(max_order=2)[0], "A + BD + CE")
+
+    def test_large_design_is_fast(self):
+        """2^(15-10) 전체 별칭 사슬"""
+        start = time.perf_counter()
+        info = alias_structure("a b c d e ab ac ad ae bc bd be cd ce de").to_dict()
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(len(info["aliases"]), 31)
+        self.assertEqual(sum(info["word_length_pattern"]), 2 ** 10 - 1)
+        self.assertTrue(all(chain.count(" + ") + chain.count(" - ") == 1023 for chain in info["aliases"]))
+
+    def test_from_columns(self):
+        aliasing = alias_structure_from_columns([1, 2, 4, 7])
+        self.assertEqual(aliasing.words(), ["ABCD"])
+
+    def test_popcount_fallback(self):
+        """NumPy 1.x 용 바이트 표 popcount 가 비트 수를 그대로 셈"""
+        masks = np.array([[0, 1, 7], [2 ** 40 + 3, 2 ** 62, 255]], dtype=np.int64)
+        expected = [[bin(int(v)).count("1") for v in row] for row in masks]
+        with mock.patch.object(aliasing_module, '_NATIVE_POPCOUNT', False):
+            np.testing.assert_array_equal(popcount(masks), expected)
+            np.testing.assert_array_equal(popcount(masks.astype(np.uint16) & 0xFF), [[0, 1, 3], [2, 0, 8]])
+            self.assertEqual(int(popcount(np.int64(11))), 3)
+            info = alias_structure("a b c d abc abd acd").to_dict()
+        self.assertEqual(info, alias_structure("a b c d abc abd acd").to_dict())
+
+    def test_invalid_generator(self):
+        for design_str in ["", "a b ac", "a b aab", "a b a1"]:
+            with self.assertRaises(ValueError):
+                alias_structure(design_str)
+
+    def test_controller_attaches_aliasing(self):
+        df = DesignController().create_fractional_factorial("a b c abc")
+        aliasing = df.attrs["aliasing"].to_dict()
+        self.assertEqual(df.attrs["aliasing"].resolution, 4)
+        # 별칭 표는 설계 열 이름을 쓴다
+        self.assertEqual(aliasing["factors"], list(df.columns))
+        self.assertEqual(aliasing["defining_relation"], "I = F1*F2*F3*F4")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+분석 레지스트리 단위 테스트
+"""
+
+import sys
+import os
+import subprocess
+import unittest
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from PySide6.QtWidgets import QApplication
+from core.registry import (
+    ANALYSES, CHEAP, COST_CLASSES, CPU, HEAVY, AnalysisSpec, get_analysis, register_analysis, web_analyses,
+)
+from models.analysis_result import AnalysisResult
+import webapp.services.analysis_runner as runner_module
+from webapp.services.analysis_runner import AnalysisError, AnalysisRunner, executor_for
+
+
+class TestAnalysisRegistry(unittest.TestCase):
+    """분석 레지스트리 및 러너 분기 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def test_entry_points_and_schemas_resolve(self):
+        """모든 웹 분석의 진입점 메서드와 스키마가 존재"""
+        for spec in web_analyses():
+            self.assertIn(spec.cost, COST_CLASSES)
+            cls, method = spec.load_entry_point()
+            self.assertTrue(callable(getattr(cls, method)), spec.analysis_id)
+            schema = spec.load_schema()
+            if schema is not None:
+                for key in spec.empty_as_none:
+                    self.assertIn(key, schema.model_fields)
+
+    def test_lookup_by_desktop_id(self):
+        """데스크톱 요청 id 로 조회"""
+        self.assertEqual(get_analysis('basic_stats').analysis_id, 'basic_statistics')
+        self.assertEqual(get_analysis('one_way_anova').desktop_handler, 'run_one_way_anova')
+        self.assertFalse(get_analysis('two_way_anova').web)
+        with self.assertRaises(KeyError):
+            get_analysis('없는 분석')
+
+    def test_register_validation(self):
+        """중복 id 와 알 수 없는 비용 등급 거부"""
+        with self.assertRaises(ValueError):
+            register_analysis(AnalysisSpec('anova', 'dup'))
+        with self.assertRaises(ValueError):
+            register_analysis(AnalysisSpec('new_analysis', 'x', cost='gpu'))
+        self.assertNotIn('new_analysis', ANALYSES)
+
+    def test_prepare_empty_lists(self):
+        """빈 리스트는 자동 선택(None)으로 전달"""
+        params = get_analysis('permutation_anova').prepare({'factors': [], 'seed': 1})
+        self.assertEqual(params, {'factors': None, 'seed': 1})
+
+    def test_runner_dispatch(self):
+        """러너가 레지스트리 진입점을 실행"""
+        df = pd.DataFrame({'x': np.arange(10.0), 'y': np.arange(10.0) ** 2})
+        res = AnalysisRunner().run('basic_statistics', df)
+        self.assertIsInstance(res, AnalysisResult)
+        self.assertEqual(res['type'], '기초 통계')
+        with self.assertRaises(AnalysisError):
+            AnalysisRunner().run('two_way_anova', df)
+
+    def test_executor_choice(self):
+        """비용 등급별 실행기"""
+        self.assertIsNone(executor_for(CHEAP))
+        self.assertIsInstance(executor_for(CPU), ThreadPoolExecutor)
+        self.assertIs(executor_for(CPU), executor_for(CPU))
+
+    def test_used_columns(self):
+        """요청이 쓰는 열만, 자동 선택/없는 열이면 None"""
+        spec = get_analysis('best_subsets')
+        columns = ['a', 'b', 'y', 'c']
+        self.assertEqual(spec.used_columns(columns, {'response': 'y', 'factors': ['c', 'a']}), ['a', 'y', 'c'])
+        self.assertIsNone(spec.used_columns(columns, spec.prepare({'response': 'y', 'factors': []})))
+        self.assertIsNone(spec.used_columns(columns, {'response': 'y', 'factors': ['z']}))
+        self.assertIsNone(get_analysis('anova').used_columns(columns, {}))
+
+    def test_heavy_process_payload(self):
+        """HEAVY 프로세스 실행은 필요한 열만 전달, 작은 표는 스레드 풀에서 실행"""
+        pool = ProcessPoolExecutor(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        done = Future()
+        done.set_result('ok')
+        rng = np.random.default_rng(0)
+        params = {'response': 'y', 'factors': ['a', 'b']}
+        with mock.patch.object(runner_module, 'executor_for',
+                               side_effect=lambda cost: pool if cost == HEAVY else executor_for(cost)), \
+                mock.patch.object(pool, 'submit', return_value=done) as submit:
+            big = pd.DataFrame(rng.integers(0, 2, (120_000, 6)), columns=['a', 'b', 'c', 'd', 'e', 'y'])
+            self.assertEqual(AnalysisRunner().run('doe_anova', big, **params), 'ok')
+            self.assertEqual(list(submit.call_args.args[2].columns), ['a', 'b', 'y'])
+            small = big.head(40)
+            res = AnalysisRunner().run('doe_anova', small, **params)
+            self.assertEqual(submit.call_count, 1)
+            self.assertIsInstance(res, AnalysisResult)
+
+    def test_startup_does_not_import_heavy_libraries(self):
+        """레지스트리/분석 라우터 import 만으로는 무거운 라이브러리를 로드하지 않음"""
+        code = (
+            "import sys; import webapp.api.analysis; "
+            "print(','.join(m for m in ('scipy', 'statsmodels', 'sklearn', 'PySide6', "
+            "'controllers.analysis_controller') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True, text=True,
+                             timeout=120)
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertEqual(out.stdout.strip(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
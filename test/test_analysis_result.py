@@ -0,0 +1,138 @@
+"""
+슬롯 기반 분석 결과 객체 단위 테스트
+"""
+
+import sys
+import os
+import json
+import unittest
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from models.analysis_result import (
+    FRAME, RESULT_TAG, AnalysisResult, GenericResults, ModelResults, RegressionResults, result_encoders,
+)
+from models.project import Project, serialize_value
+from utils.compact_array import CompactArray
+from webapp.serialization import to_jsonable
+
+
+class TestAnalysisResult(unittest.TestCase):
+    """AnalysisResult 및 스키마 직렬화 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 2요인 DOE 데이터"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'A': np.tile(['L', 'H'], 20),
+            'B': np.repeat(['L', 'H'], 20),
+        })
+        self.df['Y'] = rng.normal(size=len(self.df)) + (self.df['A'] == 'H') * 2
+
+    def _run_doe(self):
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_doe_anova(self.df, 'Y', ['A', 'B'], bootstrap_samples=0)
+        return holder['res']
+
+    def test_controller_emits_slotted_result(self):
+        """컨트롤러가 계열별 슬롯 객체를 전달하고 dict 처럼 접근 가능"""
+        res = self._run_doe()
+        self.assertIsInstance(res, AnalysisResult)
+        self.assertIsInstance(res['results'], ModelResults)
+        self.assertFalse(hasattr(res, '__dict__'))
+        self.assertFalse(hasattr(res['results'], '__dict__'))
+        self.assertEqual(res.get('type'), 'DOE ANOVA')
+        self.assertIn('anova', res['results'])
+        self.assertIsInstance(res['results']['anova'], pd.DataFrame)
+        self.assertIsNone(res['results'].get('없는 키'))
+
+    def test_family_selection(self):
+        """분석 유형/키 구성으로 results 클래스 선택"""
+        reg = AnalysisResult.create('회귀분석', '', {'r_squared': 0.5})
+        self.assertIsInstance(reg['results'], RegressionResults)
+        free = AnalysisResult.create('주효과 ANOVA', '', {'anova': pd.DataFrame(), 'coefficients': pd.Series(dtype=float)})
+        self.assertIsInstance(free['results'], ModelResults)
+        other = AnalysisResult.create('기타', '', {'x': 1})
+        self.assertIsInstance(other['results'], GenericResults)
+        self.assertEqual(dict(other['results']), {'x': 1})
+
+    def test_extras_kept(self):
+        """스키마 밖 키(선택 첨부)는 부가 필드로 보관"""
+        res = AnalysisResult.create('DOE ANOVA', '', {'r_squared': 0.9})
+        res['results']['bootstrap'] = {'samples': 10}
+        self.assertEqual(res['results']['bootstrap'], {'samples': 10})
+        self.assertEqual(list(res['results']), ['r_squared', 'bootstrap'])
+        del res['results']['bootstrap']
+        self.assertNotIn('bootstrap', res['results'])
+
+    def test_summary_light_fields_only(self):
+        """요약에는 스칼라/텍스트/이름 필드만 포함"""
+        res = self._run_doe()
+        summary = res.summary()
+        self.assertEqual(summary['type'], 'DOE ANOVA')
+        light = summary['summary']
+        self.assertIn('r_squared', light)
+        self.assertEqual(light['factors'], ['A', 'B'])
+        for heavy in ('anova', 'coefficients', 'residuals', 'leverage'):
+            self.assertNotIn(heavy, light)
+        json.dumps(to_jsonable(summary))
+
+    def test_project_roundtrip(self):
+        """프로젝트 저장/불러오기에서 결과 클래스와 값 유지"""
+        res = self._run_doe()
+        project = Project(name='p')
+        project.add_analysis(res)
+        text = json.dumps(project.to_dict())
+        self.assertIn(RESULT_TAG, json.loads(text)['analysis_history'][0])
+
+        loaded = Project.from_dict(json.loads(text)).analysis_history[0]
+        self.assertIsInstance(loaded, AnalysisResult)
+        self.assertIsInstance(loaded['results'], ModelResults)
+        pd.testing.assert_frame_equal(
+            loaded['results']['anova'].reset_index(drop=True),
+            res['results']['anova'].reset_index(drop=True),
+            check_dtype=False,
+        )
+        self.assertIsInstance(loaded['results']['residuals'], CompactArray)
+        self.assertFalse(loaded['results']['residuals'].loaded)
+        np.testing.assert_allclose(np.asarray(loaded['results']['residuals']),
+                                   np.asarray(res['results']['residuals']))
+
+    def test_to_jsonable(self):
+        """웹 직렬화도 스키마 경로 사용"""
+        res = self._run_doe()
+        data = json.loads(json.dumps(to_jsonable(res)))
+        self.assertEqual(data['results'][RESULT_TAG], 'ModelResults')
+        self.assertEqual(data['results']['anova']['__type__'], 'DataFrame')
+        self.assertEqual(data['results']['residuals']['__type__'], 'ArrayRef')
+        self.assertIsInstance(data['results']['r_squared'], float)
+
+    def test_declared_kind_mismatch_falls_back(self):
+        """선언 종류와 다른 값(구버전 결과)은 저장/웹 모두 공용 인코더 표에서 범용 직렬화로"""
+        encoders = result_encoders(lambda v: ('fallback', v), frame=(pd.DataFrame, lambda v: 'frame'),
+                                   series=(pd.Series, str), array=(np.ndarray, list))
+        self.assertEqual(encoders[FRAME](pd.DataFrame()), 'frame')
+        self.assertEqual(encoders[FRAME]([1, 2]), ('fallback', [1, 2]))
+
+        results = ModelResults(anova={'legacy': 1.0}, r_squared=np.float64(0.5))
+        self.assertEqual(serialize_value(results)['anova'], {'legacy': 1.0})
+        self.assertEqual(to_jsonable(results)['anova'], {'legacy': 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
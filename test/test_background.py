@@ -0,0 +1,51 @@
+"""
+GUI 밖 작업 실행 도우미(views.background) 단위 테스트
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtWidgets import QApplication
+from views.background import run_in_background
+
+
+class TestBackground(unittest.TestCase):
+    """작업 스레드 실행 / GUI 스레드 콜백 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _wait(self, results, timeout=10):
+        deadline = time.perf_counter() + timeout
+        while not results and time.perf_counter() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        self.assertTrue(results, "작업이 끝나지 않았습니다.")
+
+    def test_result_delivered_on_gui_thread(self):
+        main = threading.get_ident()
+        results = []
+        run_in_background(lambda: (threading.get_ident(), 6 * 7),
+                          lambda value: results.append((value, threading.get_ident())))
+        self._wait(results)
+        (worker, value), callback_thread = results[0]
+        self.assertEqual(value, 42)
+        self.assertNotEqual(worker, main)
+        self.assertEqual(callback_thread, main)
+
+    def test_error_callback(self):
+        errors = []
+        run_in_background(lambda: 1 / 0, lambda value: errors.append(value), errors.append)
+        self._wait(errors)
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+분기한정 전체 부분집합 회귀 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import itertools
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from controllers.design_controller import DesignController
+from utils.best_subsets import best_subsets, code_factors
+
+
+def brute_force_rss(X, y, k, top):
+    """크기 k 의 모든 부분집합 RSS 중 작은 top 개"""
+    Xc = np.column_stack([np.ones(len(y)), X])
+    rss = []
+    for combo in itertools.combinations(range(X.shape[1]), k):
+        cols = [0] + [c + 1 for c in combo]
+        beta = np.linalg.lstsq(Xc[:, cols], y, rcond=None)[0]
+        rss.append(float(np.sum((y - Xc[:, cols] @ beta) ** 2)))
+    return sorted(rss)[:top]
+
+
+class TestBestSubsets(unittest.TestCase):
+    """best_subsets 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 12개 후보 중 4개 유효"""
+        rng = np.random.default_rng(1)
+        self.X = rng.normal(size=(40, 12))
+        self.y = 2 * self.X[:, 0] - self.X[:, 3] + 0.7 * self.X[:, 7] + 0.3 * self.X[:, 9] + rng.normal(size=40)
+        self.names = [f'x{i}' for i in range(12)]
+
+    def test_matches_brute_force(self):
+        """모든 크기에서 상위 RSS 가 전수 탐색과 일치"""
+        result = best_subsets(self.X, self.y, self.names, top=3)
+        models = result['models']
+        self.assertTrue(result['complete'])
+        for k in range(1, 13):
+            expected = brute_force_rss(self.X, self.y, k, 3)
+            np.testing.assert_allclose(models.loc[models['size'] == k, 'rss'].values, expected)
+        # 가지치기로 2^12 보다 훨씬 적은 노드만 방문
+        self.assertLess(result['nodes'], 2 ** 12 // 4)
+
+    def test_processes_give_same_models(self):
+        """최상위 가지를 프로세스로 나누어도 결과는 같음"""
+        single = best_subsets(self.X, self.y, self.names, top=3)
+        parallel = best_subsets(self.X, self.y, self.names, top=3, max_workers=3)
+        self.assertTrue(parallel['complete'])
+        self.assertEqual(list(single['models']['terms']), list(parallel['models']['terms']))
+        np.testing.assert_allclose(single['models']['rss'].values, parallel['models']['rss'].values)
+
+    def test_large_candidate_set(self):
+        """40개 후보, 최대 8개 모형도 빠르게 완료하고 유효 요인을 모두 선택"""
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(120, 40))
+        y = X[:, :5] @ [3, -2, 1.5, 1, -1] + rng.normal(size=120)
+        result = best_subsets(X, y, [f'x{i}' for i in range(40)], max_size=8, top=3, criterion='bic')
+        self.assertTrue(result['complete'])
+        self.assertTrue({'x0', 'x1', 'x2', 'x3', 'x4'} <= set(result['best']['terms'].split(', ')))
+
+    def test_time_budget(self):
+        """시간 제한을 넘기면 중단하고 complete=False"""
+        rng = np.random.default_rng(4)
+        X = rng.normal(size=(100, 60))
+        y = rng.normal(size=100)
+        result = best_subsets(X, y, [f'x{i}' for i in range(60)], max_size=12, time_budget=0.2)
+        self.assertFalse(result['complete'])
+        self.assertFalse(result['models'].empty)
+
+    def test_plackett_burman_screening(self):
+        """Plackett-Burman 설계에서 유효 요인 식별 및 2수준 범주형 코딩"""
+        design = DesignController().create_plackett_burman(11)
+        rng = np.random.default_rng(5)
+        y = 50 + 4 * design['F2'] - 3 * design['F5'] + 2 * design['F9'] + rng.normal(0, 0.5, len(design))
+        design['Y'] = y
+        design['F3'] = design['F3'].map({-1: 'Low', 1: 'High'})
+        X = code_factors(design, list(design.columns[:-1]))
+        result = best_subsets(X, y, list(design.columns[:-1]), top=2)
+        top3 = result['models'].query('size == 3 and rank_in_size == 1')['terms'].iloc[0]
+        self.assertEqual(top3, 'F2, F5, F9')
+
+    def test_controller_result(self):
+        """run_best_subsets 와 Plackett-Burman 주효과 ANOVA 첨부"""
+        df = pd.DataFrame(self.X[:, :6], columns=self.names[:6])
+        df['Y'] = self.y
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_best_subsets(df, response='Y', top=2, criterion='cp')
+        results = holder['res']['results']
+        self.assertEqual(holder['res']['type'], '최적 부분집합 회귀')
+        self.assertIn('x0', results['best']['terms'])
+
+        controller.run_main_effects_anova(df.round(0), 'Y', ['x0', 'x3'], analysis_type='Plackett-Burman 분석',
+                                          bootstrap_samples=0, best_subsets_top=2)
+        self.assertIn('best_subsets', holder['res']['results'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+DOE 효과 부트스트랩 엔진 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+import itertools
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import statsmodels.formula.api as smf
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+import utils.bootstrap as bootstrap_module
+from utils.bootstrap import bootstrap_ols, bootstrap_model
+
+
+class TestBootstrap(unittest.TestCase):
+    """bootstrap_ols 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 2수준 3요인 완전요인 x 3반복"""
+        rng = np.random.default_rng(7)
+        runs = list(itertools.product([-1, 1], repeat=3)) * 3
+        self.df = pd.DataFrame(runs, columns=['A', 'B', 'D'])
+        self.df['Y'] = 10 + 3 * self.df['A'] - 2 * self.df['B'] + rng.normal(0, 1, len(self.df))
+        self.model = smf.ols('Y ~ A + B + D', data=self.df).fit()
+
+    def test_deterministic_across_workers(self):
+        """같은 seed 면 작업자 수와 무관하게 같은 결과"""
+        single = bootstrap_model(self.model, n_boot=1200, seed=11)
+        threaded = bootstrap_model(self.model, n_boot=1200, seed=11, max_workers=3)
+        pd.testing.assert_frame_equal(single['intervals'], threaded['intervals'])
+
+    def test_residual_bootstrap_standard_errors(self):
+        """잔차 부트스트랩 표준오차가 OLS 표준오차와 비슷함"""
+        result = bootstrap_model(self.model, n_boot=4000, seed=1)
+        intervals = result['intervals']
+        ratio = intervals['std_error'] / self.model.bse
+        self.assertTrue(((ratio > 0.8) & (ratio < 1.2)).all(), ratio)
+        self.assertEqual(result['n_valid'], 4000)
+
+    def test_intervals_contain_estimate(self):
+        """백분위/BCa 구간이 추정치를 포함하고 유의한 효과는 0을 제외"""
+        intervals = bootstrap_model(self.model, n_boot=2000, seed=3)['intervals']
+        for kind in ('pct', 'bca'):
+            self.assertTrue((intervals[f'{kind}_lower'] <= intervals['estimate']).all())
+            self.assertTrue((intervals[f'{kind}_upper'] >= intervals['estimate']).all())
+            self.assertGreater(intervals.loc['A', f'{kind}_lower'], 0)
+            self.assertLess(intervals.loc['B', f'{kind}_upper'], 0)
+
+    def test_pairs_bootstrap(self):
+        """쌍 재표본 방식도 배치 풀이로 동작"""
+        X = self.model.model.exog
+        y = self.model.model.endog
+        result = bootstrap_ols(X, y, n_boot=1000, method='pairs', seed=5)
+        self.assertGreater(result['n_valid'], 900)
+        np.testing.assert_allclose(result['intervals']['estimate'].values, self.model.params.values)
+
+    def test_saturated_design_rejected(self):
+        """잔차 자유도가 0이면 오류"""
+        X = np.column_stack([np.ones(4), [-1, 1, -1, 1], [-1, -1, 1, 1], [1, -1, -1, 1]])
+        with self.assertRaises(ValueError):
+            bootstrap_ols(X, np.arange(4.0))
+
+    def test_doe_anova_attaches_bootstrap(self):
+        """run_doe_anova 결과에 부트스트랩 구간 첨부"""
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_doe_anova(self.df, response='Y', factors=['A', 'B'], bootstrap_samples=500)
+        boot = holder['res']['results']['bootstrap']
+        self.assertEqual(list(boot['intervals'].index), list(holder['res']['results']['coefficients'].index))
+
+    def test_bootstrap_opt_in_and_workers(self):
+        """기본은 부트스트랩 생략, 작업자 수는 그대로 전달되고 결과는 같다"""
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_doe_anova(self.df, response='Y', factors=['A', 'B'])
+        self.assertNotIn('bootstrap', holder['res']['results'])
+
+        results = []
+        for workers in (1, 3):
+            with mock.patch('utils.bootstrap.run_seeded_chunks', wraps=bootstrap_module.run_seeded_chunks) as spy:
+                controller.run_main_effects_anova(self.df, 'Y', ['A', 'B'], bootstrap_samples=1200,
+                                                  max_workers=workers)
+            self.assertEqual(spy.call_args.kwargs['max_workers'], workers)
+            results.append(holder['res']['results']['bootstrap']['intervals'])
+        pd.testing.assert_frame_equal(results[0], results[1])
+
+    def test_chunk_size_bounded_by_rows(self):
+        """행이 많으면 청크 크기를 줄여 (B, n) 인덱스 행렬 크기를 제한"""
+        rng = np.random.default_rng(0)
+        n = 20_000
+        X = np.column_stack([np.ones(n), rng.normal(size=n)])
+        y = X @ [1.0, 2.0] + rng.normal(size=n)
+        with mock.patch('utils.bootstrap.run_seeded_chunks', wraps=bootstrap_module.run_seeded_chunks) as spy:
+            bootstrap_ols(X, y, n_boot=300)
+        chunk_size = spy.call_args.args[3]
+        self.assertLessEqual(chunk_size * n, bootstrap_module.MAX_CHUNK_CELLS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -72,7 +72,8 @@ class TestChartController(unittest.TestCase):
         # Then
         expected_types = [
             "히스토그램", "박스플롯", "산점도", "선 그래프",
-            "막대 그래프", "상관행렬", "주효과도", "상호작용도"
+            "막대 그래프", "상관행렬", "주효과도", "상호작용도",
+            "등고선도", "3D 표면도", "파레토 차트", "정규확률도"
         ]
         
         self.assertEqual(len(chart_types), len(expected_types))
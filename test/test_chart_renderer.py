@@ -0,0 +1,129 @@
+"""
+웹 차트 렌더러(ChartService + FigurePool) 단위 테스트
+"""
+
+import sys
+import os
+import threading
+import unittest
+import warnings
+import base64
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from core.charts import ChartBuilder, FigurePool
+from core.errors import ChartError
+from webapp.serialization import fig_to_base64_png
+from webapp.services.chart_service import ChartService
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class TestChartRenderer(unittest.TestCase):
+    """Figure 재사용 렌더러 테스트 클래스"""
+
+    def setUp(self):
+        # 한글 폰트가 없는 환경의 글리프 누락 경고 무시
+        caught = warnings.catch_warnings()
+        caught.__enter__()
+        self.addCleanup(caught.__exit__, None, None, None)
+        warnings.simplefilter('ignore', UserWarning)
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'x': rng.normal(size=40),
+            'y': rng.normal(size=40),
+            'g': np.tile(['a', 'b'], 20),
+        })
+        self.service = ChartService()
+
+    def _png(self, chart_info):
+        data = base64.b64decode(chart_info['image_base64_png'])
+        self.assertTrue(data.startswith(PNG_SIGNATURE))
+        return data
+
+    def test_figure_reused(self):
+        """같은 스레드에서는 같은 Figure 를 비워서 다시 사용"""
+        pool = FigurePool()
+        fig1, ax1 = pool.acquire((4, 3), 80)
+        ax1.plot([1, 2, 3])
+        fig2, ax2 = pool.acquire((6, 4), 100)
+        self.assertIs(fig1, fig2)
+        self.assertEqual(fig2.axes, [ax2])
+        self.assertFalse(ax2.lines)
+        self.assertEqual(tuple(fig2.get_size_inches()), (6, 4))
+        self.assertEqual(fig2.dpi, 100)
+
+    def test_same_image_as_fresh_figure(self):
+        """다른 차트를 그린 뒤에도 새 Figure 로 그린 것과 같은 이미지"""
+        first = self._png(self.service.create_chart_base64('histogram', self.df, x_var='x'))
+        self.service.create_chart_base64('correlation_matrix', self.df)
+        self.service.create_chart_base64('boxplot', self.df, x_var='g', y_var='y')
+        again = self._png(self.service.create_chart_base64('histogram', self.df, x_var='x'))
+
+        fig = ChartBuilder().create_chart('히스토그램', self.df, x_var='x')['figure']
+        fresh = base64.b64decode(fig_to_base64_png(fig))
+        plt.close(fig)
+        self.assertEqual(first, again)
+        self.assertEqual(first, fresh)
+
+    def test_no_pyplot_figures_leak(self):
+        """렌더러는 pyplot 전역 Figure 를 만들지 않고 builder 는 한 번만 생성"""
+        before = plt.get_fignums()
+        self.service.create_chart_base64('scatter', self.df, x_var='x', y_var='y')
+        builder = self.service.builder
+        self.service.create_chart_base64('line', self.df, x_var='x', y_var='y')
+        self.assertIs(self.service.builder, builder)
+        self.assertEqual(plt.get_fignums(), before)
+
+    def test_batch(self):
+        """여러 차트를 한 번에 렌더링, 실패 시 몇 번째 차트인지 표시"""
+        results = self.service.create_charts_base64(self.df, [
+            {'chart_type': 'scatter', 'x_var': 'x', 'y_var': 'y'},
+            {'chart_type': 'histogram', 'x_var': 'y', 'options': {'bins': 5}},
+            {'chart_type': 'correlation_matrix'},
+        ])
+        self.assertEqual([r['type'] for r in results], ['산점도', '히스토그램', '상관행렬'])
+        self.assertEqual(results[1]['options']['bins'], 5)
+        images = [self._png(r) for r in results]
+        self.assertEqual(len(set(images)), 3)
+        for r in results:
+            self.assertNotIn('figure', r)
+
+        with self.assertRaises(ChartError) as ctx:
+            self.service.create_charts_base64(self.df, [
+                {'chart_type': 'scatter', 'x_var': 'x', 'y_var': 'y'},
+                {'chart_type': 'scatter', 'x_var': 'x'},
+            ])
+        self.assertIn('2번째', ctx.exception.message)
+
+    def test_threads(self):
+        """스레드마다 별도 Figure 로 동시에 렌더링"""
+        expected = self._png(self.service.create_chart_base64('scatter', self.df, x_var='x', y_var='y'))
+        outputs, errors = [], []
+
+        def render():
+            try:
+                for _ in range(3):
+                    outputs.append(self._png(self.service.create_chart_base64('scatter', self.df, x_var='x', y_var='y')))
+            except Exception as exc:  # pragma: no cover - 실패 시 메시지 확인용
+                errors.append(exc)
+
+        threads = [threading.Thread(target=render) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(outputs), 9)
+        self.assertTrue(all(png == expected for png in outputs))
+
+
+if __name__ == '__main__':
+    unittest.main()
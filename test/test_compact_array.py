@@ -0,0 +1,131 @@
+"""
+분석 결과 압축 배열 저장 단위 테스트
+"""
+
+import sys
+import os
+import json
+import unittest
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from models.project import Project
+from utils.compact_array import CompactArray, compact_array, decode_array, encode_array
+from webapp.serialization import to_jsonable
+
+
+class TestCompactArray(unittest.TestCase):
+    """CompactArray 및 프로젝트 직렬화 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 2요인 DOE 데이터"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'A': np.tile(['L', 'H'], 20),
+            'B': np.repeat(['L', 'H'], 20),
+        })
+        self.df['Y'] = rng.normal(size=len(self.df)) + (self.df['A'] == 'H') * 2
+
+    def _run_doe(self, controller):
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_doe_anova(self.df, 'Y', ['A', 'B'], bootstrap_samples=0)
+        return holder['res']
+
+    def test_encode_roundtrip(self):
+        """float64/float32 인코딩 왕복"""
+        for dtype in (np.float64, np.float32):
+            values = np.random.default_rng(1).normal(size=1000).astype(dtype)
+            decoded = decode_array(json.loads(json.dumps(encode_array(values))))
+            self.assertEqual(decoded.dtype, values.dtype)
+            np.testing.assert_array_equal(decoded, values)
+
+    def test_list_compatibility(self):
+        """len/인덱싱/반복/np.asarray 가 리스트처럼 동작"""
+        arr = compact_array([1.0, 2.0, 3.0])
+        self.assertEqual(len(arr), 3)
+        self.assertEqual(arr[1], 2.0)
+        self.assertEqual(list(arr), [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(np.asarray(arr, dtype=float), [1.0, 2.0, 3.0])
+        self.assertEqual(arr.tolist(), [1.0, 2.0, 3.0])
+
+    def test_array_copy_argument(self):
+        """__array__ 가 copy 인자를 따름 (True: 항상 복사, False: 복사 필요 시 오류)"""
+        arr = compact_array([1.0, 2.0, 3.0])
+        self.assertTrue(np.shares_memory(np.asarray(arr), arr.array))
+        copied = np.array(arr, copy=True)
+        self.assertFalse(np.shares_memory(copied, arr.array))
+        copied[0] = 9.0
+        self.assertEqual(arr[0], 1.0)
+        self.assertTrue(np.shares_memory(np.array(arr, copy=False), arr.array))
+        with self.assertRaises(ValueError):
+            np.array(arr, dtype=np.float32, copy=False)
+        self.assertEqual(np.asarray(arr, dtype=np.float32).dtype, np.float32)
+
+    def test_web_response_uses_array_refs(self):
+        """웹 응답은 배열 값 대신 shape/dtype 와 arrays 엔드포인트 경로만 보냄"""
+        result = self._run_doe(AnalysisController())
+        data = to_jsonable(result, array_ref='/api/v1/analysis/projects/p/history/0/arrays')
+        residuals = data['results']['residuals']
+        self.assertEqual(residuals, {'__type__': 'ArrayRef', 'shape': [len(self.df)], 'dtype': '<f8',
+                                     'ref': '/api/v1/analysis/projects/p/history/0/arrays/residuals'})
+        self.assertNotIn('data', data['results']['leverage'])
+        self.assertNotIn('ref', to_jsonable(result)['results']['residuals'])
+
+    def test_controller_stores_typed_arrays(self):
+        """DOE 결과의 잔차/적합값/진단량이 타입 배열, float32 옵션"""
+        controller = AnalysisController()
+        results = self._run_doe(controller)['results']
+        for key in ('residuals', 'fitted', 'leverage', 'cooks_distance'):
+            self.assertIsInstance(results[key], CompactArray)
+            self.assertEqual(len(results[key]), len(self.df))
+
+        controller.result_array_dtype = np.float32
+        results32 = self._run_doe(controller)['results']
+        self.assertEqual(results32['residuals'].dtype, np.float32)
+        np.testing.assert_allclose(results32['residuals'], results['residuals'], rtol=1e-6)
+
+    def test_project_save_load_is_lazy(self):
+        """프로젝트 저장은 압축 바이너리, 불러온 배열은 접근할 때 디코딩"""
+        project = Project()
+        project.add_analysis(self._run_doe(AnalysisController()))
+        text = json.dumps(project.to_dict())
+        saved = json.loads(text)['analysis_history'][0]['results']['residuals']
+        self.assertEqual(saved['__type__'], 'ndarray')
+
+        loaded = Project.from_dict(json.loads(text))
+        residuals = loaded.analysis_history[0]['results']['residuals']
+        self.assertIsInstance(residuals, CompactArray)
+        self.assertFalse(residuals.loaded)
+        self.assertEqual(len(residuals), len(self.df))
+        self.assertFalse(residuals.loaded)
+        original = project.analysis_history[0]['results']['residuals']
+        np.testing.assert_array_equal(np.asarray(residuals), np.asarray(original))
+        self.assertTrue(residuals.loaded)
+        # 다시 저장할 때 디코딩하지 않은 배열은 페이로드를 그대로 사용
+        self.assertEqual(json.loads(json.dumps(loaded.to_dict()))['analysis_history'][0]['results']['residuals'],
+                         saved)
+
+    def test_compact_payload_is_smaller(self):
+        """큰 배열은 JSON 리스트보다 작게 인코딩"""
+        values = np.random.default_rng(2).normal(size=100_000)
+        as_list = len(json.dumps(values.tolist()))
+        as_payload = len(json.dumps(compact_array(values, dtype=np.float32).to_payload()))
+        self.assertLess(as_payload, as_list / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
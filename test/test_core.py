@@ -0,0 +1,103 @@
+"""
+Qt 비의존 분석/차트 코어 단위 테스트
+"""
+
+import sys
+import os
+import subprocess
+import unittest
+from unittest.mock import Mock
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from core.analysis import AnalysisService
+from core.charts import ChartBuilder
+from core.errors import AnalysisError, ChartError, CoreError
+from models.analysis_result import AnalysisResult
+
+
+class TestAnalysisCore(unittest.TestCase):
+    """코어 반환/예외 규약과 Qt 어댑터 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 2요인 DOE 데이터"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'A': np.tile(['L', 'H'], 8),
+            'B': np.repeat(['L', 'H'], 8),
+        })
+        self.df['Y'] = rng.normal(size=len(self.df)) + (self.df['A'] == 'H') * 2
+
+    def test_service_returns_result(self):
+        """코어는 결과 객체를 반환하고 진행 상태를 콜백으로 알림"""
+        messages = []
+        result = AnalysisService(progress=messages.append).doe_anova(self.df, 'Y', ['A', 'B'], bootstrap_samples=0)
+        self.assertIsInstance(result, AnalysisResult)
+        self.assertEqual(result['type'], 'DOE ANOVA')
+        self.assertIn('DOE ANOVA가 완료되었습니다.', messages)
+
+    def test_service_raises_typed_errors(self):
+        """입력 오류는 제목/메시지가 있는 AnalysisError"""
+        service = AnalysisService()
+        with self.assertRaises(AnalysisError) as ctx:
+            service.doe_anova(self.df, 'Y', ['없는 열'])
+        self.assertEqual(ctx.exception.title, '분석 오류')
+        self.assertIsInstance(ctx.exception, CoreError)
+        with self.assertRaises(AnalysisError):
+            service.basic_statistics(pd.DataFrame())
+
+    def test_adapter_converts_errors_to_signals(self):
+        """Qt 어댑터는 코어 예외를 error_occurred 로 전달"""
+        controller = AnalysisController()
+        error_signal = Mock()
+        completed_signal = Mock()
+        controller.error_occurred.connect(error_signal)
+        controller.analysis_completed.connect(completed_signal)
+        controller.run_doe_anova(self.df, 'Y', ['없는 열'])
+        error_signal.assert_called_once_with('분석 오류', '요인/반응 열을 찾을 수 없습니다.')
+        completed_signal.assert_not_called()
+
+    def test_chart_builder(self):
+        """차트 코어는 figure 포함 정보 반환, 잘못된 입력은 ChartError"""
+        import matplotlib.pyplot as plt
+
+        info = ChartBuilder().create_chart('주효과도', self.df, x_var='A', y_var='Y')
+        self.assertIsInstance(info['figure'], plt.Figure)
+        plt.close(info['figure'])
+        with self.assertRaises(ChartError):
+            ChartBuilder().create_chart('없는 차트', self.df)
+
+    def test_web_stack_does_not_import_qt(self):
+        """웹 앱 로드와 분석/차트 실행에 PySide6 가 필요하지 않음"""
+        code = (
+            "import sys, pandas as pd\n"
+            "import webapp.app\n"
+            "from webapp.services.analysis_runner import AnalysisRunner\n"
+            "from webapp.services.chart_service import ChartService\n"
+            "df = pd.DataFrame({'x': [1.0, 2, 3, 4, 5], 'y': [2.0, 4, 5, 4, 6]})\n"
+            "AnalysisRunner().run('basic_statistics', df)\n"
+            "ChartService().create_chart_base64('scatter', df, x_var='x', y_var='y')\n"
+            "print('PySide6' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True, text=True,
+                             timeout=120)
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertEqual(out.stdout.strip().splitlines()[-1], 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
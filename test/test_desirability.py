@@ -0,0 +1,118 @@
+"""
+만족도(desirability) 다중 반응 최적화 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.analysis import AnalysisService
+from core.errors import AnalysisError
+from models.analysis_result import OptimizationResults
+from utils.desirability import (DesirabilityProblem, individual_desirability, latin_hypercube,
+                                optimize, overall_desirability)
+from utils.rsm import QuadraticModel
+
+
+class TestDesirability(unittest.TestCase):
+    """만족도 최적화 테스트 클래스"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        a, b = rng.uniform(-1, 1, (2, 30))
+        self.df = pd.DataFrame({
+            'A': 50 + 10 * a,
+            'B': 20 + 5 * b,
+            # y1 최대점: 코딩 (0.3, -0.2)
+            'y1': 80 - 5 * (a - 0.3) ** 2 - 4 * (b + 0.2) ** 2 + rng.normal(0, 0.05, 30),
+            'y2': 10 + 2 * a - 3 * b + rng.normal(0, 0.05, 30),
+        })
+
+    def test_individual_desirability(self):
+        """최대화/최소화/목표값 d 함수 (범위 밖 0/1, 가중치 지수)"""
+        goals = [
+            {"goal": "maximize", "lower": 0, "upper": 10, "target": 5, "weight": 2, "weight_upper": 2},
+            {"goal": "minimize", "lower": 0, "upper": 10, "target": 5, "weight": 1, "weight_upper": 1},
+            {"goal": "target", "lower": 0, "upper": 10, "target": 4, "weight": 1, "weight_upper": 1},
+        ]
+        Y = np.array([[-1, -1, -1], [5, 5, 2], [12, 12, 7], [10, 0, 4]], dtype=float)
+        d = individual_desirability(Y, goals)
+        np.testing.assert_allclose(d[:, 0], [0, 0.25, 1, 1])
+        np.testing.assert_allclose(d[:, 1], [1, 0.5, 0, 1])
+        np.testing.assert_allclose(d[:, 2], [0, 0.5, 0.5, 1])
+        # 가중 기하평균, 하나라도 0 이면 0
+        np.testing.assert_allclose(overall_desirability(d, [1, 1, 1]), [0, (0.25 * 0.5 * 0.5) ** (1 / 3), 0, 1])
+
+    def test_latin_hypercube_strata(self):
+        """각 축의 n 등분 구간마다 정확히 한 점"""
+        X = latin_hypercube(50, 3, np.random.default_rng(0))
+        self.assertTrue(np.all(np.abs(X) <= 1))
+        for j in range(3):
+            strata = np.floor((X[:, j] + 1) / 2 * 50).astype(int)
+            self.assertEqual(sorted(strata), list(range(50)))
+
+    def test_shared_coding_matches_single_model(self):
+        """공통 코딩으로 적합한 계수 행렬의 예측이 반응별 단독 모형과 같음"""
+        goals = [{"response": "y1", "goal": "maximize"}, {"response": "y2", "goal": "minimize"}]
+        problem = DesirabilityProblem.from_frame(self.df, goals, ['A', 'B'])
+        X = latin_hypercube(20, 2, np.random.default_rng(2))
+        Y, _, _ = problem.evaluate(X)
+        for j, response in enumerate(['y1', 'y2']):
+            model = QuadraticModel.from_frame(self.df, response, ['A', 'B'])
+            fit, _ = model.predict(problem.natural(X))
+            np.testing.assert_allclose(Y[:, j], fit, rtol=1e-9)
+
+    def test_single_response_finds_stationary_point(self):
+        """단일 반응 최대화의 최적점이 정준분석 정상점과 일치"""
+        # 상한을 최댓값 위로 두어 d = 1 평탄 구간이 없게 함
+        goals = [{"response": "y1", "goal": "maximize", "lower": 60, "upper": 90}]
+        problem = DesirabilityProblem.from_frame(self.df, goals, ['A', 'B'])
+        result = optimize(problem, n_candidates=500, n_starts=4, seed=0)
+        stationary = QuadraticModel.from_frame(self.df, 'y1', ['A', 'B']).canonical_analysis()["stationary_point"]
+        self.assertAlmostEqual(result["best"]["point"]["A"], stationary["A"], places=2)
+        self.assertAlmostEqual(result["best"]["point"]["B"], stationary["B"], places=2)
+        self.assertAlmostEqual(result["best"]["predictions"]["y1"],
+                               60 + 30 * result["best"]["overall"], places=6)
+
+    def test_refinement_improves_and_parallel_is_deterministic(self):
+        """국소 최적화는 후보 최댓값 이상, 스레드 병렬 결과는 직렬과 같음"""
+        goals = [{"response": "y1", "goal": "maximize"}, {"response": "y2", "goal": "minimize"}]
+        problem = DesirabilityProblem.from_frame(self.df, goals, ['A', 'B'])
+        serial = optimize(problem, n_candidates=300, n_starts=6, seed=5)
+        parallel = optimize(problem, n_candidates=300, n_starts=6, seed=5, max_workers=3)
+        self.assertGreaterEqual(serial["best"]["overall"], serial["candidate_best"] - 1e-12)
+        self.assertEqual(serial["best"], parallel["best"])
+        grid = optimize(problem, method="grid", n_candidates=400)
+        self.assertEqual(grid["n_candidates"], 400)
+        self.assertAlmostEqual(grid["best"]["overall"], serial["best"]["overall"], places=4)
+        # 2^k 격자가 후보점 수를 넘으면 라틴 하이퍼큐브로 바꿔 상한을 지킴
+        small = optimize(problem, method="grid", n_candidates=3, n_starts=2)
+        self.assertEqual((small["method"], small["n_candidates"]), ("lhs", 3))
+
+    def test_service_result(self):
+        """AnalysisService 결과 계열/필드와 입력 오류"""
+        service = AnalysisService()
+        result = service.desirability_optimization(
+            self.df, [{"response": "y1", "goal": "target", "target": 78}, {"response": "y2", "goal": "minimize"}],
+            ['A', 'B'], n_candidates=500, n_starts=3)
+        details = result["results"]
+        self.assertIsInstance(details, OptimizationResults)
+        self.assertEqual(details["responses"], ['y1', 'y2'])
+        self.assertEqual(set(details["best_point"]), {'A', 'B'})
+        self.assertIn('D', details["solutions"].columns)
+        self.assertAlmostEqual(details["solutions"]["D"].iloc[0], details["overall_desirability"])
+
+        with self.assertRaises(AnalysisError):
+            service.desirability_optimization(self.df, [{"response": "y1", "goal": "best"}], ['A', 'B'])
+        with self.assertRaises(AnalysisError):
+            service.desirability_optimization(self.df, [{"response": "y1", "goal": "target", "target": 1000}],
+                                              ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+2수준 효과 엔진(Yates/FWHT, Lenth PSE, 확률도/파레토) 단위 테스트
+"""
+
+import sys
+import os
+import json
+import time
+import unittest
+import warnings
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import statsmodels.formula.api as smf
+from pyDOE2 import ff2n, fracfact, pbdesign
+from scipy.linalg import hadamard
+
+from core.analysis import AnalysisService
+from core.charts import ChartBuilder
+from core.errors import AnalysisError, ChartError
+from models.analysis_result import EffectsResults
+from models.project import Project
+from utils.effects import effects_from_frame, fwht, lenth_pse, two_level_effects
+
+
+class TestEffects(unittest.TestCase):
+    """2수준 효과 엔진 테스트"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        X = np.vstack([ff2n(3)] * 2)
+        y = 10 + 3 * X[:, 0] - 2 * X[:, 1] * X[:, 2] + rng.normal(0, 0.2, len(X))
+        df = pd.DataFrame(X, columns=['A', 'B', 'C'])
+        df['C'] = np.where(df['C'] > 0, 'hi', 'lo')   # 범주형: 정렬 순서상 'lo' 가 상위 수준
+        df['y'] = y
+        self.df = df.sample(frac=1, random_state=3).reset_index(drop=True)
+
+    def test_fwht_matches_hadamard(self):
+        """제자리 FWHT = 자연 순서 Hadamard 행렬 곱 (2차원 포함)"""
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(64, 3))
+        expected = hadamard(64) @ values
+        result = fwht(values.copy())
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+        single = np.arange(8, dtype=float)
+        self.assertIs(fwht(single), single)
+        with self.assertRaises(ValueError):
+            fwht(np.ones(6))
+        with self.assertRaises(ValueError):
+            fwht(np.ones(8, dtype=int))
+
+    def test_full_factorial_matches_ols(self):
+        """반복 있는 완전요인: 효과 = 2·OLS 계수, 순수오차 t 값 = 포화 모형 t 값"""
+        result = effects_from_frame(self.df, 'y', ['A', 'B', 'C'])
+        table = result['effects'].set_index('term')
+        self.assertEqual(list(table.index), ['A', 'B', 'AB', 'C', 'AC', 'BC', 'ABC'])
+        self.assertEqual(result['levels']['C'], ('hi', 'lo'))
+        self.assertEqual((result['runs'], result['replicates'], result['pure_error_df']), (8, 2, 8))
+
+        coded = self.df.copy()
+        coded['C'] = np.where(coded['C'] == 'lo', 1.0, -1.0)
+        model = smf.ols('y ~ A * B * C', data=coded).fit()
+        for term, name in [('A', 'A'), ('B', 'B'), ('AB', 'A:B'), ('C', 'C'), ('BC', 'B:C'), ('ABC', 'A:B:C')]:
+            self.assertAlmostEqual(table.loc[term, 'effect'], 2 * model.params[name], places=10)
+            self.assertAlmostEqual(table.loc[term, 't_value'], model.tvalues[name], places=8)
+            self.assertAlmostEqual(table.loc[term, 'p_value'], model.pvalues[name], places=8)
+        self.assertAlmostEqual(result['mean'], model.params['Intercept'], places=10)
+        self.assertAlmostEqual(table['sum_sq'].sum(), result['total_sum_sq'] - model.ssr, places=8)
+        # C 의 상위 수준이 'lo' 이므로 BC 효과 부호가 반전된다
+        self.assertGreater(table.loc['BC', 'effect'], 3.5)
+
+    def test_lenth(self):
+        """Lenth PSE / ME 와 유의 효과, 확률도 분위수, 파레토 순위"""
+        self.assertAlmostEqual(lenth_pse([-0.5, 0.3, 10, 0.2, -0.1, 0.4, 8]), 0.45)
+        result = effects_from_frame(self.df, 'y', ['A', 'B', 'C'])
+        self.assertEqual(sorted(result['active']), ['A', 'BC'])
+        self.assertAlmostEqual(result['lenth_df'], 7 / 3)
+        self.assertAlmostEqual(result['margin_of_error'] / result['pse'], 3.7641, places=3)
+        self.assertGreater(result['simultaneous_margin'], result['margin_of_error'])
+        table = result['effects']
+        order = np.argsort(table['effect'].abs().to_numpy())
+        self.assertTrue(np.all(np.diff(table['half_normal_q'].to_numpy()[order]) > 0))
+        self.assertTrue(np.all(table['half_normal_q'] > 0))
+        self.assertEqual(table.sort_values('pareto_rank')['term'].tolist()[:2], ['A', 'BC'])
+        self.assertAlmostEqual(table['normal_q'].sum(), 0.0)
+
+    def test_fractional_factorial_aliases(self):
+        """부분요인: 생성 열 복원, 대비 이름 = 최저 차수 별칭, 음수 생성 열 부호"""
+        X = fracfact('a b c -abc d e ade')
+        rng = np.random.default_rng(1)
+        y = X @ np.arange(1.0, 8.0) + 0.5 * X[:, 0] * X[:, 4] + rng.normal(0, 0.05, len(X))
+        df = pd.DataFrame(X, columns=list('ABCDEFG'))
+        df['y'] = y
+        result = effects_from_frame(df.sample(frac=1, random_state=5), 'y', list('ABCDEFG'))
+        self.assertEqual(result['runs'], 32)
+        self.assertEqual(result['base_factors'], ['A', 'B', 'C', 'E', 'F'])
+        self.assertEqual(result['generators'], ['D = -ABC', 'G = AEF'])
+        self.assertEqual(result['resolution'], 4)
+        table = result['effects'].set_index('term')
+        self.assertEqual(len(table), 31)
+        beta = np.linalg.lstsq(np.c_[np.ones(len(X)), X], y, rcond=None)[0]
+        for i, name in enumerate('ABCDEFG'):
+            self.assertAlmostEqual(table.loc[name, 'effect'], 2 * beta[i + 1], places=8)
+        self.assertEqual(table.loc['D', 'aliases'].split(' ')[:3], ['D', '-', 'ABC'])
+        self.assertAlmostEqual(table.loc['AE', 'effect'], 1.0, delta=0.1)
+
+    def test_invalid_designs(self):
+        """비정규/불균형/다수준 설계는 오류"""
+        pb = pd.DataFrame(pbdesign(11), columns=[f'F{i}' for i in range(11)])
+        pb['y'] = np.arange(12.0)
+        with self.assertRaises(ValueError):
+            effects_from_frame(pb, 'y', list(pb.columns[:-1]))
+        with self.assertRaises(ValueError):
+            effects_from_frame(self.df.iloc[:-1], 'y', ['A', 'B', 'C'])
+        three = self.df.copy()
+        three.loc[0, 'A'] = 0
+        with self.assertRaises(ValueError):
+            effects_from_frame(three, 'y', ['A', 'B', 'C'])
+        # 16런 비정규 (Hadamard 행렬 열 조합 중 곱이 아닌 열)
+        H = hadamard(16)[:, 1:]
+        odd = np.column_stack([H[:, :4], H[:, 0] * np.where(np.arange(16) % 3 == 0, -1, 1)])
+        bad = pd.DataFrame(odd[:, :5], columns=list('ABCDE'))
+        bad['y'] = np.arange(16.0)
+        with self.assertRaises(ValueError):
+            effects_from_frame(bad, 'y', list('ABCDE'))
+
+    def test_large_full_factorial(self):
+        """2^16 완전요인 (65,536 대비) 을 한 번의 변환으로"""
+        k = 16
+        runs = np.arange(1 << k)
+        bits = ((runs[:, None] >> np.arange(k)) & 1).astype(bool)
+        y = 5.0 + 2.0 * bits[:, 3] + np.random.default_rng(2).normal(0, 0.01, len(runs))
+        start = time.perf_counter()
+        result = two_level_effects(bits, y, [f'X{i}' for i in range(k)])
+        elapsed = time.perf_counter() - start
+        table = result['effects']
+        self.assertEqual(len(table), (1 << k) - 1)
+        # 대비가 많으면 개별 ME 는 약 α 비율로 거짓 양성 → 동시 SME 기준으로 확인
+        self.assertEqual(table.loc[table['simultaneous'], 'term'].tolist(), ['X3'])
+        self.assertLess(len(result['active']), 0.1 * len(table))
+        self.assertAlmostEqual(table.loc[table['term'] == 'X3', 'effect'].item(), 2.0, places=2)
+        self.assertLess(elapsed, 10.0)
+
+    def test_analysis_service(self):
+        """코어 분석: 요인 자동 선택, 결과 레코드, 프로젝트 저장 왕복"""
+        service = AnalysisService()
+        result = service.factorial_effects(self.df, 'y')
+        self.assertEqual(result['type'], '2수준 효과 분석')
+        results = result['results']
+        self.assertIsInstance(results, EffectsResults)
+        self.assertEqual(results['factors'], ['A', 'B', 'C'])
+        self.assertEqual(sorted(results['active']), ['A', 'BC'])
+
+        project = Project('effects')
+        project.add_analysis(result)
+        loaded = Project.from_dict(json.loads(json.dumps(project.to_dict()))).analysis_history[0]
+        self.assertEqual(list(loaded['results']['effects']['term']), list(results['effects']['term']))
+
+        with self.assertRaises(AnalysisError):
+            service.factorial_effects(self.df, 'missing')
+        with self.assertRaises(AnalysisError):
+            service.factorial_effects(self.df.iloc[:-1], 'y', ['A', 'B', 'C'])
+
+    def test_charts(self):
+        """파레토 차트/정규확률도 차트 생성"""
+        builder = ChartBuilder()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            for chart_type, options in [('파레토 차트', {'response': 'y'}),
+                                        ('정규확률도', {'response': 'y'}),
+                                        ('정규확률도', {'response': 'y', 'half_normal': False})]:
+                info = builder.create_chart(chart_type, self.df, options=options)
+                self.assertEqual(info['type'], chart_type)
+                self.assertTrue(info['figure'].axes)
+                plt.close(info['figure'])
+        with self.assertRaises(ChartError):
+            builder.create_chart('파레토 차트', self.df)
+
+
+if __name__ == '__main__':
+    unittest.main()
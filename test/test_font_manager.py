@@ -0,0 +1,103 @@
+"""
+폰트 관리자(디스크 캐시) 단위 테스트
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from utils.font_manager import FALLBACK_FONTS, FontManager
+
+
+class TestFontManager(unittest.TestCase):
+    """한글 폰트 탐색 캐시 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / 'font.json'
+        self.original_family = list(plt.rcParams['font.family'])
+
+    def tearDown(self):
+        plt.rcParams['font.family'] = self.original_family
+        self.tmp.cleanup()
+
+    def test_lazy_resolution(self):
+        """생성 시에는 탐색하지 않고, 첫 폰트 설정 때 탐색 후 캐시 기록"""
+        manager = FontManager(self.cache_path)
+        self.assertIsNone(manager.cache_hit)
+        self.assertFalse(self.cache_path.exists())
+
+        manager.setup_default_font()
+        self.assertFalse(manager.cache_hit)
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(manager.get_current_font(), manager.available_fonts[0])
+        self.assertEqual(plt.rcParams['font.family'][0], manager.available_fonts[0])
+        self.assertEqual(manager.available_fonts[-len(FALLBACK_FONTS):], FALLBACK_FONTS)
+
+    def test_cache_hit(self):
+        """같은 환경에서는 디스크 캐시 결과를 그대로 사용"""
+        first = FontManager(self.cache_path)
+        first.setup_default_font()
+
+        second = FontManager(self.cache_path)
+        second.setup_default_font()
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(second.available_fonts, first.available_fonts)
+        self.assertEqual(second.font_path, first.font_path)
+
+    def test_stale_or_broken_cache(self):
+        """폰트 디렉터리 변경/손상된 파일/사라진 폰트 파일이면 다시 탐색"""
+        FontManager(self.cache_path).setup_default_font()
+        data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+
+        stale = dict(data, key=dict(data['key'], font_dirs=[['/nonexistent', 0]]))
+        self.cache_path.write_text(json.dumps(stale), encoding='utf-8')
+        manager = FontManager(self.cache_path)
+        manager.setup_default_font()
+        self.assertFalse(manager.cache_hit)
+
+        missing = dict(data, font_path=os.path.join(self.tmp.name, 'gone.ttf'))
+        self.cache_path.write_text(json.dumps(missing), encoding='utf-8')
+        manager = FontManager(self.cache_path)
+        manager.setup_default_font()
+        self.assertFalse(manager.cache_hit)
+
+        self.cache_path.write_text('{not json', encoding='utf-8')
+        manager = FontManager(self.cache_path)
+        manager.setup_default_font()
+        self.assertFalse(manager.cache_hit)
+        self.assertTrue(FontManager(self.cache_path).available_fonts)
+
+        manager.clear_cache()
+        self.assertFalse(self.cache_path.exists())
+
+    def test_hangul_rendering(self):
+        """한글 폰트가 있으면 캐시에서 복원한 설정으로 한글 글리프 누락 없이 렌더링"""
+        FontManager(self.cache_path).setup_default_font()
+        manager = FontManager(self.cache_path)
+        manager.setup_default_font()
+        if manager.available_fonts[0] in FALLBACK_FONTS:
+            self.skipTest("설치된 한글 폰트 없음")
+
+        fig, ax = plt.subplots()
+        ax.set_title('한글 제목 테스트')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            fig.canvas.draw()
+        plt.close(fig)
+        self.assertFalse([w for w in caught if 'missing from' in str(w.message)])
+
+
+if __name__ == '__main__':
+    unittest.main()
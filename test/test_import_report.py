@@ -0,0 +1,84 @@
+"""
+import 시간 보고서 및 지연 import 단위 테스트
+"""
+
+import sys
+import os
+import subprocess
+import unittest
+
+# src 경로를 sys.path에 추가
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from utils.import_report import format_report, import_report, parse_importtime
+
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     numpy.core
+import time:       500 |        800 |   numpy
+import time:        50 |        970 | webapp.app
+"""
+
+
+class TestImportReport(unittest.TestCase):
+    """import 시간 보고서와 무거운 라이브러리 지연 로딩 테스트 클래스"""
+
+    def _loaded(self, statement):
+        """새 인터프리터에서 statement 실행 후 로드된 무거운 라이브러리 목록"""
+        code = (f"{statement}\nimport sys\n"
+                "print(','.join(m for m in ('scipy', 'statsmodels', 'sklearn', 'seaborn', "
+                "'matplotlib', 'pyDOE2', 'PySide6') if m in sys.modules))")
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        proc = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, env=env,
+                              capture_output=True, text=True, timeout=300)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        return [name for name in proc.stdout.rstrip("\n").split("\n")[-1].split(",") if name]
+
+    def test_parse_importtime(self):
+        """-X importtime 출력 파싱 (머리글 제외, 깊이 계산)"""
+        rows = parse_importtime(SAMPLE)
+        self.assertEqual([row["module"] for row in rows], ["_io", "numpy.core", "numpy", "webapp.app"])
+        self.assertEqual(rows[1]["depth"], 2)
+        self.assertEqual(rows[3]["depth"], 0)
+        self.assertEqual(rows[2]["self_us"], 500)
+        self.assertEqual(rows[2]["cumulative_us"], 800)
+
+    def test_report(self):
+        """보고서: 누적 시간 정렬, 무거운 라이브러리 검출, 텍스트 출력"""
+        report = import_report("core.errors")
+        self.assertEqual(report["target"], "core.errors")
+        self.assertGreater(report["total_ms"], 0)
+        cumulative = [row["cumulative_us"] for row in report["modules"]]
+        self.assertEqual(cumulative, sorted(cumulative, reverse=True))
+        self.assertEqual(report["heavy"], [])
+        text = format_report(report, top=3)
+        self.assertIn("import core.errors", text)
+        self.assertEqual(len(text.splitlines()), 4 + 3)
+
+    def test_web_startup_loads_no_heavy_libraries(self):
+        """웹 앱 시작 시 scipy/statsmodels/matplotlib/Qt 등을 로드하지 않음"""
+        self.assertEqual(self._loaded("import webapp.app"), [])
+
+    def test_core_modules_defer_plotting_and_doe(self):
+        """차트 빌더/설계 컨트롤러 import 시 matplotlib/seaborn/pyDOE2 지연"""
+        self.assertEqual(self._loaded("import core.charts"), [])
+        loaded = self._loaded("import controllers.design_controller")
+        self.assertNotIn("pyDOE2", loaded)
+        self.assertNotIn("matplotlib", loaded)
+
+    def test_lazy_package_attributes(self):
+        """utils/views 패키지의 지연 속성이 첫 접근 시 로드됨"""
+        import utils
+        self.assertTrue(callable(utils.get_font_manager))
+        self.assertTrue(callable(utils.set_korean_font))
+        with self.assertRaises(AttributeError):
+            utils.no_such_attribute
+        import views
+        from views.chart_view import ChartView
+        self.assertIs(views.ChartView, ChartView)
+
+
+if __name__ == '__main__':
+    unittest.main()
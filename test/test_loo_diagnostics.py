@@ -0,0 +1,94 @@
+"""
+닫힌 형태 PRESS / leave-one-out 진단 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import itertools
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import statsmodels.formula.api as smf
+from statsmodels.stats.outliers_influence import OLSInfluence
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from utils.loo_diagnostics import loo_diagnostics, model_diagnostics
+
+
+class TestLooDiagnostics(unittest.TestCase):
+    """loo_diagnostics 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 2요인 2차 반응표면 데이터"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame(rng.uniform(-1, 1, size=(25, 2)), columns=['a', 'b'])
+        self.df['y'] = 1 + self.df['a'] + self.df['a'] ** 2 + rng.normal(0, 0.3, len(self.df))
+        self.formula = 'y ~ a + b + a:b + I(a**2) + I(b**2)'
+        self.model = smf.ols(self.formula, data=self.df).fit()
+
+    def test_press_matches_refits(self):
+        """PRESS 가 n 번 재적합한 값과 일치"""
+        press = 0.0
+        for i in range(len(self.df)):
+            refit = smf.ols(self.formula, data=self.df.drop(index=i)).fit()
+            press += (self.df['y'][i] - refit.predict(self.df.iloc[[i]]).iloc[0]) ** 2
+        result = model_diagnostics(self.model)
+        self.assertAlmostEqual(result['press'], press)
+        tss = ((self.df['y'] - self.df['y'].mean()) ** 2).sum()
+        self.assertAlmostEqual(result['predicted_r_squared'], 1 - press / tss)
+
+    def test_matches_statsmodels_influence(self):
+        """레버리지/스튜던트화 잔차/Cook 거리가 OLSInfluence 와 일치"""
+        result = model_diagnostics(self.model)
+        influence = OLSInfluence(self.model)
+        np.testing.assert_allclose(result['leverage'], influence.hat_matrix_diag)
+        np.testing.assert_allclose(result['studentized_residuals'], influence.resid_studentized_internal)
+        np.testing.assert_allclose(result['externally_studentized'], influence.resid_studentized_external)
+        np.testing.assert_allclose(result['cooks_distance'], influence.cooks_distance[0])
+
+    def test_rank_deficient_design(self):
+        """계수 부족(별칭) 설계에서도 유효 계수로 계산"""
+        runs = pd.DataFrame(list(itertools.product([0, 1], repeat=3)) * 2, columns=['A', 'B', 'D'])
+        runs['y'] = np.random.default_rng(1).normal(size=len(runs))
+        model = smf.ols('y ~ C(A) + C(B) + C(D) + C(A):C(B) + C(A):C(D) + C(B):C(D)', data=runs).fit()
+        result = model_diagnostics(model)
+        self.assertEqual(result['rank'], 7)
+        np.testing.assert_allclose(result['leverage'], OLSInfluence(model).hat_matrix_diag)
+
+    def test_saturated_design(self):
+        """레버리지 1(포화) 이면 PRESS 는 NaN"""
+        X = np.column_stack([np.ones(4), [-1, 1, -1, 1], [-1, -1, 1, 1], [1, -1, -1, 1]])
+        result = loo_diagnostics(X, np.arange(4.0))
+        self.assertTrue(np.isnan(result['press']))
+        self.assertTrue(np.isnan(result['predicted_r_squared']))
+
+    def test_attached_to_rsm_and_doe(self):
+        """run_rsm_quadratic / run_doe_anova 결과에 진단 첨부"""
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_rsm_quadratic(self.df, 'y', ['a', 'b'])
+        results = holder['res']['results']
+        self.assertAlmostEqual(results['press'], model_diagnostics(self.model)['press'])
+        self.assertEqual(len(results['cooks_distance']), len(self.df))
+
+        self.df['g'] = np.where(self.df['a'] > 0, 'H', 'L')
+        self.df['k'] = np.where(self.df['b'] > 0, 'H', 'L')
+        controller.run_doe_anova(self.df, 'y', ['g', 'k'], bootstrap_samples=0)
+        self.assertIn('predicted_r_squared', holder['res']['results'])
+
+
+if __name__ == '__main__':
+    unittest.main()
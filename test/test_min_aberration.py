@@ -0,0 +1,154 @@
+"""
+최소 aberration 2^(k-p) 생성 열 탐색 단위 테스트
+"""
+
+import sys
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+from utils.aliasing import alias_structure
+import utils.min_aberration as ma
+
+
+class TestMinAberration(unittest.TestCase):
+    """최소 aberration 탐색 테스트"""
+
+    def _find(self, factors, runs, **kwargs):
+        return ma.minimum_aberration(factors, runs, use_catalogue=False, **kwargs)
+
+    def test_known_word_length_patterns(self):
+        # Chen, Sun & Wu (1993) 표의 최소 aberration WLP (A3, A4, A5, ...)
+        cases = {
+            (5, 16): [0, 0, 1],
+            (6, 16): [0, 3, 0],
+            (7, 16): [0, 7, 0],
+            (8, 32): [0, 3, 4],
+            (9, 32): [0, 6, 8],
+            (11, 32): [0, 25, 0, 27],
+        }
+        for (factors, runs), expected in cases.items():
+            info = self._find(factors, runs)
+            wlp = info["word_length_pattern"]
+            self.assertEqual(wlp[2:2 + len(expected)], expected, (factors, runs))
+            self.assertEqual(wlp[:2], [0, 0])
+            self.assertTrue(info["exhaustive"])
+
+    def test_design_string_matches_aliasing(self):
+        info = self._find(7, 16)
+        self.assertEqual(info["resolution"], 4)
+        self.assertEqual(info["runs"], 16)
+        df = DesignController().create_fractional_factorial(info["design_str"])
+        self.assertEqual(df.shape, (16, 7))
+        self.assertEqual(list(df.attrs["aliasing"].word_length_pattern), info["word_length_pattern"])
+        # 2수준 열은 모두 균형·직교
+        X = df.to_numpy()
+        np.testing.assert_array_equal(X.T @ X, 16 * np.eye(7))
+
+    def test_sequential_matches_exhaustive(self):
+        for factors, m in [(8, 4), (9, 5), (12, 5)]:
+            exhaustive = ma.search(factors, m)
+            with mock.patch.object(ma, "EXHAUSTIVE_LIMIT", 0):
+                sequential = ma.search(factors, m)
+            self.assertEqual(sequential["word_length_pattern"], exhaustive["word_length_pattern"], (factors, m))
+            self.assertTrue(sequential["exhaustive"])
+
+    def test_canonical_form_invariance(self):
+        rng = np.random.default_rng(3)
+        m = 5
+        base = ma._columns(np.array([[7, 11, 19, 29]]), m)[0]
+        form = ma.canonical_form(base, m)
+        self.assertIsNotNone(form)
+        for _ in range(5):
+            # 기본 요인 재표현(가역 GF(2) 선형변환) + 열 순서 교환
+            while True:
+                T = rng.integers(0, 2, size=(m, m))
+                if round(abs(np.linalg.det(T))) % 2 == 1:
+                    break
+            bits = (base[:, None] >> np.arange(m)) & 1
+            mapped = (bits @ T.T) % 2 @ (1 << np.arange(m))
+            mapped = rng.permutation(mapped)
+            self.assertEqual(ma.canonical_form(mapped, m), form)
+        other = ma._columns(np.array([[3, 5, 6, 7, 9]]), m)[0]
+        self.assertNotEqual(ma.canonical_form(other, m), form)
+
+    def test_min_resolution(self):
+        info = self._find(8, 16, min_resolution=4)
+        self.assertEqual(info["resolution"], 4)
+        with self.assertRaises(ValueError):
+            self._find(9, 16, min_resolution=4)
+
+    def test_catalogue_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "catalogue.json"
+            first = ma.minimum_aberration(9, 32, catalogue_path=path)
+            self.assertEqual(first["source"], "search")
+            self.assertTrue(path.exists())
+            self.assertIn("9-5", ma.load_catalogue(path))
+            second = ma.minimum_aberration(9, 32, catalogue_path=path)
+            self.assertEqual(second["source"], "catalogue")
+            self.assertEqual(second["design_str"], first["design_str"])
+            with self.assertRaises(ValueError):
+                ma.minimum_aberration(9, 16, min_resolution=4, catalogue_path=path)
+
+    def test_full_factorial_budget(self):
+        info = self._find(4, 20)
+        self.assertEqual(info["runs"], 16)
+        self.assertEqual(info["generators"], [])
+        self.assertIsNone(info["resolution"])
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            self._find(1, 16)
+        with self.assertRaises(ValueError):
+            self._find(16, 16)          # 16런에는 최대 15요인
+        with self.assertRaises(ValueError):
+            self._find(10, 512)
+
+    def test_time_budget(self):
+        """시간 상한을 넘기면 그때까지의 최선 설계를 근사 결과로 반환"""
+        start = time.perf_counter()
+        info = self._find(20, 128, time_budget=0.2)
+        self.assertLess(time.perf_counter() - start, 15)
+        self.assertFalse(info["exhaustive"])
+        self.assertEqual(info["resolution"], 4)
+        aliasing = alias_structure(info["design_str"])
+        self.assertEqual(list(aliasing.word_length_pattern), info["word_length_pattern"])
+        # 작은 문제는 상한 안에 끝나면 완전 탐색 결과 그대로
+        self.assertEqual(self._find(9, 32, time_budget=30)["word_length_pattern"][2:5], [0, 6, 8])
+
+    def test_process_pool_matches_serial(self):
+        """프로세스 풀(한 번 만든 풀 + as_completed)로 나누어도 결과는 직렬과 같음"""
+        serial = ma.search(12, 5)
+        with mock.patch.object(ma, "EXHAUSTIVE_LIMIT", 0):
+            parallel = ma.search(12, 5, max_workers=2, time_budget=60)
+        self.assertEqual(parallel["word_length_pattern"], serial["word_length_pattern"])
+        self.assertTrue(parallel["exhaustive"])
+
+    def test_map_until_cancels_at_deadline(self):
+        """deadline 이 지나면 남은 작업을 취소하고 끝난 앞부분만 반환"""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results, complete = ma._map_until(time.sleep, [0.0] + [0.5] * 20, executor, time.perf_counter())
+        self.assertFalse(complete)
+        self.assertGreaterEqual(len(results), 1)
+        self.assertLess(len(results), 21)
+
+    def test_controller_design(self):
+        df = DesignController().create_min_aberration_design(6, 16, max_workers=1, use_catalogue=False)
+        self.assertEqual(df.shape, (16, 6))
+        self.assertEqual(df.attrs["min_aberration"]["word_length_pattern"][3], 3)
+        self.assertEqual(df.attrs["aliasing"].resolution, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+혼합물 설계(심플렉스 격자/중심/제약 꼭짓점) 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+from math import comb
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+from controllers.mixture_design import (extreme_vertices, iter_extreme_vertices, iter_simplex_lattice,
+                                        lattice_size, simplex_centroid, simplex_lattice)
+
+
+def _recursive_lattice(components, degree):
+    """이전 재귀 구현 (순서 비교용)"""
+    points = []
+
+    def _recurse(parts_left, remaining, current):
+        if parts_left == 1:
+            points.append(current + [remaining])
+            return
+        for i in range(remaining + 1):
+            _recurse(parts_left - 1, remaining - i, current + [i])
+
+    _recurse(components, degree, [])
+    return np.array(points) / degree
+
+
+class TestMixtureDesign(unittest.TestCase):
+    """혼합물 설계 테스트 클래스"""
+
+    def test_lattice_matches_recursive(self):
+        """점/순서가 이전 재귀 구현과 같고 점 수는 C(m+q-1, q-1)"""
+        for q, m in [(2, 1), (3, 3), (4, 2), (5, 4)]:
+            points = simplex_lattice(q, m)
+            np.testing.assert_allclose(points, _recursive_lattice(q, m))
+            self.assertEqual(len(points), comb(m + q - 1, q - 1))
+            np.testing.assert_allclose(points.sum(axis=1), 1.0)
+
+    def test_streaming_lattice(self):
+        """청크를 이어 붙이면 한 번에 만든 격자와 같음, 범위 필터 적용"""
+        full = simplex_lattice(6, 5)
+        chunks = list(iter_simplex_lattice(6, 5, chunk_size=37))
+        self.assertTrue(all(len(c) <= 37 for c in chunks))
+        np.testing.assert_allclose(np.vstack(chunks), full)
+        lower = [0.2, 0, 0, 0, 0, 0]
+        filtered = np.vstack(list(iter_simplex_lattice(6, 5, chunk_size=50, lower=lower)))
+        np.testing.assert_allclose(filtered, full[full[:, 0] >= 0.2 - 1e-12])
+        self.assertEqual(lattice_size(12, 12), comb(23, 11))
+        with self.assertRaises(ValueError):
+            simplex_lattice(12, 12)  # 135만 점 → 스트리밍 모드 안내
+
+    def test_simplex_centroid(self):
+        """2^q - 1 점, 부분집합 크기 순, 전체 중심이 마지막"""
+        points = simplex_centroid(4)
+        self.assertEqual(points.shape, (15, 4))
+        np.testing.assert_allclose(points[:4], np.eye(4))
+        np.testing.assert_allclose(points[-1], [0.25] * 4)
+
+    def test_extreme_vertices_textbook(self):
+        """McLean–Anderson 형 예제: 0.4≤x1≤0.6, 0.1≤x2≤0.5, 0.1≤x3≤0.3"""
+        points = extreme_vertices([0.4, 0.1, 0.1], [0.6, 0.5, 0.3], overall_centroid=False)
+        expected = {(0.4, 0.5, 0.1), (0.6, 0.3, 0.1), (0.6, 0.1, 0.3), (0.4, 0.3, 0.3)}
+        self.assertEqual({tuple(np.round(p, 9)) for p in points}, expected)
+        with_edges = extreme_vertices([0.4, 0.1, 0.1], [0.6, 0.5, 0.3], edge_centroids=True)
+        self.assertEqual(len(with_edges), 4 + 4 + 1)
+        np.testing.assert_allclose(with_edges.sum(axis=1), 1.0)
+
+    def test_extreme_vertices_unconstrained_is_simplex(self):
+        """제약이 없으면 꼭짓점은 순수 성분, 스트리밍 결과 합집합도 같음"""
+        points = extreme_vertices([0] * 5, [1] * 5, overall_centroid=False)
+        self.assertEqual({tuple(p) for p in points}, {tuple(r) for r in np.eye(5)})
+        streamed = np.vstack(list(iter_extreme_vertices([0] * 5, [1] * 5, chunk_size=3)))
+        self.assertEqual({tuple(p) for p in streamed}, {tuple(r) for r in np.eye(5)})
+
+    def test_streamed_vertices_have_no_duplicates(self):
+        """경계에 닿는 꼭짓점/하한=상한 성분이 있어도 청크 사이 중복 없음"""
+        lower, upper = [0.1, 0.1, 0.1, 0, 0, 0.05], [0.3, 0.3, 0.3, 0.5, 0.5, 0.05]
+        streamed = np.vstack(list(iter_extreme_vertices(lower, upper, chunk_size=4)))
+        rounded = {tuple(np.round(p, 9)) for p in streamed}
+        self.assertEqual(len(rounded), len(streamed))
+        full = extreme_vertices(lower, upper, overall_centroid=False)
+        self.assertEqual(rounded, {tuple(np.round(p, 9)) for p in full})
+
+    def test_candidate_limits(self):
+        """스트리밍도 후보 수 상한을 넘으면 첫 청크 전에 오류"""
+        with self.assertRaises(ValueError):
+            next(iter_simplex_lattice(30, 100))
+        with self.assertRaises(ValueError):
+            next(iter_extreme_vertices([0] * 30, [1] * 30))
+
+    def test_controller_and_errors(self):
+        """DesignController 위임과 실행 불가능한 범위 오류"""
+        controller = DesignController()
+        df = controller.create_mixture_design(3, kind="centroid", component_names=['A', 'B', 'C'])
+        self.assertEqual(list(df.columns), ['A', 'B', 'C'])
+        self.assertEqual(len(df), 7)
+        chunks = list(controller.iter_mixture_design(4, degree=6, chunk_size=20))
+        self.assertEqual(sum(len(c) for c in chunks), comb(9, 3))
+        with self.assertRaises(ValueError):
+            controller.create_mixture_design(3, kind="extreme_vertices", lower=[0.5, 0.4, 0.2])
+        with self.assertRaises(ValueError):
+            controller.create_mixture_design(3, kind="lattice", lower=[0.9, 0, 0], upper=[0.95, 0.05, 0.04])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+정규성 검정 서비스 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scipy import stats
+from utils.normality import NormalityTestService, normality_test, select_normality_test
+
+
+class TestNormalityService(unittest.TestCase):
+    """NormalityTestService 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        rng = np.random.default_rng(3)
+        self.columns = {
+            'small': rng.normal(size=200),
+            'medium': rng.standard_t(5, size=8000),
+            'large': rng.normal(size=60000),
+            'tiny': np.array([1.0, np.nan]),
+        }
+        self.service = NormalityTestService(max_workers=3)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.service.shutdown()
+
+    def test_select_by_sample_size(self):
+        """표본 크기별 검정 선택"""
+        self.assertIsNone(select_normality_test(2))
+        self.assertEqual(select_normality_test(100), 'shapiro')
+        self.assertEqual(select_normality_test(8000), 'anderson')
+        self.assertEqual(select_normality_test(60000), 'dagostino')
+
+    def test_matches_reference_tests(self):
+        """선택된 검정 결과가 기준 구현과 일치"""
+        small = normality_test(self.columns['small'])
+        self.assertAlmostEqual(small['p_value'], stats.shapiro(self.columns['small']).pvalue, places=10)
+
+        large = normality_test(self.columns['large'])
+        self.assertAlmostEqual(large['p_value'], stats.normaltest(self.columns['large']).pvalue, places=10)
+
+        medium = normality_test(self.columns['medium'])
+        self.assertEqual(medium['test_name'], 'Anderson-Darling')
+        from statsmodels.stats.diagnostic import normal_ad
+        reference_stat, reference_p = normal_ad(self.columns['medium'])
+        self.assertAlmostEqual(medium['statistic'], reference_stat, places=6)
+        self.assertAlmostEqual(medium['p_value'], reference_p, places=10)
+        self.assertFalse(medium['normal'])
+
+    def test_run_in_pool_preserves_order(self):
+        """작업자 풀 결과가 입력 열 순서로 반환"""
+        columns = {name: (None, values) for name, values in self.columns.items()}
+        results = self.service.run(columns)
+        self.assertEqual(list(results), list(self.columns))
+        self.assertIsNone(results['tiny']['test'])
+        self.assertTrue(results['small']['normal'])
+
+    def test_cache_by_column_version(self):
+        """같은 열 버전은 캐시, 버전이 바뀌면 재검정"""
+        calls = []
+        first = self.service.run({'small': (('d', 'small', 1), lambda: calls.append(1) or self.columns['small'])})
+        second = self.service.run({'small': (('d', 'small', 1), lambda: calls.append(2) or self.columns['small'])})
+        self.assertIs(first['small'], second['small'])
+        self.assertEqual(calls, [1])
+
+        self.service.run({'small': (('d', 'small', 2), lambda: calls.append(3) or self.columns['small'])})
+        self.assertEqual(calls, [1, 3])
+
+    def test_cache_is_bounded(self):
+        """셀 편집마다 버전이 늘어도 캐시는 상한을 넘지 않고 최근 키를 유지"""
+        service = NormalityTestService(max_workers=1, cache_size=3)
+        self.addCleanup(service.shutdown)
+        values = self.columns['small']
+        for version in range(6):
+            service.run({'small': (('d', 'small', version), values)})
+        self.assertEqual(len(service._cache), 3)
+        self.assertIsNone(service.cached(('d', 'small', 0)))
+        self.assertIsNotNone(service.cached(('d', 'small', 5)))
+
+    def test_cancel_drops_stale_results(self):
+        """취소된 요청의 결과는 콜백으로 전달되지 않음"""
+        import threading
+        service = NormalityTestService(max_workers=1)
+        gate = threading.Event()
+        received = []
+
+        # Given: 작업자를 잠시 막아 둔 상태에서 요청
+        service._get_executor().submit(gate.wait)
+        service.submit({'small': (None, self.columns['small'])}, lambda c, r: received.append(c))
+        # When
+        service.cancel()
+        gate.set()
+        service._executor.shutdown(wait=True)
+        # Then
+        self.assertEqual(received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+D-/I-최적 설계 (Fedorov 교환) 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+from utils.optimal_design import (_initial_rows, candidate_grid, constraint_mask, exchange, model_matrix,
+                                  optimal_design, parse_constraint)
+
+
+class TestOptimalDesign(unittest.TestCase):
+    """최적 설계 테스트 클래스"""
+
+    def test_rank_one_updates_match_direct(self):
+        """교환 후 추적한 log det / tr(M⁻¹W) 가 정보행렬을 직접 계산한 값과 같음"""
+        F = model_matrix(candidate_grid(3, 3), "quadratic")
+        W = F.T @ F / len(F)
+        rng = np.random.default_rng(0)
+        for criterion in ("D", "I"):
+            rows = _initial_rows(F, np.zeros((0, F.shape[1])), 14, rng)
+            result = exchange(F, np.zeros((0, F.shape[1])), rows, criterion, W, max_passes=1)
+            M = F[result["rows"]].T @ F[result["rows"]]
+            self.assertGreater(result["exchanges"], 0)
+            self.assertAlmostEqual(result["logdet"], np.linalg.slogdet(M)[1], places=8)
+            if criterion == "I":
+                self.assertAlmostEqual(result["value"], np.trace(np.linalg.solve(M, W)), places=8)
+
+    def test_time_budget(self):
+        """전체 시간 상한을 넘기면 그때까지의 최선 설계를 timed_out=True 로 반환"""
+        names = [f'F{i}' for i in range(7)]
+        result = optimal_design(names, 50, criterion="I", n_starts=20, time_budget=0.2)
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(len(result["design"]), 50)
+        self.assertGreater(result["d_efficiency"], 0)
+        self.assertFalse(optimal_design(['A', 'B'], 9, n_starts=2, time_budget=30)["timed_out"])
+
+    def test_known_optimum(self):
+        """1차 모형 2³ 8런 D-최적은 완전요인설계 (D-효율 100%)"""
+        result = optimal_design(['A', 'B', 'C'], 8, model="linear", n_starts=4, seed=1)
+        self.assertAlmostEqual(result["d_efficiency"], 100.0, places=6)
+        corners = {tuple(row) for row in result["design"][['A', 'B', 'C']].to_numpy()}
+        self.assertEqual(len(corners), 8)
+
+    def test_i_optimal_lower_average_variance(self):
+        """I-최적 설계의 평균 예측분산 ≤ D-최적 설계"""
+        d_opt = optimal_design(['A', 'B', 'C'], 15, criterion="D", n_starts=6, seed=2)
+        i_opt = optimal_design(['A', 'B', 'C'], 15, criterion="I", n_starts=6, seed=2)
+        self.assertLessEqual(i_opt["average_variance"], d_opt["average_variance"] + 1e-12)
+        self.assertGreaterEqual(d_opt["d_efficiency"], i_opt["d_efficiency"] - 1e-9)
+
+    def test_parallel_starts_deterministic(self):
+        """같은 seed 면 작업자 수와 무관하게 같은 설계"""
+        serial = optimal_design(['A', 'B'], 9, n_starts=6, seed=7)
+        parallel = optimal_design(['A', 'B'], 9, n_starts=6, seed=7, max_workers=3)
+        pd.testing.assert_frame_equal(serial["design"], parallel["design"])
+
+    def test_constraints_and_fixed_runs(self):
+        """제약조건을 만족하는 후보만 사용하고 고정 런은 그대로 포함"""
+        constraint = parse_constraint("A + B <= 15", ['A', 'B'])
+        self.assertEqual(constraint, {"coefficients": {'A': 1.0, 'B': 1.0}, "upper": 15.0})
+        result = optimal_design(['A', 'B'], 8, model="interaction", levels=5, bounds=[(0, 10), (0, 10)],
+                                constraints=[constraint], fixed_runs=[[5, 5]], seed=0)
+        design = result["design"]
+        self.assertEqual(len(design), 8)
+        self.assertEqual(design["Fixed"].tolist(), [True] + [False] * 7)
+        self.assertEqual(design.loc[0, ['A', 'B']].tolist(), [5.0, 5.0])
+        free = design[~design["Fixed"]]
+        self.assertTrue(np.all(free['A'] + free['B'] <= 15 + 1e-9))
+        self.assertTrue(np.all(constraint_mask(free[['A', 'B']].to_numpy(), ['A', 'B'], [constraint])))
+
+    def test_controller_and_errors(self):
+        """컨트롤러 DataFrame/효율 지표와 입력 오류"""
+        df = DesignController().create_optimal_design(3, 12, criterion="D", n_starts=3)
+        self.assertEqual(list(df.columns), ['F1', 'F2', 'F3'])
+        self.assertEqual(len(df), 12)
+        self.assertEqual(df.attrs["optimal_design"]["n_parameters"], 10)
+        with self.assertRaises(ValueError):
+            optimal_design(['A', 'B', 'C'], 5)  # 런 < 계수
+        with self.assertRaises(ValueError):
+            optimal_design(['A', 'B'], 6, constraints=[{"coefficients": {'A': 1}, "upper": -5}])
+        with self.assertRaises(ValueError):
+            parse_constraint("A + Z <= 1", ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+직교배열 카탈로그/강도 검사 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+from utils.orthogonal_arrays import (CATALOGUE, galois_field, is_orthogonal, orthogonal_array, resolve,
+                                     strength)
+
+
+class TestOrthogonalArrays(unittest.TestCase):
+    """직교배열 테스트 클래스"""
+
+    def test_catalogue_is_orthogonal(self):
+        """모든 카탈로그 배열이 선언한 크기/수준 구성으로 강도 2 를 만족"""
+        for name, spec in CATALOGUE.items():
+            with self.subTest(name=name):
+                array = orthogonal_array(name)
+                self.assertEqual(array.shape, (spec.runs, spec.columns))
+                self.assertEqual(list(array.max(axis=0) + 1), spec.column_levels)
+                self.assertTrue(is_orthogonal(array, 2, spec.column_levels))
+
+    def test_legacy_tables_unchanged(self):
+        """기존 L4/L8/L9 표와 같은 값/열 순서"""
+        l8 = [[1, 1, 1, 1, 1, 1, 1], [1, 1, 1, 2, 2, 2, 2], [1, 2, 2, 1, 1, 2, 2], [1, 2, 2, 2, 2, 1, 1],
+              [2, 1, 2, 1, 2, 1, 2], [2, 1, 2, 2, 1, 2, 1], [2, 2, 1, 1, 2, 2, 1], [2, 2, 1, 2, 1, 1, 2]]
+        l9 = [[1, 1, 1, 1], [1, 2, 2, 2], [1, 3, 3, 3], [2, 1, 2, 3], [2, 2, 3, 1],
+              [2, 3, 1, 2], [3, 1, 3, 2], [3, 2, 1, 3], [3, 3, 2, 1]]
+        np.testing.assert_array_equal(orthogonal_array("L4") + 1, [[1, 1, 1], [1, 2, 2], [2, 1, 2], [2, 2, 1]])
+        np.testing.assert_array_equal(orthogonal_array("L8") + 1, l8)
+        np.testing.assert_array_equal(orthogonal_array("L9") + 1, l9)
+
+    def test_strength_check(self):
+        """강도 검사: 완전요인은 강도 k, 한 칸을 바꾸면 강도 0, 2^(3-1) 은 강도 2"""
+        full = np.array([[a, b, c] for a in range(2) for b in range(3) for c in range(2)])
+        self.assertEqual(strength(full), 3)
+        broken = full.copy()
+        broken[0, 1] = 1
+        self.assertEqual(strength(broken), 0)
+        self.assertEqual(strength(orthogonal_array("L4")), 2)
+        self.assertFalse(is_orthogonal(orthogonal_array("L8")[:6], 2))
+
+    def test_galois_field(self):
+        """GF(q) 곱셈군: 0 이 아닌 원소마다 역원이 있고 분배법칙 성립"""
+        for q in (4, 8, 9, 25, 27):
+            add, mul = galois_field(q)
+            for a in range(1, q):
+                self.assertIn(1, mul[a, 1:])
+            a, b, c = np.meshgrid(range(q), range(q), range(q), indexing="ij")
+            np.testing.assert_array_equal(mul[a, add[b, c]], add[mul[a, b], mul[a, c]])
+
+    def test_resolve_and_cache(self):
+        """짧은 이름/대소문자/공백 정규화, 메모이즈된 읽기 전용 배열"""
+        self.assertEqual(resolve("l16").name, "L16(2^15)")
+        self.assertEqual(resolve("L16(4^5)").name, "L16(4^5)")
+        self.assertEqual(resolve(" L36(2^11  3^12) ").name, "L36(2^11 3^12)")
+        self.assertIs(orthogonal_array("L27(3^13)"), orthogonal_array("L27(3^13)"))
+        self.assertFalse(orthogonal_array("L12").flags.writeable)
+        with self.assertRaises(ValueError):
+            resolve("L13")
+
+    def test_controller(self):
+        """13요인 L27 과 혼합 L18, 요인 수 초과 오류"""
+        controller = DesignController()
+        df = controller.create_orthogonal_array(13, design="L27")
+        self.assertEqual(df.shape, (27, 13))
+        self.assertEqual(df.min().min(), 1)
+        self.assertEqual(df.max().max(), 3)
+        l18 = controller.create_orthogonal_array(8, design="L18")
+        self.assertEqual([l18[c].nunique() for c in l18.columns], [2] + [3] * 7)
+        with self.assertRaises(ValueError):
+            controller.create_orthogonal_array(12, design="L12(2^11)")
+        names = [item["name"] for item in controller.list_orthogonal_arrays()]
+        self.assertIn("L81(3^40)", names)
+
+
+if __name__ == '__main__':
+    unittest.main()
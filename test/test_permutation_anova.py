@@ -0,0 +1,83 @@
+"""
+순열검정 ANOVA 엔진 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import itertools
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from utils.permutation_anova import permutation_anova, permutation_oneway
+
+
+class TestPermutationAnova(unittest.TestCase):
+    """순열 ANOVA 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 3x2x2 불균형 설계, 치우친 계수형 반응"""
+        rng = np.random.default_rng(0)
+        runs = list(itertools.product(['a1', 'a2', 'a3'], ['b1', 'b2'], ['d1', 'd2'])) * 4
+        self.df = pd.DataFrame(runs, columns=['A', 'B', 'D']).iloc[:-3]
+        self.df['Y'] = rng.poisson(3 + 2 * (self.df['A'] == 'a3')).astype(float)
+
+    def test_observed_f_matches_statsmodels(self):
+        """관측 F/제곱합이 anova_lm(typ=2) 와 일치"""
+        for interactions, rhs in ((False, 'C(A) + C(B) + C(D)'),
+                                  (True, 'C(A) + C(B) + C(D) + C(A):C(B) + C(A):C(D) + C(B):C(D)')):
+            result = permutation_anova(self.df, 'Y', ['A', 'B', 'D'], interactions=interactions, n_permutations=99)
+            expected = sm.stats.anova_lm(smf.ols(f'Y ~ {rhs}', data=self.df).fit(), typ=2)
+            pd.testing.assert_frame_equal(result['anova'][['sum_sq', 'df', 'F', 'PR(>F)']], expected,
+                                          check_exact=False, rtol=1e-8)
+
+    def test_permutation_p_close_to_f_test(self):
+        """정규 근사가 맞는 경우 순열 p-값이 F 검정 p-값과 가까움"""
+        anova = permutation_anova(self.df, 'Y', ['A', 'B'], n_permutations=4999)['anova']
+        diff = (anova['PR(perm)'] - anova['PR(>F)']).abs().dropna()
+        self.assertTrue((diff < 0.03).all(), diff)
+
+    def test_oneway_shortcut(self):
+        """일원 배치 그룹 합 계산이 scipy f_oneway 와 같은 F"""
+        from scipy import stats
+        result = permutation_oneway(self.df['Y'], self.df['A'], n_permutations=999, seed=1)
+        groups = [g['Y'].values for _, g in self.df.groupby('A')]
+        self.assertAlmostEqual(result['f_statistic'], stats.f_oneway(*groups).statistic, places=10)
+        self.assertGreaterEqual(result['p_value'], 1 / 1000)
+
+    def test_deterministic_across_workers(self):
+        """같은 seed 면 작업자 수·청크 병렬과 무관하게 같은 p-값"""
+        serial = permutation_anova(self.df, 'Y', ['A', 'B'], n_permutations=3000, seed=5, chunk_size=500)
+        threaded = permutation_anova(self.df, 'Y', ['A', 'B'], n_permutations=3000, seed=5, chunk_size=500,
+                                     max_workers=3)
+        pd.testing.assert_frame_equal(serial['anova'], threaded['anova'])
+
+    def test_controller_method(self):
+        """AnalysisController.run_permutation_anova 결과 구조"""
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(name=name, res=res))
+        controller.run_permutation_anova(self.df, response='Y', factors=['A'], n_permutations=199)
+        self.assertEqual(holder['name'], '순열 ANOVA')
+        results = holder['res']['results']
+        self.assertIn('PR(perm)', results['anova'].columns)
+        self.assertEqual(results['n_permutations'], 199)
+
+
+if __name__ == '__main__':
+    unittest.main()
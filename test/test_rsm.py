@@ -0,0 +1,177 @@
+"""
+RSM 엔진(정준분석/정상점/격자 예측) 단위 테스트
+"""
+
+import sys
+import os
+import json
+import time
+import unittest
+import warnings
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import statsmodels.formula.api as smf
+
+from core.analysis import AnalysisService
+from core.charts import ChartBuilder
+from core.errors import AnalysisError, ChartError
+from models.analysis_result import ResponseSurfaceResults
+from models.project import Project
+from utils.compact_array import CompactArray
+from utils.rsm import QuadraticModel, quadratic_term_names
+
+
+def _ccd(center=(60.0, 3.0), half=(20.0, 2.0)):
+    """2요인 CCD (α=√2, 중심점 5회) 원 단위 좌표"""
+    a = np.sqrt(2)
+    coded = np.array([[-1, -1], [1, -1], [-1, 1], [1, 1], [-a, 0], [a, 0], [0, -a], [0, a]] + [[0, 0]] * 5)
+    return coded * np.array(half) + np.array(center)
+
+
+class TestRsm(unittest.TestCase):
+    """2차 반응표면 엔진 테스트 클래스"""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        X = _ccd()
+        A, B = X[:, 0], X[:, 1]
+        # 최대점 (A, B) = (62, 2.5)
+        y = 100 - 0.04 * (A - 62) ** 2 - 2.5 * (B - 2.5) ** 2 + 0.05 * (A - 62) * (B - 2.5)
+        self.df = pd.DataFrame({'A': A, 'B': B, 'y': y + rng.normal(0, 0.2, len(y))})
+
+    def test_matches_statsmodels(self):
+        """항 이름/순서, 적합값, 평균 예측 표준오차가 statsmodels 2차 모형과 일치"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.uniform(-3, 3, size=(25, 3)), columns=['A', 'B', 'C'])
+        df['y'] = 1 + df.A - 2 * df.B ** 2 + df.A * df.C + rng.normal(0, 0.5, 25)
+        ols = smf.ols('y ~ A + B + C + A:B + A:C + B:C + I(A**2) + I(B**2) + I(C**2)', df).fit()
+        self.assertEqual(quadratic_term_names(['A', 'B', 'C']), list(ols.params.index))
+
+        model = QuadraticModel.from_frame(df, 'y', ['A', 'B', 'C'])
+        fit, se = model.predict(df[['A', 'B', 'C']].to_numpy())
+        np.testing.assert_allclose(fit, ols.fittedvalues, rtol=1e-9)
+        np.testing.assert_allclose(se, ols.get_prediction(df).se_mean, rtol=1e-8)
+        self.assertAlmostEqual(model.sigma2, ols.scale, places=10)
+
+    def test_stationary_point(self):
+        """최대점 위치/종류와 B, b 추출"""
+        model = QuadraticModel.from_frame(self.df, 'y', ['A', 'B'])
+        B = model.B
+        np.testing.assert_allclose(B, B.T)
+        ca = model.canonical_analysis()
+        self.assertEqual(ca['nature'], '최대')
+        self.assertFalse(ca['ridge'])
+        self.assertTrue(ca['within_region'])
+        self.assertAlmostEqual(ca['stationary_point']['A'], 62, delta=0.5)
+        self.assertAlmostEqual(ca['stationary_point']['B'], 2.5, delta=0.05)
+        self.assertAlmostEqual(ca['stationary_response'], 100, delta=0.5)
+        self.assertTrue(all(v < 0 for v in ca['eigenvalues']))
+        # 고유벡터는 정규직교
+        V = ca['eigenvectors'].to_numpy()
+        np.testing.assert_allclose(V.T @ V, np.eye(2), atol=1e-12)
+        # 정상점에서의 예측값 = b0 + ½ x_sᵀ b
+        fit, _ = model.predict(np.array([[ca['stationary_point']['A'], ca['stationary_point']['B']]]))
+        self.assertAlmostEqual(fit[0], ca['stationary_response'], places=8)
+
+    def test_nature(self):
+        """최소/안장점/능선 판정"""
+        X = _ccd(center=(0, 0), half=(1, 1))
+        A, B = X[:, 0], X[:, 1]
+        cases = {
+            '최소': A ** 2 + B ** 2,
+            '안장점': A ** 2 - B ** 2,
+            '능선': 2 * A + B,
+        }
+        for nature, y in cases.items():
+            df = pd.DataFrame({'A': A, 'B': B, 'y': y})
+            ca = QuadraticModel.from_frame(df, 'y', ['A', 'B']).canonical_analysis()
+            self.assertEqual(ca['nature'], nature, nature)
+
+        # 고유값 하나가 0 인 상승 능선: 종류는 나머지 고유값 부호, 정상점은 정의되지 않음
+        df = pd.DataFrame({'A': A, 'B': B, 'y': -(A - B) ** 2 + 0.5 * (A + B)})
+        ca = QuadraticModel.from_frame(df, 'y', ['A', 'B']).canonical_analysis()
+        self.assertEqual(ca['nature'], '최대')
+        self.assertTrue(ca['ridge'])
+        self.assertIsNone(ca['stationary_point'])
+
+    def test_grid(self):
+        """격자 예측 = 점별 예측, 고정 요인, 해상도 검증, 500×500 속도"""
+        model = QuadraticModel.from_frame(self.df, 'y', ['A', 'B'])
+        grid = model.grid('A', 'B', resolution=30)
+        self.assertEqual(grid['fit'].shape, (30, 30))
+        i, j = 7, 19
+        fit, se = model.predict(np.array([[grid['x'][j], grid['y'][i]]]))
+        self.assertAlmostEqual(grid['fit'][i, j], fit[0], places=10)
+        self.assertAlmostEqual(grid['se'][i, j], se[0], places=10)
+        self.assertAlmostEqual(grid['x'][0], self.df.A.min())
+        self.assertAlmostEqual(grid['y'][-1], self.df.B.max())
+
+        with self.assertRaises(ValueError):
+            model.grid('A', 'A')
+        with self.assertRaises(ValueError):
+            model.grid('A', 'B', resolution=5000)
+
+        start = time.perf_counter()
+        big = model.grid('A', 'B', resolution=500)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(big['se'].shape, (500, 500))
+        self.assertTrue(np.all(big['se'] > 0))
+
+        df3 = self.df.assign(C=np.linspace(0, 1, len(self.df)))
+        df3['y'] = df3.y + 3 * df3.C
+        model3 = QuadraticModel.from_frame(df3, 'y', ['A', 'B', 'C'])
+        low = model3.grid('A', 'B', resolution=10, fixed={'C': 0.0})
+        high = model3.grid('A', 'B', resolution=10, fixed={'C': 1.0})
+        self.assertEqual(low['fixed'], {'C': 0.0})
+        self.assertGreater(high['fit'].mean(), low['fit'].mean())
+
+    def test_service(self):
+        """rsm_quadratic 정준분석 첨부, rsm_surface 격자 결과와 저장/복원"""
+        service = AnalysisService()
+        res = service.rsm_quadratic(self.df, 'y', ['A', 'B'])
+        self.assertEqual(res['results']['canonical_analysis']['nature'], '최대')
+
+        surface = service.rsm_surface(self.df, 'y', ['A', 'B'], resolution=40)
+        results = surface['results']
+        self.assertIsInstance(results, ResponseSurfaceResults)
+        self.assertIsInstance(results['fit'], CompactArray)
+        self.assertEqual(results['fit'].shape, (40, 40))
+        self.assertEqual(results['nature'], '최대')
+
+        project = Project(name='p')
+        project.add_analysis(surface)
+        loaded = Project.from_dict(json.loads(json.dumps(project.to_dict()))).analysis_history[0]
+        np.testing.assert_array_equal(np.asarray(loaded['results']['fit']), np.asarray(results['fit']))
+
+        with self.assertRaises(AnalysisError):
+            service.rsm_surface(self.df, 'y', ['A', 'B'], x_factor='A', y_factor='A')
+        with self.assertRaises(AnalysisError):
+            service.rsm_surface(self.df.head(4), 'y', ['A', 'B'])
+
+    def test_charts(self):
+        """등고선도/3D 표면도 차트 생성"""
+        builder = ChartBuilder()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            for chart_type in ('등고선도', '3D 표면도'):
+                info = builder.create_chart(chart_type, self.df, x_var='A', y_var='B',
+                                            options={'response': 'y', 'resolution': 50})
+                self.assertEqual(info['type'], chart_type)
+                self.assertTrue(info['figure'].axes)
+                plt.close(info['figure'])
+        self.assertEqual(info['figure'].axes[0].name, '3d')
+        with self.assertRaises(ChartError):
+            builder.create_chart('등고선도', self.df, x_var='A', y_var='B')
+        with self.assertRaises(ChartError):
+            builder.create_chart('등고선도', self.df, x_var='A', y_var='A', options={'response': 'y'})
+
+
+if __name__ == '__main__':
+    unittest.main()
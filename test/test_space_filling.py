@@ -0,0 +1,137 @@
+"""
+공간 채움 설계(LHS, maximin LHS, Sobol/Halton) 단위 테스트
+"""
+
+import sys
+import os
+import time
+import unittest
+
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+import utils.space_filling as sf
+
+
+class TestSpaceFilling(unittest.TestCase):
+    """공간 채움 설계 테스트"""
+
+    def _assert_latin(self, design):
+        n = len(design)
+        cells = np.floor(np.asarray(design) * n).astype(int)
+        np.testing.assert_array_equal(np.sort(cells, axis=0), np.repeat(np.arange(n)[:, None], design.shape[1], 1))
+
+    def test_latin_hypercube(self):
+        """열마다 n 칸에 한 점씩, 칸 중앙 옵션, 시드 재현"""
+        design = sf.latin_hypercube(40, 6, seed=1)
+        self.assertEqual(design.shape, (40, 6))
+        self._assert_latin(design)
+        np.testing.assert_array_equal(design, sf.latin_hypercube(40, 6, seed=1))
+        centered = sf.latin_hypercube(10, 3, seed=2, centered=True)
+        np.testing.assert_allclose(np.sort(centered[:, 0]), (np.arange(10) + 0.5) / 10)
+
+    def test_incremental_tracking_matches_full(self):
+        """증분 갱신한 φ_p 가 최종 설계에서 새로 구한 φ_p 와 같고 LHS 구조 유지"""
+        rng = np.random.default_rng(5)
+        for n, d in [(30, 2), (200, 8)]:
+            levels = sf._lhs_levels(n, d, rng)
+            result = sf._anneal(levels, 8000, 50.0, rng, None)
+            best = result['levels']
+            np.testing.assert_array_equal(np.sort(best, axis=1), np.tile(np.arange(n), (d, 1)))
+            full = sf.distance_metrics(best.T / n, p=50.0)['phi_p']
+            self.assertAlmostEqual(result['phi_p'] / full, 1.0, places=9)
+
+    def test_maximin_improves_random_lhs(self):
+        """maximin LHS 최소 거리 > 무작위 LHS 20개 중 최선"""
+        for n, d in [(20, 2), (100, 5)]:
+            random_best = max(sf.distance_metrics(sf.latin_hypercube(n, d, seed=s, centered=True), p=None)
+                              ['min_distance'] for s in range(20))
+            result = sf.maximin_lhs(n, d, seed=3, restarts=2)
+            self.assertGreater(result['min_distance'], 1.2 * random_best)
+            self.assertGreater(result['min_distance'], result['initial_min_distance'])
+            self._assert_latin(result['design'])
+            self.assertEqual(result['restarts'], 2)
+
+    def test_restarts_reproducible_across_workers(self):
+        """같은 seed 면 직렬/프로세스 병렬 결과가 같다"""
+        serial = sf.maximin_lhs(30, 3, seed=7, restarts=3, iterations=2000)
+        parallel = sf.maximin_lhs(30, 3, seed=7, restarts=3, iterations=2000, max_workers=2, use_processes=True)
+        np.testing.assert_array_equal(serial['design'], parallel['design'])
+
+    def test_large_design(self):
+        """2000런 × 20차원을 시간 한도 안에서 개선"""
+        start = time.perf_counter()
+        result = sf.maximin_lhs(2000, 20, seed=0, restarts=1, iterations=3000, time_budget=20)
+        self.assertLess(time.perf_counter() - start, 30)
+        self.assertGreater(result['min_distance'], 1.2 * result['initial_min_distance'])
+        self.assertEqual(result['design'].shape, (2000, 20))
+
+    def test_total_time_budget(self):
+        """time_budget 은 재시작 전체 한도"""
+        result = sf.maximin_lhs(3000, 10, seed=0, restarts=4, time_budget=2)
+        self.assertLess(result['elapsed'], 6)
+        self.assertEqual(result['restarts'], 4)
+
+    def test_distance_metrics(self):
+        """블록 계산 최소 거리/φ_p = 전체 쌍 직접 계산"""
+        rng = np.random.default_rng(0)
+        X = rng.random((1500, 4))
+        d = np.sqrt(((X[:, None, :] - X[None, :, :]) ** 2).sum(axis=2))[np.triu_indices(1500, 1)]
+        metrics = sf.distance_metrics(X, p=10.0)
+        self.assertAlmostEqual(metrics['min_distance'], d.min(), places=6)
+        self.assertAlmostEqual(metrics['phi_p'] / (d ** -10.0).sum() ** 0.1, 1.0, places=6)
+
+    def test_low_discrepancy(self):
+        """스크램블 Sobol 2^m 점은 축마다 균형, Halton 은 시드 재현"""
+        sobol = sf.low_discrepancy(64, 5, kind='sobol', seed=1)
+        counts = np.stack([np.bincount(np.floor(sobol[:, j] * 8).astype(int), minlength=8) for j in range(5)])
+        np.testing.assert_array_equal(counts, 8)
+        halton = sf.low_discrepancy(50, 3, kind='halton', seed=2)
+        np.testing.assert_array_equal(halton, sf.low_discrepancy(50, 3, kind='halton', seed=2))
+        with self.assertRaises(ValueError):
+            sf.low_discrepancy(10, 2, kind='faure')
+
+    def test_space_filling_design(self):
+        """요인 범위 변환, 불일치도: Sobol < 무작위 LHS"""
+        bounds = [(10, 20), (-1, 1), (0, 100)]
+        sobol = sf.space_filling_design(['a', 'b', 'c'], 128, kind='sobol', bounds=bounds, seed=0)
+        lhs = sf.space_filling_design(['a', 'b', 'c'], 128, kind='lhs', bounds=bounds, seed=0)
+        for result in (sobol, lhs):
+            design = result['design']
+            self.assertEqual(list(design.columns), ['a', 'b', 'c'])
+            self.assertTrue(((design >= [10, -1, 0]) & (design <= [20, 1, 100])).all().all())
+        self.assertTrue(sobol['balanced'])
+        self.assertLess(sobol['discrepancy'], lhs['discrepancy'])
+        self.assertFalse(sf.space_filling_design(['a'], 100, kind='sobol')['balanced'])
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            sf.space_filling_design(['a'], 10, kind='grid')
+        with self.assertRaises(ValueError):
+            sf.space_filling_design(['a', 'b'], 1)
+        with self.assertRaises(ValueError):
+            sf.space_filling_design(['a', 'b'], 10, bounds=[(0, 1), (2, 2)])
+        with self.assertRaises(ValueError):
+            sf.maximin_lhs(10, 2, p=0)
+        with self.assertRaises(ValueError):
+            sf.space_filling_design(['a', 'b'], sf.MAXIMIN_MAX_RUNS + 1)   # 거리 행렬을 만들기 전에 거부
+        self.assertEqual(len(sf.space_filling_design(['a', 'b'], sf.MAXIMIN_MAX_RUNS + 1, kind='sobol')['design']),
+                         sf.MAXIMIN_MAX_RUNS + 1)
+
+    def test_controller_design(self):
+        df = DesignController().create_space_filling_design(4, 40, bounds=[(0, 5)] * 4, seed=1, restarts=2)
+        self.assertEqual(df.shape, (40, 4))
+        self.assertEqual(list(df.columns), ['X1', 'X2', 'X3', 'X4'])
+        info = df.attrs['space_filling']
+        self.assertEqual(info['kind'], 'maximin_lhs')
+        self._assert_latin(df.to_numpy() / 5)
+        self.assertGreater(info['min_distance'], info['initial_min_distance'])
+        with self.assertRaises(ValueError):
+            DesignController().create_space_filling_design(2, 10, factor_names=['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+분할구 설계(벡터화 생성) 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from controllers.design_controller import DesignController
+
+
+class TestSplitPlot(unittest.TestCase):
+    """분할구 설계 테스트"""
+
+    def setUp(self):
+        self.controller = DesignController()
+
+    def test_structure(self):
+        df = self.controller.create_split_plot([2, 3], [2, 2], seed=1)
+        self.assertEqual(list(df.columns), ["W1", "W2", "S1", "S2", "WholePlot"])
+        self.assertEqual(len(df), 6 * 4)
+        self.assertEqual(df["WholePlot"].nunique(), 6)
+
+    def test_level_grid_matches_fullfact_order(self):
+        grid = DesignController._level_grid([2, 3])
+        expected = self.controller.create_full_factorial([2, 3]).to_numpy()
+        np.testing.assert_array_equal(grid, expected)
+
+    def test_whole_plot_factors_constant(self):
+        df = self.controller.create_split_plot([3, 2], [2, 3], seed=7)
+        for _, block in df.groupby("WholePlot"):
+            self.assertEqual(len(block[["W1", "W2"]].drop_duplicates()), 1)
+            # 각 전구에 세구 완전요인이 한 번씩
+            self.assertEqual(len(block[["S1", "S2"]].drop_duplicates()), 6)
+        # 전구 요인 조합도 한 번씩
+        self.assertEqual(len(df[["W1", "W2"]].drop_duplicates()), 6)
+
+    def test_seed_is_deterministic(self):
+        a = self.controller.create_split_plot([2, 2], [3, 2], seed=42)
+        b = self.controller.create_split_plot([2, 2], [3, 2], seed=42)
+        self.assertTrue(a.equals(b))
+
+    def test_shared_subplot_order(self):
+        df = self.controller.create_split_plot([4], [2, 3], seed=3, seed_per_block=False)
+        orders = [tuple(map(tuple, block[["S1", "S2"]].to_numpy())) for _, block in df.groupby("WholePlot")]
+        self.assertEqual(len(set(orders)), 1)
+
+    def test_no_randomization_is_standard_order(self):
+        df = self.controller.create_split_plot([2], [2, 2], randomize_whole=False, randomize_subplot=False)
+        np.testing.assert_array_equal(df["W1"].to_numpy(), [0, 0, 0, 0, 1, 1, 1, 1])
+        np.testing.assert_array_equal(df["S1"].to_numpy(), [0, 1, 0, 1] * 2)
+
+    def test_replicates(self):
+        df = self.controller.create_split_plot([2, 2], [2], replicates=3, seed=0)
+        self.assertEqual(len(df), 4 * 2 * 3)
+        self.assertEqual(df["WholePlot"].nunique(), 12)
+        for _, rep in df.groupby("Replicate"):
+            self.assertEqual(len(rep[["W1", "W2"]].drop_duplicates()), 4)
+
+    def test_invalid_levels(self):
+        with self.assertRaises(ValueError):
+            self.controller.create_split_plot([2, 0], [2])
+        with self.assertRaises(ValueError):
+            self.controller.create_split_plot([], [2])
+        with self.assertRaises(ValueError):
+            self.controller.create_split_plot([2], [2], replicates=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
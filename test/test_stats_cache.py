@@ -0,0 +1,138 @@
+"""
+증분 통계 캐시 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtWidgets import QApplication, QTableWidgetItem
+from utils.stats_cache import DatasetStatsCache
+from views.data_view import DataTableView
+
+
+class TestDatasetStatsCache(unittest.TestCase):
+    """DatasetStatsCache 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비"""
+        rng = np.random.default_rng(1)
+        self.df = pd.DataFrame({
+            'x': rng.normal(100, 5, 200),
+            'n': rng.integers(0, 10, 200),
+            'label': rng.choice(['A', 'B', 'C'], 200),
+        })
+
+    def _assert_matches(self, cache, df):
+        expected = df.select_dtypes(include=['number']).describe()
+        np.testing.assert_allclose(cache.describe().values, expected.values, rtol=1e-9)
+        for col in expected.columns:
+            self.assertAlmostEqual(cache.column_stats(col)['skew'], df[col].skew(), places=8)
+
+    def test_initial_describe(self):
+        """초기 요약이 describe()/skew() 와 일치"""
+        cache = DatasetStatsCache(self.df)
+        self.assertEqual(cache.numeric_columns, ['x', 'n'])
+        self.assertEqual(cache.categorical_columns, ['label'])
+        self._assert_matches(cache, self.df)
+
+    def test_append_rows(self):
+        """행 추가 시 추가분만 반영해도 전체 재계산과 같음"""
+        cache = DatasetStatsCache(self.df)
+        extra = self.df.iloc[:30].assign(x=lambda d: d['x'] + 50)
+        merged = pd.concat([self.df, extra], ignore_index=True)
+        cache.on_append(extra, merged)
+        self._assert_matches(cache, merged)
+
+    def test_cell_edit_updates_moments_and_extrema(self):
+        """셀 편집(극값 제거 포함) 후 통계가 정확함"""
+        df = self.df.copy()
+        cache = DatasetStatsCache(df)
+        version = cache.column_version('x')
+        row = int(df['x'].idxmax())
+        old = df.at[row, 'x']
+
+        # Given: 최댓값을 작은 값으로 변경
+        df.at[row, 'x'] = 90.0
+        # When
+        cache.on_cell_edit('x', old, 90.0, df)
+        # Then
+        self._assert_matches(cache, df)
+        self.assertGreater(cache.column_version('x'), version)
+        self.assertEqual(cache.column_version('n'), 1)
+
+    def test_cell_edit_to_missing(self):
+        """값을 비우면 결측 수가 증가"""
+        df = self.df.copy()
+        cache = DatasetStatsCache(df)
+        old = df.at[3, 'x']
+        df.at[3, 'x'] = np.nan
+        cache.on_cell_edit('x', old, None, df)
+        self.assertEqual(cache.missing_counts()['x'], 1)
+        self._assert_matches(cache, df)
+
+    def test_type_change_rebuilds_column(self):
+        """숫자 열에 문자열이 들어오면 범주형으로 재분류"""
+        df = self.df.copy()
+        cache = DatasetStatsCache(df)
+        values = df['n'].tolist()
+        values[0] = 'abc'
+        df['n'] = pd.Series(values)
+        cache.on_cell_edit('n', 5, 'abc', df)
+        self.assertNotIn('n', cache.numeric_columns)
+        self.assertIn('n', cache.categorical_columns)
+
+    def test_data_table_view_incremental(self):
+        """DataTableView 셀 편집/행 추가가 캐시에 반영"""
+        view = DataTableView()
+        view.set_data(self.df)
+
+        # When: 셀 편집
+        view.table.setItem(0, 0, QTableWidgetItem("123.5"))
+        # Then
+        self.assertEqual(view.df.at[0, 'x'], 123.5)
+        self._assert_matches(view.stats_cache, view.df)
+
+        # When: 행 추가
+        view.append_data(self.df.iloc[:5])
+        # Then
+        self.assertEqual(view.table.rowCount(), 205)
+        self._assert_matches(view.stats_cache, view.df)
+
+    def test_hidden_columns_survive_append_and_edit(self):
+        """열을 숨긴 채 행 추가/셀 편집 → 복원 시 편집 값과 숨긴 열 유지"""
+        view = DataTableView()
+        view.set_data(self.df)
+        hidden = self.df.columns[-1]
+        view.hide_column_by_name(hidden)
+        view.append_data(view.get_data().iloc[:2])
+        view.add_row()
+        self.assertEqual(len(view._df_full), 203)
+        view.table.setItem(202, 0, QTableWidgetItem("7.25"))
+        view.table.setItem(1, 0, QTableWidgetItem("-1.5"))
+        with mock.patch('views.data_view.QInputDialog.getItem', return_value=(hidden, True)):
+            view.restore_hidden_columns()
+        self.assertIn(hidden, view.df.columns)
+        self.assertEqual(view.df.at[202, 'x'], 7.25)
+        self.assertEqual(view.df.at[1, 'x'], -1.5)
+        self.assertTrue(view.df[hidden].iloc[200:].isna().all())
+        self.assertEqual(view.df[hidden].iloc[:200].tolist(), self.df[hidden].tolist())
+        self.assertIs(view.get_data(copy=False), view.df)
+
+
+if __name__ == '__main__':
+    unittest.main()
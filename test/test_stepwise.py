@@ -0,0 +1,105 @@
+"""
+스윕 연산자 기반 단계적 회귀 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import statsmodels.api as sm
+from PySide6.QtWidgets import QApplication
+from controllers.analysis_controller import AnalysisController
+from utils.stepwise import SweepRegression, stepwise_select, sweep, reverse_sweep
+
+
+class TestStepwiseRegression(unittest.TestCase):
+    """stepwise_select 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """클래스 레벨 설정 - QApplication 초기화"""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """테스트 준비: 6개 후보 중 3개만 유효"""
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(80, 6))
+        self.y = 2 + 3 * self.X[:, 0] - 2 * self.X[:, 2] + 0.5 * self.X[:, 4] + rng.normal(size=80)
+        self.names = [f'x{i}' for i in range(6)]
+
+    def test_sweep_is_reversible(self):
+        """스윕 후 역스윕하면 원래 행렬로 복원"""
+        model = SweepRegression(self.X, self.y, self.names)
+        original = model.A.copy()
+        for j in (0, 3, 5):
+            sweep(model.A, j)
+        for j in (3, 0, 5):
+            reverse_sweep(model.A, j)
+        np.testing.assert_allclose(model.A, original, atol=1e-8)
+
+    def test_matches_statsmodels(self):
+        """모든 방향/기준에서 선택 모형의 계수·AIC·p-값이 OLS 재적합과 일치"""
+        for direction in ('stepwise', 'forward', 'backward'):
+            for criterion in ('aic', 'bic', 'pvalue'):
+                result = stepwise_select(self.X, self.y, self.names, direction, criterion)
+                self.assertEqual(sorted(result['selected']), ['x0', 'x2', 'x4'], (direction, criterion))
+                idx = [self.names.index(s) for s in result['selected']]
+                ols = sm.OLS(self.y, sm.add_constant(self.X[:, idx])).fit()
+                np.testing.assert_allclose(result['coefficients'].values, ols.params)
+                np.testing.assert_allclose(result['std_errors'].values, ols.bse)
+                np.testing.assert_allclose(result['p_values'].values, ols.pvalues)
+                self.assertAlmostEqual(result['aic'], ols.aic)
+                self.assertAlmostEqual(result['bic'], ols.bic)
+
+    def test_path_records_steps(self):
+        """선택 경로: 전진은 추가만, 후진은 전체 모형에서 제거만"""
+        forward = stepwise_select(self.X, self.y, self.names, 'forward')['path']
+        self.assertEqual(forward['action'].iloc[0], 'start')
+        self.assertEqual(list(forward['action'].iloc[1:].unique()), ['add'])
+        self.assertEqual(forward['term'].iloc[1], 'x0')
+        self.assertTrue((forward['aic'].diff().dropna() < 0).all())
+
+        backward = stepwise_select(self.X, self.y, self.names, 'backward')['path']
+        self.assertEqual(backward['n_terms'].iloc[0], 6)
+        self.assertEqual(list(backward['action'].iloc[1:].unique()), ['remove'])
+
+    def test_collinear_candidate_skipped(self):
+        """완전 공선 후보는 진입하지 않음"""
+        X = np.column_stack([self.X, self.X[:, 0] + self.X[:, 2]])
+        result = stepwise_select(X, self.y, self.names + ['x_dup'], 'forward', 'aic')
+        self.assertLessEqual(len(result['selected']), 3 + 1)
+        self.assertTrue(np.all(np.isfinite(result['std_errors'].values)))
+
+    def test_invalid_options(self):
+        """지원하지 않는 방향/기준은 ValueError"""
+        with self.assertRaises(ValueError):
+            stepwise_select(self.X, self.y, self.names, direction='both')
+        with self.assertRaises(ValueError):
+            stepwise_select(self.X, self.y, self.names, criterion='cp')
+
+    def test_controller_result(self):
+        """run_stepwise_regression 결과 구조"""
+        df = pd.DataFrame(self.X, columns=self.names)
+        df['Y'] = self.y
+        controller = AnalysisController()
+        holder = {}
+        controller.analysis_completed.connect(lambda name, res: holder.update(res=res))
+        controller.run_stepwise_regression(df, response='Y', criterion='bic')
+        results = holder['res']['results']
+        self.assertEqual(holder['res']['type'], '단계적 회귀')
+        self.assertEqual(results['candidates'], self.names)
+        self.assertIn('Intercept', results['coefficients'].index)
+        self.assertIsInstance(results['path'], pd.DataFrame)
+        self.assertEqual(len(results['residuals']), len(df))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+스트리밍 기술통계 엔진 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+
+# src 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.streaming_stats import (
+    QuantileSketch, StreamingStatistics, iter_csv_chunks, summarize_chunks, summarize_file
+)
+
+
+class TestStreamingStatistics(unittest.TestCase):
+    """StreamingStatistics 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'x': rng.normal(10, 2, 5000),
+            'y': rng.exponential(3, 5000),
+            'label': rng.choice(['A', 'B'], 5000),
+        })
+        self.df.loc[::97, 'x'] = np.nan
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _chunks(self, size=700):
+        return [self.df.iloc[i:i + size] for i in range(0, len(self.df), size)]
+
+    def test_moments_match_describe(self):
+        """청크 누적 결과가 describe()의 모멘트와 일치"""
+        stats = summarize_chunks(self._chunks())
+        expected = self.df.select_dtypes(include=[np.number]).describe()
+        summary = stats.to_summary()
+
+        self.assertEqual(list(summary.index), list(expected.index))
+        self.assertEqual(list(summary.columns), ['x', 'y'])
+        for row in ('count', 'mean', 'std', 'min', 'max'):
+            np.testing.assert_allclose(summary.loc[row].values, expected.loc[row].values, rtol=1e-9)
+
+    def test_approximate_quantiles(self):
+        """근사 분위수 오차가 작음"""
+        summary = summarize_chunks(self._chunks()).to_summary()
+        expected = self.df[['x', 'y']].quantile([0.25, 0.5, 0.75])
+        for q, row in zip([0.25, 0.5, 0.75], ['25%', '50%', '75%']):
+            for col in ('x', 'y'):
+                spread = expected[col].max() - expected[col].min()
+                self.assertLess(abs(summary.loc[row, col] - expected.loc[q, col]), 0.05 * spread)
+
+    def test_merge_equals_sequential(self):
+        """부분 결과 병합이 순차 누적과 같음"""
+        chunks = self._chunks()
+        left = StreamingStatistics()
+        right = StreamingStatistics()
+        for chunk in chunks[:3]:
+            left.update(chunk)
+        for chunk in chunks[3:]:
+            right.update(chunk)
+        merged = left.merge(right).to_summary()
+        sequential = summarize_chunks(chunks).to_summary()
+        np.testing.assert_allclose(merged.loc[['count', 'mean', 'std', 'min', 'max']].values,
+                                   sequential.loc[['count', 'mean', 'std', 'min', 'max']].values, rtol=1e-9)
+
+    def test_threaded_summary(self):
+        """스레드 병렬 집계 결과가 순차 집계와 같음"""
+        threaded = summarize_chunks(self._chunks(), max_workers=3).to_summary()
+        sequential = summarize_chunks(self._chunks()).to_summary()
+        np.testing.assert_allclose(threaded.loc['mean'].values, sequential.loc['mean'].values, rtol=1e-9)
+
+    def test_result_structure(self):
+        """run_basic_statistics 와 같은 결과 구조"""
+        result = summarize_chunks(self._chunks()).to_result()
+        self.assertEqual(result['type'], '기초 통계')
+        details = result['results']
+        for key in ('summary', 'missing_values', 'data_types', 'variable_count', 'observation_count'):
+            self.assertIn(key, details)
+        self.assertEqual(details['observation_count'], len(self.df))
+        self.assertEqual(details['missing_values']['x'], int(self.df['x'].isna().sum()))
+
+    def test_summarize_csv_file(self):
+        """CSV 파일 스트리밍 집계"""
+        path = os.path.join(self.temp_dir, 'data.csv')
+        self.df.to_csv(path, index=False)
+        stats = summarize_file(path, chunksize=1000)
+        self.assertEqual(stats.rows, len(self.df))
+        self.assertAlmostEqual(stats.to_summary().loc['mean', 'y'], self.df['y'].mean(), places=9)
+
+    def test_late_decode_error(self):
+        """첫 청크 이후의 인코딩 오류도 같은 ValueError 로"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'late.csv')
+            with open(path, 'wb') as f:
+                f.write(b'x\n' + b'1\n' * 50 + b'\xff\xfe\n')
+            chunks = iter_csv_chunks(path, chunksize=10, encoding='utf-8')
+            self.assertEqual(len(next(chunks)), 10)
+            with self.assertRaisesRegex(ValueError, 'CSV 파일을 읽을 수 없습니다'):
+                list(chunks)
+
+    def test_sketch_roundtrip(self):
+        """스케치 dict 변환 후 동일한 분위수"""
+        sketch = QuantileSketch(compression=50)
+        sketch.update(np.arange(10000, dtype=float))
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+        self.assertEqual(sketch.quantiles([0.5], 0, 9999), restored.quantiles([0.5], 0, 9999))
+        self.assertLessEqual(sketch.means.size, 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
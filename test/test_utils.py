@@ -20,7 +20,7 @@ from utils.data_utils import (
 )
 from utils.file_utils import (
     ensure_directory_exists, get_safe_filename, get_unique_filename,
-    backup_file, load_json_file, save_json_file, get_file_info,
+    backup_file, load_json_file, save_json_file, write_json_atomic, get_file_info,
     find_files_by_extension, export_dataframe, validate_file_path
 )
 
@@ -251,6 +251,22 @@ class TestFileUtils(unittest.TestCase):
         self.assertEqual(loaded_data['name'], '테스트')
         self.assertEqual(loaded_data['values'], [1, 2, 3])
     
+    def test_write_json_atomic(self):
+        """동시 원자적 JSON 기록 테스트 (임시 파일 이름이 겹치지 않고 남지 않음)"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        json_file = os.path.join(self.temp_dir, "cache", "atomic.json")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: write_json_atomic({'i': i}, json_file), range(32)))
+        self.assertTrue(all(results))
+        self.assertIn(load_json_file(json_file)['i'], range(32))
+        self.assertEqual(os.listdir(os.path.dirname(json_file)), ['atomic.json'])
+        
+        # 직렬화할 수 없는 데이터는 실패하고 기존 파일을 그대로 둠
+        self.assertFalse(write_json_atomic({'bad': object()}, json_file))
+        self.assertIn(load_json_file(json_file)['i'], range(32))
+        self.assertEqual(os.listdir(os.path.dirname(json_file)), ['atomic.json'])
+    
     def test_get_file_info(self):
         """파일 정보 가져오기 테스트"""
         # 존재하지 않는 파일
@@ -29,6 +29,47 @@ def main() -> int:
 
     pid = client.post("/api/v1/projects", json={"name": None}).json()["data"]["project_id"]
 
+    r = client.post("/api/v1/design/optimal", json={"factors": 3, "runs": 14, "criterion": "I", "n_starts": 4})
+    print("design optimal:", r.status_code)
+    if r.status_code == 200:
+        print("design optimal.d_efficiency:", r.json()["data"]["d_efficiency"])
+    r = client.get("/api/v1/design/orthogonal_arrays")
+    print("design orthogonal_arrays:", r.status_code, len(r.json()["data"]) if r.status_code == 200 else None)
+    r = client.post("/api/v1/design/orthogonal_array", json={"factors": 13, "design": "L27"})
+    print("design orthogonal_array L27:", r.status_code)
+    r = client.post("/api/v1/design/mixture",
+                    json={"components": 3, "kind": "extreme_vertices", "lower": [0.4, 0.1, 0.1], "upper": [0.6, 0.5, 0.3]})
+    print("design mixture:", r.status_code)
+    r = client.post("/api/v1/design/space_filling", json={"factors": 4, "runs": 60, "restarts": 2, "time_budget": 5})
+    print("design space_filling:", r.status_code, r.json()["data"]["min_distance"] if r.status_code == 200 else None)
+    r = client.post("/api/v1/design/fractional_factorial", json={"design_str": "a b c d ab ac bcd"})
+    print("design fractional_factorial (rows):", r.status_code, len(r.json()["data"]["data"]) if r.status_code == 200 else None)
+    r = client.post("/api/v1/design/fractional_factorial",
+                    json={"design_str": "a b c d ab ac bcd", "alias_order": 2, "include_aliasing": True})
+    print("design fractional_factorial:", r.status_code, r.json()["data"]["aliasing"]["resolution"] if r.status_code == 200 else None)
+    r = client.post("/api/v1/design/min_aberration", json={"factors": 9, "runs": 32})
+    print("design min_aberration:", r.status_code, r.json()["data"]["word_length_pattern"][:5] if r.status_code == 200 else None)
+    if r.status_code == 200:
+        # 설계 + 합성 반응 → 2수준 효과 분석 / 파레토 차트
+        design = r.json()["data"]["design"]
+        names = design["columns"]
+        lines = [",".join(names + ["y"])]
+        for i, row in enumerate(design["data"]):
+            y = 3 * row[names[0]] - 2 * row[names[1]] + 10 + 0.05 * ((7 * i) % 5)
+            lines.append(",".join(str(row[n]) for n in names) + f",{y}")
+        fid = client.post("/api/v1/projects", json={"name": "effects"}).json()["data"]["project_id"]
+        client.post(f"/api/v1/projects/{fid}/data/upload",
+                    files={"file": ("ff.csv", "\n".join(lines).encode(), "text/csv")})
+        r = client.post(f"/api/v1/analysis/projects/{fid}/factorial_effects", json={"response": "y"})
+        print("factorial_effects:", r.status_code, r.json()["data"]["results"].get("active") if r.status_code == 200 else r.json())
+        rc = client.post(f"/api/v1/charts/projects/{fid}", json={"chart_type": "pareto", "options": {"response": "y"}})
+        print("chart pareto", rc.status_code)
+    r = client.post("/api/v1/design/split_plot",
+                    json={"whole_levels": [2, 3], "subplot_levels": [2, 2], "replicates": 2, "seed": 1})
+    print("design split_plot:", r.status_code)
+    r = client.post("/api/v1/design/mixture/stream", json={"components": 6, "degree": 10, "chunk_size": 500})
+    print("design mixture stream:", r.status_code, len(r.text.splitlines()))
+
     picked = None
     for name in candidates:
         p = sample_dir / name
@@ -83,6 +124,74 @@ def main() -> int:
     else:
         data = r.json()["data"]
         print("doe_anova.type:", data.get("type"))
+        ra = client.get(data["results"]["residuals"]["ref"])
+        print("doe_anova.residuals:", ra.status_code, len(ra.json()["data"]["values"]) if ra.status_code == 200 else None)
+        rh = client.get(f"/api/v1/analysis/projects/{pid}/history")
+        print("history:", rh.status_code, sorted(rh.json()["data"][0].get("summary", {}))[:5] if rh.status_code == 200 else None)
+        ri = client.get(f"/api/v1/analysis/projects/{pid}/history/0")
+        print("history/0:", ri.status_code, "anova" in ri.json()["data"]["results"] if ri.status_code == 200 else None)
+
+    numeric_factors = [c for c in factors if c in numeric][:2]
+    if len(numeric_factors) >= 2:
+        r = client.post(
+            f"/api/v1/analysis/projects/{pid}/rsm_surface",
+            json={"response": response, "factors": numeric_factors, "resolution": 50},
+        )
+        print("rsm_surface:", r.status_code)
+        if r.status_code != 200:
+            print(json.dumps(r.json(), ensure_ascii=False, indent=2))
+        else:
+            print("rsm_surface.nature:", r.json()["data"]["results"].get("nature"))
+        rc = client.post(
+            f"/api/v1/charts/projects/{pid}",
+            json={"chart_type": "contour", "x_var": numeric_factors[0], "y_var": numeric_factors[1],
+                  "options": {"response": response, "factors": numeric_factors}},
+        )
+        print("chart contour", rc.status_code)
+        r = client.post(
+            f"/api/v1/analysis/projects/{pid}/desirability_optimization",
+            json={"goals": [{"response": response, "goal": "maximize"}], "factors": numeric_factors,
+                  "n_candidates": 2000, "n_starts": 4},
+        )
+        print("desirability_optimization:", r.status_code)
+        if r.status_code != 200:
+            print(json.dumps(r.json(), ensure_ascii=False, indent=2))
+        else:
+            print("desirability.D:", r.json()["data"]["results"].get("overall_desirability"))
+
+    rr = client.get("/api/v1/analysis/registry")
+    print("registry:", rr.status_code, [a["id"] for a in rr.json()["data"]] if rr.status_code == 200 else None)
+
+    r = client.post(
+        f"/api/v1/analysis/projects/{pid}/permutation_anova",
+        json={"response": response, "factors": factors, "n_permutations": 999},
+    )
+    print("permutation_anova:", r.status_code)
+    if r.status_code != 200:
+        print(json.dumps(r.json(), ensure_ascii=False, indent=2))
+    else:
+        print("permutation_anova.method:", r.json()["data"]["results"].get("method"))
+
+    predictors = [c for c in numeric if c != response]
+    r = client.post(
+        f"/api/v1/analysis/projects/{pid}/stepwise_regression",
+        json={"response": response, "predictors": predictors},
+    )
+    print("stepwise_regression:", r.status_code)
+    if r.status_code != 200:
+        print(json.dumps(r.json(), ensure_ascii=False, indent=2))
+    else:
+        print("stepwise_regression.selected:", r.json()["data"]["results"].get("selected"))
+
+    r = client.post(
+        f"/api/v1/analysis/projects/{pid}/best_subsets",
+        json={"response": response, "factors": factors, "top": 3},
+    )
+    print("best_subsets:", r.status_code)
+    if r.status_code != 200:
+        print(json.dumps(r.json(), ensure_ascii=False, indent=2))
+    else:
+        print("best_subsets.best:", (r.json()["data"]["results"].get("best") or {}).get("terms"))
 
     for chart_type, body in [
         ("주효과도", {"chart_type": "주효과도", "x_var": (factors[0] if factors else None), "y_var": response, "group_var": None, "options": None}),
@@ -96,6 +205,19 @@ def main() -> int:
         else:
             print(" ", "image_base64_png" in rc.json()["data"])
 
+    rc = client.post(
+        f"/api/v1/charts/projects/{pid}/batch",
+        json={"charts": [
+            {"chart_type": "histogram", "x_var": response},
+            {"chart_type": "correlation_matrix"},
+        ]},
+    )
+    print("chart batch", rc.status_code)
+    if rc.status_code != 200:
+        print(" ", json.dumps(rc.json(), ensure_ascii=False, indent=2))
+    else:
+        print(" ", [c["type"] for c in rc.json()["data"]])
+
     return 0
 
 